@@ -19,6 +19,13 @@ Usage::
 
     # JSON output for CI/dashboards
     uv run python scripts/bench_bbmd.py --json
+
+    # Server drains datagrams in batches (compare against the default run)
+    uv run python scripts/bench_bbmd.py --batched-io
+
+    # Broadcast fan-out to 5000 registered foreign devices, per-destination
+    # sends vs one batched send per broadcast
+    uv run python scripts/bench_bbmd.py --fanout 5000
 """
 
 from __future__ import annotations
@@ -47,6 +54,18 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--warmup", type=int, default=5, help="Warmup seconds (default: 5)")
     p.add_argument("--sustain", type=int, default=30, help="Sustained test seconds (default: 30)")
     p.add_argument("--port", type=int, default=0, help="Server port (0=auto, default: 0)")
+    p.add_argument(
+        "--batched-io",
+        action="store_true",
+        help="Drain server datagrams in batches (DeviceConfig.batched_io)",
+    )
+    p.add_argument(
+        "--fanout",
+        type=int,
+        metavar="N",
+        default=0,
+        help="Time BBMD broadcast fan-out to N registered foreign devices instead",
+    )
     p.add_argument("--json", action="store_true", help="Output JSON report to stdout")
     p.add_argument("--profile", action="store_true", help="Enable pyinstrument profiling")
     p.add_argument("--profile-html", metavar="PATH", help="Save interactive HTML profile to file")
@@ -484,6 +503,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
         instance_number=server_instance,
         name=f"Bench-BBMD-{server_instance}",
         port=server_port,
+        batched_io=args.batched_io,
     )
     app = BACnetApplication(config)
     await app.start()
@@ -659,6 +679,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
                 "fdt_workers": args.fdt_workers,
                 "bdt_workers": args.bdt_workers,
                 "total_workers": total_workers,
+                "batched_io": args.batched_io,
                 "warmup_seconds": args.warmup,
                 "sustain_seconds": args.sustain,
             },
@@ -723,6 +744,111 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
         await app.stop()
 
 
+# ---------------------------------------------------------------------------
+# Fan-out benchmark (BBMD only, real UDP socket)
+# ---------------------------------------------------------------------------
+
+
+async def _run_fanout(args: argparse.Namespace) -> dict[str, Any]:
+    import socket
+
+    from bac_py.network.address import BIPAddress
+    from bac_py.transport.bbmd import FDTEntry
+    from bac_py.transport.bip import BIPTransport
+    from bac_py.types.enums import BvlcFunction
+
+    log = sys.stderr.write
+    duration = max(1.0, args.sustain / 2)
+    who_is = b"\x01\x20\xff\xff\x00\xff\x10\x08"
+    source = BIPAddress(host="127.0.0.1", port=47999)
+    results: dict[str, dict[str, float]] = {}
+
+    # The first foreign device is a real socket so delivery can be checked;
+    # the rest are unbound loopback ports the kernel discards.
+    sink = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sink.bind(("127.0.0.1", 0))
+    sink.setblocking(False)
+    sink_port = sink.getsockname()[1]
+    base_port = 20000 if sink_port >= 20000 + args.fanout or sink_port < 20000 else 40000
+
+    if not args.json:
+        log(
+            f"\n{'=' * 70}\n"
+            f"  BBMD Fan-out Benchmark: {args.fanout:,} foreign devices, "
+            f"{duration:.0f}s per mode (batched_io={args.batched_io})\n"
+            f"{'=' * 70}\n"
+        )
+
+    try:
+        for mode in ("per-destination", "batched"):
+            transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=args.batched_io)
+            await transport.start()
+            try:
+                bbmd = await transport.attach_bbmd(max_fdt_entries=args.fanout)
+                if mode == "per-destination":
+                    bbmd._send_many = None
+                expiry = time.monotonic() + 3600
+                for i in range(args.fanout):
+                    port = sink_port if i == 0 else base_port + i
+                    addr = BIPAddress(host="127.0.0.1", port=port)
+                    bbmd._fdt[addr] = FDTEntry(address=addr, ttl=3600, expiry=expiry + i)
+
+                received = 0
+                count = 0
+                t0 = time.perf_counter()
+                deadline = t0 + duration
+                while time.perf_counter() < deadline:
+                    bbmd.handle_bvlc(BvlcFunction.ORIGINAL_BROADCAST_NPDU, who_is, source)
+                    count += 1
+                    # Let batched sockets flush and drain the sink.
+                    await asyncio.sleep(0)
+                    with contextlib.suppress(BlockingIOError):
+                        while True:
+                            sink.recv(64)
+                            received += 1
+                elapsed = time.perf_counter() - t0
+
+                t1 = time.perf_counter()
+                bbmd._purge_expired_fdt_entries()
+                purge_ms = (time.perf_counter() - t1) * 1000
+
+                stats = bbmd.fanout_stats
+                results[mode] = {
+                    "broadcasts_per_s": round(count / elapsed, 1),
+                    "datagrams_per_s": round(stats.fd_datagrams / elapsed, 1),
+                    "sink_delivery": round(received / count, 4),
+                    "max_fanout": stats.max_fanout,
+                    "send_errors": stats.send_errors,
+                    "fanout_ms_per_broadcast": round(stats.fanout_time / count * 1000, 3),
+                    "idle_purge_ms": round(purge_ms, 3),
+                }
+            finally:
+                await transport.stop()
+            if not args.json:
+                r = results[mode]
+                log(
+                    f"  {mode:<16s} {r['broadcasts_per_s']:>8,.0f} bcast/s  "
+                    f"{r['datagrams_per_s']:>10,.0f} dgram/s  "
+                    f"{r['fanout_ms_per_broadcast']:.3f} ms/bcast  "
+                    f"delivery {r['sink_delivery']:.0%}\n"
+                )
+    finally:
+        sink.close()
+
+    speedup = (
+        results["batched"]["broadcasts_per_s"] / results["per-destination"]["broadcasts_per_s"]
+    )
+    if not args.json:
+        log(f"  Batched speedup: x{speedup:.2f}\n{'=' * 70}\n")
+    return {
+        "mode": "fanout",
+        "transport": "bbmd",
+        "config": {"foreign_devices": args.fanout, "batched_io": args.batched_io},
+        "modes": results,
+        "speedup": round(speedup, 2),
+    }
+
+
 def main() -> None:
     args = _parse_args()
 
@@ -738,7 +864,7 @@ def main() -> None:
 
     if profiler:
         profiler.start()
-    result = asyncio.run(_run(args))
+    result = asyncio.run(_run_fanout(args) if args.fanout else _run(args))
     if profiler:
         profiler.stop()
         if args.profile:
@@ -747,6 +873,11 @@ def main() -> None:
             profiler.write_html(args.profile_html)
             print(f"Profile saved to {args.profile_html}", file=sys.stderr)
 
+    if args.fanout:
+        if args.json:
+            print(json.dumps(result, indent=2))
+        return
+
     error_rate = result["sustained"]["error_rate"]
     if error_rate >= 0.005:
         print(f"FAIL: Error rate {error_rate:.2%} exceeds 0.5%", file=sys.stderr)
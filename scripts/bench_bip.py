@@ -19,6 +19,12 @@ Usage::
 
     # JSON output for CI/dashboards
     uv run python scripts/bench_bip.py --json
+
+    # Server drains datagrams in batches (compare against the default run)
+    uv run python scripts/bench_bip.py --batched-io
+
+    # Multi-process server: read throughput with 1, 2 and 4 shards
+    uv run python scripts/bench_bip.py --shards 1,2,4 --client-procs 4
 """
 
 from __future__ import annotations
@@ -46,6 +52,23 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--warmup", type=int, default=5, help="Warmup seconds (default: 5)")
     p.add_argument("--sustain", type=int, default=30, help="Sustained test seconds (default: 30)")
     p.add_argument("--port", type=int, default=0, help="Server port (0=auto, default: 0)")
+    p.add_argument(
+        "--batched-io",
+        action="store_true",
+        help="Drain server datagrams in batches (DeviceConfig.batched_io)",
+    )
+    p.add_argument(
+        "--shards",
+        metavar="N[,N...]",
+        help="Run a sharded server (bac_py.app.sharding) with each worker count "
+        "in turn and report read throughput per shard",
+    )
+    p.add_argument(
+        "--client-procs",
+        type=int,
+        default=4,
+        help="Client processes in --shards mode (default: 4)",
+    )
     p.add_argument("--json", action="store_true", help="Output JSON report to stdout")
     p.add_argument("--profile", action="store_true", help="Enable pyinstrument profiling")
     p.add_argument("--profile-html", metavar="PATH", help="Save interactive HTML profile to file")
@@ -457,6 +480,171 @@ async def _stop_phase(
         t.cancel()
 
 
+# ---------------------------------------------------------------------------
+# Sharded mode (multi-process server, scaling per shard)
+# ---------------------------------------------------------------------------
+
+SHARD_BENCH_PORT = 47850
+
+
+def _shard_setup(app: Any, index: int) -> None:
+    """Populate each shard worker with the stress objects."""
+    _create_stress_objects(app)
+
+
+async def _shard_client_run(
+    port: int, instance: int, readers: int, rpms: int, warmup: int, sustain: int
+) -> tuple[int, int, float, list[float]]:
+    from bac_py import Client
+
+    server = f"127.0.0.1:{port}"
+    async with Client(instance_number=instance, port=0) as client:
+        for phase in (warmup, sustain):
+            stats = Stats()
+            stop = asyncio.Event()
+            tasks = [
+                asyncio.create_task(_read_worker(client, server, stats, stop))
+                for _ in range(readers)
+            ] + [
+                asyncio.create_task(_rpm_worker(client, server, stats, stop)) for _ in range(rpms)
+            ]
+            t0 = time.monotonic()
+            await asyncio.sleep(phase)
+            await _stop_phase(stop, tasks)
+            elapsed = time.monotonic() - t0
+    return stats.total_ok, stats.errors, elapsed, stats.combined_latencies()
+
+
+def _shard_client_proc(
+    queue: Any, port: int, instance: int, readers: int, rpms: int, warmup: int, sustain: int
+) -> None:
+    queue.put(asyncio.run(_shard_client_run(port, instance, readers, rpms, warmup, sustain)))
+
+
+async def _wait_for_server(port: int, instance: int, timeout: float = 15.0) -> None:
+    from bac_py import Client
+    from bac_py.app.application import DeviceConfig
+
+    deadline = time.monotonic() + timeout
+    config = DeviceConfig(instance_number=899, port=0, apdu_timeout=1000, apdu_retries=0)
+    async with Client(config) as client:
+        while True:
+            try:
+                await client.read(f"127.0.0.1:{port}", f"device,{instance}", "object-name")
+                return
+            except Exception:
+                if time.monotonic() > deadline:
+                    raise
+                await asyncio.sleep(0.2)
+
+
+def _run_sharded(args: argparse.Namespace) -> dict[str, Any]:
+    import multiprocessing
+    import os
+
+    from bac_py.app.application import DeviceConfig
+    from bac_py.app.sharding import ShardSupervisor
+
+    log = sys.stderr.write
+    shard_counts = [int(n) for n in args.shards.split(",")]
+    port = args.port or SHARD_BENCH_PORT
+    server_instance = 400
+    readers = args.pools * args.readers
+    rpms = args.pools * args.rpm
+    cores = os.cpu_count() or 1
+
+    if not args.json:
+        log(
+            f"\n{'=' * 70}\n"
+            f"  BIP Sharded Benchmark: shards {shard_counts} on port {port}\n"
+            f"  {args.client_procs} client procs x ({readers}R + {rpms}RPM)  |  "
+            f"Warmup: {args.warmup}s  |  Sustained: {args.sustain}s  |  CPUs: {cores}\n"
+            f"{'=' * 70}\n"
+        )
+
+    runs: list[dict[str, Any]] = []
+    for shards in shard_counts:
+        config = DeviceConfig(
+            instance_number=server_instance,
+            name=f"Bench-BIP-{server_instance}",
+            port=port,
+            batched_io=args.batched_io,
+        )
+        supervisor = ShardSupervisor(config, _shard_setup, workers=shards)
+        supervisor.start()
+        try:
+            asyncio.run(_wait_for_server(port, server_instance))
+            queue: Any = multiprocessing.Queue()
+            procs = [
+                multiprocessing.Process(
+                    target=_shard_client_proc,
+                    args=(queue, port, 800 + i, readers, rpms, args.warmup, args.sustain),
+                )
+                for i in range(args.client_procs)
+            ]
+            for proc in procs:
+                proc.start()
+            results = [queue.get() for _ in procs]
+            for proc in procs:
+                proc.join()
+        finally:
+            supervisor.stop()
+
+        ok = sum(r[0] for r in results)
+        errors = sum(r[1] for r in results)
+        elapsed = max(r[2] for r in results)
+        lats = [lat for r in results for lat in r[3]]
+        rps = ok / elapsed if elapsed else 0.0
+        total = ok + errors
+        runs.append(
+            {
+                "shards": shards,
+                "successful": ok,
+                "errors": errors,
+                "error_rate": round(errors / total, 4) if total else 0.0,
+                "throughput_rps": round(rps, 1),
+                "rps_per_shard": round(rps / shards, 1),
+                "latency_ms": _latency_dict(lats),
+            }
+        )
+        if not args.json:
+            log(f"  {shards} shard(s): {rps:,.0f} req/s  |  {_latency_summary(lats)}\n")
+
+    base = runs[0]["throughput_rps"] / runs[0]["shards"] if runs else 0.0
+    for run in runs:
+        run["scaling_efficiency"] = round(run["rps_per_shard"] / base, 3) if base else 0.0
+
+    result: dict[str, Any] = {
+        "mode": "sharded",
+        "transport": "bip",
+        "config": {
+            "port": port,
+            "cpu_count": cores,
+            "client_procs": args.client_procs,
+            "readers_per_proc": readers,
+            "rpm_per_proc": rpms,
+            "batched_io": args.batched_io,
+            "warmup_seconds": args.warmup,
+            "sustain_seconds": args.sustain,
+        },
+        "runs": runs,
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        log(f"\n{'=' * 70}\n  SCALING (relative to {runs[0]['shards']} shard(s))\n{'=' * 70}\n")
+        for run in runs:
+            log(
+                f"  {run['shards']:>3} shard(s): {run['throughput_rps']:>10,.0f} req/s  "
+                f"{run['rps_per_shard']:>9,.0f} req/s/shard  "
+                f"efficiency {run['scaling_efficiency']:.0%}\n"
+            )
+        if max(shard_counts) > cores:
+            log(f"  Note: more shards than the {cores} available CPU(s)\n")
+        log(f"{'=' * 70}\n")
+    return result
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -475,6 +663,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
         instance_number=server_instance,
         name=f"Bench-BIP-{server_instance}",
         port=server_port,
+        batched_io=args.batched_io,
     )
     app = BACnetApplication(config)
     await app.start()
@@ -615,6 +804,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
                 "objlist_workers": args.objlist,
                 "cov_subscribers": args.cov,
                 "total_workers": total_workers,
+                "batched_io": args.batched_io,
                 "warmup_seconds": args.warmup,
                 "sustain_seconds": args.sustain,
             },
@@ -689,6 +879,14 @@ def main() -> None:
 
         profiler = Profiler(async_mode="enabled")
 
+    if args.shards:
+        result = _run_sharded(args)
+        worst = max(run["error_rate"] for run in result["runs"])
+        if worst >= 0.005:
+            print(f"FAIL: Error rate {worst:.2%} exceeds 0.5%", file=sys.stderr)
+            sys.exit(1)
+        return
+
     if profiler:
         profiler.start()
     result = asyncio.run(_run(args))
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""Event engine benchmark — per-cycle cost of scan vs change-driven evaluation.
+
+Builds object databases of increasing size filled with intrinsic-reporting
+AnalogValue objects, writes Present_Value on a fixed number of them each
+cycle, and times ``EventEngine._evaluate_cycle()`` in both evaluation
+modes.  No network I/O is involved; notifications go to a no-op sink.
+
+Usage::
+
+    # Default: 1k / 10k / 50k objects, 10 changes per cycle, 20 cycles
+    uv run python scripts/bench_events.py
+
+    # Custom sizes and change rate
+    uv run python scripts/bench_events.py --counts 5000,100000 --changes 100
+
+    # JSON output for CI/dashboards
+    uv run python scripts/bench_events.py --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from bac_py.app.event_engine import EventEngine
+from bac_py.objects.analog import AnalogValueObject
+from bac_py.objects.base import ObjectDatabase
+from bac_py.types.enums import ObjectType, PropertyIdentifier
+from bac_py.types.primitives import ObjectIdentifier
+
+
+def _parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Event engine cycle-cost benchmark")
+    p.add_argument(
+        "--counts",
+        default="1000,10000,50000",
+        help="Comma-separated object counts (default: 1000,10000,50000)",
+    )
+    p.add_argument("--changes", type=int, default=10, help="Writes per cycle (default: 10)")
+    p.add_argument("--cycles", type=int, default=20, help="Measured cycles (default: 20)")
+    p.add_argument("--json", action="store_true", help="Output JSON report to stdout")
+    return p.parse_args()
+
+
+def _build_app(count: int) -> tuple[Any, list[AnalogValueObject]]:
+    """Create a minimal application stand-in holding *count* objects."""
+    db = ObjectDatabase()
+    objects = []
+    for i in range(1, count + 1):
+        av = AnalogValueObject(
+            i,
+            object_name=f"av-{i}",
+            high_limit=80.0,
+            low_limit=10.0,
+            deadband=2.0,
+            event_enable=[True, True, True],
+            time_delay=0,
+        )
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 50.0
+        db.add(av)
+        objects.append(av)
+    app = SimpleNamespace(
+        object_db=db,
+        device_object_identifier=ObjectIdentifier(ObjectType.DEVICE, 1),
+        unconfirmed_request=lambda **_: None,
+    )
+    return app, objects
+
+
+def _measure(count: int, changes: int, cycles: int, *, change_driven: bool) -> dict[str, Any]:
+    app, objects = _build_app(count)
+    engine = EventEngine(app, change_driven=change_driven)
+    engine._evaluate_cycle()  # prime contexts (and change callbacks)
+
+    samples = []
+    cursor = 0
+    for cycle in range(cycles):
+        value = 85.0 if cycle % 2 == 0 else 50.0
+        for _ in range(changes):
+            objects[cursor % count].write_property(PropertyIdentifier.PRESENT_VALUE, value)
+            cursor += 1
+        start = time.perf_counter()
+        engine._evaluate_cycle()
+        samples.append(time.perf_counter() - start)
+
+    return {
+        "mode": "change" if change_driven else "scan",
+        "objects": count,
+        "changes_per_cycle": changes,
+        "cycle_ms_p50": round(statistics.median(samples) * 1000, 3),
+        "cycle_ms_max": round(max(samples) * 1000, 3),
+    }
+
+
+def main() -> int:
+    args = _parse_args()
+    counts = [int(c) for c in args.counts.split(",") if c]
+    results = []
+    for count in counts:
+        for change_driven in (False, True):
+            result = _measure(count, args.changes, args.cycles, change_driven=change_driven)
+            results.append(result)
+            if not args.json:
+                print(
+                    f"{result['mode']:>6}  {count:>7} objects  "
+                    f"p50 {result['cycle_ms_p50']:>9.3f} ms  "
+                    f"max {result['cycle_ms_max']:>9.3f} ms",
+                    file=sys.stderr,
+                )
+    if args.json:
+        print(json.dumps({"changes_per_cycle": args.changes, "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
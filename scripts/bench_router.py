@@ -20,6 +20,12 @@ Usage::
 
     # JSON output for CI/dashboards
     uv run python scripts/bench_router.py --json
+
+    # End-to-end run with the decode/re-encode forwarding path
+    uv run python scripts/bench_router.py --no-fast-forward
+
+    # Forwarding micro-benchmark: fast path vs decode/re-encode, no sockets
+    uv run python scripts/bench_router.py --forwarding
 """
 
 from __future__ import annotations
@@ -45,6 +51,16 @@ def _parse_args() -> argparse.Namespace:
     p.add_argument("--objlist", type=int, default=1, help="Object-list workers (default: 1)")
     p.add_argument("--warmup", type=int, default=5, help="Warmup seconds (default: 5)")
     p.add_argument("--sustain", type=int, default=30, help="Sustained test seconds (default: 30)")
+    p.add_argument(
+        "--no-fast-forward",
+        action="store_true",
+        help="Forward by decoding and re-encoding each NPDU (RouterConfig.fast_forwarding)",
+    )
+    p.add_argument(
+        "--forwarding",
+        action="store_true",
+        help="Time NetworkRouter forwarding alone, fast path vs decode/re-encode",
+    )
     p.add_argument("--json", action="store_true", help="Output JSON report to stdout")
     p.add_argument("--profile", action="store_true", help="Enable pyinstrument profiling")
     p.add_argument("--profile-html", metavar="PATH", help="Save interactive HTML profile to file")
@@ -503,6 +519,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
             RouterPortConfig(port_id=2, network_number=net2, interface="127.0.0.1", port=0),
         ],
         application_port_id=1,
+        fast_forwarding=not args.no_fast_forward,
     )
     router_app = BACnetApplication(
         DeviceConfig(
@@ -699,6 +716,7 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
                 "total_workers": total_workers,
                 "warmup_seconds": args.warmup,
                 "sustain_seconds": args.sustain,
+                "fast_forwarding": not args.no_fast_forward,
             },
             "warmup": {
                 "duration": args.warmup,
@@ -758,6 +776,129 @@ async def _run(args: argparse.Namespace) -> dict[str, Any]:
         await router_app.stop()
 
 
+# ---------------------------------------------------------------------------
+# Forwarding micro-benchmark (router only, no sockets)
+# ---------------------------------------------------------------------------
+
+
+class _NullTransport:
+    """Transport stand-in that counts sends."""
+
+    def __init__(self, mac: bytes) -> None:
+        self.local_mac = mac
+        self.max_npdu_length = 1497
+        self.sent = 0
+
+    def on_receive(self, callback: Any) -> None:
+        pass
+
+    def send_unicast(self, npdu: bytes, mac: bytes) -> None:
+        self.sent += 1
+
+    def send_broadcast(self, npdu: bytes) -> None:
+        self.sent += 1
+
+
+def _forwarding_mix() -> list[tuple[str, bytes]]:
+    from bac_py.network.address import BACnetAddress
+    from bac_py.network.npdu import NPDU, encode_npdu
+
+    device = b"\x7f\x00\x00\x02\xba\xc0"
+    rp_request = b"\x00\x05\x01\x0c\x0c\x00\x00\x00\x01\x19\x55"
+    rpm_ack = b"\x30\x01\x0e" + bytes(400)
+    routed_source = BACnetAddress(network=1, mac_address=b"\x7f\x00\x00\x03\xba\xc0")
+    return [
+        (
+            "request to directly-connected net",
+            encode_npdu(
+                NPDU(
+                    destination=BACnetAddress(network=2, mac_address=device),
+                    expecting_reply=True,
+                    apdu=rp_request,
+                )
+            ),
+        ),
+        (
+            "large ack via next-hop router",
+            encode_npdu(
+                NPDU(
+                    destination=BACnetAddress(network=3, mac_address=device),
+                    source=routed_source,
+                    apdu=rpm_ack,
+                )
+            ),
+        ),
+        (
+            "global broadcast",
+            encode_npdu(
+                NPDU(
+                    destination=BACnetAddress(network=0xFFFF, mac_address=b""),
+                    apdu=b"\x10\x08",
+                )
+            ),
+        ),
+    ]
+
+
+def _run_forwarding(args: argparse.Namespace) -> dict[str, Any]:
+    from bac_py.network.router import NetworkRouter, RouterPort
+
+    log = sys.stderr.write
+    duration = max(1.0, args.sustain / 3)
+    source_mac = b"\x7f\x00\x00\x01\xba\xc0"
+    results: dict[str, dict[str, float]] = {}
+
+    if not args.json:
+        log(
+            f"\n{'=' * 70}\n"
+            f"  Router Forwarding Benchmark: {duration:.0f}s per case and mode\n"
+            f"{'=' * 70}\n"
+        )
+
+    for name, data in _forwarding_mix():
+        rates: dict[str, float] = {}
+        for mode, fast in (("decode", False), ("fast", True)):
+            transports = [_NullTransport(bytes([10, 0, 0, i, 0xBA, 0xC0])) for i in (1, 2)]
+            ports = [
+                RouterPort(
+                    port_id=i + 1,
+                    network_number=i + 1,
+                    transport=t,  # type: ignore[arg-type]
+                    mac_address=t.local_mac,
+                    max_npdu_length=t.max_npdu_length,
+                )
+                for i, t in enumerate(transports)
+            ]
+            router = NetworkRouter(ports, fast_forwarding=fast)
+            router.routing_table.update_route(3, 2, b"\x0a\x00\x00\x63\xba\xc0")
+            receive = router._on_port_receive
+            count = 0
+            t0 = time.perf_counter()
+            deadline = t0 + duration
+            while time.perf_counter() < deadline:
+                for _ in range(1000):
+                    receive(1, data, source_mac)
+                count += 1000
+            elapsed = time.perf_counter() - t0
+            rates[mode] = count / elapsed
+            assert transports[1].sent == count
+        speedup = rates["fast"] / rates["decode"]
+        results[name] = {
+            "decode_npdus_per_s": round(rates["decode"], 1),
+            "fast_npdus_per_s": round(rates["fast"], 1),
+            "speedup": round(speedup, 2),
+        }
+        if not args.json:
+            log(
+                f"  {name:<36s} decode {rates['decode']:>10,.0f}/s  "
+                f"fast {rates['fast']:>10,.0f}/s  x{speedup:.2f}\n"
+            )
+
+    if not args.json:
+        log(f"{'=' * 70}\n")
+    return {"mode": "forwarding", "transport": "router", "cases": results}
+
+
 def main() -> None:
     args = _parse_args()
 
@@ -773,7 +914,7 @@ def main() -> None:
 
     if profiler:
         profiler.start()
-    result = asyncio.run(_run(args))
+    result = _run_forwarding(args) if args.forwarding else asyncio.run(_run(args))
     if profiler:
         profiler.stop()
         if args.profile:
@@ -782,6 +923,11 @@ def main() -> None:
             profiler.write_html(args.profile_html)
             print(f"Profile saved to {args.profile_html}", file=sys.stderr)
 
+    if args.forwarding:
+        if args.json:
+            print(json.dumps(result, indent=2))
+        return
+
     error_rate = result["sustained"]["error_rate"]
     # Routing on loopback has higher error rates than direct BIP due to
     # extra UDP hops and broadcast limitations on macOS.  Use 1% threshold.
@@ -22,6 +22,7 @@ from bac_py.app.client import (
     BDTEntryInfo,
     DiscoveredDevice,
     FDTEntryInfo,
+    ObjectListProgress,
     RouterInfo,
     UnconfiguredDevice,
     decode_cov_values,
@@ -44,6 +45,7 @@ __all__ = [
     "EthernetTransport",
     "FDTEntryInfo",
     "ForeignDeviceStatus",
+    "ObjectListProgress",
     "RouterConfig",
     "RouterInfo",
     "RouterPortConfig",
@@ -0,0 +1,29 @@
+"""Concurrent fan-out helper shared by the client and site scan."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+
+async def gather_or_cancel[T](coros: list[Coroutine[Any, Any, T]]) -> list[T]:
+    """Run *coros* concurrently, cancelling the rest if one fails.
+
+    Unlike :func:`asyncio.gather`, the remaining tasks are cancelled and
+    awaited before the first exception propagates, so none outlive the
+    caller.
+
+    :param coros: Coroutines to run.
+    :returns: Their results, in order.
+    """
+    tasks = [asyncio.ensure_future(coro) for coro in coros]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
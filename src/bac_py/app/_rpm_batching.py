@@ -0,0 +1,187 @@
+"""Size estimation and splitting for ReadPropertyMultiple requests.
+
+Shared by :meth:`BACnetClient.read_multiple
+<bac_py.app.client.BACnetClient.read_multiple>` and
+:class:`~bac_py.app.polling_engine.PollingEngine` to pack read access
+specifications into requests whose encoded request and estimated
+ComplexACK both fit the peer's limits (Clause 15.7).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bac_py.segmentation.manager import compute_max_segment_payload
+from bac_py.services.read_property_multiple import ReadAccessSpecification
+from bac_py.types.enums import AbortReason, PropertyIdentifier, Segmentation
+
+if TYPE_CHECKING:
+    from bac_py.app.device_cache import DeviceInfo
+    from bac_py.services.read_property_multiple import PropertyReference
+
+# Conservative per-item size estimates.  An object entry costs its context
+# tagged identifier plus opening/closing tags; a result element costs the
+# property identifier, optional array index, opening/closing tags, and the
+# value itself.
+OBJECT_SPEC_SIZE = 7
+OBJECT_RESULT_OVERHEAD = 7
+PROPERTY_RESULT_OVERHEAD = 7
+ESTIMATED_VALUE_SIZE = 10
+
+# ALL, REQUIRED and OPTIONAL expand to every property of the object.
+_ESTIMATED_EXPANDED_SIZE = 400
+_EXPANDING_PROPERTIES = frozenset(
+    {PropertyIdentifier.ALL, PropertyIdentifier.REQUIRED, PropertyIdentifier.OPTIONAL}
+)
+
+DEFAULT_RESPONSE_SEGMENTS = 8
+"""Segments budgeted for one response when the peer can segment and the
+local device does not cap ``max_segments``."""
+
+OVERSIZE_ABORT_REASONS = frozenset(
+    {
+        AbortReason.SEGMENTATION_NOT_SUPPORTED,
+        AbortReason.BUFFER_OVERFLOW,
+        AbortReason.APDU_TOO_LONG,
+    }
+)
+"""Abort reasons meaning a request or its ComplexACK was too large, so a
+smaller chunk may succeed."""
+
+
+def reference_request_size(ref: PropertyReference) -> int:
+    """Estimate the request bytes used by one property reference."""
+    # [0] property-identifier (2-4 bytes), [1] array index (2-6 bytes)
+    return 4 if ref.property_array_index is None else 8
+
+
+def reference_response_size(ref: PropertyReference) -> int:
+    """Estimate the ComplexACK bytes produced by one property reference."""
+    if ref.property_identifier in _EXPANDING_PROPERTIES:
+        return _ESTIMATED_EXPANDED_SIZE
+    return PROPERTY_RESULT_OVERHEAD + ESTIMATED_VALUE_SIZE
+
+
+def response_size(specs: list[ReadAccessSpecification]) -> int:
+    """Estimate the ComplexACK bytes produced by a chunk of specifications."""
+    return sum(
+        OBJECT_RESULT_OVERHEAD
+        + sum(map(reference_response_size, spec.list_of_property_references))
+        for spec in specs
+    )
+
+
+def rpm_size_limits(
+    local_max_apdu: int,
+    device_info: DeviceInfo | None,
+    *,
+    default_max_apdu: int | None = None,
+    allow_segmentation: bool = True,
+    max_segments: int | None = None,
+) -> tuple[int, int]:
+    """Compute request and response byte budgets for one RPM to a peer.
+
+    Requests are always kept to a single APDU.  The response may span
+    several segments when *allow_segmentation* is set and the peer's
+    cached I-Am says it can transmit segmented messages.
+
+    :param local_max_apdu: Max APDU length accepted by the local device.
+    :param device_info: Cached peer capabilities, or ``None`` if unknown.
+    :param default_max_apdu: Max APDU assumed for unknown peers.  Defaults
+        to *local_max_apdu*.
+    :param allow_segmentation: Whether a segmented response is acceptable.
+    :param max_segments: Local ``max_segments`` limit, or ``None`` for
+        :data:`DEFAULT_RESPONSE_SEGMENTS`.
+    :returns: ``(max_request_bytes, max_response_bytes)``.
+    """
+    if device_info is None:
+        max_apdu = min(local_max_apdu, default_max_apdu or local_max_apdu)
+        segmented = False
+    else:
+        max_apdu = min(local_max_apdu, device_info.max_apdu_length)
+        segmented = device_info.segmentation_supported in (
+            Segmentation.BOTH,
+            Segmentation.TRANSMIT,
+        )
+    max_request = compute_max_segment_payload(max_apdu, "confirmed_request")
+    max_response = compute_max_segment_payload(max_apdu, "complex_ack")
+    if allow_segmentation and segmented:
+        max_response *= max_segments or DEFAULT_RESPONSE_SEGMENTS
+    return max_request, max_response
+
+
+def split_read_access_specs(
+    specs: list[ReadAccessSpecification],
+    max_request: int,
+    max_response: int,
+) -> list[list[ReadAccessSpecification]]:
+    """Split *specs* into chunks whose request and response fit the budgets.
+
+    Property references are kept in their original order.  An object
+    whose references do not fit in the current chunk is continued in
+    the next one with a new specification for the same object.  A
+    single reference that exceeds the budget on its own still gets a
+    chunk of its own.
+
+    :param specs: Read access specifications to split.
+    :param max_request: Maximum encoded request bytes per chunk.
+    :param max_response: Maximum estimated response bytes per chunk.
+    :returns: Non-empty list of chunks, each a list of specifications.
+    """
+    chunks: list[list[ReadAccessSpecification]] = []
+    current: list[ReadAccessSpecification] = []
+    request_size = 0
+    response_size = 0
+    for spec in specs:
+        refs: list[PropertyReference] = []
+        for ref in spec.list_of_property_references:
+            req = reference_request_size(ref) + (0 if refs else OBJECT_SPEC_SIZE)
+            resp = reference_response_size(ref) + (0 if refs else OBJECT_RESULT_OVERHEAD)
+            if (current or refs) and (
+                request_size + req > max_request or response_size + resp > max_response
+            ):
+                if refs:
+                    current.append(ReadAccessSpecification(spec.object_identifier, refs))
+                chunks.append(current)
+                current = []
+                refs = []
+                req = reference_request_size(ref) + OBJECT_SPEC_SIZE
+                resp = reference_response_size(ref) + OBJECT_RESULT_OVERHEAD
+                request_size = 0
+                response_size = 0
+            refs.append(ref)
+            request_size += req
+            response_size += resp
+        if refs:
+            current.append(ReadAccessSpecification(spec.object_identifier, refs))
+    if current or not chunks:
+        chunks.append(current)
+    return chunks
+
+
+def halve_read_access_specs(
+    specs: list[ReadAccessSpecification],
+) -> tuple[list[ReadAccessSpecification], list[ReadAccessSpecification]] | None:
+    """Split a chunk into two halves by property reference count.
+
+    :returns: The two halves, or ``None`` if *specs* holds a single
+        property reference and cannot be split further.
+    """
+    total = sum(len(spec.list_of_property_references) for spec in specs)
+    if total < 2:
+        return None
+    budget = total // 2
+    first: list[ReadAccessSpecification] = []
+    second: list[ReadAccessSpecification] = []
+    for spec in specs:
+        refs = spec.list_of_property_references
+        if budget >= len(refs):
+            first.append(spec)
+            budget -= len(refs)
+        elif budget > 0:
+            first.append(ReadAccessSpecification(spec.object_identifier, refs[:budget]))
+            second.append(ReadAccessSpecification(spec.object_identifier, refs[budget:]))
+            budget = 0
+        else:
+            second.append(spec)
+    return first, second
@@ -0,0 +1,110 @@
+"""Per-network bounded device scheduler shared by site scan and fleet backup."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Protocol
+
+from bac_py.services.errors import BACnetTimeoutError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+
+    from bac_py.app.client import DiscoveredDevice
+    from bac_py.app.site_scan import SiteScanCheckpoint
+    from bac_py.types.primitives import ObjectIdentifier
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE = (BACnetTimeoutError, TimeoutError)
+"""Errors after which a device is worth retrying."""
+
+
+class DeviceOutcome(Protocol):
+    """Result of a per-device job, as yielded by :func:`run_per_network`."""
+
+    @property
+    def ok(self) -> bool: ...
+
+
+def object_name(oid: ObjectIdentifier) -> str:
+    """Format *oid* as a ``read_multiple`` result key, e.g. ``"analog-input,1"``."""
+    return f"{oid.object_type.name.lower().replace('_', '-')},{oid.instance_number}"
+
+
+async def run_per_network[R: DeviceOutcome](
+    devices: Iterable[DiscoveredDevice],
+    job: Callable[[DiscoveredDevice], Awaitable[R]],
+    *,
+    max_concurrency: int,
+    max_per_network: int,
+    checkpoint: SiteScanCheckpoint | None = None,
+    name: str = "scheduler",
+) -> AsyncGenerator[R]:
+    """Run *job* for every device, yielding results in completion order.
+
+    At most *max_concurrency* jobs run at once, and at most
+    *max_per_network* on any one BACnet network.  Free slots are handed
+    to the networks round-robin.  Duplicate devices and devices already
+    in *checkpoint* are skipped; devices whose result is ``ok`` are
+    recorded in it.  Jobs still running when the iterator is closed are
+    cancelled.
+
+    :param devices: Devices to run *job* for.
+    :param job: Coroutine function run once per device.
+    :param max_concurrency: Maximum jobs running at once.
+    :param max_per_network: Maximum jobs running at once on one network.
+    :param checkpoint: Checkpoint to skip and record completed devices.
+    :param name: Prefix for log messages.
+    :returns: Async generator of job results.
+    """
+    pending: dict[int | None, deque[DiscoveredDevice]] = {}
+    seen: set[int] = set()
+    for device in devices:
+        if device.instance in seen or (checkpoint is not None and device.instance in checkpoint):
+            continue
+        seen.add(device.instance)
+        pending.setdefault(device.address.network, deque()).append(device)
+    logger.info("%s: %d devices on %d networks", name, len(seen), len(pending))
+
+    networks = deque(pending)
+    active: dict[int | None, int] = dict.fromkeys(pending, 0)
+    running: dict[asyncio.Future[R], tuple[int | None, DiscoveredDevice]] = {}
+
+    def _launch() -> None:
+        while len(running) < max_concurrency:
+            for _ in range(len(networks)):
+                network = networks[0]
+                networks.rotate(-1)
+                if pending[network] and active[network] < max_per_network:
+                    device = pending[network].popleft()
+                    active[network] += 1
+                    running[asyncio.ensure_future(job(device))] = (network, device)
+                    break
+            else:
+                return
+
+    try:
+        _launch()
+        while running:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            finished = []
+            for task in done:
+                network, device = running.pop(task)
+                active[network] -= 1
+                finished.append((task, device))
+            _launch()
+            for task, device in finished:
+                result = task.result()
+                if checkpoint is not None and result.ok:
+                    checkpoint.mark_completed(device.instance)
+                yield result
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if checkpoint is not None:
+            checkpoint.save()
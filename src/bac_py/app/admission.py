@@ -0,0 +1,214 @@
+"""Admission control for inbound service requests.
+
+Every inbound request runs in its own handler task.  The
+:class:`AdmissionController` caps how many of those tasks run at once,
+overall and per source address, and holds further requests in a bounded
+queue.  When the queue is full the request overflows and the application
+answers it according to :class:`OverflowPolicy`.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from bac_py.network.address import BACnetAddress
+
+
+class OverflowPolicy(Enum):
+    """Response to a confirmed request that finds the admission queue full.
+
+    Unconfirmed requests that overflow are always dropped.
+    """
+
+    ABORT = "abort"
+    """Answer with an Abort-PDU carrying ``OUT_OF_RESOURCES``."""
+
+    REJECT = "reject"
+    """Answer with a Reject-PDU carrying ``OTHER``."""
+
+    DROP = "drop"
+    """Send nothing; the client times out and may retry."""
+
+
+@dataclass(frozen=True, slots=True)
+class AdmissionPolicy:
+    """Limits for concurrently running inbound request handlers."""
+
+    max_concurrent: int = 64
+    """Handlers running at once across all sources."""
+
+    max_per_source: int = 16
+    """Handlers running at once for a single source address."""
+
+    max_queue: int = 256
+    """Requests waiting for a handler slot before new ones overflow."""
+
+    overflow: OverflowPolicy = OverflowPolicy.ABORT
+    """How a confirmed request that overflows the queue is answered."""
+
+    def __post_init__(self) -> None:
+        """Validate the limits."""
+        if self.max_concurrent < 1:
+            msg = f"max_concurrent must be >= 1, got {self.max_concurrent}"
+            raise ValueError(msg)
+        if self.max_per_source < 1:
+            msg = f"max_per_source must be >= 1, got {self.max_per_source}"
+            raise ValueError(msg)
+        if self.max_queue < 0:
+            msg = f"max_queue must be >= 0, got {self.max_queue}"
+            raise ValueError(msg)
+
+
+@dataclass
+class AdmissionStats:
+    """Counters for an :class:`AdmissionController`."""
+
+    active: int = 0
+    """Handlers currently running."""
+
+    queue_depth: int = 0
+    """Requests currently waiting for a slot."""
+
+    max_queue_depth: int = 0
+    """Highest queue depth observed."""
+
+    admitted: int = 0
+    """Requests that were given a handler slot."""
+
+    queued: int = 0
+    """Admitted requests that had to wait for their slot."""
+
+    overflowed: int = 0
+    """Requests refused because the queue was full."""
+
+    total_wait: float = 0.0
+    """Cumulative seconds queued requests spent waiting."""
+
+    max_wait: float = 0.0
+    """Longest single queueing delay in seconds."""
+
+    @property
+    def mean_wait(self) -> float:
+        """Average queueing delay of requests that waited, in seconds."""
+        return self.total_wait / self.queued if self.queued else 0.0
+
+
+class AdmissionController:
+    """Grant handler slots to inbound requests.
+
+    A request is started through its *start* callback as soon as a slot
+    is free, and must call :meth:`release` when its handler finishes.
+    Waiting requests are served round-robin across source addresses, so
+    one busy client cannot starve the others.
+
+    :param policy: Concurrency and queue limits.
+    """
+
+    def __init__(self, policy: AdmissionPolicy | None = None) -> None:
+        self._policy = policy or AdmissionPolicy()
+        self._per_source: dict[BACnetAddress, int] = {}
+        # Insertion order doubles as the round-robin ring.
+        self._waiting: dict[BACnetAddress, deque[tuple[Callable[[], None], float]]] = {}
+        self._stats = AdmissionStats()
+
+    @property
+    def policy(self) -> AdmissionPolicy:
+        """The limits in force."""
+        return self._policy
+
+    @property
+    def stats(self) -> AdmissionStats:
+        """Running counters."""
+        return self._stats
+
+    def submit(self, source: BACnetAddress, start: Callable[[], None]) -> bool:
+        """Start a request now or queue it until a slot is free.
+
+        :param source: Address the request came from.
+        :param start: Called once the request holds a slot.
+        :returns: ``False`` if the request overflowed and was not accepted.
+        """
+        stats = self._stats
+        if source not in self._waiting and self._has_slot(source):
+            self._grant(source, start)
+            return True
+        if stats.queue_depth >= self._policy.max_queue:
+            stats.overflowed += 1
+            return False
+        self._waiting.setdefault(source, deque()).append((start, time.monotonic()))
+        stats.queue_depth += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        return True
+
+    def try_acquire(self, source: BACnetAddress) -> bool:
+        """Take a slot for *source* now, without queueing.
+
+        Used for requests run on the receive path.  Fails if no slot is
+        free or *source* already has requests waiting, so they keep
+        their turn.
+
+        :param source: Address the request came from.
+        :returns: ``True`` if a slot was taken; call :meth:`release` once
+            the request finishes.
+        """
+        if source in self._waiting or not self._has_slot(source):
+            return False
+        self._take(source)
+        return True
+
+    def release(self, source: BACnetAddress) -> None:
+        """Free the slot held by a finished request from *source*."""
+        self._stats.active -= 1
+        remaining = self._per_source.get(source, 1) - 1
+        if remaining > 0:
+            self._per_source[source] = remaining
+        else:
+            self._per_source.pop(source, None)
+        self._drain()
+
+    def clear(self) -> None:
+        """Discard all queued requests without starting them."""
+        self._waiting.clear()
+        self._stats.queue_depth = 0
+
+    def _has_slot(self, source: BACnetAddress) -> bool:
+        return (
+            self._stats.active < self._policy.max_concurrent
+            and self._per_source.get(source, 0) < self._policy.max_per_source
+        )
+
+    def _take(self, source: BACnetAddress) -> None:
+        self._stats.active += 1
+        self._stats.admitted += 1
+        self._per_source[source] = self._per_source.get(source, 0) + 1
+
+    def _grant(self, source: BACnetAddress, start: Callable[[], None]) -> None:
+        self._take(source)
+        start()
+
+    def _drain(self) -> None:
+        """Hand free slots to waiting requests, one source at a time."""
+        stats = self._stats
+        while self._waiting and stats.active < self._policy.max_concurrent:
+            for source in self._waiting:
+                if self._has_slot(source):
+                    break
+            else:
+                return
+            queue = self._waiting.pop(source)
+            start, queued_at = queue.popleft()
+            if queue:
+                self._waiting[source] = queue
+            stats.queue_depth -= 1
+            wait = time.monotonic() - queued_at
+            stats.queued += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            self._grant(source, start)
@@ -3,13 +3,18 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
 import struct
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
-from bac_py.app.cov import COVManager
+from bac_py.app.admission import AdmissionController, AdmissionPolicy, OverflowPolicy
+from bac_py.app.cov import COVCoalescing, COVManager
+from bac_py.app.device_cache import DeviceCache, DeviceInfo
 from bac_py.app.event_engine import EventEngine
+from bac_py.app.notification_delivery import DeliveryPolicy, NotificationDelivery
 from bac_py.app.tsm import ClientTSM, ServerTSM
 from bac_py.encoding.apdu import (
     AbortPDU,
@@ -27,7 +32,7 @@ from bac_py.network.layer import NetworkLayer
 from bac_py.network.router import NetworkRouter, RouterPort
 from bac_py.objects.base import ObjectDatabase
 from bac_py.segmentation.manager import compute_max_segment_payload
-from bac_py.services.base import ServiceRegistry
+from bac_py.services.base import ServiceRegistry, run_eagerly
 from bac_py.services.cov import COVNotificationRequest
 from bac_py.services.errors import BACnetAbortError, BACnetError, BACnetRejectError
 from bac_py.transport.bip import BIPTransport
@@ -43,10 +48,12 @@ from bac_py.types.enums import (
 from bac_py.types.primitives import ObjectIdentifier
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Awaitable, Callable, Coroutine, Hashable
 
-    from bac_py.app.tsm import ServerTransaction
+    from bac_py.app.device_cache import DeviceCacheBackend
+    from bac_py.app.tsm import RequestQueueStats, RTTEstimate, ServerTransaction
     from bac_py.network.address import BACnetAddress, BIP6Address, BIPAddress
+    from bac_py.network.pacing import PacingPolicy, PacingRate, PacingStats, SendPacer
     from bac_py.transport.bbmd import BDTEntry
     from bac_py.transport.ethernet import EthernetTransport
     from bac_py.transport.sc import SCTransport, SCTransportConfig
@@ -54,17 +61,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True, slots=True)
-class DeviceInfo:
-    """Cached peer device capabilities from I-Am responses (Clause 19.4)."""
-
-    max_apdu_length: int
-    """Maximum APDU length accepted by the peer device."""
-
-    segmentation_supported: int
-    """Segmentation support level (Segmentation enum value)."""
-
-
 @dataclass
 class BBMDConfig:
     """Configuration for BBMD on a router port."""
@@ -75,6 +71,9 @@ class BBMDConfig:
     If empty, the BBMD starts with an empty BDT (foreign-device-only mode).
     """
 
+    max_fdt_entries: int = 128
+    """Maximum number of registered foreign devices."""
+
 
 @dataclass
 class RouterPortConfig:
@@ -86,6 +85,8 @@ class RouterPortConfig:
     port: int = 0xBAC0
     broadcast_address: str = "255.255.255.255"
     """Directed broadcast address for this port's subnet."""
+    batched_io: bool = False
+    """Drain BACnet/IP datagrams in batches on this port (IPv4 only)."""
     bbmd_config: BBMDConfig | None = None
     ipv6: bool = False
     """Use BACnet/IPv6 (Annex U) transport for this port."""
@@ -108,6 +109,10 @@ class RouterConfig:
     ports: list[RouterPortConfig] = field(default_factory=list)
     application_port_id: int = 1
 
+    fast_forwarding: bool = True
+    """Forward routed APDUs by rewriting the NPCI bytes instead of decoding
+    and re-encoding each NPDU.  See :class:`~bac_py.network.router.NetworkRouter`."""
+
 
 @dataclass
 class DeviceConfig:
@@ -155,6 +160,70 @@ class DeviceConfig:
     max_segments: int | None = None
     """Maximum segments accepted, or ``None`` for unlimited."""
 
+    max_outstanding_per_peer: int | None = None
+    """Maximum concurrent confirmed requests to a single peer, or ``None``
+    for no limit. Requests beyond the limit are queued FIFO. Per-device and
+    per-network overrides are set with
+    :meth:`BACnetApplication.set_request_limit`."""
+
+    adaptive_apdu_timeout: bool = False
+    """Derive each peer's APDU timeout from measured round-trip times
+    instead of using :attr:`apdu_timeout` for every device.  Fast local
+    devices then fail over quickly while slow routed devices get longer
+    timeouts."""
+
+    min_apdu_timeout: int = 250  # milliseconds
+    """Lower bound in milliseconds for adaptive APDU timeouts."""
+
+    max_apdu_timeout: int | None = None  # milliseconds
+    """Upper bound in milliseconds for adaptive APDU timeouts, including
+    retry backoff.  ``None`` uses :attr:`apdu_timeout`."""
+
+    device_cache_backend: DeviceCacheBackend | None = None
+    """Persistent store for the peer device cache (e.g.
+    :class:`~bac_py.app.device_cache.SQLiteDeviceCacheBackend`).  When set,
+    cached device capabilities, object lists and failures are loaded on
+    start and flushed periodically and on stop.  ``None`` keeps the cache
+    in memory only."""
+
+    device_cache_size: int = 1000
+    """Maximum peer devices kept in the device cache (least recently used
+    devices are evicted first)."""
+
+    device_cache_flush_interval: float = 30.0
+    """Seconds between incremental flushes of the device cache to
+    :attr:`device_cache_backend`.  ``0`` flushes only on stop."""
+
+    change_driven_events: bool = False
+    """Evaluate intrinsic event reporting only for objects whose monitored
+    properties were written or whose time delay expired, instead of
+    scanning every object each cycle.  See
+    :class:`~bac_py.app.event_engine.EventEngine`."""
+
+    cov_coalescing: COVCoalescing | None = None
+    """Coalesce COV notifications per subscriber and deliver them in
+    batches, as COVNotificationMultiple where the subscriber supports it.
+    ``None`` sends every change immediately.  See
+    :class:`~bac_py.app.cov.COVCoalescing`."""
+
+    notification_delivery: DeliveryPolicy = field(default_factory=DeliveryPolicy)
+    """Per-recipient in-flight window, queue size, and circuit-breaker
+    backoff for confirmed COV and event notifications.  See
+    :class:`~bac_py.app.notification_delivery.NotificationDelivery`."""
+
+    admission: AdmissionPolicy | None = None
+    """Limits on concurrently running inbound request handlers, overall
+    and per source, and how confirmed requests are answered once the
+    admission queue is full.  ``None`` runs every request at once, without
+    limits.  See :class:`~bac_py.app.admission.AdmissionController`."""
+
+    send_pacing: PacingPolicy | None = None
+    """Token-bucket rate limits for sends to remote networks, per DNET and
+    per router MAC, so bursts do not overrun slow trunks behind IP routers.
+    ``None`` sends immediately.  An unset :attr:`PacingPolicy.max_delay
+    <bac_py.network.pacing.PacingPolicy.max_delay>` defaults to
+    :attr:`apdu_timeout`.  See :class:`~bac_py.network.pacing.SendPacer`."""
+
     router_config: RouterConfig | None = None
     """Optional router configuration for multi-network mode."""
 
@@ -164,6 +233,16 @@ class DeviceConfig:
     (e.g. ``"192.168.1.255"``) when running in Docker bridge networks
     where global broadcast is not routable."""
 
+    batched_io: bool = False
+    """Drain BACnet/IP datagrams from the socket in batches instead of one
+    per event-loop wakeup.  Helps under Who-Is storms and BBMD fan-out.
+    IPv4 only; see :class:`~bac_py.transport.bip.BIPTransport`."""
+
+    reuse_port: bool = False
+    """Bind the BACnet/IP socket with ``SO_REUSEPORT`` so several processes
+    can share :attr:`port`.  Set by :class:`~bac_py.app.sharding.ShardSupervisor`
+    for its workers.  IPv4 only."""
+
     password: str | None = None
     """Optional password for DeviceCommunicationControl and ReinitializeDevice
     services (1-20 characters, per Clause 16.1.3.1 and 16.4.3.4).
@@ -269,7 +348,16 @@ class BACnetApplication:
         self._cov_callbacks: dict[int, Callable[..., Any]] = {}
         self._dcc_state: EnableDisable = EnableDisable.ENABLE
         self._dcc_timer: asyncio.TimerHandle | None = None
-        self._device_info_cache: dict[BACnetAddress, DeviceInfo] = {}
+        self._dcc_listeners: list[Callable[[EnableDisable], None]] = []
+        self._device_cache = DeviceCache(
+            config.device_cache_backend, max_entries=config.device_cache_size
+        )
+        self._notification_delivery = NotificationDelivery(
+            self.confirmed_request, config.notification_delivery
+        )
+        self._admission = (
+            AdmissionController(config.admission) if config.admission is not None else None
+        )
 
     @property
     def object_db(self) -> ObjectDatabase:
@@ -286,6 +374,30 @@ class BACnetApplication:
         """The device configuration."""
         return self._config
 
+    @property
+    def admission(self) -> AdmissionController | None:
+        """Admission control for inbound request handlers, or ``None`` if off."""
+        return self._admission
+
+    @property
+    def notification_delivery(self) -> NotificationDelivery:
+        """Queues for outgoing confirmed COV and event notifications."""
+        return self._notification_delivery
+
+    def response_limit(self, source: BACnetAddress) -> int | None:
+        """Return the largest confirmed-service ACK *source* can receive.
+
+        Service handlers use this to size responses that may be cut short,
+        such as ReadRange.
+
+        :param source: Address of a client whose request is being handled.
+        :returns: Maximum service-ack length in bytes, or ``None`` if the
+            client set no limit or no request from it is in progress.
+        """
+        if self._server_tsm is None:
+            return None
+        return self._server_tsm.response_limit(source)
+
     @property
     def cov_manager(self) -> COVManager | None:
         """The COV subscription manager, or None if not started."""
@@ -326,6 +438,30 @@ class BACnetApplication:
                 duration * 60,
                 self._dcc_timer_expired,
             )
+        self._notify_dcc_listeners()
+
+    def register_dcc_listener(self, listener: Callable[[EnableDisable], None]) -> None:
+        """Register a callback fired whenever the DCC state is set.
+
+        Called with the new state after :meth:`set_dcc_state` and when a
+        DCC duration expires.
+
+        :param listener: Function to call with the new :class:`EnableDisable`.
+        """
+        self._dcc_listeners.append(listener)
+
+    def unregister_dcc_listener(self, listener: Callable[[EnableDisable], None]) -> None:
+        """Remove a callback added with :meth:`register_dcc_listener`."""
+        with contextlib.suppress(ValueError):
+            self._dcc_listeners.remove(listener)
+
+    def _notify_dcc_listeners(self) -> None:
+        """Pass the current DCC state to every DCC listener."""
+        for listener in list(self._dcc_listeners):
+            try:
+                listener(self._dcc_state)
+            except Exception:
+                logger.exception("DCC listener failed")
 
     @property
     def device_object_identifier(self) -> Any:
@@ -346,7 +482,118 @@ class BACnetApplication:
         :param address: The peer device address.
         :returns: Cached device info, or ``None``.
         """
-        return self._device_info_cache.get(address)
+        return self._device_cache.get_device_info(address)
+
+    @property
+    def device_cache(self) -> DeviceCache:
+        """Cache of peer device capabilities, object lists and failures."""
+        return self._device_cache
+
+    def set_request_limit(
+        self,
+        limit: int | None,
+        *,
+        address: BACnetAddress | None = None,
+        network: int | None = None,
+        local_network: bool = False,
+    ) -> None:
+        """Limit concurrent confirmed requests to a device or network.
+
+        Use this to keep slow trunks (e.g. MS/TP behind a router) from
+        being flooded by bursts of concurrent requests.  See
+        :meth:`ClientTSM.set_request_limit <bac_py.app.tsm.ClientTSM.set_request_limit>`
+        for how scopes are resolved.
+
+        :param limit: Maximum concurrent requests, or ``None`` to remove
+            the limit for the given scope.
+        :param address: Apply the limit to this device only.
+        :param network: Apply a shared limit to every device on this
+            network number.
+        :param local_network: Apply a shared limit to every device on the
+            local network.
+        :raises RuntimeError: If the application is not started.
+        """
+        if self._client_tsm is None:
+            msg = "Application not started"
+            raise RuntimeError(msg)
+        self._client_tsm.set_request_limit(
+            limit, address=address, network=network, local_network=local_network
+        )
+
+    @property
+    def request_queue_stats(self) -> RequestQueueStats | None:
+        """Queueing counters for outstanding-request limits, or ``None`` if not started."""
+        if self._client_tsm is None:
+            return None
+        return self._client_tsm.queue_stats
+
+    def _send_pacer(self) -> SendPacer | None:
+        network = self._router or self._network
+        return network.pacer if network is not None else None
+
+    def _pacing_policy(self) -> PacingPolicy | None:
+        """Return the configured pacing policy with queue delay capped.
+
+        Requests are timed from when they are handed to the network layer,
+        so an NPDU queued past the APDU timeout would only go out after
+        its transaction has retried.
+        """
+        policy = self._config.send_pacing
+        if policy is None or policy.max_delay is not None:
+            return policy
+        return replace(policy, max_delay=self._config.apdu_timeout / 1000)
+
+    def set_send_rate(
+        self,
+        rate: PacingRate | None,
+        *,
+        network: int | None = None,
+        router: BACnetAddress | None = None,
+    ) -> None:
+        """Change the outbound rate for a remote network or router.
+
+        Requires :attr:`DeviceConfig.send_pacing` to be set.
+
+        :param rate: New rate, or ``None`` to fall back to the policy
+            default.
+        :param network: Destination network number to pace.
+        :param router: Address of the router to pace (its MAC is used).
+        :raises RuntimeError: If the application is not started or
+            pacing is not enabled.
+        :raises ValueError: If neither or both of *network* and *router*
+            are given.
+        """
+        pacer = self._send_pacer()
+        if pacer is None:
+            msg = "Send pacing is not enabled"
+            raise RuntimeError(msg)
+        if (network is None) == (router is None):
+            msg = "Specify exactly one of network or router"
+            raise ValueError(msg)
+        if network is not None:
+            pacer.set_network_rate(network, rate)
+        elif router is not None:
+            pacer.set_router_rate(router.mac_address, rate)
+
+    @property
+    def send_pacing_stats(self) -> dict[int, PacingStats] | None:
+        """Pacing counters per destination network, or ``None`` if pacing is off."""
+        pacer = self._send_pacer()
+        return pacer.all_stats() if pacer is not None else None
+
+    def get_rtt_estimate(self, address: BACnetAddress) -> RTTEstimate | None:
+        """Return the measured round-trip estimate for a peer device.
+
+        Estimates are only collected when
+        :attr:`DeviceConfig.adaptive_apdu_timeout` is enabled.
+
+        :param address: The peer device address.
+        :returns: The current estimate, or ``None`` if the peer has not
+            been measured or the application is not started.
+        """
+        if self._client_tsm is None:
+            return None
+        return self._client_tsm.rtt_estimate(address)
 
     async def start(self) -> None:
         """Start the transport and initialize all layers."""
@@ -378,6 +625,14 @@ class BACnetApplication:
             max_apdu_length=self._config.max_apdu_length,
             max_segments=self._config.max_segments,
             segment_timeout=segment_timeout,
+            max_outstanding_per_peer=self._config.max_outstanding_per_peer,
+            adaptive_timeout=self._config.adaptive_apdu_timeout,
+            min_apdu_timeout=self._config.min_apdu_timeout / 1000,
+            max_apdu_timeout=(
+                self._config.max_apdu_timeout / 1000
+                if self._config.max_apdu_timeout is not None
+                else None
+            ),
         )
         self._server_tsm = ServerTSM(
             network,
@@ -388,24 +643,32 @@ class BACnetApplication:
         self._running = True
 
         # Initialize COV manager and register notification handlers
-        self._cov_manager = COVManager(self)
+        self._cov_manager = COVManager(self, coalescing=self._config.cov_coalescing)
         self._service_registry.register_confirmed(
             ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION,
             self._handle_confirmed_cov_notification,
+            inline=True,
         )
         self._service_registry.register_unconfirmed(
             UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
             self._handle_unconfirmed_cov_notification,
+            inline=True,
         )
 
         # Initialize event engine and start evaluation loop
-        self._event_engine = EventEngine(self)
+        self._event_engine = EventEngine(self, change_driven=self._config.change_driven_events)
         await self._event_engine.start()
 
+        if self._device_cache.backend is not None:
+            self._device_cache.load()
+            if self._config.device_cache_flush_interval > 0:
+                self._spawn_task(self._flush_device_cache_loop())
+
         # Register I-Am listener for device info caching (Clause 19.4)
         self._service_registry.register_unconfirmed(
             UnconfirmedServiceChoice.I_AM,
             self._handle_i_am_for_cache,
+            inline=True,
         )
 
         # Broadcast I-Am on startup per Clause 12.11.13
@@ -428,7 +691,7 @@ class BACnetApplication:
                 multicast_address=mcast,
                 vmac=self._config.vmac,
             )
-            self._network = NetworkLayer(self._transport)
+            self._network = NetworkLayer(self._transport, pacing=self._pacing_policy())
             self._network.on_receive(self._on_apdu_received)
             await self._transport.start()
         else:
@@ -436,8 +699,10 @@ class BACnetApplication:
                 interface=self._config.interface,
                 port=self._config.port,
                 broadcast_address=self._config.broadcast_address,
+                batched_io=self._config.batched_io,
+                reuse_port=self._config.reuse_port,
             )
-            self._network = NetworkLayer(self._transport)
+            self._network = NetworkLayer(self._transport, pacing=self._pacing_policy())
             self._network.on_receive(self._on_apdu_received)
             await self._transport.start()
 
@@ -449,7 +714,11 @@ class BACnetApplication:
         assert sc_config is not None  # guaranteed by caller
         transport = SCTransport(sc_config)
         self._transport = transport
-        self._network = NetworkLayer(transport, network_number=sc_config.network_number)
+        self._network = NetworkLayer(
+            transport,
+            network_number=sc_config.network_number,
+            pacing=self._pacing_policy(),
+        )
         self._network.on_receive(self._on_apdu_received)
         await transport.start()
         if sc_config.primary_hub_uri:
@@ -472,7 +741,7 @@ class BACnetApplication:
             mac_address=self._config.ethernet_mac,
         )
         self._transport = transport
-        self._network = NetworkLayer(transport)
+        self._network = NetworkLayer(transport, pacing=self._pacing_policy())
         self._network.on_receive(self._on_apdu_received)
         await transport.start()
 
@@ -524,13 +793,17 @@ class BACnetApplication:
                     interface=pc.interface,
                     port=pc.port,
                     broadcast_address=pc.broadcast_address,
+                    batched_io=pc.batched_io,
                 )
                 await transport.start()
             self._transports.append(transport)
 
             # Attach BBMD if configured for this port (BIP/BIP6 only)
             if pc.bbmd_config is not None and hasattr(transport, "attach_bbmd"):
-                await transport.attach_bbmd(pc.bbmd_config.bdt_entries or None)  # type: ignore[arg-type]
+                await transport.attach_bbmd(
+                    pc.bbmd_config.bdt_entries or None,  # type: ignore[arg-type]
+                    max_fdt_entries=pc.bbmd_config.max_fdt_entries,
+                )
 
             port = RouterPort(
                 port_id=pc.port_id,
@@ -544,6 +817,8 @@ class BACnetApplication:
             ports,
             application_port_id=self._config.router_config.application_port_id,
             application_callback=self._on_apdu_received,
+            pacing=self._pacing_policy(),
+            fast_forwarding=self._config.router_config.fast_forwarding,
         )
         await self._router.start()
 
@@ -567,6 +842,10 @@ class BACnetApplication:
             self._cov_manager.shutdown()
             self._cov_manager = None
 
+        await self._notification_delivery.close()
+        if self._admission is not None:
+            self._admission.clear()
+
         # Cancel DCC timer
         if self._dcc_timer is not None:
             self._dcc_timer.cancel()
@@ -592,11 +871,21 @@ class BACnetApplication:
         if self._router:
             await self._router.stop()
         elif self._transport:
+            if self._network is not None and self._network.pacer is not None:
+                self._network.pacer.close()
             await self._transport.stop()
 
+        # Persist what was learned about peers before dropping it
+        if self._device_cache.backend is not None:
+            try:
+                self._device_cache.flush()
+            except Exception:
+                logger.warning("Failed to flush device cache", exc_info=True)
+            self._device_cache.backend.close()
+
         # Clear caches and listener registrations to release references
         self._unconfirmed_listeners.clear()
-        self._device_info_cache.clear()
+        self._device_cache.clear()
         self._running = False
         logger.info("BACnetApplication stopped")
 
@@ -870,14 +1159,12 @@ class BACnetApplication:
             from bac_py.services.who_is import IAmRequest
 
             iam = IAmRequest.decode(data)
-            # Evict oldest entries if cache exceeds limit to prevent unbounded growth
-            if len(self._device_info_cache) >= 1000:
-                # Remove first 100 entries (FIFO order preserved in Python 3.7+ dicts)
-                for evict_key in list(self._device_info_cache)[:100]:
-                    del self._device_info_cache[evict_key]
-            self._device_info_cache[source] = DeviceInfo(
+            self._device_cache.update_from_i_am(
+                source,
+                device_instance=iam.object_identifier.instance_number,
                 max_apdu_length=iam.max_apdu_length,
                 segmentation_supported=int(iam.segmentation_supported),
+                vendor_id=iam.vendor_id,
             )
             logger.debug(
                 "cached device info: instance=%s max_apdu=%d from %s",
@@ -888,6 +1175,16 @@ class BACnetApplication:
         except Exception:
             logger.debug("Failed to decode I-Am for cache from %s", source, exc_info=True)
 
+    async def _flush_device_cache_loop(self) -> None:
+        """Periodically write device cache changes to its backend."""
+        interval = self._config.device_cache_flush_interval
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self._device_cache.flush()
+            except Exception:
+                logger.warning("Failed to flush device cache", exc_info=True)
+
     async def confirmed_request(
         self,
         destination: BACnetAddress,
@@ -915,7 +1212,7 @@ class BACnetApplication:
 
         # Constrain APDU size to peer capability if cached (Clause 19.4)
         max_apdu_override: int | None = None
-        device_info = self._device_info_cache.get(destination)
+        device_info = self._device_cache.get_device_info(destination)
         if device_info is not None:
             max_apdu_override = min(self._config.max_apdu_length, device_info.max_apdu_length)
 
@@ -925,9 +1222,14 @@ class BACnetApplication:
             destination,
             max_apdu_override=max_apdu_override,
         )
-        if timeout is not None:
-            return await asyncio.wait_for(coro, timeout)
-        return await coro
+        try:
+            if timeout is not None:
+                return await asyncio.wait_for(coro, timeout)
+            return await coro
+        except BACnetRejectError as exc:
+            if exc.reason == RejectReason.UNRECOGNIZED_SERVICE:
+                self._device_cache.mark_service_failed(destination, service_choice)
+            raise
 
     def unconfirmed_request(
         self,
@@ -966,43 +1268,49 @@ class BACnetApplication:
         apdu_bytes = encode_apdu(pdu)
         network.send(apdu_bytes, destination, expecting_reply=False)
 
-    def send_confirmed_cov_notification(
+    def send_confirmed_notification(
         self,
         service_data: bytes,
         destination: BACnetAddress,
         service_choice: int,
+        *,
+        key: Hashable | None = None,
     ) -> None:
-        """Send a confirmed COV notification (fire-and-forget).
+        """Queue a confirmed notification without awaiting its response.
 
-        Unlike ``confirmed_request``, this does not await a response.
-        COV notifications are best-effort; failures are logged but
-        do not propagate.
+        Notifications are delivered through the per-recipient window of
+        :attr:`notification_delivery`.  Failures are counted and logged
+        but do not propagate.
 
         :param service_data: Encoded service request bytes.
         :param destination: Target device address.
         :param service_choice: Confirmed service choice number.
+        :param key: Optional identity of the reported object; a queued
+            notification with the same key is replaced by this one.
         """
-        self._spawn_task(self._send_confirmed_cov(service_data, destination, service_choice))
+        self._notification_delivery.submit(destination, service_choice, service_data, key=key)
 
-    async def _send_confirmed_cov(
+    def send_confirmed_cov_notification(
         self,
         service_data: bytes,
         destination: BACnetAddress,
         service_choice: int,
+        *,
+        key: Hashable | None = None,
     ) -> None:
-        """Background task to send a confirmed COV notification."""
-        try:
-            await self.confirmed_request(
-                destination=destination,
-                service_choice=service_choice,
-                service_data=service_data,
-            )
-        except Exception:
-            logger.debug(
-                "Confirmed COV notification to %s failed",
-                destination,
-                exc_info=True,
-            )
+        """Queue a confirmed COV notification (fire-and-forget).
+
+        Unlike ``confirmed_request``, this does not await a response.
+        COV notifications are best-effort; see
+        :meth:`send_confirmed_notification`.
+
+        :param service_data: Encoded service request bytes.
+        :param destination: Target device address.
+        :param service_choice: Confirmed service choice number.
+        :param key: Optional identity of the reported object; a queued
+            notification with the same key is replaced by this one.
+        """
+        self.send_confirmed_notification(service_data, destination, service_choice, key=key)
 
     # --- COV callback management ---
 
@@ -1063,6 +1371,7 @@ class BACnetApplication:
         self._dcc_state = EnableDisable.ENABLE
         self._dcc_timer = None
         logger.info("DCC timer expired, communication re-enabled")
+        self._notify_dcc_listeners()
 
     # Services allowed when DCC is DISABLE (per Clause 16.1)
     _DCC_ALLOWED_SERVICES: frozenset[int] = frozenset(
@@ -1089,10 +1398,29 @@ class BACnetApplication:
         if isinstance(pdu, ConfirmedRequestPDU):
             if pdu.segmented:
                 self._handle_segmented_request(pdu, source)
-            else:
-                self._spawn_task(self._handle_confirmed_request(pdu, source))
+            elif self._service_registry.is_inline_confirmed(pdu.service_choice):
+                if not self._run_inline(
+                    source, partial(self._handle_confirmed_request, pdu, source)
+                ):
+                    self._refuse_confirmed_request(pdu.invoke_id, source)
+            elif not self._admit(source, partial(self._handle_confirmed_request, pdu, source)):
+                self._refuse_confirmed_request(pdu.invoke_id, source)
         elif isinstance(pdu, UnconfirmedRequestPDU):
-            self._spawn_task(self._handle_unconfirmed_request(pdu, source))
+            registry = self._service_registry
+            handler = partial(self._handle_unconfirmed_request, pdu, source)
+            if registry.is_inline_unconfirmed(pdu.service_choice) or not (
+                registry.has_unconfirmed_handler(pdu.service_choice)
+            ):
+                # Only an inline handler or synchronous listeners will run
+                admitted = self._run_inline(source, handler)
+            else:
+                admitted = self._admit(source, handler)
+            if not admitted:
+                logger.debug(
+                    "Admission queue full: dropped unconfirmed service %d from %s",
+                    pdu.service_choice,
+                    source,
+                )
         elif isinstance(pdu, SimpleAckPDU):
             if self._client_tsm:
                 self._client_tsm.handle_simple_ack(source, pdu.invoke_id, pdu.service_choice)
@@ -1144,7 +1472,98 @@ class BACnetApplication:
         txn, service_data = result
         if service_data is not None:
             # All segments received, dispatch to service handler
-            self._spawn_task(self._dispatch_request(txn, pdu.service_choice, service_data, source))
+            handler = partial(
+                self._dispatch_request, txn, pdu.service_choice, service_data, source
+            )
+            if not self._admit(source, handler):
+                response = self._refuse_confirmed_request(txn.invoke_id, source, reply=True)
+                if response is not None:
+                    self._server_tsm.complete_transaction(txn, response)
+
+    def _run_inline(
+        self, source: BACnetAddress, handler: Callable[[], Coroutine[Any, Any, None]]
+    ) -> bool:
+        """Run a request handler on the receive path.
+
+        Handlers registered inline normally finish without suspending, so
+        no task is created.  With admission control on, the handler still
+        holds a slot while it runs: if one suspends, the remainder continues
+        in a background task that keeps the slot until it finishes.  When
+        no slot is free the request goes through :meth:`_admit` instead.
+
+        :returns: ``False`` if the admission queue overflowed.
+        """
+        admission = self._admission
+        if admission is not None and not admission.try_acquire(source):
+            return self._admit(source, handler)
+        rest: Any
+        try:
+            done, rest = run_eagerly(handler())
+        except Exception as exc:
+            if admission is not None:
+                admission.release(source)
+            logger.error("Inline request handling failed: %s", exc, exc_info=exc)
+            return True
+        if not done:
+            self._spawn_task(self._run_admitted(source, lambda: rest))
+        elif admission is not None:
+            admission.release(source)
+        return True
+
+    def _admit(self, source: BACnetAddress, handler: Callable[[], Awaitable[None]]) -> bool:
+        """Run *handler* in a background task once admission control allows.
+
+        :returns: ``False`` if the admission queue overflowed.
+        """
+        if self._admission is None:
+            self._spawn_task(handler())
+            return True
+        return self._admission.submit(
+            source, lambda: self._spawn_task(self._run_admitted(source, handler))
+        )
+
+    async def _run_admitted(
+        self, source: BACnetAddress, handler: Callable[[], Awaitable[None]]
+    ) -> None:
+        """Run an admitted request handler and release its slot."""
+        try:
+            await handler()
+        finally:
+            if self._admission is not None:
+                self._admission.release(source)
+
+    def _refuse_confirmed_request(
+        self, invoke_id: int, source: BACnetAddress, *, reply: bool = False
+    ) -> bytes | None:
+        """Answer a confirmed request that overflowed the admission queue.
+
+        :param invoke_id: Invoke ID of the refused request.
+        :param source: Requesting device.
+        :param reply: Answer even under :attr:`OverflowPolicy.DROP`, for
+            requests the server TSM already holds a transaction for.
+        :returns: The encoded response sent, or ``None`` if dropped.
+        """
+        policy = (
+            self._admission.policy.overflow
+            if self._admission is not None
+            else OverflowPolicy.ABORT
+        )
+        logger.debug("Admission queue full: %s confirmed request from %s", policy.value, source)
+        network = self._router or self._network
+        if network is None or (policy is OverflowPolicy.DROP and not reply):
+            return None
+        response_pdu: RejectPDU | AbortPDU
+        if policy is OverflowPolicy.REJECT:
+            response_pdu = RejectPDU(invoke_id=invoke_id, reject_reason=RejectReason.OTHER)
+        else:
+            response_pdu = AbortPDU(
+                sent_by_server=True,
+                invoke_id=invoke_id,
+                abort_reason=AbortReason.OUT_OF_RESOURCES,
+            )
+        response = encode_apdu(response_pdu)
+        network.send(response, source, expecting_reply=False)
+        return response
 
     async def _handle_confirmed_request(
         self,
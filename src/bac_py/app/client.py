@@ -6,9 +6,18 @@ import asyncio
 import contextlib
 import enum
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from bac_py.app._gather import gather_or_cancel
+from bac_py.app._rpm_batching import (
+    OVERSIZE_ABORT_REASONS,
+    halve_read_access_specs,
+    rpm_size_limits,
+    split_read_access_specs,
+)
+from bac_py.app.device_cache import DeviceRecord
+from bac_py.app.file_transfer import DEFAULT_WINDOW
 from bac_py.encoding.primitives import (
     decode_all_application_values,
     decode_and_unwrap,
@@ -51,6 +60,7 @@ from bac_py.services.device_mgmt import (
     TimeSynchronizationRequest,
     UTCTimeSynchronizationRequest,
 )
+from bac_py.services.errors import BACnetError, BACnetRejectError
 from bac_py.services.event_notification import (
     AcknowledgeAlarmRequest,
     EventNotificationRequest,
@@ -74,6 +84,7 @@ from bac_py.services.private_transfer import (
 )
 from bac_py.services.read_property import ReadPropertyACK, ReadPropertyRequest
 from bac_py.services.read_property_multiple import (
+    ReadAccessResult,
     ReadAccessSpecification,
     ReadPropertyMultipleACK,
     ReadPropertyMultipleRequest,
@@ -105,16 +116,19 @@ from bac_py.services.write_property_multiple import (
     WritePropertyMultipleRequest,
 )
 from bac_py.types.enums import (
+    AbortReason,
     AcknowledgmentFilter,
     BackupAndRestoreState,
     ConfirmedServiceChoice,
     EnableDisable,
+    ErrorCode,
     EventState,
     EventType,
     MessagePriority,
     ObjectType,
     PropertyIdentifier,
     ReinitializedState,
+    RejectReason,
     Segmentation,
     UnconfirmedServiceChoice,
     VTClass,
@@ -123,9 +137,11 @@ from bac_py.types.parsing import parse_object_identifier, parse_property_identif
 from bac_py.types.primitives import BACnetDate, BACnetTime, ObjectIdentifier
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Callable, Iterable, Sequence
 
     from bac_py.app.application import BACnetApplication
+    from bac_py.app.file_transfer import FileSink, FileSource
+    from bac_py.app.site_scan import SiteScanCheckpoint, SiteScanResult
     from bac_py.network.address import BACnetAddress
     from bac_py.transport.bip import BIPTransport
     from bac_py.types.audit_types import (
@@ -262,6 +278,39 @@ class BackupData:
     """List of (file_object_id, file_data) tuples."""
 
 
+@dataclass(slots=True)
+class ObjectListProgress:
+    """Progress of an element-by-element ``object-list`` read.
+
+    Pass the same instance to repeated
+    :meth:`BACnetClient.get_object_list` calls to resume a read that
+    was interrupted (e.g. by a timeout) instead of starting over.
+    """
+
+    count: int | None = None
+    """Array length read from ``object-list[0]``, or ``None`` if not yet read."""
+
+    elements: dict[int, ObjectIdentifier | None] = field(default_factory=dict)
+    """Elements read so far, keyed by array index.  ``None`` marks an index
+    that returned an error or a non-identifier value."""
+
+    @property
+    def missing(self) -> list[int]:
+        """Array indices that have not been read yet."""
+        if self.count is None:
+            return []
+        return [i for i in range(1, self.count + 1) if i not in self.elements]
+
+    @property
+    def complete(self) -> bool:
+        """Whether every element has been read."""
+        return self.count is not None and not self.missing
+
+    def object_list(self) -> list[ObjectIdentifier]:
+        """Return the identifiers read so far, in array order."""
+        return [oid for _, oid in sorted(self.elements.items()) if oid is not None]
+
+
 def decode_cov_values(notification: COVNotificationRequest) -> dict[str, object]:
     """Decode COV notification property values to a Python dict.
 
@@ -351,6 +400,11 @@ class BACnetClient:
         """
         self._app = app
 
+    @property
+    def app(self) -> BACnetApplication:
+        """The application requests are sent through."""
+        return self._app
+
     async def read_property(
         self,
         address: BACnetAddress,
@@ -380,12 +434,19 @@ class BACnetClient:
             property_identifier=property_identifier,
             property_array_index=array_index,
         )
-        response_data = await self._app.confirmed_request(
-            destination=address,
-            service_choice=ConfirmedServiceChoice.READ_PROPERTY,
-            service_data=request.encode(),
-            timeout=timeout,
-        )
+        try:
+            response_data = await self._app.confirmed_request(
+                destination=address,
+                service_choice=ConfirmedServiceChoice.READ_PROPERTY,
+                service_data=request.encode(),
+                timeout=timeout,
+            )
+        except BACnetError as exc:
+            if exc.error_code == ErrorCode.UNKNOWN_PROPERTY:
+                self._app.device_cache.mark_property_failed(
+                    address, object_identifier, property_identifier
+                )
+            raise
         return ReadPropertyACK.decode(response_data)
 
     async def write_property(
@@ -669,12 +730,25 @@ class BACnetClient:
             list[str | int | PropertyIdentifier],
         ],
         timeout: float | None = None,
+        *,
+        max_concurrency: int = 4,
     ) -> dict[str, dict[str, object]]:
         """Read multiple properties from multiple objects.
 
         Convenience wrapper around :meth:`read_property_multiple` that
         accepts a simplified dict format and returns decoded Python values.
 
+        The request is split into as many ReadPropertyMultiple requests
+        as needed for each request and its estimated response to fit
+        the peer's max APDU length and segmentation support, taken from
+        its cached I-Am (see
+        :meth:`~bac_py.app.application.BACnetApplication.get_device_info`).
+        Peers without cached info are assumed to accept the local max
+        APDU without segmentation.  The requests run concurrently and
+        their results are merged.  If the peer still aborts a request
+        because its response is too large, that request is retried in
+        two halves.
+
         :param address: Target device (e.g. ``"192.168.1.100"``).
         :param specs: Mapping of object identifiers to lists of property
             identifiers. Example::
@@ -684,7 +758,10 @@ class BACnetClient:
                     "ai,2": ["pv", "status"],
                 }
 
-        :param timeout: Optional caller-level timeout in seconds.
+        :param timeout: Optional caller-level timeout in seconds, applied
+            to each ReadPropertyMultiple request.
+        :param max_concurrency: Maximum ReadPropertyMultiple requests in
+            flight at once when the read is split.
         :returns: Nested dict mapping object ID strings to property name/value
             dicts. Property values are decoded to native Python types.
             Properties that returned errors have ``None`` as their value.
@@ -719,27 +796,71 @@ class BACnetClient:
                 )
             )
 
-        ack = await self.read_property_multiple(addr, access_specs, timeout=timeout)
+        config = self._app.config
+        max_request, max_response = rpm_size_limits(
+            config.max_apdu_length,
+            self._app.get_device_info(addr),
+            max_segments=config.max_segments,
+        )
+        chunks = split_read_access_specs(access_specs, max_request, max_response)
+        if len(chunks) == 1:
+            access_results = await self._read_rpm_chunk(addr, chunks[0], timeout)
+        else:
+            logger.debug("read_multiple split into %d requests to %s", len(chunks), addr)
+            semaphore = asyncio.Semaphore(max_concurrency)
+
+            async def _run(chunk: list[ReadAccessSpecification]) -> list[ReadAccessResult]:
+                async with semaphore:
+                    return await self._read_rpm_chunk(addr, chunk, timeout)
+
+            chunk_results = await gather_or_cancel([_run(chunk) for chunk in chunks])
+            access_results = [r for results in chunk_results for r in results]
 
         result: dict[str, dict[str, object]] = {}
-        for access_result in ack.list_of_read_access_results:
+        for access_result in access_results:
             obj_type = access_result.object_identifier.object_type
             instance = access_result.object_identifier.instance_number
             obj_key_str = f"{obj_type.name.lower().replace('_', '-')},{instance}"
 
-            props: dict[str, object] = {}
+            props = result.setdefault(obj_key_str, {})
             for elem in access_result.list_of_results:
                 prop_name = elem.property_identifier.name.lower().replace("_", "-")
                 if elem.property_access_error is not None:
+                    if elem.property_access_error[1] == ErrorCode.UNKNOWN_PROPERTY:
+                        self._app.device_cache.mark_property_failed(
+                            addr, access_result.object_identifier, elem.property_identifier
+                        )
                     props[prop_name] = None
                 elif elem.property_value is not None and elem.property_value:
                     props[prop_name] = decode_and_unwrap(elem.property_value)
                 else:
                     props[prop_name] = None
-            result[obj_key_str] = props
 
         return result
 
+    async def _read_rpm_chunk(
+        self,
+        address: BACnetAddress,
+        access_specs: list[ReadAccessSpecification],
+        timeout: float | None,
+    ) -> list[ReadAccessResult]:
+        """Read one chunk of :meth:`read_multiple`, halving it on oversize aborts."""
+        from bac_py.services.errors import BACnetAbortError
+
+        try:
+            ack = await self.read_property_multiple(address, access_specs, timeout=timeout)
+        except BACnetAbortError as exc:
+            if exc.reason not in OVERSIZE_ABORT_REASONS:
+                raise
+            halves = halve_read_access_specs(access_specs)
+            if halves is None:
+                raise
+            logger.debug("RPM to %s aborted (%s), retrying in two halves", address, exc.reason)
+            first = await self._read_rpm_chunk(address, halves[0], timeout)
+            second = await self._read_rpm_chunk(address, halves[1], timeout)
+            return first + second
+        return ack.list_of_read_access_results
+
     async def write_multiple(
         self,
         address: str | BACnetAddress,
@@ -817,17 +938,37 @@ class BACnetClient:
         address: str | BACnetAddress,
         device_instance: int,
         timeout: float | None = None,
+        *,
+        use_cache: bool = False,
+        max_in_flight: int = 4,
+        progress: ObjectListProgress | None = None,
     ) -> list[ObjectIdentifier]:
         """Read the complete object list from a device.
 
         Attempts to read the full ``object-list`` property first. If
         the response is too large (:class:`BACnetAbortError` with
         segmentation-not-supported), falls back to reading the array
-        length then each element individually.
+        length and then the elements by array index.  The elements are
+        packed into ReadPropertyMultiple requests sized to the peer's
+        max APDU, with up to *max_in_flight* requests outstanding.
+        Devices that reject ReadPropertyMultiple are read with one
+        ReadProperty per element, still *max_in_flight* at a time.
+
+        The result is stored in the application's
+        :attr:`~bac_py.app.application.BACnetApplication.device_cache`.
 
         :param address: Target device (e.g. ``"192.168.1.100"``).
         :param device_instance: Device instance number of the target.
-        :param timeout: Optional caller-level timeout in seconds.
+        :param timeout: Optional caller-level timeout in seconds, applied
+            to each request.
+        :param use_cache: Return the cached object list, if any, instead
+            of reading it from the device.  See
+            :meth:`refresh_device_cache` for keeping it current.
+        :param max_in_flight: Maximum element requests outstanding at
+            once during the fallback.
+        :param progress: Optional :class:`ObjectListProgress` updated as
+            elements arrive.  If the read fails part way, call again
+            with the same object to fetch only the missing elements.
         :returns: List of :class:`ObjectIdentifier` for all objects in the device.
 
         Example::
@@ -837,52 +978,203 @@ class BACnetClient:
                 print(obj.object_type, obj.instance_number)
         """
         logger.debug("get_object_list from %s", address)
+        if max_in_flight < 1:
+            msg = f"max_in_flight must be at least 1, got {max_in_flight}"
+            raise ValueError(msg)
+        addr = parse_address(address)
+        if use_cache:
+            record = self._app.device_cache.get(addr)
+            if record is not None and record.object_list is not None:
+                return list(record.object_list)
+        if progress is None:
+            progress = ObjectListProgress()
+        result = await self._read_object_list(
+            addr, device_instance, timeout, max_in_flight, progress
+        )
+        self._app.device_cache.set_object_list(addr, result)
+        return result
+
+    async def _read_object_list(
+        self,
+        addr: BACnetAddress,
+        device_instance: int,
+        timeout: float | None,
+        max_in_flight: int,
+        progress: ObjectListProgress,
+    ) -> list[ObjectIdentifier]:
+        """Read ``object-list`` from the device (see :meth:`get_object_list`)."""
         from bac_py.services.errors import BACnetAbortError
-        from bac_py.types.enums import AbortReason
 
-        addr = parse_address(address)
         device_obj = ObjectIdentifier(ObjectType.DEVICE, device_instance)
-        try:
+        if progress.count is None:
+            try:
+                ack = await self.read_property(
+                    addr,
+                    device_obj,
+                    PropertyIdentifier.OBJECT_LIST,
+                    timeout=timeout,
+                )
+                if ack.property_value:
+                    values = decode_all_application_values(ack.property_value)
+                    return [v for v in values if isinstance(v, ObjectIdentifier)]
+                return []
+            except BACnetAbortError as exc:
+                if exc.reason != AbortReason.SEGMENTATION_NOT_SUPPORTED:
+                    raise
+
+            # Fallback: read array length, then the elements
             ack = await self.read_property(
                 addr,
                 device_obj,
                 PropertyIdentifier.OBJECT_LIST,
+                array_index=0,
                 timeout=timeout,
             )
-            if ack.property_value:
-                values = decode_all_application_values(ack.property_value)
-                return [v for v in values if isinstance(v, ObjectIdentifier)]
-            return []
-        except BACnetAbortError as exc:
-            if exc.reason != AbortReason.SEGMENTATION_NOT_SUPPORTED:
-                raise
+            count_val = decode_and_unwrap(ack.property_value)
+            progress.count = count_val if isinstance(count_val, int) else 0
+            progress.elements.clear()
+
+        missing = progress.missing
+        if missing:
+            logger.debug(
+                "Reading %d of %d object-list elements from %s",
+                len(missing),
+                progress.count,
+                addr,
+            )
+            semaphore = asyncio.Semaphore(max_in_flight)
+            rpm = ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+            if not self._app.device_cache.is_service_failed(addr, rpm):
+                try:
+                    await self._read_object_list_rpm(
+                        addr, device_obj, missing, progress, semaphore, timeout
+                    )
+                except BACnetRejectError as exc:
+                    if exc.reason != RejectReason.UNRECOGNIZED_SERVICE:
+                        raise
+                    self._app.device_cache.mark_service_failed(addr, rpm)
+                    logger.debug("%s rejected RPM, reading object-list elements singly", addr)
+            missing = progress.missing
+            if missing:
+                await self._read_object_list_rp(
+                    addr, device_obj, missing, progress, semaphore, timeout
+                )
+        return progress.object_list()
 
-        # Fallback: read array length, then each element
-        ack = await self.read_property(
-            addr,
+    async def _read_object_list_rpm(
+        self,
+        addr: BACnetAddress,
+        device_obj: ObjectIdentifier,
+        indices: list[int],
+        progress: ObjectListProgress,
+        semaphore: asyncio.Semaphore,
+        timeout: float | None,
+    ) -> None:
+        """Read ``object-list`` elements in ReadPropertyMultiple batches."""
+        from bac_py.services.read_property_multiple import PropertyReference
+
+        spec = ReadAccessSpecification(
             device_obj,
-            PropertyIdentifier.OBJECT_LIST,
-            array_index=0,
-            timeout=timeout,
-        )
-        count_val = decode_and_unwrap(ack.property_value)
-        if not isinstance(count_val, int) or count_val == 0:
-            return []
+            [PropertyReference(PropertyIdentifier.OBJECT_LIST, i) for i in indices],
+        )
+        config = self._app.config
+        max_request, max_response = rpm_size_limits(
+            config.max_apdu_length,
+            self._app.get_device_info(addr),
+            allow_segmentation=False,
+        )
+        chunks = split_read_access_specs([spec], max_request, max_response)
+
+        async def _run(chunk: list[ReadAccessSpecification]) -> None:
+            async with semaphore:
+                results = await self._read_rpm_chunk(addr, chunk, timeout)
+            for access_result in results:
+                for elem in access_result.list_of_results:
+                    index = elem.property_array_index
+                    if index is None:
+                        continue
+                    value = None
+                    if elem.property_access_error is None and elem.property_value:
+                        value = decode_and_unwrap(elem.property_value)
+                    progress.elements[index] = (
+                        value if isinstance(value, ObjectIdentifier) else None
+                    )
 
-        result: list[ObjectIdentifier] = []
-        for i in range(1, count_val + 1):
-            ack = await self.read_property(
-                addr,
-                device_obj,
-                PropertyIdentifier.OBJECT_LIST,
-                array_index=i,
-                timeout=timeout,
-            )
-            val = decode_and_unwrap(ack.property_value)
-            if isinstance(val, ObjectIdentifier):
-                result.append(val)
+        await gather_or_cancel([_run(chunk) for chunk in chunks])
 
-        return result
+    async def _read_object_list_rp(
+        self,
+        addr: BACnetAddress,
+        device_obj: ObjectIdentifier,
+        indices: list[int],
+        progress: ObjectListProgress,
+        semaphore: asyncio.Semaphore,
+        timeout: float | None,
+    ) -> None:
+        """Read ``object-list`` elements with one ReadProperty each."""
+
+        async def _run(index: int) -> None:
+            async with semaphore:
+                ack = await self.read_property(
+                    addr,
+                    device_obj,
+                    PropertyIdentifier.OBJECT_LIST,
+                    array_index=index,
+                    timeout=timeout,
+                )
+            value = decode_and_unwrap(ack.property_value)
+            progress.elements[index] = value if isinstance(value, ObjectIdentifier) else None
+
+        await gather_or_cancel([_run(i) for i in indices])
+
+    async def refresh_device_cache(
+        self,
+        address: str | BACnetAddress,
+        device_instance: int | None = None,
+        timeout: float | None = None,
+    ) -> DeviceRecord:
+        """Revalidate a device's cached data against its database revision.
+
+        Reads ``DATABASE_REVISION`` from the device object.  If it
+        differs from the cached value, the cached object list and failed
+        properties are discarded.  The object list is then read only if
+        no valid copy is cached, so a restart with a persisted cache costs
+        one read per unchanged device.
+
+        :param address: Target device (e.g. ``"192.168.1.100"``).
+        :param device_instance: Device instance number, or ``None`` to
+            use the instance cached from its I-Am.
+        :param timeout: Optional caller-level timeout in seconds.
+        :returns: The up-to-date cache record for the device.
+        :raises ValueError: If *device_instance* is ``None`` and no
+            instance is cached for *address*.
+        """
+        addr = parse_address(address)
+        cache = self._app.device_cache
+        if device_instance is None:
+            cached = cache.get(addr)
+            if cached is None or cached.device_instance is None:
+                msg = f"No cached device instance for {addr}; pass device_instance"
+                raise ValueError(msg)
+            device_instance = cached.device_instance
+
+        device_obj = ObjectIdentifier(ObjectType.DEVICE, device_instance)
+        ack = await self.read_property(
+            addr, device_obj, PropertyIdentifier.DATABASE_REVISION, timeout=timeout
+        )
+        revision = decode_and_unwrap(ack.property_value)
+        cache.set_device_instance(addr, device_instance)
+        if isinstance(revision, int):
+            cache.set_database_revision(addr, revision)
+
+        record = cache.get(addr)
+        if record is None or record.object_list is None:
+            await self.get_object_list(addr, device_instance, timeout=timeout)
+            record = cache.get(addr)
+        if record is None:
+            # Evicted by concurrent updates to a very small cache.
+            record = DeviceRecord(addr, device_instance=device_instance)
+        return record
 
     # --- COV convenience ---
 
@@ -1205,6 +1497,8 @@ class BACnetClient:
         timeout: float = 3.0,
         expected_count: int | None = None,
         enrich_timeout: float = 5.0,
+        *,
+        max_concurrency: int = 32,
     ) -> list[DiscoveredDevice]:
         """Discover devices and enrich with profile metadata (Annex X).
 
@@ -1218,6 +1512,7 @@ class BACnetClient:
         :param timeout: Seconds to wait for Who-Is responses.
         :param expected_count: Return early once this many devices respond.
         :param enrich_timeout: Per-device timeout for RPM enrichment.
+        :param max_concurrency: Maximum enrichment reads in flight at once.
         :returns: List of :class:`DiscoveredDevice` with profile metadata.
         """
         logger.info("discover_extended timeout=%s low=%s high=%s", timeout, low_limit, high_limit)
@@ -1232,7 +1527,13 @@ class BACnetClient:
             expected_count=expected_count,
         )
 
+        semaphore = asyncio.Semaphore(max_concurrency)
+
         async def _enrich_device(dev: DiscoveredDevice) -> DiscoveredDevice:
+            async with semaphore:
+                return await _read_profile(dev)
+
+        async def _read_profile(dev: DiscoveredDevice) -> DiscoveredDevice:
             profile_name: str | None = None
             profile_location: str | None = None
             tags: list[dict[str, Any]] | None = None
@@ -1282,6 +1583,60 @@ class BACnetClient:
         )
         return list(enriched)
 
+    def scan_site(
+        self,
+        *,
+        devices: Iterable[DiscoveredDevice] | None = None,
+        low_limit: int | None = None,
+        high_limit: int | None = None,
+        destination: BACnetAddress = GLOBAL_BROADCAST,
+        discover_timeout: float = 3.0,
+        properties: Sequence[str | int | PropertyIdentifier] | None = (
+            PropertyIdentifier.OBJECT_NAME,
+            PropertyIdentifier.PRESENT_VALUE,
+        ),
+        max_concurrency: int = 32,
+        max_per_network: int = 4,
+        requests_per_device: int = 2,
+        retries: int = 2,
+        backoff: float = 1.0,
+        timeout: float | None = None,
+        use_cache: bool = False,
+        checkpoint: SiteScanCheckpoint | None = None,
+    ) -> AsyncIterator[SiteScanResult]:
+        """Scan a site's devices, object lists, and property values.
+
+        Returns an async iterator yielding one
+        :class:`~bac_py.app.site_scan.SiteScanResult` per device as it
+        completes.  See :func:`bac_py.app.site_scan.scan_site` for the
+        parameters.
+
+        Example::
+
+            checkpoint = SiteScanCheckpoint("scan.json")
+            async for result in client.scan_site(checkpoint=checkpoint):
+                print(result.device.instance, len(result.object_list))
+        """
+        from bac_py.app.site_scan import scan_site
+
+        return scan_site(
+            self,
+            devices=devices,
+            low_limit=low_limit,
+            high_limit=high_limit,
+            destination=destination,
+            discover_timeout=discover_timeout,
+            properties=properties,
+            max_concurrency=max_concurrency,
+            max_per_network=max_per_network,
+            requests_per_device=requests_per_device,
+            retries=retries,
+            backoff=backoff,
+            timeout=timeout,
+            use_cache=use_cache,
+            checkpoint=checkpoint,
+        )
+
     async def traverse_hierarchy(
         self,
         address: str | BACnetAddress,
@@ -1684,6 +2039,72 @@ class BACnetClient:
         )
         return AtomicWriteFileACK.decode(response_data)
 
+    async def download_file(
+        self,
+        address: BACnetAddress,
+        file_identifier: ObjectIdentifier,
+        sink: FileSink,
+        *,
+        window: int = DEFAULT_WINDOW,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+    ) -> int:
+        """Download a stream-access File object with pipelined reads.
+
+        Keeps *window* AtomicReadFile requests in flight and writes the
+        contents to *sink* in file order.  See
+        :func:`bac_py.app.file_transfer.download_file` for the parameters.
+
+        Example::
+
+            with open("backup.bin", "wb") as f:
+                size = await client.download_file(addr, file_oid, f)
+
+        :returns: Number of bytes downloaded.
+        """
+        from bac_py.app.file_transfer import download_file
+
+        return await download_file(
+            self,
+            address,
+            file_identifier,
+            sink,
+            window=window,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
+    async def upload_file(
+        self,
+        address: BACnetAddress,
+        file_identifier: ObjectIdentifier,
+        source: FileSource,
+        *,
+        start: int = 0,
+        window: int = DEFAULT_WINDOW,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+    ) -> int:
+        """Upload to a stream-access File object with pipelined writes.
+
+        Keeps *window* AtomicWriteFile requests in flight.  See
+        :func:`bac_py.app.file_transfer.upload_file` for the parameters.
+
+        :returns: Number of bytes uploaded.
+        """
+        from bac_py.app.file_transfer import upload_file
+
+        return await upload_file(
+            self,
+            address,
+            file_identifier,
+            source,
+            start=start,
+            window=window,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
     # --- Object management ---
 
     async def create_object(
@@ -2857,12 +3278,7 @@ class BACnetClient:
 
         # Step 3: Upload configuration files
         for file_oid, file_data in backup_data.configuration_files:
-            await self.atomic_write_file(
-                address,
-                file_oid,
-                StreamWriteAccess(0, file_data),
-                timeout=timeout,
-            )
+            await self.upload_file(address, file_oid, file_data, timeout=timeout)
 
         # Step 4: End restore
         await self.reinitialize_device(
@@ -2923,25 +3339,12 @@ class BACnetClient:
         self,
         address: BACnetAddress,
         file_oid: ObjectIdentifier,
-        chunk_size: int = 1024,
+        chunk_size: int | None = None,
         timeout: float | None = None,
     ) -> bytes:
         """Download an entire file via AtomicReadFile stream access."""
-        from bac_py.services.file_access import StreamReadACK
-
         buf = bytearray()
-        file_offset = 0
-        while True:
-            ack = await self.atomic_read_file(
-                address,
-                file_oid,
-                StreamReadAccess(file_offset, chunk_size),
-                timeout=timeout,
-            )
-            access = ack.access_method
-            assert isinstance(access, StreamReadACK)
-            buf.extend(access.file_data)
-            if ack.end_of_file:
-                break
-            file_offset += len(access.file_data)
+        await self.download_file(
+            address, file_oid, buf.extend, chunk_size=chunk_size, timeout=timeout
+        )
         return bytes(buf)
@@ -13,9 +13,15 @@ from bac_py.encoding.primitives import (
     encode_application_bit_string,
     encode_property_value,
 )
-from bac_py.services.cov import BACnetPropertyValue, COVNotificationRequest
+from bac_py.services.cov import (
+    BACnetPropertyValue,
+    COVNotificationMultipleRequest,
+    COVNotificationRequest,
+    COVObjectNotification,
+    COVPropertyValue,
+)
 from bac_py.services.errors import BACnetError
-from bac_py.types.constructed import StatusFlags
+from bac_py.types.constructed import BACnetDateTime, BACnetTimeStamp, StatusFlags
 from bac_py.types.enums import (
     ConfirmedServiceChoice,
     ErrorClass,
@@ -27,6 +33,8 @@ from bac_py.types.enums import (
 from bac_py.types.primitives import BitString
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from bac_py.app.application import BACnetApplication
     from bac_py.network.address import BACnetAddress
     from bac_py.objects.base import BACnetObject, ObjectDatabase
@@ -40,6 +48,17 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _notification_key(notification: COVNotificationRequest) -> Hashable:
+    """Identify what a COV notification reports, for superseding queued ones."""
+    return (
+        notification.subscriber_process_identifier,
+        notification.monitored_object_identifier,
+        tuple(
+            (v.property_identifier, v.property_array_index) for v in notification.list_of_values
+        ),
+    )
+
+
 @dataclass
 class COVSubscription:
     """Tracks a single COV subscription."""
@@ -110,6 +129,51 @@ class PropertySubscription:
     """Timer handle for subscription expiry, if any."""
 
 
+@dataclass(frozen=True, slots=True)
+class COVCoalescing:
+    """Settings for coalescing COV notifications to a subscriber.
+
+    Changes detected while a batch is open are combined per subscriber
+    process and sent together once *max_notification_delay* has passed
+    since the first change, or as soon as the batch covers
+    *max_batch_size* objects.  Each object appears once per batch,
+    carrying its latest values.
+    """
+
+    max_notification_delay: float = 0.1
+    """Seconds a detected change may wait before its notification is sent."""
+
+    max_batch_size: int = 32
+    """Maximum monitored objects per batch; a full batch is sent at once."""
+
+    use_multiple: bool | None = None
+    """Send each batch as one COVNotificationMultiple request.  ``None``
+    does so only for subscribers that subscribed with
+    SubscribeCOVPropertyMultiple; other batches are sent as one
+    COVNotification per object."""
+
+    def __post_init__(self) -> None:
+        """Validate the delay and batch size."""
+        if self.max_notification_delay < 0:
+            msg = f"max_notification_delay must be >= 0, got {self.max_notification_delay}"
+            raise ValueError(msg)
+        if self.max_batch_size < 1:
+            msg = f"max_batch_size must be >= 1, got {self.max_batch_size}"
+            raise ValueError(msg)
+
+
+@dataclass
+class _PendingBatch:
+    """Coalesced changes awaiting delivery to one subscriber process."""
+
+    subscriber: BACnetAddress
+    process_id: int
+    confirmed: bool
+    use_multiple: bool
+    objects: dict[Any, list[COVSubscription | PropertySubscription]] = field(default_factory=dict)
+    handle: asyncio.TimerHandle | None = None
+
+
 class COVManager:
     """Manages COV subscriptions and notification dispatch.
 
@@ -117,6 +181,17 @@ class COVManager:
     - Analog objects: ``|new - last| >= COV_INCREMENT`` (any change if no increment set)
     - Binary/multistate objects: any change in Present_Value
     - Any object: change in Status_Flags
+
+    Notifications are sent as soon as a change is detected unless
+    coalescing is enabled, globally via *coalescing* or per subscriber
+    via :meth:`set_coalescing`.  Initial notifications sent on
+    subscription are never delayed.
+
+    :param app: The owning application.
+    :param max_subscriptions: Maximum object-level subscriptions.
+    :param max_property_subscriptions: Maximum property-level subscriptions.
+    :param coalescing: Default :class:`COVCoalescing` for all subscribers,
+        or ``None`` to send every change immediately.
     """
 
     def __init__(
@@ -125,10 +200,18 @@ class COVManager:
         *,
         max_subscriptions: int = 1000,
         max_property_subscriptions: int = 1000,
+        coalescing: COVCoalescing | None = None,
     ) -> None:
         self._app = app
         self._max_subscriptions = max_subscriptions
         self._max_property_subscriptions = max_property_subscriptions
+        self._coalescing = coalescing
+        self._subscriber_coalescing: dict[Any, COVCoalescing | None] = {}
+        # Subscribers known to accept COVNotificationMultiple, kept while
+        # they hold property subscriptions
+        self._multiple_subscribers: set[Any] = set()
+        self._property_sub_counts: dict[Any, int] = {}
+        self._pending_batches: dict[tuple[Any, int, bool], _PendingBatch] = {}
         self._subscriptions: dict[
             tuple[Any, int, Any],  # (subscriber, process_id, object_id)
             COVSubscription,
@@ -248,6 +331,8 @@ class COVManager:
         if obj_bucket:
             for _key, sub in list(obj_bucket.items()):
                 if self._should_notify(sub, obj):
+                    if self._queue_change(sub, obj_id):
+                        continue
                     self._send_notification(sub, obj)
                     # Update last-reported values
                     sub.last_present_value = self._read_present_value(obj)
@@ -267,7 +352,12 @@ class COVManager:
         return list(obj_bucket.values()) if obj_bucket else []
 
     def shutdown(self) -> None:
-        """Cancel all subscription timers."""
+        """Cancel all subscription timers and drop pending coalesced changes."""
+        for batch in self._pending_batches.values():
+            if batch.handle:
+                batch.handle.cancel()
+        self._pending_batches.clear()
+
         for sub in self._subscriptions.values():
             if sub.expiry_handle:
                 sub.expiry_handle.cancel()
@@ -279,6 +369,8 @@ class COVManager:
                 prop_sub.expiry_handle.cancel()
         self._property_subscriptions.clear()
         self._prop_subs_by_obj_prop.clear()
+        self._property_sub_counts.clear()
+        self._multiple_subscribers.clear()
 
     def remove_object_subscriptions(self, object_id: ObjectIdentifier) -> None:
         """Remove all subscriptions for a deleted object.
@@ -301,7 +393,8 @@ class COVManager:
         for idx_key in prop_idx_keys:
             prop_bucket = self._prop_subs_by_obj_prop.pop(idx_key)
             for pkey, psub in prop_bucket.items():
-                self._property_subscriptions.pop(pkey, None)
+                if self._property_subscriptions.pop(pkey, None) is not None:
+                    self._release_property_subscriber(psub.subscriber)
                 if psub.expiry_handle:
                     psub.expiry_handle.cancel()
 
@@ -366,6 +459,10 @@ class COVManager:
         )
         self._property_subscriptions[key] = sub
         self._prop_subs_by_obj_prop.setdefault((obj_id, prop_id), {})[key] = sub
+        if existing is None:
+            self._property_sub_counts[subscriber] = (
+                self._property_sub_counts.get(subscriber, 0) + 1
+            )
 
         # Start lifetime timer if applicable
         if lifetime is not None and lifetime > 0:
@@ -439,6 +536,10 @@ class COVManager:
                 )
                 self._property_subscriptions[key] = sub
                 self._prop_subs_by_obj_prop.setdefault((obj_id, prop_id), {})[key] = sub
+                if existing is None:
+                    counts = self._property_sub_counts
+                    counts[subscriber] = counts.get(subscriber, 0) + 1
+                self._multiple_subscribers.add(subscriber)
 
                 # Start lifetime timer if applicable
                 if lifetime is not None and lifetime > 0:
@@ -479,6 +580,7 @@ class COVManager:
         if sub:
             if sub.expiry_handle:
                 sub.expiry_handle.cancel()
+            self._release_property_subscriber(subscriber)
             idx_key = (obj_id, property_id)
             prop_bucket = self._prop_subs_by_obj_prop.get(idx_key)
             if prop_bucket is not None:
@@ -514,9 +616,215 @@ class COVManager:
             )
 
             if self._should_notify_property(sub, obj, current_value):
+                if self._queue_change(sub, obj_id):
+                    continue
                 self._send_property_notification(sub, obj)
                 sub.last_value = current_value
 
+    # --- Coalescing ---
+
+    def set_coalescing(self, subscriber: BACnetAddress, coalescing: COVCoalescing | None) -> None:
+        """Override notification coalescing for one subscriber.
+
+        :param subscriber: Address of the subscribing device.
+        :param coalescing: Settings to use for *subscriber*, or ``None``
+            to send its notifications immediately.
+        """
+        self._subscriber_coalescing[subscriber] = coalescing
+
+    def flush_pending(self) -> None:
+        """Send all coalesced notifications now."""
+        for key in list(self._pending_batches):
+            self._flush_batch(key)
+
+    def _queue_change(self, sub: COVSubscription | PropertySubscription, obj_id: Any) -> bool:
+        """Add a detected change to the subscriber's pending batch.
+
+        :returns: ``False`` if coalescing is disabled for the subscriber
+            and the caller should notify immediately.
+        """
+        config = self._subscriber_coalescing.get(sub.subscriber, self._coalescing)
+        if config is None:
+            return False
+        key = (sub.subscriber, sub.process_id, sub.confirmed)
+        batch = self._pending_batches.get(key)
+        if batch is None:
+            use_multiple = config.use_multiple
+            if use_multiple is None:
+                use_multiple = sub.subscriber in self._multiple_subscribers
+            batch = _PendingBatch(sub.subscriber, sub.process_id, sub.confirmed, use_multiple)
+            self._pending_batches[key] = batch
+            loop = asyncio.get_running_loop()
+            batch.handle = loop.call_later(config.max_notification_delay, self._flush_batch, key)
+        subs = batch.objects.setdefault(obj_id, [])
+        if not any(pending is sub for pending in subs):
+            subs.append(sub)
+        if len(batch.objects) >= config.max_batch_size:
+            self._flush_batch(key)
+        return True
+
+    def _flush_batch(self, key: tuple[Any, int, bool]) -> None:
+        """Send a pending batch with the latest values of its objects."""
+        batch = self._pending_batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle:
+            batch.handle.cancel()
+
+        db = self._app.object_db
+        notifications: list[tuple[Any, list[tuple[int, int | None, bytes]], int]] = []
+        for obj_id, subs in batch.objects.items():
+            obj = db.get(obj_id)
+            live = [sub for sub in subs if self._is_active(sub)]
+            if obj is None or not live:
+                continue
+            values = self._collect_batch_values(obj, live)
+            notifications.append((obj_id, values, self._batch_time_remaining(live)))
+        if not notifications:
+            return
+
+        device_id = self._app.device_object_identifier
+        logger.debug(
+            "COV batch of %d objects to %s (multiple=%s)",
+            len(notifications),
+            batch.subscriber,
+            batch.use_multiple,
+        )
+        if batch.use_multiple:
+            finite = [remaining for _, _, remaining in notifications if remaining > 0]
+            request = COVNotificationMultipleRequest(
+                subscriber_process_identifier=batch.process_id,
+                initiating_device_identifier=device_id,
+                time_remaining=min(finite) if finite else 0,
+                timestamp=BACnetTimeStamp(choice=2, value=BACnetDateTime.now()),
+                list_of_cov_notifications=[
+                    COVObjectNotification(
+                        monitored_object_identifier=obj_id,
+                        list_of_values=[
+                            COVPropertyValue(prop_id, value, array_index)
+                            for prop_id, array_index, value in values
+                        ],
+                    )
+                    for obj_id, values, _ in notifications
+                ],
+            )
+            self._transmit(
+                request.encode(),
+                batch.subscriber,
+                batch.confirmed,
+                ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION_MULTIPLE,
+                UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION_MULTIPLE,
+            )
+            return
+
+        for obj_id, values, remaining in notifications:
+            notification = COVNotificationRequest(
+                subscriber_process_identifier=batch.process_id,
+                initiating_device_identifier=device_id,
+                monitored_object_identifier=obj_id,
+                time_remaining=remaining,
+                list_of_values=[
+                    BACnetPropertyValue(
+                        property_identifier=PropertyIdentifier(prop_id),
+                        property_array_index=array_index,
+                        value=value,
+                    )
+                    for prop_id, array_index, value in values
+                ],
+            )
+            self._transmit(
+                notification.encode(),
+                batch.subscriber,
+                batch.confirmed,
+                ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION,
+                UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
+                _notification_key(notification),
+            )
+
+    def _collect_batch_values(
+        self,
+        obj: BACnetObject,
+        subs: list[COVSubscription | PropertySubscription],
+    ) -> list[tuple[int, int | None, bytes]]:
+        """Read and encode the current values for a batched object.
+
+        Returns ``(property, array_index, encoded)`` entries with
+        Status_Flags last, and records them as the subscriptions'
+        last-reported values.
+        """
+        obj_type = obj.object_identifier.object_type
+        values: dict[tuple[int, int | None], bytes] = {}
+        for sub in subs:
+            if isinstance(sub, COVSubscription):
+                present_value = self._read_present_value(obj)
+                values[(PropertyIdentifier.PRESENT_VALUE, None)] = self._encode_value(
+                    present_value, obj_type
+                )
+                sub.last_present_value = present_value
+                sub.last_status_flags = self._read_status_flags(obj)
+            else:
+                value = self._read_property_value(
+                    obj, sub.monitored_property, sub.property_array_index
+                )
+                values[(sub.monitored_property, sub.property_array_index)] = self._encode_value(
+                    value, obj_type
+                )
+                sub.last_value = value
+        status_key: tuple[int, int | None] = (PropertyIdentifier.STATUS_FLAGS, None)
+        values.pop(status_key, None)
+        values[status_key] = self._encode_status_flags(self._read_status_flags(obj))
+        return [(prop_id, index, value) for (prop_id, index), value in values.items()]
+
+    def _is_active(self, sub: COVSubscription | PropertySubscription) -> bool:
+        """Return whether a queued subscription has not been cancelled or expired."""
+        if isinstance(sub, COVSubscription):
+            key = (sub.subscriber, sub.process_id, sub.monitored_object)
+            return self._subscriptions.get(key) is sub
+        prop_key = (
+            sub.subscriber,
+            sub.process_id,
+            sub.monitored_object,
+            sub.monitored_property,
+            sub.property_array_index,
+        )
+        return self._property_subscriptions.get(prop_key) is sub
+
+    @staticmethod
+    def _batch_time_remaining(subs: list[COVSubscription | PropertySubscription]) -> int:
+        """Smallest remaining lifetime among *subs*, or 0 if all are indefinite."""
+        now = time.monotonic()
+        remaining = [
+            int(max(0, sub.lifetime - (now - sub.created_at)))
+            for sub in subs
+            if sub.lifetime is not None
+        ]
+        return min(remaining) if remaining else 0
+
+    def _transmit(
+        self,
+        encoded: bytes,
+        subscriber: BACnetAddress,
+        confirmed: bool,
+        confirmed_choice: ConfirmedServiceChoice,
+        unconfirmed_choice: UnconfirmedServiceChoice,
+        key: Hashable | None = None,
+    ) -> None:
+        """Send an encoded notification as a confirmed or unconfirmed request.
+
+        *key* lets a confirmed notification still queued for delivery be
+        replaced by a newer one reporting the same values.
+        """
+        if confirmed:
+            self._app.send_confirmed_cov_notification(
+                encoded, subscriber, confirmed_choice, key=key
+            )
+        else:
+            self._app.unconfirmed_request(
+                destination=subscriber,
+                service_choice=unconfirmed_choice,
+                service_data=encoded,
+            )
+
     def _should_notify_property(
         self,
         sub: PropertySubscription,
@@ -605,18 +913,14 @@ class COVManager:
             list_of_values=list_of_values,
         )
 
-        encoded = notification.encode()
-
-        if sub.confirmed:
-            self._app.send_confirmed_cov_notification(
-                encoded, sub.subscriber, ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION
-            )
-        else:
-            self._app.unconfirmed_request(
-                destination=sub.subscriber,
-                service_choice=UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
-                service_data=encoded,
-            )
+        self._transmit(
+            notification.encode(),
+            sub.subscriber,
+            sub.confirmed,
+            ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION,
+            UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
+            _notification_key(notification),
+        )
 
     def _on_property_subscription_expired(
         self,
@@ -628,6 +932,7 @@ class COVManager:
         """
         sub = self._property_subscriptions.pop(key, None)
         if sub:
+            self._release_property_subscriber(sub.subscriber)
             idx_key = (sub.monitored_object, sub.monitored_property)
             prop_bucket = self._prop_subs_by_obj_prop.get(idx_key)
             if prop_bucket is not None:
@@ -641,6 +946,19 @@ class COVManager:
                 sub.monitored_property,
             )
 
+    def _release_property_subscriber(self, subscriber: Any) -> None:
+        """Count one property subscription of *subscriber* as removed.
+
+        A subscriber with none left is no longer remembered as accepting
+        COVNotificationMultiple.
+        """
+        count = self._property_sub_counts.get(subscriber, 0) - 1
+        if count > 0:
+            self._property_sub_counts[subscriber] = count
+        else:
+            self._property_sub_counts.pop(subscriber, None)
+            self._multiple_subscribers.discard(subscriber)
+
     @staticmethod
     def _read_property_value(
         obj: BACnetObject,
@@ -749,18 +1067,14 @@ class COVManager:
             list_of_values=list_of_values,
         )
 
-        encoded = notification.encode()
-
-        if sub.confirmed:
-            self._app.send_confirmed_cov_notification(
-                encoded, sub.subscriber, ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION
-            )
-        else:
-            self._app.unconfirmed_request(
-                destination=sub.subscriber,
-                service_choice=UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
-                service_data=encoded,
-            )
+        self._transmit(
+            notification.encode(),
+            sub.subscriber,
+            sub.confirmed,
+            ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION,
+            UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION,
+            _notification_key(notification),
+        )
 
     def _on_subscription_expired(self, key: tuple[Any, int, Any]) -> None:
         """Remove expired subscription."""
@@ -0,0 +1,571 @@
+"""Peer device capability cache with optional persistence.
+
+:class:`DeviceCache` keeps what the application has learned about remote
+devices -- max APDU length and segmentation from I-Am (Clause 19.4),
+vendor, database revision, object list, and which properties and
+services failed -- in a bounded LRU.  A :class:`DeviceCacheBackend`
+(:class:`JSONDeviceCacheBackend` or :class:`SQLiteDeviceCacheBackend`)
+lets the cache be loaded at startup and flushed incrementally so a
+restart does not have to rediscover a whole site.
+
+Cached object lists and failed properties are discarded when a device
+reports a different ``DATABASE_REVISION`` (Clause 12.11.35).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
+
+from bac_py.network.address import BACnetAddress
+from bac_py.types.enums import ObjectType, PropertyIdentifier
+from bac_py.types.primitives import ObjectIdentifier
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = logging.getLogger(__name__)
+
+_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceInfo:
+    """Cached peer device capabilities from I-Am responses (Clause 19.4)."""
+
+    max_apdu_length: int
+    """Maximum APDU length accepted by the peer device."""
+
+    segmentation_supported: int
+    """Segmentation support level (Segmentation enum value)."""
+
+
+@dataclass
+class DeviceRecord:
+    """Everything cached about one peer device."""
+
+    address: BACnetAddress
+    """Address the device was last seen at."""
+
+    max_apdu_length: int | None = None
+    """Maximum APDU length accepted by the device, from I-Am."""
+
+    segmentation_supported: int | None = None
+    """Segmentation support level (Segmentation enum value), from I-Am."""
+
+    device_instance: int | None = None
+    """Device object instance number."""
+
+    vendor_id: int | None = None
+    """ASHRAE vendor identifier."""
+
+    database_revision: int | None = None
+    """Last known ``DATABASE_REVISION`` of the device object."""
+
+    object_list: list[ObjectIdentifier] | None = None
+    """Cached object list, or ``None`` if not read yet."""
+
+    failed_properties: set[tuple[ObjectIdentifier, PropertyIdentifier]] = field(
+        default_factory=set
+    )
+    """Properties the device reported as unknown."""
+
+    failed_services: set[int] = field(default_factory=set)
+    """Confirmed service choices the device rejected as unrecognized."""
+
+    updated: float = 0.0
+    """Wall-clock time (``time.time()``) of the last change."""
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """APDU capabilities, or ``None`` until an I-Am has been seen."""
+        if self.max_apdu_length is None or self.segmentation_supported is None:
+            return None
+        return DeviceInfo(self.max_apdu_length, self.segmentation_supported)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a JSON-friendly dictionary."""
+        return {
+            "address": self.address.to_dict(),
+            "max_apdu_length": self.max_apdu_length,
+            "segmentation_supported": self.segmentation_supported,
+            "device_instance": self.device_instance,
+            "vendor_id": self.vendor_id,
+            "database_revision": self.database_revision,
+            "object_list": (
+                [[int(oid.object_type), oid.instance_number] for oid in self.object_list]
+                if self.object_list is not None
+                else None
+            ),
+            "failed_properties": sorted(
+                [int(oid.object_type), oid.instance_number, int(prop)]
+                for oid, prop in self.failed_properties
+            ),
+            "failed_services": sorted(self.failed_services),
+            "updated": self.updated,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DeviceRecord:
+        """Reconstruct a record produced by :meth:`to_dict`."""
+        object_list = data.get("object_list")
+        return cls(
+            address=BACnetAddress.from_dict(data["address"]),
+            max_apdu_length=data.get("max_apdu_length"),
+            segmentation_supported=data.get("segmentation_supported"),
+            device_instance=data.get("device_instance"),
+            vendor_id=data.get("vendor_id"),
+            database_revision=data.get("database_revision"),
+            object_list=(
+                [ObjectIdentifier(ObjectType(t), i) for t, i in object_list]
+                if object_list is not None
+                else None
+            ),
+            failed_properties={
+                (ObjectIdentifier(ObjectType(t), i), PropertyIdentifier(p))
+                for t, i, p in data.get("failed_properties", [])
+            },
+            failed_services=set(data.get("failed_services", [])),
+            updated=data.get("updated", 0.0),
+        )
+
+
+@runtime_checkable
+class DeviceCacheBackend(Protocol):
+    """Storage interface for persisting :class:`DeviceRecord` entries."""
+
+    def load(self) -> list[DeviceRecord]:  # pragma: no cover
+        """Return every stored record."""
+        ...
+
+    def save(self, records: list[DeviceRecord]) -> None:  # pragma: no cover
+        """Insert or replace *records*."""
+        ...
+
+    def delete(self, addresses: list[BACnetAddress]) -> None:  # pragma: no cover
+        """Remove the records for *addresses*."""
+        ...
+
+    def close(self) -> None:  # pragma: no cover
+        """Release any open resources."""
+        ...
+
+
+def _address_key(address: BACnetAddress) -> str:
+    network = "" if address.network is None else str(address.network)
+    return f"{network}/{address.mac_address.hex()}"
+
+
+class JSONDeviceCacheBackend:
+    """Store the cache as a single JSON file.
+
+    Every save rewrites the file atomically (write to a temporary file,
+    then rename).  Suited to a few thousand devices; use
+    :class:`SQLiteDeviceCacheBackend` for larger sites.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialise the backend.
+
+        :param path: JSON file to read and write.  It is created on the
+            first save if it does not exist.
+        """
+        self._path = Path(path)
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            entries: dict[str, dict[str, Any]] = {}
+            try:
+                raw = json.loads(self._path.read_text())
+            except FileNotFoundError:
+                raw = None
+            except (OSError, ValueError):
+                logger.warning("Ignoring unreadable device cache %s", self._path, exc_info=True)
+                raw = None
+            if raw is not None and raw.get("version") == _FORMAT_VERSION:
+                for item in raw.get("devices", []):
+                    entries[_address_key(BACnetAddress.from_dict(item["address"]))] = item
+            self._entries = entries
+        return self._entries
+
+    def _write(self) -> None:
+        payload = {"version": _FORMAT_VERSION, "devices": list(self._read().values())}
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp.replace(self._path)
+
+    def load(self) -> list[DeviceRecord]:
+        """Return every record stored in the file."""
+        records: list[DeviceRecord] = []
+        for item in self._read().values():
+            try:
+                records.append(DeviceRecord.from_dict(item))
+            except (KeyError, TypeError, ValueError):
+                logger.debug("Skipping malformed device cache entry %r", item)
+        return records
+
+    def save(self, records: list[DeviceRecord]) -> None:
+        """Insert or replace *records* and rewrite the file."""
+        entries = self._read()
+        for record in records:
+            entries[_address_key(record.address)] = record.to_dict()
+        self._write()
+
+    def delete(self, addresses: list[BACnetAddress]) -> None:
+        """Remove *addresses* and rewrite the file."""
+        entries = self._read()
+        for address in addresses:
+            entries.pop(_address_key(address), None)
+        self._write()
+
+    def close(self) -> None:
+        """Drop the in-memory copy of the file."""
+        self._entries = None
+
+
+class SQLiteDeviceCacheBackend:
+    """Store the cache in a SQLite database, one row per device.
+
+    Saves and deletes touch only the affected rows, so flushing a few
+    changed devices stays cheap regardless of site size.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Initialise the backend.
+
+        :param path: SQLite database file.  It is created with the
+            required table on first use.
+        """
+        self._path = os.fspath(path)
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self._path)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS devices ("
+                "address TEXT PRIMARY KEY, record TEXT NOT NULL, updated REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def load(self) -> list[DeviceRecord]:
+        """Return every record stored in the database."""
+        records: list[DeviceRecord] = []
+        for (raw,) in self._connect().execute("SELECT record FROM devices ORDER BY updated"):
+            try:
+                records.append(DeviceRecord.from_dict(json.loads(raw)))
+            except (KeyError, TypeError, ValueError):
+                logger.debug("Skipping malformed device cache row %r", raw)
+        return records
+
+    def save(self, records: list[DeviceRecord]) -> None:
+        """Insert or replace *records* in one transaction."""
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO devices (address, record, updated) VALUES (?, ?, ?)",
+                [(_address_key(r.address), json.dumps(r.to_dict()), r.updated) for r in records],
+            )
+
+    def delete(self, addresses: list[BACnetAddress]) -> None:
+        """Remove *addresses* in one transaction."""
+        with self._connect() as conn:
+            conn.executemany(
+                "DELETE FROM devices WHERE address = ?",
+                [(_address_key(a),) for a in addresses],
+            )
+
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class DeviceCache:
+    """Bounded LRU cache of :class:`DeviceRecord` entries keyed by address.
+
+    All methods are synchronous and meant to be called from the event
+    loop thread.  Changes are tracked so :meth:`flush` only writes the
+    records that changed since the last flush.
+    """
+
+    def __init__(
+        self,
+        backend: DeviceCacheBackend | None = None,
+        *,
+        max_entries: int = 1000,
+    ) -> None:
+        """Initialise the cache.
+
+        :param backend: Optional persistent store used by :meth:`load`
+            and :meth:`flush`.
+        :param max_entries: Maximum devices kept; the least recently used
+            device is evicted (from memory and from the backend) first.
+        :raises ValueError: If *max_entries* is less than 1.
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise ValueError(msg)
+        self._backend = backend
+        self._max_entries = max_entries
+        self._records: OrderedDict[BACnetAddress, DeviceRecord] = OrderedDict()
+        self._by_instance: dict[int, BACnetAddress] = {}
+        self._dirty: set[BACnetAddress] = set()
+        self._removed: set[BACnetAddress] = set()
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, address: object) -> bool:
+        return address in self._records
+
+    def __iter__(self) -> Iterator[DeviceRecord]:
+        return iter(list(self._records.values()))
+
+    @property
+    def backend(self) -> DeviceCacheBackend | None:
+        """The persistent store, or ``None`` for a memory-only cache."""
+        return self._backend
+
+    # --- Lookup ---
+
+    def get(self, address: BACnetAddress) -> DeviceRecord | None:
+        """Return the record for *address* and mark it recently used."""
+        record = self._records.get(address)
+        if record is not None:
+            self._records.move_to_end(address)
+        return record
+
+    def get_device_info(self, address: BACnetAddress) -> DeviceInfo | None:
+        """Return the APDU capabilities cached for *address*, if known."""
+        record = self.get(address)
+        return record.device_info if record is not None else None
+
+    def find_by_instance(self, device_instance: int) -> DeviceRecord | None:
+        """Return the record of the device with *device_instance*, if cached."""
+        address = self._by_instance.get(device_instance)
+        return self.get(address) if address is not None else None
+
+    # --- Updates ---
+
+    def _record_for(self, address: BACnetAddress) -> DeviceRecord:
+        """Return the record for *address*, creating it if needed."""
+        record = self.get(address)
+        if record is None:
+            record = DeviceRecord(address)
+            self._insert(record)
+        return record
+
+    def _insert(self, record: DeviceRecord) -> None:
+        self._records[record.address] = record
+        self._removed.discard(record.address)
+        if record.device_instance is not None:
+            self._by_instance[record.device_instance] = record.address
+        while len(self._records) > self._max_entries:
+            address, evicted = self._records.popitem(last=False)
+            self._forget(address, evicted)
+
+    def _forget(self, address: BACnetAddress, record: DeviceRecord) -> None:
+        self._dirty.discard(address)
+        self._removed.add(address)
+        if (
+            record.device_instance is not None
+            and self._by_instance.get(record.device_instance) == address
+        ):
+            del self._by_instance[record.device_instance]
+
+    def _touch(self, record: DeviceRecord) -> None:
+        record.updated = time.time()
+        self._dirty.add(record.address)
+
+    def put(self, record: DeviceRecord) -> None:
+        """Insert or replace a whole record."""
+        old = self._records.pop(record.address, None)
+        if old is not None:
+            self._forget(record.address, old)
+        self._insert(record)
+        self._touch(record)
+
+    def update_from_i_am(
+        self,
+        address: BACnetAddress,
+        *,
+        device_instance: int,
+        max_apdu_length: int,
+        segmentation_supported: int,
+        vendor_id: int,
+    ) -> DeviceRecord:
+        """Record the contents of an I-Am received from *address*.
+
+        If a different device instance previously answered from this
+        address, its cached data is discarded.
+        """
+        record = self._record_for(address)
+        if record.device_instance not in (None, device_instance):
+            logger.debug(
+                "device at %s changed from %s to %s, discarding cached data",
+                address,
+                record.device_instance,
+                device_instance,
+            )
+            record = DeviceRecord(address)
+            self.put(record)
+        if (
+            record.device_instance == device_instance
+            and record.max_apdu_length == max_apdu_length
+            and record.segmentation_supported == segmentation_supported
+            and record.vendor_id == vendor_id
+        ):
+            return record
+        old = self._by_instance.get(device_instance)
+        if old is not None and old != address and old in self._records:
+            # The device moved; drop the stale address.
+            self.remove(old)
+        record.device_instance = device_instance
+        record.max_apdu_length = max_apdu_length
+        record.segmentation_supported = segmentation_supported
+        record.vendor_id = vendor_id
+        self._by_instance[device_instance] = address
+        self._touch(record)
+        return record
+
+    def set_device_instance(self, address: BACnetAddress, device_instance: int) -> None:
+        """Record the device instance at *address* learned other than by I-Am."""
+        record = self._record_for(address)
+        if record.device_instance == device_instance:
+            return
+        if (
+            record.device_instance is not None
+            and self._by_instance.get(record.device_instance) == address
+        ):
+            del self._by_instance[record.device_instance]
+        record.device_instance = device_instance
+        self._by_instance[device_instance] = address
+        self._touch(record)
+
+    def set_database_revision(self, address: BACnetAddress, revision: int) -> bool:
+        """Record the device's ``DATABASE_REVISION``.
+
+        :returns: ``True`` if the revision changed and the cached object
+            list and failed properties were discarded.
+        """
+        record = self._record_for(address)
+        if record.database_revision == revision:
+            return False
+        invalidated = record.database_revision is not None
+        if invalidated:
+            logger.debug(
+                "database revision of %s changed %s -> %s, invalidating cache",
+                address,
+                record.database_revision,
+                revision,
+            )
+            record.object_list = None
+            record.failed_properties.clear()
+        record.database_revision = revision
+        self._touch(record)
+        return invalidated
+
+    def set_object_list(self, address: BACnetAddress, object_list: list[ObjectIdentifier]) -> None:
+        """Cache the object list read from *address*."""
+        record = self._record_for(address)
+        record.object_list = list(object_list)
+        self._touch(record)
+
+    def mark_property_failed(
+        self,
+        address: BACnetAddress,
+        object_identifier: ObjectIdentifier,
+        property_identifier: PropertyIdentifier,
+    ) -> None:
+        """Remember that *address* does not support a property."""
+        record = self._record_for(address)
+        key = (object_identifier, property_identifier)
+        if key not in record.failed_properties:
+            record.failed_properties.add(key)
+            self._touch(record)
+
+    def is_property_failed(
+        self,
+        address: BACnetAddress,
+        object_identifier: ObjectIdentifier,
+        property_identifier: PropertyIdentifier,
+    ) -> bool:
+        """Return whether a property is known to be unsupported."""
+        record = self._records.get(address)
+        return record is not None and (
+            (object_identifier, property_identifier) in record.failed_properties
+        )
+
+    def mark_service_failed(self, address: BACnetAddress, service_choice: int) -> None:
+        """Remember that *address* rejected a confirmed service."""
+        record = self._record_for(address)
+        if service_choice not in record.failed_services:
+            record.failed_services.add(service_choice)
+            self._touch(record)
+
+    def is_service_failed(self, address: BACnetAddress, service_choice: int) -> bool:
+        """Return whether a confirmed service is known to be unsupported."""
+        record = self._records.get(address)
+        return record is not None and service_choice in record.failed_services
+
+    def remove(self, address: BACnetAddress) -> None:
+        """Forget everything cached for *address*."""
+        record = self._records.pop(address, None)
+        if record is not None:
+            self._forget(address, record)
+
+    def clear(self) -> None:
+        """Drop all in-memory records without touching the backend."""
+        self._records.clear()
+        self._by_instance.clear()
+        self._dirty.clear()
+        self._removed.clear()
+
+    # --- Persistence ---
+
+    def load(self) -> int:
+        """Replace the in-memory contents with the backend's records.
+
+        The most recently updated records are kept if the backend holds
+        more than ``max_entries``.
+
+        :returns: Number of records loaded.
+        """
+        self.clear()
+        if self._backend is None:
+            return 0
+        for record in sorted(self._backend.load(), key=lambda r: r.updated):
+            self._insert(record)
+        logger.info("loaded %d cached devices", len(self._records))
+        return len(self._records)
+
+    def flush(self) -> int:
+        """Write changed records to the backend and drop evicted ones.
+
+        :returns: Number of records written.
+        """
+        dirty = [self._records[a] for a in self._dirty if a in self._records]
+        removed = list(self._removed)
+        if self._backend is not None:
+            # Leave the change sets intact if the backend fails so the
+            # next flush retries them.
+            if removed:
+                self._backend.delete(removed)
+            if dirty:
+                self._backend.save(dirty)
+        self._dirty.clear()
+        self._removed.clear()
+        if self._backend is None:
+            return 0
+        logger.debug("flushed %d cached devices (%d removed)", len(dirty), len(removed))
+        return len(dirty)
@@ -7,7 +7,9 @@ algorithm evaluators defined in Clause 13.3.
 The :class:`EventEngine` is the async integration layer that periodically
 evaluates ``EventEnrollment`` objects and intrinsic-reporting objects,
 drives the state machines, and dispatches ``EventNotificationRequest``
-PDUs on state transitions.
+PDUs on state transitions.  In change-driven mode it re-evaluates only
+intrinsic-reporting objects whose inputs were written, plus those whose
+time-delay timers have expired.
 
 The state machine and evaluators are **pure logic** -- no async, no I/O,
 no side effects.  The ``EventEngine`` provides the async scheduling and
@@ -18,6 +20,8 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
+import itertools
 import logging
 import time
 from dataclasses import dataclass, field
@@ -38,6 +42,7 @@ if TYPE_CHECKING:
     from bac_py.app.application import BACnetApplication
     from bac_py.objects.base import BACnetObject
     from bac_py.types.enums import LifeSafetyState, TimerState
+    from bac_py.types.primitives import ObjectIdentifier
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +107,18 @@ class EventStateMachine:
         """Return the effective time-delay-normal value."""
         return self.time_delay_normal if self.time_delay_normal is not None else self.time_delay
 
+    @property
+    def pending_deadline(self) -> float | None:
+        """Monotonic time at which a pending transition's time delay elapses.
+
+        ``None`` when no transition is pending.
+        """
+        if self._pending_state is None or self._pending_since is None:
+            return None
+        if self._pending_state == EventState.NORMAL:
+            return self._pending_since + self.effective_time_delay_normal
+        return self._pending_since + self.time_delay
+
     def evaluate(
         self,
         event_result: EventState | None,
@@ -626,6 +643,32 @@ class _EnrollmentContext:
         self.last_reliability: Reliability = Reliability.NO_FAULT_DETECTED
 
 
+_INTRINSIC_INPUTS = (
+    PropertyIdentifier.PRESENT_VALUE,
+    PropertyIdentifier.RELIABILITY,
+    PropertyIdentifier.EVENT_DETECTION_ENABLE,
+    PropertyIdentifier.EVENT_ALGORITHM_INHIBIT,
+    PropertyIdentifier.RELIABILITY_EVALUATION_INHIBIT,
+    PropertyIdentifier.EVENT_ENABLE,
+    PropertyIdentifier.TIME_DELAY,
+    PropertyIdentifier.TIME_DELAY_NORMAL,
+    PropertyIdentifier.HIGH_LIMIT,
+    PropertyIdentifier.LOW_LIMIT,
+    PropertyIdentifier.DEADBAND,
+    PropertyIdentifier.LIMIT_ENABLE,
+    PropertyIdentifier.ALARM_VALUE,
+    PropertyIdentifier.ALARM_VALUES,
+    PropertyIdentifier.SETPOINT,
+    PropertyIdentifier.ERROR_LIMIT,
+    PropertyIdentifier.TRACKING_VALUE,
+    PropertyIdentifier.MODE,
+    PropertyIdentifier.LIFE_SAFETY_ALARM_VALUES,
+    PropertyIdentifier.POLARITY,
+)
+"""Properties read by intrinsic evaluation; writes to any of them queue the
+object for re-evaluation in change-driven mode."""
+
+
 class EventEngine:
     """Async event/alarm evaluation engine per Clause 13.
 
@@ -640,6 +683,32 @@ class EventEngine:
     algorithms (Clause 13.4) then event algorithms (Clause 13.3),
     feeds results to per-enrollment :class:`EventStateMachine` instances,
     and dispatches ``EventNotificationRequest`` PDUs on transitions.
+
+    With *change_driven* enabled, intrinsic-reporting objects are not
+    scanned every cycle.  Instead the engine registers
+    :class:`~bac_py.objects.base.ObjectDatabase` change callbacks on the
+    properties intrinsic evaluation reads and re-evaluates an object only
+    after one of them is written, or when a pending time-delay transition
+    comes due (tracked in a timer heap).  The per-cycle cost then scales
+    with the number of changed objects rather than the database size.
+    Objects added to or removed from the database (including an object
+    deleted and re-created under the same identifier) are picked up via an
+    :meth:`~bac_py.objects.base.ObjectDatabase.register_membership_listener`
+    hook.  Code that updates ``_properties`` directly bypasses the change
+    callbacks and should call :meth:`notify_changed`; otherwise such updates
+    are only seen at the next periodic resync.
+    ``EventEnrollment`` objects are evaluated every cycle in both modes.
+
+    :param app: The owning application.
+    :param scan_interval: Seconds between evaluation cycles.
+    :param change_driven: Re-evaluate intrinsic-reporting objects only
+        when their inputs change or a time delay expires.
+    :param resync_interval: In change-driven mode, seconds between full
+        re-evaluations of every intrinsic-reporting object, as a safety
+        net for updates that bypass the change callbacks.  Defaults to 60
+        seconds.  ``None`` disables periodic resyncs, in which case direct
+        ``_properties`` updates are never evaluated unless
+        :meth:`notify_changed` is called.
     """
 
     def __init__(
@@ -647,14 +716,33 @@ class EventEngine:
         app: BACnetApplication,
         *,
         scan_interval: float = 1.0,
+        change_driven: bool = False,
+        resync_interval: float | None = 60.0,
     ) -> None:
         self._app = app
         self._scan_interval = scan_interval
+        self._change_driven = change_driven
+        self._resync_interval = resync_interval
         self._task: asyncio.Task[None] | None = None
         # Keyed by (object_type, instance_number) for both enrollment and intrinsic
         self._contexts: dict[tuple[int, int], _EnrollmentContext] = {}
-        # Track fire-and-forget confirmed notification tasks to prevent GC
-        self._pending_confirmed_tasks: set[asyncio.Task[None]] = set()
+        # Change-driven state: registered callbacks, objects awaiting
+        # evaluation, and time-delay deadlines (heap + current deadline per
+        # object; superseded heap entries are skipped when popped).
+        self._watches: dict[ObjectIdentifier, Callable[[PropertyIdentifier, Any, Any], None]] = {}
+        self._watched_objects: dict[ObjectIdentifier, BACnetObject] = {}
+        self._watches_stale = True
+        self._membership_hooked = False
+        self._dirty: set[ObjectIdentifier] = set()
+        self._timers: list[tuple[float, int, ObjectIdentifier]] = []
+        self._deadlines: dict[ObjectIdentifier, float] = {}
+        self._timer_seq = itertools.count()
+        self._next_resync: float | None = None
+
+    @property
+    def change_driven(self) -> bool:
+        """Whether intrinsic reporting is evaluated on change rather than by scan."""
+        return self._change_driven
 
     # --- Lifecycle ---
 
@@ -671,12 +759,8 @@ class EventEngine:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
             self._task = None
-        # Cancel pending confirmed notification tasks to release memory
-        for task in self._pending_confirmed_tasks:
-            if not task.done():
-                task.cancel()
-        self._pending_confirmed_tasks.clear()
         self._contexts.clear()
+        self._unwatch_all()
 
     # --- Main loop ---
 
@@ -699,10 +783,132 @@ class EventEngine:
             self._evaluate_enrollment(obj, now)
 
         # 2. Evaluate intrinsic-reporting objects
+        if self._change_driven:
+            self._evaluate_changed(now)
+            return
         for bac_obj in db.values():
             if bac_obj.INTRINSIC_EVENT_ALGORITHM is not None:
                 self._evaluate_intrinsic(bac_obj, now)
 
+    # --- Change-driven evaluation ---
+
+    def notify_changed(self, object_id: ObjectIdentifier) -> None:
+        """Queue an object for re-evaluation in the next change-driven cycle.
+
+        Needed only for updates that bypass
+        :meth:`~bac_py.objects.base.BACnetObject.write_property`.
+
+        :param object_id: Identifier of the changed object.
+        """
+        self._dirty.add(object_id)
+
+    def _evaluate_changed(self, now: float) -> None:
+        """Evaluate intrinsic-reporting objects that changed or have timers due."""
+        db = self._app.object_db
+        if not self._membership_hooked:
+            db.register_membership_listener(self._on_membership_change)
+            self._membership_hooked = True
+        if self._watches_stale:
+            self._sync_watches()
+        if self._resync_interval is not None:
+            if self._next_resync is None:
+                self._next_resync = now + self._resync_interval
+            elif now >= self._next_resync:
+                self._dirty.update(self._watches)
+                self._next_resync = now + self._resync_interval
+
+        timers = self._timers
+        while timers and timers[0][0] <= now:
+            deadline, _, object_id = heapq.heappop(timers)
+            if self._deadlines.get(object_id) == deadline:
+                del self._deadlines[object_id]
+                self._dirty.add(object_id)
+
+        if not self._dirty:
+            return
+        dirty, self._dirty = self._dirty, set()
+        for object_id in dirty:
+            obj = db.get(object_id)
+            if obj is None or obj.INTRINSIC_EVENT_ALGORITHM is None:
+                continue
+            self._evaluate_intrinsic(obj, now)
+            self._schedule_time_delay(object_id)
+
+    def _schedule_time_delay(self, object_id: ObjectIdentifier) -> None:
+        """Arm the timer heap for an object's pending time-delay transition."""
+        ctx = self._contexts.get((int(object_id.object_type), object_id.instance_number))
+        deadline = ctx.state_machine.pending_deadline if ctx is not None else None
+        if deadline is None:
+            self._deadlines.pop(object_id, None)
+            return
+        if self._deadlines.get(object_id) != deadline:
+            self._deadlines[object_id] = deadline
+            heapq.heappush(self._timers, (deadline, next(self._timer_seq), object_id))
+
+    def _on_membership_change(self, object_id: ObjectIdentifier, obj: BACnetObject | None) -> None:
+        """Mark the watches for re-sync after an object is added or removed."""
+        self._watches_stale = True
+
+    def _sync_watches(self) -> None:
+        """Register change callbacks for new objects and drop removed ones.
+
+        Runs on the first cycle and after the database membership changes.
+        An identifier whose object instance was replaced is re-watched from
+        scratch.  Newly watched objects are queued for an initial evaluation.
+        """
+        db = self._app.object_db
+        stale = [
+            oid for oid, watched in self._watched_objects.items() if db.get(oid) is not watched
+        ]
+        for object_id in stale:
+            self._unwatch(object_id)
+            self._contexts.pop((int(object_id.object_type), object_id.instance_number), None)
+            self._deadlines.pop(object_id, None)
+            self._dirty.discard(object_id)
+        for obj in db.values():
+            object_id = obj.object_identifier
+            if obj.INTRINSIC_EVENT_ALGORITHM is None or object_id in self._watches:
+                continue
+            callback = self._make_change_callback(object_id)
+            for prop_id in _INTRINSIC_INPUTS:
+                if prop_id in obj.PROPERTY_DEFINITIONS:
+                    db.register_change_callback(object_id, prop_id, callback)
+            self._watches[object_id] = callback
+            self._watched_objects[object_id] = obj
+            self._dirty.add(object_id)
+        self._watches_stale = False
+
+    def _make_change_callback(
+        self, object_id: ObjectIdentifier
+    ) -> Callable[[PropertyIdentifier, Any, Any], None]:
+        """Create the change callback that queues *object_id* for evaluation."""
+
+        def _on_change(prop_id: PropertyIdentifier, old_value: Any, new_value: Any) -> None:
+            self._dirty.add(object_id)
+
+        return _on_change
+
+    def _unwatch(self, object_id: ObjectIdentifier) -> None:
+        """Unregister the change callbacks for one object."""
+        callback = self._watches.pop(object_id)
+        self._watched_objects.pop(object_id, None)
+        db = self._app.object_db
+        for prop_id in _INTRINSIC_INPUTS:
+            db.unregister_change_callback(object_id, prop_id, callback)
+
+    def _unwatch_all(self) -> None:
+        """Unregister every change callback and reset change-driven state."""
+        for object_id in list(self._watches):
+            self._unwatch(object_id)
+        if self._membership_hooked:
+            self._app.object_db.unregister_membership_listener(self._on_membership_change)
+            self._membership_hooked = False
+        self._watches_stale = True
+        self._dirty.clear()
+        self._timers.clear()
+        self._deadlines.clear()
+        self._next_resync = None
+
     # --- Enrollment-based evaluation ---
 
     def _evaluate_enrollment(self, enrollment: BACnetObject, now: float) -> None:
@@ -1247,11 +1453,14 @@ class EventEngine:
             logger.debug("Failed to send unconfirmed event notification", exc_info=True)
 
     def _send_notification_confirmed(self, notification: Any, dest: Any) -> None:
-        """Encode and send a confirmed event notification.
+        """Encode and queue a confirmed event notification.
 
-        Because confirmed requests are async and the engine evaluation
-        cycle is synchronous, we schedule the send as an asyncio task.
+        The evaluation cycle is synchronous, so the notification is handed
+        to the application's per-recipient delivery queue rather than
+        awaited here.
         """
+        from bac_py.types.enums import ConfirmedServiceChoice
+
         try:
             encoded = notification.encode()
         except Exception:
@@ -1264,27 +1473,12 @@ class EventEngine:
             return
 
         try:
-            loop = asyncio.get_running_loop()
-            _task = loop.create_task(self._send_confirmed_async(encoded, address))
-            # Store reference to prevent GC of the fire-and-forget task
-            self._pending_confirmed_tasks.add(_task)
-            _task.add_done_callback(self._pending_confirmed_tasks.discard)
+            self._app.send_confirmed_notification(
+                encoded, address, ConfirmedServiceChoice.CONFIRMED_EVENT_NOTIFICATION
+            )
         except RuntimeError:
             logger.debug("No running event loop for confirmed notification")
 
-    async def _send_confirmed_async(self, encoded: bytes, address: Any) -> None:
-        """Send a confirmed event notification asynchronously."""
-        from bac_py.types.enums import ConfirmedServiceChoice
-
-        try:
-            await self._app.confirmed_request(
-                destination=address,
-                service_choice=ConfirmedServiceChoice.CONFIRMED_EVENT_NOTIFICATION,
-                service_data=encoded,
-            )
-        except Exception:
-            logger.debug("Failed to send confirmed event notification", exc_info=True)
-
     # --- Helper methods ---
 
     def _get_priority(self, notification_class_num: int, to_state: EventState) -> int:
@@ -0,0 +1,373 @@
+"""Windowed stream transfers of remote File objects.
+
+:func:`download_file` and :func:`upload_file` move a File object's
+contents with AtomicReadFile and AtomicWriteFile (Clause 14), keeping
+several requests in flight to the same device instead of waiting for
+each round trip in turn.
+
+Chunks are sized from the peer's cached I-Am: a read response fills one
+APDU, or several segments when the peer can transmit segmented messages,
+and a write request always fits in one APDU.  A chunk aborted because it
+was too large is split in half and retried, and later chunks use the
+smaller size.
+
+Downloaded chunks may complete out of order; they are reassembled and
+written to the sink strictly in file order, so the whole file is never
+held in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections import deque
+from typing import TYPE_CHECKING, Any, Protocol
+
+from bac_py.app._rpm_batching import rpm_size_limits
+from bac_py.services.errors import BACnetAbortError
+from bac_py.services.file_access import StreamReadAccess, StreamReadACK, StreamWriteAccess
+from bac_py.types.enums import AbortReason
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from bac_py.app.application import BACnetApplication
+    from bac_py.app.client import BACnetClient
+    from bac_py.network.address import BACnetAddress
+    from bac_py.types.primitives import ObjectIdentifier
+
+logger = logging.getLogger(__name__)
+
+# Service parameters around the file data: endOfFile, the [0] opening and
+# closing tags, fileStartPosition, and the octet string header.
+_READ_ACK_OVERHEAD = 16
+# fileIdentifier, the [0] opening and closing tags, fileStartPosition, and
+# the octet string header.
+_WRITE_REQUEST_OVERHEAD = 20
+
+MIN_CHUNK_SIZE = 32
+"""Smallest chunk a transfer shrinks to before giving up."""
+
+DEFAULT_WINDOW = 4
+"""Requests kept in flight to the device by default."""
+
+_SHRINK_REASONS = frozenset(
+    {
+        AbortReason.SEGMENTATION_NOT_SUPPORTED,
+        AbortReason.BUFFER_OVERFLOW,
+        AbortReason.APDU_TOO_LONG,
+    }
+)
+
+
+class _Writable(Protocol):
+    def write(self, data: bytes, /) -> Any: ...
+
+
+class _Readable(Protocol):
+    def read(self, size: int, /) -> bytes: ...
+
+
+type FileSink = _Writable | Callable[[bytes], Awaitable[None] | None]
+"""Destination of a download: a binary file object, or a callable taking
+each chunk in file order.  Either may return an awaitable."""
+
+type FileSource = bytes | bytearray | memoryview | _Readable
+"""Source of an upload: a bytes-like object, or a binary file object read
+sequentially."""
+
+
+def stream_chunk_sizes(app: BACnetApplication, address: BACnetAddress) -> tuple[int, int]:
+    """Return the ``(read, write)`` chunk sizes to use with *address*.
+
+    :param app: Application whose device cache holds the peer's I-Am.
+    :param address: Peer device address.
+    :returns: File bytes per AtomicReadFile response and per
+        AtomicWriteFile request.
+    """
+    config = app.config
+    max_request, max_response = rpm_size_limits(
+        config.max_apdu_length,
+        app.get_device_info(address),
+        max_segments=config.max_segments,
+    )
+    return (
+        max(MIN_CHUNK_SIZE, max_response - _READ_ACK_OVERHEAD),
+        max(MIN_CHUNK_SIZE, max_request - _WRITE_REQUEST_OVERHEAD),
+    )
+
+
+def _validate_window(window: int) -> None:
+    if window < 1:
+        msg = f"window must be >= 1, got {window}"
+        raise ValueError(msg)
+
+
+class _Window:
+    """State shared by the workers of one transfer."""
+
+    def __init__(self, chunk_size: int) -> None:
+        self.chunk_size = chunk_size
+        self.next_offset = 0
+        self.limit: int | None = None
+        """Offset at or after which nothing more is sent."""
+        self.failure: tuple[int, BaseException] | None = None
+
+    def stop_at(self, offset: int) -> None:
+        self.limit = offset if self.limit is None else min(self.limit, offset)
+
+    def fail(self, offset: int, exc: BaseException) -> None:
+        """Record the failure of the chunk at *offset*; the lowest one wins."""
+        if self.failure is None or offset < self.failure[0]:
+            self.failure = (offset, exc)
+        self.stop_at(offset)
+
+    def shrink(self, exc: BACnetAbortError, count: int) -> int | None:
+        """Return the size to retry an aborted *count*-byte chunk with."""
+        if exc.reason not in _SHRINK_REASONS or count <= MIN_CHUNK_SIZE:
+            return None
+        smaller = max(MIN_CHUNK_SIZE, count // 2)
+        self.chunk_size = min(self.chunk_size, smaller)
+        return smaller
+
+
+async def download_file(
+    client: BACnetClient,
+    address: BACnetAddress,
+    file_identifier: ObjectIdentifier,
+    sink: FileSink,
+    *,
+    window: int = DEFAULT_WINDOW,
+    chunk_size: int | None = None,
+    timeout: float | None = None,
+) -> int:
+    """Download a stream-access File object into *sink*.
+
+    While the file size is unknown, reads past its end are issued
+    speculatively; their results, including errors, are discarded once a
+    response reports end of file.
+
+    :param client: Client used to send the requests.
+    :param address: Device holding the file.
+    :param file_identifier: File object to read.
+    :param sink: Receives the file contents in order.
+    :param window: AtomicReadFile requests kept in flight.
+    :param chunk_size: Bytes requested per read.  Defaults to the largest
+        response the peer can send (see :func:`stream_chunk_sizes`).
+    :param timeout: Optional caller-level timeout per request in seconds.
+    :returns: Number of bytes written to *sink*.
+    :raises BACnetError: On an Error-PDU for a chunk within the file.
+    :raises BACnetTimeoutError: If a chunk times out after all retries.
+    """
+    _validate_window(window)
+    state = _Window(chunk_size or stream_chunk_sizes(client.app, address)[0])
+    retry: deque[tuple[int, int]] = deque()
+    pending: dict[int, bytes] = {}
+    written = 0
+    end: int | None = None
+    probed = False
+    flushing = asyncio.Lock()
+    progress = asyncio.Condition()
+    # Bound on data buffered ahead of the sink while an early chunk lags
+    max_ahead = state.chunk_size * window * 4
+
+    def _take() -> tuple[int, int] | None:
+        limit = state.limit
+        while retry:
+            start, count = retry.popleft()
+            if limit is None or start < limit:
+                return start, count
+        if limit is not None and state.next_offset >= limit:
+            return None
+        start = state.next_offset
+        state.next_offset += state.chunk_size
+        return start, state.chunk_size
+
+    def _can_take() -> bool:
+        if state.next_offset and not probed:
+            # Hold the window open until the first reply, so small files
+            # take a single request.
+            return False
+        return bool(retry) or state.limit is not None or state.next_offset - written < max_ahead
+
+    async def _flush() -> None:
+        nonlocal written
+        async with flushing:
+            while written in pending:
+                data = pending.pop(written)
+                write = sink.write if hasattr(sink, "write") else sink
+                result = write(data)
+                if inspect.isawaitable(result):
+                    await result
+                written += len(data)
+
+    async def _notify() -> None:
+        async with progress:
+            progress.notify_all()
+
+    async def _read(start: int, count: int) -> bool:
+        """Read one chunk; return ``False`` once this worker should stop."""
+        nonlocal end
+        try:
+            ack = await client.atomic_read_file(
+                address, file_identifier, StreamReadAccess(start, count), timeout=timeout
+            )
+        except BACnetAbortError as exc:
+            smaller = state.shrink(exc, count)
+            if smaller is None:
+                state.fail(start, exc)
+                return False
+            logger.debug("read of %d bytes from %s aborted, using %d", count, address, smaller)
+            retry.extendleft(reversed(_split(start, count, smaller)))
+            return True
+        except Exception as exc:
+            state.fail(start, exc)
+            return False
+        access = ack.access_method
+        assert isinstance(access, StreamReadACK)
+        data = bytes(access.file_data)
+        if ack.end_of_file:
+            end = start + len(data) if end is None else min(end, start + len(data))
+            state.stop_at(end)
+        elif not data:
+            msg = f"AtomicReadFile returned no data at {start} before end of file"
+            state.fail(start, RuntimeError(msg))
+            return False
+        elif len(data) < count:
+            retry.appendleft((start + len(data), count - len(data)))
+        if data:
+            pending[start] = data
+            await _flush()
+        return True
+
+    async def _worker() -> None:
+        nonlocal probed
+        try:
+            while True:
+                async with progress:
+                    await progress.wait_for(_can_take)
+                taken = _take()
+                if taken is None:
+                    return
+                keep_going = await _read(*taken)
+                probed = True
+                await _notify()
+                if not keep_going:
+                    return
+        finally:
+            await _notify()
+
+    await _run_workers(_worker, window)
+    if state.failure is not None and (end is None or state.failure[0] < end):
+        raise state.failure[1]
+    logger.debug("downloaded %d bytes of %s from %s", written, file_identifier, address)
+    return written
+
+
+async def upload_file(
+    client: BACnetClient,
+    address: BACnetAddress,
+    file_identifier: ObjectIdentifier,
+    source: FileSource,
+    *,
+    start: int = 0,
+    window: int = DEFAULT_WINDOW,
+    chunk_size: int | None = None,
+    timeout: float | None = None,
+) -> int:
+    """Upload *source* to a stream-access File object.
+
+    Chunks are written at explicit positions, so they may complete in
+    any order.  The remote file is not truncated: data past the end of
+    *source* is left in place.
+
+    :param client: Client used to send the requests.
+    :param address: Device holding the file.
+    :param file_identifier: File object to write.
+    :param source: Data to write.
+    :param start: File position to write the first byte at.
+    :param window: AtomicWriteFile requests kept in flight.
+    :param chunk_size: Bytes per write.  Defaults to the largest
+        unsegmented request the peer accepts (see
+        :func:`stream_chunk_sizes`).
+    :param timeout: Optional caller-level timeout per request in seconds.
+    :returns: Number of bytes written.
+    :raises BACnetError: On an Error-PDU response.
+    :raises BACnetTimeoutError: If a chunk times out after all retries.
+    """
+    _validate_window(window)
+    state = _Window(chunk_size or stream_chunk_sizes(client.app, address)[1])
+    retry: deque[tuple[int, memoryview | bytes]] = deque()
+    view = memoryview(source) if isinstance(source, bytes | bytearray | memoryview) else None
+    total = 0
+
+    def _take() -> tuple[int, memoryview | bytes] | None:
+        nonlocal total
+        if state.failure is not None:
+            return None
+        if retry:
+            return retry.popleft()
+        if state.limit is not None:
+            return None
+        offset = state.next_offset
+        if view is not None:
+            data: memoryview | bytes = view[offset : offset + state.chunk_size]
+        else:
+            data = source.read(state.chunk_size)  # type: ignore[union-attr]
+        if not data:
+            state.stop_at(offset)
+            return None
+        state.next_offset += len(data)
+        total = state.next_offset
+        return offset, data
+
+    async def _worker() -> None:
+        while (taken := _take()) is not None:
+            offset, data = taken
+            try:
+                await client.atomic_write_file(
+                    address,
+                    file_identifier,
+                    StreamWriteAccess(start + offset, bytes(data)),
+                    timeout=timeout,
+                )
+            except BACnetAbortError as exc:
+                smaller = state.shrink(exc, len(data))
+                if smaller is None:
+                    state.fail(offset, exc)
+                    return
+                logger.debug(
+                    "write of %d bytes to %s aborted, using %d", len(data), address, smaller
+                )
+                retry.extendleft(
+                    reversed(
+                        [
+                            (s, data[s - offset : s - offset + n])
+                            for s, n in _split(offset, len(data), smaller)
+                        ]
+                    )
+                )
+            except Exception as exc:
+                state.fail(offset, exc)
+                return
+
+    await _run_workers(_worker, window)
+    if state.failure is not None:
+        raise state.failure[1]
+    logger.debug("uploaded %d bytes of %s to %s", total, file_identifier, address)
+    return total
+
+
+def _split(start: int, count: int, size: int) -> list[tuple[int, int]]:
+    """Split ``[start, start + count)`` into ranges of at most *size* bytes."""
+    return [(s, min(size, start + count - s)) for s in range(start, start + count, size)]
+
+
+async def _run_workers(worker: Callable[[], Awaitable[None]], window: int) -> None:
+    tasks = [asyncio.ensure_future(worker()) for _ in range(window)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,532 @@
+"""Backup and restore of many devices at once (Clause 19.1).
+
+:func:`backup_fleet` runs the backup procedure of
+:meth:`~bac_py.app.client.BACnetClient.backup_device` on a list of
+devices, and :func:`restore_fleet` the restore procedure of
+:meth:`~bac_py.app.client.BACnetClient.restore_device`.  Concurrency is
+bounded both globally and per BACnet network, as in
+:func:`~bac_py.app.site_scan.scan_site`, and one result per device is
+yielded as it completes.
+
+Configuration files are streamed to disk as they are downloaded, so the
+files of a device are never held in memory.  Each device's backup is
+written to ``<directory>/<instance>/`` with a ``manifest.json`` listing
+its files in order; :func:`restore_fleet` reads the same layout.  A
+backup is assembled in ``<instance>.partial/`` and only replaces the
+previous backup once the device has ended its backup.
+
+Devices preparing for a backup or restore are polled for
+Backup_And_Restore_State from one shared loop, instead of one polling
+loop per device.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import shutil
+import time
+from contextlib import aclosing, suppress
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bac_py.app._scheduler import RETRYABLE, object_name, run_per_network
+from bac_py.app.file_transfer import DEFAULT_WINDOW, download_file, upload_file
+from bac_py.encoding.primitives import decode_all_application_values, decode_and_unwrap
+from bac_py.services.errors import BACnetTimeoutError
+from bac_py.types.enums import (
+    BackupAndRestoreState,
+    ObjectType,
+    PropertyIdentifier,
+    ReinitializedState,
+)
+from bac_py.types.parsing import parse_object_identifier
+from bac_py.types.primitives import ObjectIdentifier
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from bac_py.app.client import BACnetClient, DiscoveredDevice
+    from bac_py.app.site_scan import SiteScanCheckpoint
+    from bac_py.network.address import BACnetAddress
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+"""Name of the file listing a device's backed-up configuration files."""
+
+_BACKUP_READY = (
+    BackupAndRestoreState.PERFORMING_A_BACKUP,
+    BackupAndRestoreState.PREPARING_FOR_BACKUP,
+)
+_RESTORE_READY = (
+    BackupAndRestoreState.PERFORMING_A_RESTORE,
+    BackupAndRestoreState.PREPARING_FOR_RESTORE,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FleetBackupResult:
+    """Outcome of backing up or restoring one device."""
+
+    device: DiscoveredDevice
+    """The device."""
+
+    path: Path | None = None
+    """Directory holding the device's backup, or ``None`` if a backup
+    failed before completing."""
+
+    files: list[ObjectIdentifier] = field(default_factory=list)
+    """Configuration files transferred, in order."""
+
+    size: int = 0
+    """Total bytes transferred."""
+
+    phase: str = "done"
+    """Last step reached: ``"start"``, ``"prepare"``, ``"list"``,
+    ``"transfer"``, ``"end"``, or ``"done"``.  For a restore, ``"load"``
+    means the backup on disk could not be read."""
+
+    error: Exception | None = None
+    """Error that ended the procedure, or ``None`` on success."""
+
+    attempts: int = 1
+    """Number of attempts made, including retries."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the device was backed up or restored successfully."""
+        return self.error is None
+
+
+@dataclass(slots=True)
+class _Waiter:
+    address: BACnetAddress
+    device_oid: ObjectIdentifier
+    targets: tuple[BackupAndRestoreState, ...]
+    deadline: float
+    future: asyncio.Future[BackupAndRestoreState]
+
+
+class _StatePoller:
+    """Polls Backup_And_Restore_State of all waiting devices from one loop."""
+
+    def __init__(
+        self,
+        client: BACnetClient,
+        *,
+        interval: float,
+        max_in_flight: int,
+        timeout: float | None,
+    ) -> None:
+        self._client = client
+        self._interval = interval
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._timeout = timeout
+        self._waiters: dict[int, _Waiter] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    async def wait(
+        self,
+        address: BACnetAddress,
+        device_oid: ObjectIdentifier,
+        targets: tuple[BackupAndRestoreState, ...],
+        overall_timeout: float,
+    ) -> BackupAndRestoreState:
+        """Wait until the device reports one of *targets*."""
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(
+            address, device_oid, targets, loop.time() + overall_timeout, loop.create_future()
+        )
+        key = id(waiter)
+        self._waiters[key] = waiter
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        try:
+            return await waiter.future
+        finally:
+            self._waiters.pop(key, None)
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._waiters:
+            waiters = [w for w in self._waiters.values() if not w.future.done()]
+            await asyncio.gather(*(self._poll(w) for w in waiters))
+            now = loop.time()
+            for waiter in waiters:
+                if not waiter.future.done() and now >= waiter.deadline:
+                    msg = "Timed out waiting for backup/restore state"
+                    waiter.future.set_exception(BACnetTimeoutError(msg))
+            await asyncio.sleep(self._interval)
+
+    async def _poll(self, waiter: _Waiter) -> None:
+        async with self._semaphore:
+            try:
+                ack = await self._client.read_property(
+                    waiter.address,
+                    waiter.device_oid,
+                    PropertyIdentifier.BACKUP_AND_RESTORE_STATE,
+                    timeout=self._timeout,
+                )
+            except RETRYABLE:
+                # Devices often stop answering while they prepare
+                return
+            except Exception as exc:
+                if not waiter.future.done():
+                    waiter.future.set_exception(exc)
+                return
+        state = decode_and_unwrap(ack.property_value)
+        if isinstance(state, int) and state in waiter.targets and not waiter.future.done():
+            waiter.future.set_result(BackupAndRestoreState(state))
+
+
+async def backup_fleet(
+    client: BACnetClient,
+    devices: Iterable[DiscoveredDevice],
+    directory: str | Path,
+    *,
+    password: str | None = None,
+    max_concurrency: int = 16,
+    max_per_network: int = 4,
+    window: int = DEFAULT_WINDOW,
+    poll_interval: float = 1.0,
+    prepare_timeout: float = 300.0,
+    retries: int = 1,
+    backoff: float = 5.0,
+    timeout: float | None = None,
+    checkpoint: SiteScanCheckpoint | None = None,
+) -> AsyncIterator[FleetBackupResult]:
+    """Back up *devices* into *directory*, yielding one result per device.
+
+    Progress is resumable per device only: a *checkpoint* skips devices
+    whose backup finished, but a device interrupted part way through is
+    backed up again from the start, and the files it had already
+    downloaded are discarded.
+
+    Usage::
+
+        async for result in backup_fleet(client, devices, "backups/nightly"):
+            if not result.ok:
+                print(result.device.instance, result.phase, result.error)
+
+    :param client: Client used to send the requests.
+    :param devices: Devices to back up.
+    :param directory: Directory to write the backups to.  Created if
+        missing.
+    :param password: Optional password for ReinitializeDevice.
+    :param max_concurrency: Maximum devices backed up at once.
+    :param max_per_network: Maximum devices backed up at once on any one
+        BACnet network.  Devices on the local network share one limit.
+    :param window: AtomicReadFile requests in flight per device.
+    :param poll_interval: Seconds between Backup_And_Restore_State polls.
+    :param prepare_timeout: Seconds a device may take to become ready.
+    :param retries: Retries for a device whose requests time out.  The
+        whole backup procedure is repeated.
+    :param backoff: Delay in seconds before the first retry.  Doubles on
+        each further retry.
+    :param timeout: Optional caller-level timeout in seconds, applied to
+        each request.
+    :param checkpoint: Checkpoint to skip devices already backed up and
+        record newly completed ones.
+    :returns: Async iterator of :class:`FleetBackupResult`.
+    :raises ValueError: If a concurrency limit is below 1 or *retries*
+        is negative.
+    """
+    root = Path(directory)
+    root.mkdir(parents=True, exist_ok=True)
+
+    async def _job(device: DiscoveredDevice, poller: _StatePoller) -> FleetBackupResult:
+        return await _backup_device(
+            client, poller, device, root, password, window, prepare_timeout, timeout
+        )
+
+    async for result in _run_fleet(
+        client,
+        devices,
+        _job,
+        max_concurrency=max_concurrency,
+        max_per_network=max_per_network,
+        poll_interval=poll_interval,
+        retries=retries,
+        backoff=backoff,
+        timeout=timeout,
+        checkpoint=checkpoint,
+    ):
+        yield result
+
+
+async def restore_fleet(
+    client: BACnetClient,
+    devices: Iterable[DiscoveredDevice],
+    directory: str | Path,
+    *,
+    password: str | None = None,
+    max_concurrency: int = 16,
+    max_per_network: int = 4,
+    window: int = DEFAULT_WINDOW,
+    poll_interval: float = 1.0,
+    prepare_timeout: float = 300.0,
+    retries: int = 1,
+    backoff: float = 5.0,
+    timeout: float | None = None,
+    checkpoint: SiteScanCheckpoint | None = None,
+) -> AsyncIterator[FleetBackupResult]:
+    """Restore *devices* from backups written by :func:`backup_fleet`.
+
+    Each device is restored from ``<directory>/<instance>/``.  A device
+    whose backup cannot be read fails in the ``"load"`` phase without
+    being contacted.  If a restore fails after it started, the device is
+    sent ReinitializeDevice ABORT_RESTORE.
+
+    The parameters are those of :func:`backup_fleet`, with *window*
+    applying to AtomicWriteFile requests.
+
+    :returns: Async iterator of :class:`FleetBackupResult`.
+    :raises ValueError: If a concurrency limit is below 1 or *retries*
+        is negative.
+    """
+    root = Path(directory)
+
+    async def _job(device: DiscoveredDevice, poller: _StatePoller) -> FleetBackupResult:
+        return await _restore_device(
+            client, poller, device, root, password, window, prepare_timeout, timeout
+        )
+
+    async for result in _run_fleet(
+        client,
+        devices,
+        _job,
+        max_concurrency=max_concurrency,
+        max_per_network=max_per_network,
+        poll_interval=poll_interval,
+        retries=retries,
+        backoff=backoff,
+        timeout=timeout,
+        checkpoint=checkpoint,
+    ):
+        yield result
+
+
+async def _run_fleet(
+    client: BACnetClient,
+    devices: Iterable[DiscoveredDevice],
+    job: Callable[[DiscoveredDevice, _StatePoller], Awaitable[FleetBackupResult]],
+    *,
+    max_concurrency: int,
+    max_per_network: int,
+    poll_interval: float,
+    retries: int,
+    backoff: float,
+    timeout: float | None,
+    checkpoint: SiteScanCheckpoint | None,
+) -> AsyncIterator[FleetBackupResult]:
+    """Run *job* for every device within the concurrency limits."""
+    if min(max_concurrency, max_per_network) < 1:
+        msg = "Concurrency limits must be at least 1"
+        raise ValueError(msg)
+    if retries < 0:
+        msg = f"retries must be non-negative, got {retries}"
+        raise ValueError(msg)
+
+    poller = _StatePoller(
+        client, interval=poll_interval, max_in_flight=max_concurrency, timeout=timeout
+    )
+
+    async def _attempt(device: DiscoveredDevice) -> FleetBackupResult:
+        attempt = 0
+        while True:
+            attempt += 1
+            result = await job(device, poller)
+            if not isinstance(result.error, RETRYABLE) or attempt > retries:
+                break
+            delay = backoff * 2 ** (attempt - 1)
+            logger.debug("device %d timed out, retrying in %.1fs", device.instance, delay)
+            await asyncio.sleep(delay)
+        if result.error is not None:
+            logger.warning(
+                "device %d failed during %s: %s", device.instance, result.phase, result.error
+            )
+        return FleetBackupResult(
+            device,
+            result.path,
+            result.files,
+            result.size,
+            result.phase,
+            result.error,
+            attempts=attempt,
+        )
+
+    try:
+        async with aclosing(
+            run_per_network(
+                devices,
+                _attempt,
+                max_concurrency=max_concurrency,
+                max_per_network=max_per_network,
+                checkpoint=checkpoint,
+                name="fleet",
+            )
+        ) as results:
+            async for result in results:
+                yield result
+    finally:
+        await poller.close()
+
+
+async def _backup_device(
+    client: BACnetClient,
+    poller: _StatePoller,
+    device: DiscoveredDevice,
+    root: Path,
+    password: str | None,
+    window: int,
+    prepare_timeout: float,
+    timeout: float | None,
+) -> FleetBackupResult:
+    """Back up one device into ``root/<instance>``."""
+    address = device.address
+    device_oid = ObjectIdentifier(ObjectType.DEVICE, device.instance)
+    staging = root / f"{device.instance}.partial"
+    files: list[ObjectIdentifier] = []
+    size = 0
+    phase = "start"
+    started = False
+    try:
+        await client.reinitialize_device(
+            address, ReinitializedState.START_BACKUP, password=password, timeout=timeout
+        )
+        started = True
+
+        phase = "prepare"
+        await poller.wait(address, device_oid, _BACKUP_READY, prepare_timeout)
+
+        phase = "list"
+        file_ids = await _read_configuration_files(client, address, device_oid, timeout)
+
+        phase = "transfer"
+        shutil.rmtree(staging, ignore_errors=True)
+        staging.mkdir()
+        entries = []
+        for file_oid in file_ids:
+            name = f"{object_name(file_oid).replace(',', '-')}.bin"
+            with (staging / name).open("wb") as f:
+                written = await download_file(
+                    client, address, file_oid, f, window=window, timeout=timeout
+                )
+            files.append(file_oid)
+            size += written
+            entries.append(
+                {
+                    "object": object_name(file_oid),
+                    "name": name,
+                    "size": written,
+                }
+            )
+        manifest = {
+            "version": 1,
+            "device_instance": device.instance,
+            "created": time.time(),
+            "files": entries,
+        }
+        (staging / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+
+        phase = "end"
+        started = False
+        await client.reinitialize_device(
+            address, ReinitializedState.END_BACKUP, password=password, timeout=timeout
+        )
+    except Exception as exc:
+        if started:
+            with suppress(Exception):
+                await client.reinitialize_device(
+                    address, ReinitializedState.END_BACKUP, password=password, timeout=timeout
+                )
+        shutil.rmtree(staging, ignore_errors=True)
+        return FleetBackupResult(device, None, files, size, phase, exc)
+
+    path = root / str(device.instance)
+    shutil.rmtree(path, ignore_errors=True)
+    staging.replace(path)
+    logger.debug("backed up device %d: %d files, %d bytes", device.instance, len(files), size)
+    return FleetBackupResult(device, path, files, size)
+
+
+async def _restore_device(
+    client: BACnetClient,
+    poller: _StatePoller,
+    device: DiscoveredDevice,
+    root: Path,
+    password: str | None,
+    window: int,
+    prepare_timeout: float,
+    timeout: float | None,
+) -> FleetBackupResult:
+    """Restore one device from ``root/<instance>``."""
+    address = device.address
+    device_oid = ObjectIdentifier(ObjectType.DEVICE, device.instance)
+    path = root / str(device.instance)
+    files: list[ObjectIdentifier] = []
+    size = 0
+    phase = "load"
+    started = False
+    try:
+        manifest = json.loads((path / MANIFEST_NAME).read_text())
+        entries = [
+            (parse_object_identifier(entry["object"]), path / entry["name"])
+            for entry in manifest["files"]
+        ]
+
+        phase = "start"
+        await client.reinitialize_device(
+            address, ReinitializedState.START_RESTORE, password=password, timeout=timeout
+        )
+        started = True
+
+        phase = "prepare"
+        await poller.wait(address, device_oid, _RESTORE_READY, prepare_timeout)
+
+        phase = "transfer"
+        for file_oid, file_path in entries:
+            with file_path.open("rb") as f:
+                size += await upload_file(
+                    client, address, file_oid, f, window=window, timeout=timeout
+                )
+            files.append(file_oid)
+
+        phase = "end"
+        started = False
+        await client.reinitialize_device(
+            address, ReinitializedState.END_RESTORE, password=password, timeout=timeout
+        )
+    except Exception as exc:
+        if started:
+            with suppress(Exception):
+                await client.reinitialize_device(
+                    address, ReinitializedState.ABORT_RESTORE, password=password, timeout=timeout
+                )
+        return FleetBackupResult(device, path, files, size, phase, exc)
+
+    logger.debug("restored device %d: %d files, %d bytes", device.instance, len(files), size)
+    return FleetBackupResult(device, path, files, size)
+
+
+async def _read_configuration_files(
+    client: BACnetClient,
+    address: BACnetAddress,
+    device_oid: ObjectIdentifier,
+    timeout: float | None,
+) -> list[ObjectIdentifier]:
+    ack = await client.read_property(
+        address, device_oid, PropertyIdentifier.CONFIGURATION_FILES, timeout=timeout
+    )
+    decoded = decode_all_application_values(ack.property_value)
+    return [v for v in decoded if isinstance(v, ObjectIdentifier)]
@@ -0,0 +1,354 @@
+"""Flow-controlled delivery of confirmed notifications.
+
+Confirmed COV and event notifications are queued per recipient and sent
+through a small in-flight window, so a recipient that is slow or offline
+holds a bounded number of outstanding transactions instead of one per
+notification.  Repeated transport failures open a per-recipient circuit
+breaker that pauses delivery and probes the recipient with exponential
+backoff until it answers again.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from bac_py.services.errors import BACnetAbortError, BACnetError, BACnetRejectError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+    from bac_py.network.address import BACnetAddress
+
+logger = logging.getLogger(__name__)
+
+# Responses proving the recipient is reachable, even though the
+# notification itself was refused.
+_PEER_RESPONSES = (BACnetError, BACnetRejectError, BACnetAbortError)
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryPolicy:
+    """Limits applied to confirmed notification delivery per recipient."""
+
+    max_in_flight: int = 2
+    """Confirmed notifications awaiting a response at once."""
+
+    max_queue: int = 64
+    """Notifications held while the window is full; the oldest is dropped
+    when a new one arrives at a full queue."""
+
+    failure_threshold: int = 3
+    """Consecutive failed deliveries that open the circuit breaker."""
+
+    backoff: float = 5.0
+    """Seconds the breaker stays open before the first probe."""
+
+    max_backoff: float = 300.0
+    """Upper bound for the backoff, which doubles after each failed probe."""
+
+    def __post_init__(self) -> None:
+        """Validate the limits."""
+        if self.max_in_flight < 1:
+            msg = f"max_in_flight must be >= 1, got {self.max_in_flight}"
+            raise ValueError(msg)
+        if self.max_queue < 1:
+            msg = f"max_queue must be >= 1, got {self.max_queue}"
+            raise ValueError(msg)
+        if self.failure_threshold < 1:
+            msg = f"failure_threshold must be >= 1, got {self.failure_threshold}"
+            raise ValueError(msg)
+        if self.backoff <= 0 or self.max_backoff < self.backoff:
+            msg = (
+                f"backoff must be > 0 and <= max_backoff, got {self.backoff} "
+                f"and {self.max_backoff}"
+            )
+            raise ValueError(msg)
+
+
+@dataclass
+class RecipientStats:
+    """Delivery counters for one notification recipient."""
+
+    queue_depth: int = 0
+    """Notifications waiting for a free slot."""
+
+    max_queue_depth: int = 0
+    """Highest queue depth observed."""
+
+    in_flight: int = 0
+    """Notifications awaiting a response."""
+
+    delivered: int = 0
+    """Notifications acknowledged by the recipient."""
+
+    failed: int = 0
+    """Notifications that timed out, were refused, or could not be sent."""
+
+    dropped: int = 0
+    """Notifications discarded because the queue was full."""
+
+    superseded: int = 0
+    """Queued notifications replaced by a newer one for the same object."""
+
+    total_latency: float = 0.0
+    """Cumulative seconds from queueing to acknowledgement."""
+
+    max_latency: float = 0.0
+    """Longest single delivery latency in seconds."""
+
+    breaker_open: bool = False
+    """Whether delivery is paused by the circuit breaker."""
+
+    breaker_trips: int = 0
+    """Times the circuit breaker has opened."""
+
+    @property
+    def mean_latency(self) -> float:
+        """Average delivery latency in seconds, or 0.0 before the first delivery."""
+        return self.total_latency / self.delivered if self.delivered else 0.0
+
+
+@dataclass(slots=True)
+class _Notification:
+    service_choice: int
+    service_data: bytes
+    key: Hashable | None
+    queued_at: float
+    probe: bool = False
+
+
+class _Recipient:
+    """Queue and breaker state for one destination address."""
+
+    __slots__ = ("backoff", "failures", "keyed", "open_until", "queue", "stats", "timer")
+
+    def __init__(self) -> None:
+        self.queue: deque[_Notification] = deque()
+        self.keyed: dict[Hashable, _Notification] = {}
+        self.failures = 0
+        self.open_until: float | None = None
+        self.backoff = 0.0
+        self.timer: asyncio.TimerHandle | None = None
+        self.stats = RecipientStats()
+
+
+class NotificationDelivery:
+    """Per-recipient queues for confirmed notifications.
+
+    :param send: Coroutine function performing one confirmed request,
+        called as ``send(destination=..., service_choice=...,
+        service_data=...)``; typically
+        :meth:`~bac_py.app.application.BACnetApplication.confirmed_request`.
+    :param policy: Window, queue, and breaker limits.
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., Awaitable[Any]],
+        policy: DeliveryPolicy | None = None,
+    ) -> None:
+        self._send = send
+        self._policy = policy or DeliveryPolicy()
+        self._recipients: dict[BACnetAddress, _Recipient] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def policy(self) -> DeliveryPolicy:
+        """The limits applied to every recipient."""
+        return self._policy
+
+    def submit(
+        self,
+        destination: BACnetAddress,
+        service_choice: int,
+        service_data: bytes,
+        *,
+        key: Hashable | None = None,
+    ) -> None:
+        """Queue a confirmed notification for *destination*.
+
+        :param destination: Recipient address.
+        :param service_choice: Confirmed service choice number.
+        :param service_data: Encoded service request.
+        :param key: Identifies what the notification reports on.  A queued,
+            not yet sent notification with the same key is replaced in
+            place, so only the newest value is delivered.  ``None`` never
+            replaces anything.
+        """
+        recipient = self._recipients.get(destination)
+        if recipient is None:
+            recipient = self._recipients[destination] = _Recipient()
+        stats = recipient.stats
+
+        if key is not None:
+            queued = recipient.keyed.get(key)
+            if queued is not None:
+                queued.service_choice = service_choice
+                queued.service_data = service_data
+                stats.superseded += 1
+                return
+
+        if len(recipient.queue) >= self._policy.max_queue:
+            oldest = recipient.queue.popleft()
+            if oldest.key is not None:
+                recipient.keyed.pop(oldest.key, None)
+            stats.dropped += 1
+            logger.debug("Notification queue for %s full, dropped oldest", destination)
+
+        notification = _Notification(service_choice, service_data, key, time.monotonic())
+        recipient.queue.append(notification)
+        if key is not None:
+            recipient.keyed[key] = notification
+        self._pump(destination, recipient)
+
+    def stats(self, destination: BACnetAddress) -> RecipientStats | None:
+        """Return the delivery counters for *destination*, if it is tracked.
+
+        A recipient is tracked while it has queued or in-flight
+        notifications, or failures that count toward its circuit breaker.
+        Once it is idle and healthy it is forgotten, along with its
+        counters.
+        """
+        recipient = self._recipients.get(destination)
+        return recipient.stats if recipient is not None else None
+
+    def all_stats(self) -> dict[BACnetAddress, RecipientStats]:
+        """Return the delivery counters for every tracked recipient."""
+        return {address: r.stats for address, r in self._recipients.items()}
+
+    async def close(self) -> None:
+        """Cancel outstanding deliveries and discard all queued notifications."""
+        for recipient in self._recipients.values():
+            if recipient.timer is not None:
+                recipient.timer.cancel()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._recipients.clear()
+
+    # --- Internals ---
+
+    def _pump(self, destination: BACnetAddress, recipient: _Recipient) -> None:
+        """Start deliveries while the window and the breaker allow."""
+        limit = self._policy.max_in_flight
+        probe = False
+        if recipient.open_until is not None:
+            if time.monotonic() < recipient.open_until:
+                self._update_depth(recipient)
+                return
+            # Half-open: a single probe decides whether to close the breaker.
+            limit = 1
+            probe = True
+
+        stats = recipient.stats
+        loop = asyncio.get_running_loop()
+        while recipient.queue and stats.in_flight < limit:
+            notification = recipient.queue.popleft()
+            if notification.key is not None:
+                recipient.keyed.pop(notification.key, None)
+            notification.probe = probe
+            stats.in_flight += 1
+            task = loop.create_task(self._deliver(destination, recipient, notification))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        self._update_depth(recipient)
+
+    @staticmethod
+    def _update_depth(recipient: _Recipient) -> None:
+        stats = recipient.stats
+        stats.queue_depth = len(recipient.queue)
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+
+    async def _deliver(
+        self,
+        destination: BACnetAddress,
+        recipient: _Recipient,
+        notification: _Notification,
+    ) -> None:
+        """Send one notification and feed the outcome to the breaker."""
+        reachable = True
+        try:
+            await self._send(
+                destination=destination,
+                service_choice=notification.service_choice,
+                service_data=notification.service_data,
+            )
+        except _PEER_RESPONSES:
+            recipient.stats.failed += 1
+            logger.debug("Confirmed notification to %s refused", destination, exc_info=True)
+        except Exception:
+            recipient.stats.failed += 1
+            reachable = False
+            logger.debug("Confirmed notification to %s failed", destination, exc_info=True)
+        else:
+            latency = time.monotonic() - notification.queued_at
+            stats = recipient.stats
+            stats.delivered += 1
+            stats.total_latency += latency
+            stats.max_latency = max(stats.max_latency, latency)
+        finally:
+            recipient.stats.in_flight -= 1
+
+        if reachable:
+            self._on_reachable(destination, recipient)
+        else:
+            self._on_unreachable(destination, recipient, notification)
+        self._pump(destination, recipient)
+        if (
+            not recipient.queue
+            and not recipient.stats.in_flight
+            and not recipient.failures
+            and recipient.open_until is None
+            and self._recipients.get(destination) is recipient
+        ):
+            # Idle and healthy: nothing to keep for this address.
+            del self._recipients[destination]
+
+    def _on_reachable(self, destination: BACnetAddress, recipient: _Recipient) -> None:
+        recipient.failures = 0
+        if recipient.open_until is None:
+            return
+        recipient.open_until = None
+        recipient.backoff = 0.0
+        recipient.stats.breaker_open = False
+        if recipient.timer is not None:
+            recipient.timer.cancel()
+            recipient.timer = None
+        logger.info("Notification recipient %s reachable again, resuming delivery", destination)
+
+    def _on_unreachable(
+        self,
+        destination: BACnetAddress,
+        recipient: _Recipient,
+        notification: _Notification,
+    ) -> None:
+        recipient.failures += 1
+        if recipient.open_until is None:
+            if recipient.failures < self._policy.failure_threshold:
+                return
+            recipient.backoff = self._policy.backoff
+        elif notification.probe:
+            recipient.backoff = min(recipient.backoff * 2, self._policy.max_backoff)
+        else:
+            # A send started before the breaker opened; already backing off.
+            return
+
+        recipient.open_until = time.monotonic() + recipient.backoff
+        recipient.stats.breaker_open = True
+        recipient.stats.breaker_trips += 1
+        if recipient.timer is not None:
+            recipient.timer.cancel()
+        loop = asyncio.get_running_loop()
+        recipient.timer = loop.call_later(recipient.backoff, self._pump, destination, recipient)
+        logger.info(
+            "Notification recipient %s unreachable, pausing delivery for %.1fs",
+            destination,
+            recipient.backoff,
+        )
@@ -0,0 +1,566 @@
+"""Multi-device polling engine built on ReadPropertyMultiple (Clause 15.7).
+
+The :class:`PollingEngine` follows the same async lifecycle pattern as
+:class:`~bac_py.app.trendlog_engine.TrendLogEngine`.  Points are
+registered as ``(address, object, property, interval)`` tuples; on each
+tick the engine collects the points that are due, groups them per
+device, and packs them into as few ReadPropertyMultiple requests as the
+peer's max APDU allows.  Results are streamed to an optional callback
+and to any consumers of :meth:`PollingEngine.results`.
+
+Devices that reject ReadPropertyMultiple are marked in the application's
+:class:`~bac_py.app.device_cache.DeviceCache` and polled with individual
+ReadProperty requests from then on.  A batch whose response turns out too
+large for the device is halved and retried, and later batches for that
+device are sized to match.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import logging
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from bac_py.app._rpm_batching import (
+    OVERSIZE_ABORT_REASONS,
+    halve_read_access_specs,
+    response_size,
+    split_read_access_specs,
+)
+from bac_py.app.client import BACnetClient
+from bac_py.encoding.primitives import decode_and_unwrap
+from bac_py.network.address import parse_address
+from bac_py.segmentation.manager import compute_max_segment_payload
+from bac_py.services.errors import BACnetAbortError, BACnetError, BACnetRejectError
+from bac_py.services.read_property_multiple import PropertyReference, ReadAccessSpecification
+from bac_py.types.enums import ConfirmedServiceChoice, RejectReason
+from bac_py.types.parsing import parse_object_identifier, parse_property_identifier
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+    from bac_py.app.application import BACnetApplication
+    from bac_py.network.address import BACnetAddress
+    from bac_py.services.read_property_multiple import ReadPropertyMultipleACK
+    from bac_py.types.enums import ObjectType, PropertyIdentifier
+    from bac_py.types.primitives import ObjectIdentifier
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_APDU = 480
+"""Max APDU assumed for peers with no cached device info (smallest common size)."""
+
+
+@dataclass(frozen=True, slots=True)
+class PollPoint:
+    """A single property polled at a fixed interval.
+
+    Returned by :meth:`PollingEngine.add_point` and used as the handle
+    for :meth:`PollingEngine.remove_point`.
+    """
+
+    address: BACnetAddress
+    """Target device address."""
+
+    object_identifier: ObjectIdentifier
+    """Object containing the polled property."""
+
+    property_identifier: PropertyIdentifier
+    """Polled property."""
+
+    interval: float
+    """Poll interval in seconds."""
+
+    array_index: int | None = None
+    """Optional array index for array properties."""
+
+
+@dataclass(frozen=True, slots=True)
+class PollResult:
+    """Outcome of polling a single :class:`PollPoint`."""
+
+    point: PollPoint
+    """The point that was polled."""
+
+    value: object
+    """Decoded Python value, or ``None`` on error."""
+
+    error: Exception | None
+    """Error for this point, or ``None`` on success.
+
+    Per-property access errors from the RPM response are reported as
+    :class:`~bac_py.services.errors.BACnetError`.  Failures of the whole
+    request (timeout, abort, reject) are reported on every point in it.
+    """
+
+    timestamp: float
+    """Wall-clock time (``time.time()``) the response was processed."""
+
+
+@dataclass
+class PollingStats:
+    """Running counters for a :class:`PollingEngine`."""
+
+    requests_sent: int = 0
+    """ReadPropertyMultiple and ReadProperty requests issued."""
+
+    points_polled: int = 0
+    """Point results produced (successes and errors)."""
+
+    errors: int = 0
+    """Point results that carried an error."""
+
+    overruns: int = 0
+    """Points skipped because their device was still busy with a previous poll."""
+
+    results_dropped: int = 0
+    """Results discarded because a :meth:`PollingEngine.results` queue was full."""
+
+
+type _PointKey = tuple[ObjectIdentifier, PropertyIdentifier, int | None]
+
+
+def _point_key(point: PollPoint) -> _PointKey:
+    return (point.object_identifier, point.property_identifier, point.array_index)
+
+
+def _build_batches(
+    points: list[PollPoint], max_apdu: int, max_response: int | None = None
+) -> list[list[PollPoint]]:
+    """Split *points* for one device into batches that fit *max_apdu*.
+
+    Both the request and the estimated ComplexACK must fit in one APDU,
+    so polls never need segmentation.  Points sharing an
+    ``(object, property, index)`` key travel in the same batch so their
+    result is read once.
+
+    :param max_response: Optional tighter budget for the estimated
+        ComplexACK, learned from earlier oversize aborts.
+    """
+    response_budget = compute_max_segment_payload(max_apdu, "complex_ack")
+    if max_response is not None:
+        response_budget = min(response_budget, max_response)
+    chunks = split_read_access_specs(
+        _build_access_specs(points),
+        compute_max_segment_payload(max_apdu, "confirmed_request"),
+        response_budget,
+    )
+    return _points_for_chunks(points, chunks)
+
+
+def _points_for_chunks(
+    points: list[PollPoint], chunks: Iterable[list[ReadAccessSpecification]]
+) -> list[list[PollPoint]]:
+    """Map chunks of access specifications back to the *points* they read."""
+    by_key: dict[_PointKey, list[PollPoint]] = {}
+    for point in points:
+        by_key.setdefault(_point_key(point), []).append(point)
+    return [
+        [
+            point
+            for spec in chunk
+            for ref in spec.list_of_property_references
+            for point in by_key[
+                (spec.object_identifier, ref.property_identifier, ref.property_array_index)
+            ]
+        ]
+        for chunk in chunks
+        if chunk
+    ]
+
+
+def _build_access_specs(points: list[PollPoint]) -> list[ReadAccessSpecification]:
+    """Group a batch of points into per-object read access specifications."""
+    refs: dict[ObjectIdentifier, list[PropertyReference]] = {}
+    seen: set[_PointKey] = set()
+    for point in points:
+        key = _point_key(point)
+        if key in seen:
+            continue
+        seen.add(key)
+        refs.setdefault(point.object_identifier, []).append(
+            PropertyReference(point.property_identifier, point.array_index)
+        )
+    return [
+        ReadAccessSpecification(object_identifier=oid, list_of_property_references=prop_refs)
+        for oid, prop_refs in refs.items()
+    ]
+
+
+class PollingEngine:
+    """Async engine that polls many remote points with batched RPM requests.
+
+    Usage::
+
+        engine = PollingEngine(app, callback=on_result)
+        engine.add_point("192.168.1.100", "ai,1", "pv", interval=10.0)
+        await engine.start()
+
+        async for result in engine.results():
+            print(result.point.object_identifier, result.value)
+    """
+
+    def __init__(
+        self,
+        app: BACnetApplication,
+        *,
+        scan_interval: float = 1.0,
+        callback: Callable[[PollResult], object] | None = None,
+        max_concurrent_devices: int = 32,
+        default_max_apdu: int = _DEFAULT_MAX_APDU,
+        result_queue_size: int = 10_000,
+        timeout: float | None = None,
+    ) -> None:
+        """Initialise the polling engine.
+
+        :param app: Application used to send requests.
+        :param scan_interval: Seconds between checks for due points.
+        :param callback: Optional callable invoked with each
+            :class:`PollResult` as it is produced.
+        :param max_concurrent_devices: Maximum number of devices polled
+            concurrently.  Batches for a single device are always sent
+            one after another.
+        :param default_max_apdu: Max APDU assumed for devices with no
+            cached :class:`~bac_py.app.device_cache.DeviceInfo`.
+        :param result_queue_size: Capacity of each :meth:`results`
+            consumer queue.  Results are dropped when a consumer falls
+            this far behind.
+        :param timeout: Optional caller-level timeout in seconds for
+            each request.
+        """
+        self._app = app
+        self._client = BACnetClient(app)
+        self._scan_interval = scan_interval
+        self._callback = callback
+        self._max_concurrent_devices = max_concurrent_devices
+        self._default_max_apdu = default_max_apdu
+        self._result_queue_size = result_queue_size
+        self._timeout = timeout
+        self._task: asyncio.Task[None] | None = None
+        # point -> next due time (monotonic seconds)
+        self._points: dict[PollPoint, float] = {}
+        self._heap: list[tuple[float, int, PollPoint]] = []
+        self._counter = itertools.count()
+        self._busy: set[BACnetAddress] = set()
+        self._device_tasks: set[asyncio.Task[None]] = set()
+        self._semaphore: asyncio.Semaphore | None = None
+        # address -> ComplexACK budget learned from oversize aborts
+        self._response_limits: dict[BACnetAddress, int] = {}
+        self._queues: list[asyncio.Queue[PollResult]] = []
+        self._stats = PollingStats()
+
+    # --- Point registration ---
+
+    def add_point(
+        self,
+        address: str | BACnetAddress,
+        object_identifier: str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
+        property_identifier: str | int | PropertyIdentifier,
+        interval: float,
+        *,
+        array_index: int | None = None,
+    ) -> PollPoint:
+        """Register a point to be polled every *interval* seconds.
+
+        The first poll happens on the next engine tick.
+
+        :param address: Target device (e.g. ``"192.168.1.100"``).
+        :param object_identifier: Object to read (e.g. ``"ai,1"``).
+        :param property_identifier: Property to read (e.g. ``"pv"``).
+        :param interval: Poll interval in seconds.
+        :param array_index: Optional array index.
+        :returns: The registered :class:`PollPoint`.
+        :raises ValueError: If *interval* is not positive.
+        """
+        if interval <= 0:
+            msg = f"Poll interval must be positive, got {interval}"
+            raise ValueError(msg)
+        point = PollPoint(
+            address=parse_address(address),
+            object_identifier=parse_object_identifier(object_identifier),
+            property_identifier=parse_property_identifier(property_identifier),
+            interval=interval,
+            array_index=array_index,
+        )
+        if point not in self._points:
+            self._schedule(point, time.monotonic())
+        return point
+
+    def remove_point(self, point: PollPoint) -> None:
+        """Stop polling a previously registered point.
+
+        Removal is lazy: stale heap entries are discarded when popped.
+        """
+        self._points.pop(point, None)
+
+    @property
+    def points(self) -> list[PollPoint]:
+        """All registered points."""
+        return list(self._points)
+
+    @property
+    def stats(self) -> PollingStats:
+        """Running counters for this engine."""
+        return self._stats
+
+    # --- Result streaming ---
+
+    async def results(self) -> AsyncIterator[PollResult]:
+        """Iterate over poll results as they are produced.
+
+        Each call creates an independent consumer queue; results
+        produced before the iterator starts are not replayed.
+        """
+        queue: asyncio.Queue[PollResult] = asyncio.Queue(maxsize=self._result_queue_size)
+        self._queues.append(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues.remove(queue)
+
+    # --- Lifecycle ---
+
+    async def start(self) -> None:
+        """Start the periodic polling loop."""
+        if self._task is not None:
+            return
+        self._semaphore = asyncio.Semaphore(self._max_concurrent_devices)
+        logger.info("PollingEngine started with %d points", len(self._points))
+        self._task = asyncio.create_task(self._run_loop())
+
+    async def stop(self) -> None:
+        """Stop the polling loop and cancel in-flight device polls."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        tasks = list(self._device_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._device_tasks.clear()
+        self._busy.clear()
+        logger.info("PollingEngine stopped")
+
+    # --- Main loop ---
+
+    async def _run_loop(self) -> None:
+        """Periodically dispatch due points."""
+        try:
+            while True:
+                self._poll_cycle(time.monotonic())
+                await asyncio.sleep(self._scan_interval)
+        except asyncio.CancelledError:
+            return
+
+    def _schedule(self, point: PollPoint, due: float) -> None:
+        self._points[point] = due
+        heapq.heappush(self._heap, (due, next(self._counter), point))
+
+    def _collect_due(self, now: float) -> dict[BACnetAddress, list[PollPoint]]:
+        """Pop all due points from the heap, grouped by device address."""
+        due_by_device: dict[BACnetAddress, list[PollPoint]] = {}
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            due, _seq, point = heapq.heappop(heap)
+            if self._points.get(point) != due:
+                continue  # Removed or rescheduled
+            # Next due time advances from the scheduled slot to avoid drift,
+            # but never falls behind "now" after a long stall.
+            next_due = due + point.interval
+            if next_due <= now:
+                next_due = now + point.interval
+            self._schedule(point, next_due)
+            if point.address in self._busy:
+                self._stats.overruns += 1
+                continue
+            due_by_device.setdefault(point.address, []).append(point)
+        return due_by_device
+
+    def _poll_cycle(self, now: float) -> None:
+        """Run one dispatch cycle: start a poll task per device with due points."""
+        for address, points in self._collect_due(now).items():
+            self._busy.add(address)
+            task = asyncio.create_task(self._poll_device(address, points))
+            self._device_tasks.add(task)
+            task.add_done_callback(self._device_tasks.discard)
+
+    async def poll_now(self) -> None:
+        """Poll every registered point immediately and wait for completion.
+
+        Useful for an initial snapshot before the periodic loop starts.
+        Regular scheduling is unaffected.  Devices already being polled
+        are skipped; their results arrive from the poll in flight.
+        """
+        by_device: dict[BACnetAddress, list[PollPoint]] = {}
+        for point in self._points:
+            if point.address not in self._busy:
+                by_device.setdefault(point.address, []).append(point)
+        self._busy.update(by_device)
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_devices)
+        await asyncio.gather(
+            *(self._poll_device(address, points) for address, points in by_device.items())
+        )
+
+    # --- Per-device polling ---
+
+    def _max_apdu_for(self, address: BACnetAddress) -> int:
+        """Effective max APDU for requests to *address*."""
+        local = self._app.config.max_apdu_length
+        info = self._app.get_device_info(address)
+        if info is None:
+            return min(local, self._default_max_apdu)
+        return min(local, info.max_apdu_length)
+
+    async def _poll_device(self, address: BACnetAddress, points: list[PollPoint]) -> None:
+        """Poll all due points of one device, one batch at a time."""
+        semaphore = self._semaphore
+        try:
+            if semaphore is None:
+                await self._poll_device_batches(address, points)
+            else:
+                async with semaphore:
+                    await self._poll_device_batches(address, points)
+        finally:
+            self._busy.discard(address)
+
+    async def _poll_device_batches(self, address: BACnetAddress, points: list[PollPoint]) -> None:
+        device_cache = self._app.device_cache
+        if device_cache.is_service_failed(address, ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE):
+            await self._poll_individually(points)
+            return
+        batches = _build_batches(
+            points, self._max_apdu_for(address), self._response_limits.get(address)
+        )
+        for i, batch in enumerate(batches):
+            unpolled = await self._poll_batch(address, batch)
+            if unpolled:
+                logger.info("%s does not support RPM, falling back to ReadProperty", address)
+                device_cache.mark_service_failed(
+                    address, ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+                )
+                # The rest of this cycle goes straight to ReadProperty.
+                await self._poll_individually(
+                    unpolled + [p for rest in batches[i + 1 :] for p in rest]
+                )
+                return
+
+    async def _poll_batch(self, address: BACnetAddress, batch: list[PollPoint]) -> list[PollPoint]:
+        """Poll one batch with RPM, halving it if the response is too large.
+
+        After an oversize abort the device's response budget is lowered
+        to the size of the larger half, so later cycles send batches that
+        fit the first time.
+
+        :returns: The points left unpolled because the device rejected
+            RPM as an unrecognized service, or an empty list.
+        """
+        specs = _build_access_specs(batch)
+        try:
+            self._stats.requests_sent += 1
+            ack = await self._client.read_property_multiple(address, specs, timeout=self._timeout)
+        except BACnetRejectError as exc:
+            if exc.reason == RejectReason.UNRECOGNIZED_SERVICE:
+                return batch
+            self._emit_errors(batch, exc)
+        except BACnetAbortError as exc:
+            halves = (
+                halve_read_access_specs(specs) if exc.reason in OVERSIZE_ABORT_REASONS else None
+            )
+            if halves is None:
+                self._emit_errors(batch, exc)
+                return []
+            limit = max(response_size(half) for half in halves)
+            self._response_limits[address] = min(limit, self._response_limits.get(address, limit))
+            logger.debug(
+                "RPM poll of %s aborted (%s), retrying in two halves", address, exc.reason
+            )
+            parts = _points_for_chunks(batch, halves)
+            for i, part in enumerate(parts):
+                unpolled = await self._poll_batch(address, part)
+                if unpolled:
+                    return unpolled + [p for rest in parts[i + 1 :] for p in rest]
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.debug("RPM poll of %s failed", address, exc_info=True)
+            self._emit_errors(batch, exc)
+        else:
+            self._dispatch_ack(batch, ack)
+        return []
+
+    async def _poll_individually(self, points: list[PollPoint]) -> None:
+        """Poll points with one ReadProperty each (peer lacks RPM)."""
+        for point in points:
+            value: object = None
+            error: Exception | None = None
+            try:
+                self._stats.requests_sent += 1
+                ack = await self._client.read_property(
+                    point.address,
+                    point.object_identifier,
+                    point.property_identifier,
+                    point.array_index,
+                    timeout=self._timeout,
+                )
+                if ack.property_value:
+                    value = decode_and_unwrap(ack.property_value)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                error = exc
+            self._emit(PollResult(point, value, error, time.time()))
+
+    def _dispatch_ack(self, batch: list[PollPoint], ack: ReadPropertyMultipleACK) -> None:
+        """Match RPM results back to the points of *batch*."""
+        now = time.time()
+        results: dict[_PointKey, tuple[object, Exception | None]] = {}
+        for access_result in ack.list_of_read_access_results:
+            oid = access_result.object_identifier
+            for elem in access_result.list_of_results:
+                key = (oid, elem.property_identifier, elem.property_array_index)
+                if elem.property_access_error is not None:
+                    error_class, error_code = elem.property_access_error
+                    results[key] = (None, BACnetError(error_class, error_code))
+                elif elem.property_value:
+                    results[key] = (decode_and_unwrap(elem.property_value), None)
+                else:
+                    results[key] = (None, None)
+
+        for point in batch:
+            outcome = results.get(_point_key(point))
+            if outcome is None:
+                msg = "Property missing from ReadPropertyMultiple response"
+                self._emit(PollResult(point, None, ValueError(msg), now))
+            else:
+                self._emit(PollResult(point, outcome[0], outcome[1], now))
+
+    def _emit_errors(self, batch: list[PollPoint], exc: Exception) -> None:
+        now = time.time()
+        for point in batch:
+            self._emit(PollResult(point, None, exc, now))
+
+    def _emit(self, result: PollResult) -> None:
+        """Deliver a result to the callback and all consumer queues."""
+        self._stats.points_polled += 1
+        if result.error is not None:
+            self._stats.errors += 1
+        if self._callback is not None:
+            try:
+                self._callback(result)
+            except Exception:
+                logger.debug("Error in polling callback", exc_info=True)
+        for queue in self._queues:
+            try:
+                queue.put_nowait(result)
+            except asyncio.QueueFull:
+                self._stats.results_dropped += 1
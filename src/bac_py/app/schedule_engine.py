@@ -1,14 +1,22 @@
 """Schedule and Calendar evaluation engine per ASHRAE 135-2020 Clause 12.24.
 
 The :class:`ScheduleEngine` follows the same async lifecycle pattern as
-:class:`EventEngine` (start/stop/periodic loop).  On each cycle it:
+:class:`EventEngine` (start/stop/periodic loop).  Evaluating an object:
 
-1. Evaluates all Calendar objects (updating ``present_value``).
-2. Evaluates all Schedule objects following the resolution order in
+1. Evaluates a Calendar object (updating ``present_value``).
+2. Evaluates a Schedule object following the resolution order in
    Clause 12.24.4--12.24.9: effective_period → exception_schedule →
    weekly_schedule → schedule_default.
 3. On value change, writes the new value to each target listed in
    ``list_of_object_property_references`` at ``priority_for_writing``.
+
+Rather than re-evaluating every object on each cycle, the engine computes
+for each schedule the next time of day at which its value can change and
+sleeps on a heap of those instants.  A schedule is evaluated again when
+its instant comes due, when one of its inputs or a calendar is written,
+and for every object at midnight.  Calendars and Schedules added to or
+removed from the database are picked up through a membership listener,
+so a wake-up does not rescan the database.
 """
 
 from __future__ import annotations
@@ -16,7 +24,10 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import datetime
+import heapq
+import itertools
 import logging
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from bac_py.objects.calendar import matches_calendar_entry, matches_date_range
@@ -25,13 +36,24 @@ from bac_py.types.enums import ObjectType, PropertyIdentifier
 from bac_py.types.primitives import BACnetTime, ObjectIdentifier
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from bac_py.app.application import BACnetApplication
-    from bac_py.objects.base import ObjectDatabase
+    from bac_py.objects.base import BACnetObject, ObjectDatabase
 
 logger = logging.getLogger(__name__)
 
 _SENTINEL = object()  # Marker for "no value resolved"
 
+# Properties whose writes can change a schedule's or calendar's value
+_SCHEDULE_INPUTS = (
+    PropertyIdentifier.EFFECTIVE_PERIOD,
+    PropertyIdentifier.EXCEPTION_SCHEDULE,
+    PropertyIdentifier.WEEKLY_SCHEDULE,
+    PropertyIdentifier.SCHEDULE_DEFAULT,
+)
+_CALENDAR_INPUTS = (PropertyIdentifier.DATE_LIST,)
+
 
 def _time_tuple(t: BACnetTime) -> tuple[int, int, int, int]:
     """Convert a BACnetTime to a comparable tuple, resolving wildcards to 0."""
@@ -48,8 +70,38 @@ def _now_tuple(now: datetime.time) -> tuple[int, int, int, int]:
     return (now.hour, now.minute, now.second, now.microsecond // 10000)
 
 
+@dataclass(slots=True)
+class _Tracked:
+    """A Calendar or Schedule object the run loop is watching."""
+
+    obj: Any
+    callback: Callable[[PropertyIdentifier, Any, Any], None]
+    due: datetime.datetime | None = None
+    """Next instant the object's value can change, or ``None`` for midnight."""
+
+
+@dataclass(slots=True)
+class _Watch:
+    """Run-loop state: tracked objects and the heap of due instants."""
+
+    calendars: dict[ObjectIdentifier, _Tracked] = field(default_factory=dict)
+    schedules: dict[ObjectIdentifier, _Tracked] = field(default_factory=dict)
+    heap: list[tuple[datetime.datetime, int, ObjectIdentifier]] = field(default_factory=list)
+    dirty: set[ObjectIdentifier] = field(default_factory=set)
+    stale: bool = True
+    """Whether Calendars or Schedules were added or removed since the last sync."""
+    today: datetime.date | None = None
+    last_now: datetime.datetime | None = None
+
+
 class ScheduleEngine:
-    """Async engine that evaluates Calendar and Schedule objects periodically."""
+    """Async engine that evaluates Calendar and Schedule objects.
+
+    :param app: Application whose object database holds the objects.
+    :param scan_interval: Longest time in seconds the engine sleeps
+        between checks for wall-clock changes.  Schedules are evaluated
+        at their transition times regardless of this interval.
+    """
 
     def __init__(
         self,
@@ -62,6 +114,10 @@ class ScheduleEngine:
         self._task: asyncio.Task[None] | None = None
         # Track last written value per schedule OID to detect changes
         self._last_values: dict[ObjectIdentifier, Any] = {}
+        self._watch = _Watch()
+        self._wake: asyncio.Event | None = None
+        self._seq = itertools.count()
+        self._membership_hooked = False
 
     # --- Lifecycle ---
 
@@ -79,34 +135,166 @@ class ScheduleEngine:
             with contextlib.suppress(asyncio.CancelledError):
                 await self._task
             self._task = None
+        self._unwatch_all()
         self._last_values.clear()
         logger.info("ScheduleEngine stopped")
 
+    def invalidate(self, object_id: ObjectIdentifier | None = None) -> None:
+        """Re-evaluate a Calendar or Schedule on the next wake-up.
+
+        Writes through :meth:`~bac_py.objects.base.BACnetObject.write_property`
+        are detected automatically.  Call this after assigning an input
+        property directly or mutating it in place.
+
+        :param object_id: Object to re-evaluate, or ``None`` for all.
+        """
+        watch = self._watch
+        if object_id is None:
+            watch.today = None
+        else:
+            watch.dirty.add(object_id)
+        if self._wake is not None:
+            self._wake.set()
+
     # --- Main loop ---
 
     async def _run_loop(self) -> None:
-        """Periodically evaluate all calendars and schedules."""
+        """Evaluate schedules as they come due, sleeping in between."""
+        self._wake = wake = asyncio.Event()
         try:
             while True:
-                self._evaluate_cycle()
-                await asyncio.sleep(self._scan_interval)
+                wake.clear()
+                wake_at = self._evaluate_due()
+                delay = (wake_at - datetime.datetime.now()).total_seconds()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wake.wait(), max(0.0, min(delay, self._scan_interval)))
         except asyncio.CancelledError:
             return
+        finally:
+            self._wake = None
 
-    def _evaluate_cycle(self) -> None:
-        """Run one evaluation cycle."""
+    def _evaluate_due(self, now: datetime.datetime | None = None) -> datetime.datetime:
+        """Evaluate the objects that changed or came due since the last call.
+
+        Every object is evaluated on the first call, after midnight, and
+        when the wall clock moves backwards.
+
+        :param now: Current local time; defaults to the system clock.
+        :returns: When the earliest pending schedule transition is due.
+        """
         db = self._app.object_db
-        _now = datetime.datetime.now()
-        today = _now.date()
-        now = _now.time()
+        watch = self._watch
+        if now is None:
+            now = datetime.datetime.now()
+        today = now.date()
+        full = today != watch.today or (watch.last_now is not None and now < watch.last_now)
+        watch.today = today
+        watch.last_now = now
+        if not self._membership_hooked:
+            db.register_membership_listener(self._on_membership_change)
+            self._membership_hooked = True
+        if watch.stale:
+            self._sync_objects(db)
+
+        calendar_changed = False
+        for oid, tracked in watch.calendars.items():
+            if full or oid in watch.dirty:
+                previous = tracked.obj.read_property(PropertyIdentifier.PRESENT_VALUE)
+                calendar_changed |= tracked.obj.evaluate(today) != previous
+
+        if full or calendar_changed:
+            due = list(watch.schedules)
+            watch.heap.clear()
+        else:
+            due = [oid for oid in watch.dirty if oid in watch.schedules]
+            while watch.heap and watch.heap[0][0] <= now:
+                _, _, oid = heapq.heappop(watch.heap)
+                entry = watch.schedules.get(oid)
+                if entry is not None and entry.due is not None and entry.due <= now:
+                    due.append(oid)
+        watch.dirty.clear()
+
+        time_now = now.time()
+        for oid in dict.fromkeys(due):
+            tracked = watch.schedules[oid]
+            self._evaluate_schedule(tracked.obj, today, time_now, db)
+            tracked.due = self._next_transition(tracked.obj, today, time_now)
+            if tracked.due is not None:
+                heapq.heappush(watch.heap, (tracked.due, next(self._seq), oid))
+
+        midnight = datetime.datetime.combine(today + datetime.timedelta(days=1), datetime.time())
+        return min(watch.heap[0][0], midnight) if watch.heap else midnight
+
+    def _on_membership_change(self, object_id: ObjectIdentifier, obj: BACnetObject | None) -> None:
+        """Mark the watch for re-sync after a Calendar or Schedule is added or removed."""
+        if object_id.object_type in (ObjectType.CALENDAR, ObjectType.SCHEDULE):
+            self._watch.stale = True
+            if self._wake is not None:
+                self._wake.set()
+
+    def _sync_objects(self, db: ObjectDatabase) -> None:
+        """Start watching added objects and stop watching removed ones.
+
+        Runs on the first wake-up and after the database membership changes.
+        """
+        watch = self._watch
+        watch.stale = False
+        for obj_type, tracked_map, props in (
+            (ObjectType.CALENDAR, watch.calendars, _CALENDAR_INPUTS),
+            (ObjectType.SCHEDULE, watch.schedules, _SCHEDULE_INPUTS),
+        ):
+            current = {obj.object_identifier: obj for obj in db.get_objects_of_type(obj_type)}
+            for oid in [
+                oid for oid in tracked_map if current.get(oid) is not tracked_map[oid].obj
+            ]:
+                self._unwatch(oid, tracked_map.pop(oid), props)
+                self._last_values.pop(oid, None)
+            for oid, obj in current.items():
+                if oid in tracked_map:
+                    continue
+                callback = self._make_invalidator(oid)
+                for prop in props:
+                    db.register_change_callback(oid, prop, callback)
+                tracked_map[oid] = _Tracked(obj, callback)
+                watch.dirty.add(oid)
 
-        # 1. Evaluate all Calendar objects
-        for cal_obj in db.get_objects_of_type(ObjectType.CALENDAR):
-            cal_obj.evaluate(today)  # type: ignore[attr-defined]
+    def _make_invalidator(
+        self, object_id: ObjectIdentifier
+    ) -> Callable[[PropertyIdentifier, Any, Any], None]:
+        def _invalidate(prop_id: PropertyIdentifier, old_value: Any, new_value: Any) -> None:
+            self.invalidate(object_id)
 
-        # 2. Evaluate all Schedule objects
-        for sched_obj in db.get_objects_of_type(ObjectType.SCHEDULE):
-            self._evaluate_schedule(sched_obj, today, now, db)
+        return _invalidate
+
+    def _unwatch(
+        self,
+        object_id: ObjectIdentifier,
+        tracked: _Tracked,
+        props: tuple[PropertyIdentifier, ...],
+    ) -> None:
+        db = self._app.object_db
+        for prop in props:
+            db.unregister_change_callback(object_id, prop, tracked.callback)
+
+    def _unwatch_all(self) -> None:
+        watch = self._watch
+        for oid, tracked in watch.calendars.items():
+            self._unwatch(oid, tracked, _CALENDAR_INPUTS)
+        for oid, tracked in watch.schedules.items():
+            self._unwatch(oid, tracked, _SCHEDULE_INPUTS)
+        if self._membership_hooked:
+            self._app.object_db.unregister_membership_listener(self._on_membership_change)
+            self._membership_hooked = False
+        self._watch = _Watch()
+
+    def _evaluate_cycle(self) -> None:
+        """Evaluate every calendar and schedule once.
+
+        Forces a full pass of :meth:`_evaluate_due`, the same code the
+        run loop uses.
+        """
+        self._watch.today = None
+        self._evaluate_due()
 
     # --- Schedule evaluation (Clause 12.24.4--12.24.9) ---
 
@@ -158,6 +346,39 @@ class ScheduleEngine:
         # Step 4: Use schedule_default (Clause 12.24.9)
         self._apply_value(sched, schedule_default, db)
 
+    @staticmethod
+    def _next_transition(
+        sched: Any,
+        today: datetime.date,
+        now: datetime.time,
+    ) -> datetime.datetime | None:
+        """Return the next instant today at which *sched* can change value.
+
+        Considers every time in today's weekly entries and in every
+        exception, whether or not it matches today, so the result is never
+        later than the real transition.  ``None`` means no change before
+        midnight.
+        """
+        candidates: list[Any] = []
+        weekly_schedule = sched.read_property(PropertyIdentifier.WEEKLY_SCHEDULE)
+        day_index = today.weekday()
+        if weekly_schedule and day_index < len(weekly_schedule):
+            candidates.extend(weekly_schedule[day_index])
+        for exc in sched.read_property(PropertyIdentifier.EXCEPTION_SCHEDULE) or ():
+            candidates.extend(exc.list_of_time_values)
+
+        now_t = _now_tuple(now)
+        later = [t for t in (_time_tuple(tv.time) for tv in candidates) if t > now_t]
+        if not later:
+            return None
+        hour, minute, second, hundredth = min(later)
+        try:
+            return datetime.datetime.combine(
+                today, datetime.time(hour, minute, second, hundredth * 10000)
+            )
+        except ValueError:
+            return None
+
     def _resolve_exception_schedule(
         self,
         exceptions: list[BACnetSpecialEvent],
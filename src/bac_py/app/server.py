@@ -10,6 +10,7 @@ from __future__ import annotations
 import contextlib
 import hmac
 import logging
+from bisect import bisect_left, bisect_right
 from typing import TYPE_CHECKING, Any
 
 from bac_py.app._object_type_sets import ANALOG_TYPES
@@ -23,6 +24,8 @@ from bac_py.encoding.primitives import (
 from bac_py.network.address import GLOBAL_BROADCAST
 from bac_py.objects.base import _OBJECT_REGISTRY, create_object
 from bac_py.objects.file import FileObject
+from bac_py.objects.log_buffer import LogBufferMixin, LogRecordBuffer, datetime_key
+from bac_py.objects.trendlog import TrendLogBuffer
 from bac_py.services.alarm_summary import (
     AlarmSummary,
     EnrollmentSummary,
@@ -80,6 +83,8 @@ from bac_py.services.read_property_multiple import (
 )
 from bac_py.services.read_range import (
     RangeByPosition,
+    RangeBySequenceNumber,
+    RangeByTime,
     ReadRangeACK,
     ReadRangeRequest,
     ResultFlags,
@@ -100,7 +105,7 @@ from bac_py.services.who_is import IAmRequest, WhoIsRequest
 from bac_py.services.write_group import WriteGroupRequest
 from bac_py.services.write_property import WritePropertyRequest
 from bac_py.services.write_property_multiple import WritePropertyMultipleRequest
-from bac_py.types.constructed import BACnetTimeStamp
+from bac_py.types.constructed import BACnetDateTime, BACnetTimeStamp
 from bac_py.types.enums import (
     AcknowledgmentFilter,
     AuditOperation,
@@ -166,6 +171,104 @@ def _encode_property_value(value: Any, obj_type: ObjectType | None = None) -> by
         raise BACnetError(ErrorClass.PROPERTY, ErrorCode.OTHER) from None
 
 
+def _sequence_window(
+    first_sequence: int, total: int, reference: int, count: int
+) -> tuple[int, int]:
+    """Return the ``[start, end)`` indices selected by a RangeBySequenceNumber.
+
+    Sequence numbers are contiguous, so the reference record is found by
+    subtraction.  A reference that is no longer (or not yet) in the
+    buffer selects nothing.
+    """
+    index = reference - first_sequence
+    if not 0 <= index < total:
+        return 0, 0
+    if count >= 0:
+        return index, min(total, index + count)
+    return max(0, index + 1 + count), index + 1
+
+
+def _reference_key(range_: RangeByTime) -> int:
+    """Return the sort key of a RangeByTime reference.
+
+    The day of week is ignored and unspecified time fields count as zero.
+    The year, month and day must be given.
+
+    :raises BACnetRejectError: If the reference date is not a specific day.
+    """
+    date = range_.reference_date
+    if date.year == 0xFF or not 1 <= date.month <= 12 or not 1 <= date.day <= 31:
+        raise BACnetRejectError(RejectReason.PARAMETER_OUT_OF_RANGE)
+    return datetime_key(BACnetDateTime(date=date, time=range_.reference_time))
+
+
+def _time_window(log: Any, reference: int, count: int) -> tuple[int, int]:
+    """Return the ``[start, end)`` indices selected by a RangeByTime.
+
+    A positive count reads forward from the first record newer than
+    *reference*; a negative count reads back from the last record older
+    than it.  Records are assumed to be in timestamp order, which lets
+    both ends be found by bisection.
+
+    :param log: Log buffer, oldest record first.
+    :param reference: Reference time as returned by :func:`datetime_key`.
+    :param count: Signed record count from the request.
+    :raises BACnetError: If the records carry no date-time timestamp.
+    """
+    total = len(log)
+    if total == 0:
+        return 0, 0
+    if isinstance(log, TrendLogBuffer):
+        key = log.timestamp_key
+    else:
+        if not isinstance(getattr(log[0], "timestamp", None), BACnetDateTime):
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED)
+        if isinstance(log, LogRecordBuffer):
+            key = log.timestamp_key
+        else:
+
+            def key(index: int) -> int:
+                return datetime_key(log[index].timestamp)
+
+    if count >= 0:
+        start = bisect_right(range(total), reference, key=key)
+        return start, min(total, start + count)
+    end = bisect_left(range(total), reference, key=key)
+    return max(0, end + count), end
+
+
+def _encode_range(
+    items: Any,
+    start: int,
+    end: int,
+    obj_type: ObjectType,
+    budget: int | None,
+    *,
+    from_end: bool,
+) -> tuple[int, int, bytes]:
+    """Encode ``items[start:end]``, stopping once *budget* bytes are used.
+
+    :param from_end: Keep the records nearest *end* when the range has to
+        be cut short (a negative count), rather than those nearest *start*.
+    :returns: The ``[start, end)`` indices actually encoded, and the data.
+    """
+    chunks: list[bytes] = []
+    used = 0
+    indices = range(end - 1, start - 1, -1) if from_end else range(start, end)
+    for index in indices:
+        chunk = _encode_property_value(items[index], obj_type)
+        if budget is not None and used + len(chunk) > budget:
+            break
+        chunks.append(chunk)
+        used += len(chunk)
+    if from_end:
+        chunks.reverse()
+        start = end - len(chunks)
+    else:
+        end = start + len(chunks)
+    return start, end, b"".join(chunks)
+
+
 class DefaultServerHandlers:
     """Standard BACnet service handlers for a server device.
 
@@ -200,26 +303,32 @@ class DefaultServerHandlers:
         registry.register_confirmed(
             ConfirmedServiceChoice.READ_PROPERTY,
             self.handle_read_property,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.WRITE_PROPERTY,
             self.handle_write_property,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE,
             self.handle_read_property_multiple,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.WRITE_PROPERTY_MULTIPLE,
             self.handle_write_property_multiple,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.READ_RANGE,
             self.handle_read_range,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.SUBSCRIBE_COV,
             self.handle_subscribe_cov,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.DEVICE_COMMUNICATION_CONTROL,
@@ -256,10 +365,12 @@ class DefaultServerHandlers:
         registry.register_unconfirmed(
             UnconfirmedServiceChoice.WHO_IS,
             self.handle_who_is,
+            inline=True,
         )
         registry.register_unconfirmed(
             UnconfirmedServiceChoice.WHO_HAS,
             self.handle_who_has,
+            inline=True,
         )
         registry.register_unconfirmed(
             UnconfirmedServiceChoice.TIME_SYNCHRONIZATION,
@@ -296,10 +407,12 @@ class DefaultServerHandlers:
         registry.register_confirmed(
             ConfirmedServiceChoice.SUBSCRIBE_COV_PROPERTY,
             self.handle_subscribe_cov_property,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.SUBSCRIBE_COV_PROPERTY_MULTIPLE,
             self.handle_subscribe_cov_property_multiple,
+            inline=True,
         )
         registry.register_confirmed(
             ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION_MULTIPLE,
@@ -415,14 +528,12 @@ class DefaultServerHandlers:
             raise BACnetError(ErrorClass.OBJECT, ErrorCode.UNKNOWN_OBJECT)
 
         # May raise BACnetError for unknown/unsupported properties
-        value = self._read_object_property(
+        encoded_value = self._read_encoded_property(
             obj,
             request.property_identifier,
             request.property_array_index,
         )
 
-        encoded_value = _encode_property_value(value, obj_id.object_type)
-
         ack = ReadPropertyACK(
             object_identifier=obj_id,
             property_identifier=request.property_identifier,
@@ -717,6 +828,31 @@ class DefaultServerHandlers:
                 return cov_manager.get_active_subscriptions()
         return obj.read_property(prop_id, array_index)
 
+    def _read_encoded_property(
+        self,
+        obj: BACnetObject,
+        prop_id: PropertyIdentifier,
+        array_index: int | None = None,
+    ) -> bytes:
+        """Read a property as application-tagged bytes, using the object's cache.
+
+        Static properties are encoded once and then served from
+        :meth:`BACnetObject.get_encoded
+        <bac_py.objects.base.BACnetObject.get_encoded>` until they change.
+
+        :param obj: The BACnet object to read from.
+        :param prop_id: Property identifier to read.
+        :param array_index: Optional array index for array properties.
+        :returns: The encoded property value.
+        :raises BACnetError: If the property cannot be read or encoded.
+        """
+        encoded = obj.get_encoded(prop_id, array_index)
+        if encoded is None:
+            value = self._read_object_property(obj, prop_id, array_index)
+            encoded = _encode_property_value(value, obj.object_identifier.object_type)
+            obj.cache_encoded(prop_id, array_index, encoded)
+        return encoded
+
     def _resolve_object_id(self, obj_id: ObjectIdentifier) -> ObjectIdentifier:
         """Resolve wildcard device instance ``4194303`` to the local device.
 
@@ -820,12 +956,11 @@ class DefaultServerHandlers:
                     continue
 
                 try:
-                    value = self._read_object_property(
+                    encoded_value = self._read_encoded_property(
                         obj,
                         ref.property_identifier,
                         ref.property_array_index,
                     )
-                    encoded_value = _encode_property_value(value, obj_id.object_type)
                     elements.append(
                         ReadResultElement(
                             property_identifier=ref.property_identifier,
@@ -968,62 +1103,120 @@ class DefaultServerHandlers:
             logger.warning("read_range: unknown object %s from %s", obj_id, source)
             raise BACnetError(ErrorClass.OBJECT, ErrorCode.UNKNOWN_OBJECT)
 
-        value = self._read_object_property(
-            obj,
-            request.property_identifier,
-            request.property_array_index,
-        )
+        prop_id = request.property_identifier
+        value: Any
+        if (
+            isinstance(obj, LogBufferMixin)
+            and prop_id == PropertyIdentifier.LOG_BUFFER
+            and request.property_array_index is None
+        ):
+            # Index the ring buffer directly instead of copying every record.
+            value = obj.log_buffer
+        else:
+            value = self._read_object_property(obj, prop_id, request.property_array_index)
 
-        if not isinstance(value, list):
+        if not isinstance(value, (list, TrendLogBuffer, LogRecordBuffer)):
             logger.warning(
                 "read_range: property %s on %s is not a list",
-                request.property_identifier.name,
+                prop_id.name,
                 obj_id,
             )
             raise BACnetError(ErrorClass.PROPERTY, ErrorCode.PROPERTY_IS_NOT_A_LIST)
 
         total = len(value)
+        first_sequence: int | None = None
+        count = 0
         # Apply range qualifier
-        if isinstance(request.range, RangeByPosition):
-            ref_idx = request.range.reference_index
-            count = request.range.count
+        range_ = request.range
+        if isinstance(range_, RangeByPosition):
+            ref_idx = range_.reference_index
+            count = range_.count
             if count >= 0:
                 start = max(0, ref_idx - 1)
                 end = min(total, start + count)
             else:
-                end = min(total, ref_idx)
+                end = max(0, min(total, ref_idx))
                 start = max(0, end + count)
-            items = value[start:end]
+        elif isinstance(range_, (RangeBySequenceNumber, RangeByTime)):
+            first_sequence = self._first_sequence_number(obj, prop_id, total)
+            count = range_.count
+            if isinstance(range_, RangeBySequenceNumber):
+                start, end = _sequence_window(
+                    first_sequence, total, range_.reference_sequence_number, count
+                )
+            else:
+                reference = _reference_key(range_)
+                start, end = _time_window(value, reference, count)
+        else:
+            # No range qualifier -- return all items
+            start, end = 0, total
+
+        # Cut the range short if the ACK would not fit the requester's limits.
+        budget: int | None = None
+        limit = self._app.response_limit(source)
+        if limit is not None:
+            overhead = ReadRangeACK(
+                object_identifier=obj_id,
+                property_identifier=prop_id,
+                result_flags=ResultFlags(),
+                item_count=end - start,
+                item_data=b"",
+                property_array_index=request.property_array_index,
+                first_sequence_number=(
+                    first_sequence + end if first_sequence is not None else None
+                ),
+            ).encode()
+            budget = limit - len(overhead)
+        selected_start, selected_end = start, end
+        start, end, item_data = _encode_range(
+            value, start, end, obj_id.object_type, budget, from_end=count < 0
+        )
+        truncated = (start, end) != (selected_start, selected_end)
+        item_count = end - start
+
+        if first_sequence is not None and item_count == 0:
+            # Nothing matched, or nothing fit: no first or last item returned.
+            is_first = is_last = False
+            first_sequence = None
+        else:
             is_first = start == 0
             is_last = end >= total
-        else:
-            # No range or unsupported range type — return all items
-            items = value
-            start = 0
-            is_first = True
-            is_last = True
-
-        buf = bytearray()
-        for item in items:
-            buf.extend(_encode_property_value(item, obj_id.object_type))
-        item_data = bytes(buf)
-
-        more_items = not is_last
+            if first_sequence is not None:
+                first_sequence += start
 
         ack = ReadRangeACK(
             object_identifier=obj_id,
-            property_identifier=request.property_identifier,
+            property_identifier=prop_id,
             result_flags=ResultFlags(
                 first_item=is_first,
                 last_item=is_last,
-                more_items=more_items,
+                more_items=truncated or not is_last,
             ),
-            item_count=len(items),
+            item_count=item_count,
             item_data=item_data,
             property_array_index=request.property_array_index,
+            first_sequence_number=first_sequence,
         )
         return ack.encode()
 
+    @staticmethod
+    def _first_sequence_number(obj: BACnetObject, prop_id: PropertyIdentifier, total: int) -> int:
+        """Return the sequence number of the oldest record in a log buffer.
+
+        Records are numbered from 1 in the order they were logged, so the
+        oldest of the *total* records still buffered is derived from
+        Total_Record_Count.
+
+        :raises BACnetError: If the property is not a log buffer.
+        """
+        if (
+            prop_id != PropertyIdentifier.LOG_BUFFER
+            or PropertyIdentifier.TOTAL_RECORD_COUNT not in obj.PROPERTY_DEFINITIONS
+        ):
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED)
+        logged = obj._properties.get(PropertyIdentifier.TOTAL_RECORD_COUNT) or 0
+        return max(logged, total) - total + 1
+
     # --- Device management handlers ---
 
     def _validate_password(self, request_password: str | None) -> None:
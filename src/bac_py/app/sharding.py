@@ -0,0 +1,810 @@
+"""Multi-process BACnet/IP server sharding on one UDP port.
+
+:class:`ShardSupervisor` runs several worker processes that bind the same
+BACnet/IP port with ``SO_REUSEPORT``.  The kernel spreads unicast traffic
+between them by source address, so each client talks to one worker.
+Every worker builds its own :class:`~bac_py.app.application.BACnetApplication`
+and runs the same *setup* function, so the object databases start out
+identical.  *setup* also receives the worker index so that engines which
+change state, such as schedule and trend log engines, run on the owner only.
+
+Worker 0 is the *owner*.  It is the only worker that handles writes,
+subscriptions, event state, unconfirmed services, network-layer messages
+and BVLC management, and the only one that should act as a client, so
+confirmed notifications and their replies stay with it.  The other
+workers answer ReadProperty and ReadPropertyMultiple themselves, except
+reads of the Device object, whose subscription and communication state
+only the owner knows.  Every other datagram is passed to the owner over a
+Unix socket.  The owner processes it as if it had arrived on its own
+socket and replies from the shared port.  The owner pushes each change to
+its object database and its DeviceCommunicationControl state to the other
+workers, which apply them to their replicas.
+
+Only Linux and other platforms with ``SO_REUSEPORT`` are supported.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import multiprocessing
+import multiprocessing.connection
+import os
+import pickle
+import shutil
+import signal
+import socket
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from bac_py.objects.base import create_object
+from bac_py.types.enums import (
+    ConfirmedServiceChoice,
+    EnableDisable,
+    ObjectType,
+    PropertyIdentifier,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from bac_py.app.application import BACnetApplication, DeviceConfig
+    from bac_py.objects.base import BACnetObject
+    from bac_py.transport.bip import BIPTransport
+    from bac_py.types.primitives import ObjectIdentifier
+
+    ShardSetup = Callable[[BACnetApplication, int], Awaitable[None] | None]
+
+logger = logging.getLogger(__name__)
+
+LOCAL_SERVICES: frozenset[int] = frozenset(
+    {
+        ConfirmedServiceChoice.READ_PROPERTY,
+        ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE,
+    }
+)
+"""Confirmed services every worker answers from its own replica."""
+
+# Routing decisions for a received datagram (bit flags).
+_LOCAL = 1
+_OWNER = 2
+
+# Control-socket frames: 4-byte length of what follows, 1-byte kind.
+_FRAME_HEADER = struct.Struct(">IB")
+_FRAME_DATAGRAM = 1  # payload: 4-byte IPv4 + 2-byte port + BVLL datagram
+_FRAME_REPLICATE = 2  # payload: pickled list of replication ops
+_FRAME_DCC = 3  # payload: 1-byte EnableDisable state
+
+# Unsent bytes a worker may buffer toward the owner before dropping.
+_MAX_FORWARD_BUFFER = 1 << 20
+
+
+def _route(data: bytes) -> int:
+    """Decide which worker must process a raw BVLL datagram.
+
+    Parses only the BVLL header, the NPDU control octet and addresses,
+    and the APDU header.  Unicast confirmed requests for
+    :data:`LOCAL_SERVICES` stay local unless they may read the Device
+    object.  A Segment-ACK or Abort sent by a
+    client concerns a server transaction that may live on either worker,
+    so it goes to both; the TSM that does not know the transaction
+    ignores it.  Everything else goes to the owner.
+    """
+    # Original-Unicast-NPDU only; broadcasts, forwarded NPDUs and BVLC
+    # management belong to the owner.
+    if len(data) < 6 or data[0] != 0x81 or data[1] != 0x0A:
+        return _OWNER
+    control = data[5]
+    if control & 0x80:
+        return _OWNER  # Network-layer message
+    offset = 6
+    if control & 0x20:  # DNET present
+        if offset + 3 > len(data):
+            return _OWNER
+        offset += 3 + data[offset + 2]
+    if control & 0x08:  # SNET present
+        if offset + 3 > len(data):
+            return _OWNER
+        offset += 3 + data[offset + 2]
+    if control & 0x20:  # Hop count
+        offset += 1
+    if offset >= len(data):
+        return _OWNER
+    header = data[offset]
+    pdu_type = header >> 4
+    if pdu_type == 0:  # Confirmed-Request
+        segmented = header & 0x08
+        service_offset = offset + (5 if segmented else 3)
+        if service_offset >= len(data) or data[service_offset] not in LOCAL_SERVICES:
+            return _OWNER
+        # Every segment must reach the same worker, and later segments do
+        # not start at the object identifier, so segmented reads stay local.
+        if not segmented and _names_device(data, service_offset + 1):
+            return _OWNER
+        return _LOCAL
+    if pdu_type in (4, 7) and not header & 0x01:  # Segment-ACK / Abort from a client
+        return _LOCAL | _OWNER
+    return _OWNER
+
+
+def _names_device(data: bytes, start: int) -> bool:
+    """Return whether a read request from *start* may name a Device object.
+
+    Looks for a context-0 object identifier of type Device (``0C 02 xx``
+    with the top two bits of ``xx`` clear).  A match inside some other
+    value only sends the request to the owner, which is always correct.
+    """
+    end = len(data) - 2
+    index = data.find(b"\x0c\x02", start)
+    while 0 <= index < end:
+        if data[index + 2] < 0x40:
+            return True
+        index = data.find(b"\x0c\x02", index + 1)
+    return False
+
+
+@dataclass
+class ShardStats:
+    """Counters for one :class:`ShardWorker`."""
+
+    handled_locally: int = 0
+    """Datagrams this worker processed itself."""
+
+    forwarded: int = 0
+    """Datagrams passed to the owner (non-owner workers)."""
+
+    forward_dropped: int = 0
+    """Datagrams dropped because the owner was unreachable or backed up."""
+
+    injected: int = 0
+    """Datagrams received from other workers and processed (owner)."""
+
+    duplicates_dropped: int = 0
+    """Copies of a datagram already processed, e.g. a broadcast that
+    reached every worker (owner)."""
+
+    replication_ops_sent: int = 0
+    """Database changes pushed to workers (owner, counted per worker)."""
+
+    replication_ops_applied: int = 0
+    """Database changes applied to this worker's replica."""
+
+    connected_workers: int = 0
+    """Workers currently connected to the owner."""
+
+
+def _encode_frame(kind: int, payload: bytes) -> bytes:
+    return _FRAME_HEADER.pack(len(payload) + 1, kind) + payload
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> tuple[int, bytes]:
+    header = await reader.readexactly(_FRAME_HEADER.size)
+    length, kind = _FRAME_HEADER.unpack(header)
+    return kind, await reader.readexactly(length - 1)
+
+
+class ShardWorker:
+    """Route and replicate traffic for one worker of a sharded server.
+
+    Attach after the application has started and its object database
+    has been populated.  Created and driven by :class:`ShardSupervisor`;
+    usable directly for custom process management.
+
+    :param app: The started application, using a
+        :class:`~bac_py.transport.bip.BIPTransport` bound with
+        ``reuse_port=True``.
+    :param index: Worker index; ``0`` is the owner.
+    :param control_path: Path of the owner's Unix control socket.
+    :param dedup_window: Seconds during which the owner drops a repeat of
+        a datagram from the same source.
+    """
+
+    def __init__(
+        self,
+        app: BACnetApplication,
+        index: int,
+        control_path: str,
+        *,
+        dedup_window: float = 0.5,
+    ) -> None:
+        self._app = app
+        self._index = index
+        self._control_path = control_path
+        self._dedup_window = dedup_window
+        self._stats = ShardStats()
+        self._transport: BIPTransport | None = None
+        # Owner state
+        self._server: asyncio.AbstractServer | None = None
+        self._peers: set[asyncio.StreamWriter] = set()
+        self._peer_tasks: set[asyncio.Task[None]] = set()
+        self._seen: dict[tuple[tuple[str, int], bytes], float] = {}
+        self._pending: dict[tuple[ObjectIdentifier, PropertyIdentifier | None], None] = {}
+        self._flush_handle: asyncio.Handle | None = None
+        # Latest op per object: None key holds the add/remove op.
+        self._journal: dict[
+            ObjectIdentifier, dict[PropertyIdentifier | None, tuple[Any, ...]]
+        ] = {}
+        # Worker state
+        self._writer: asyncio.StreamWriter | None = None
+        self._connect_task: asyncio.Task[None] | None = None
+        self._running = False
+
+    @property
+    def index(self) -> int:
+        """This worker's index."""
+        return self._index
+
+    @property
+    def is_owner(self) -> bool:
+        """Whether this worker owns writes, subscriptions and events."""
+        return self._index == 0
+
+    @property
+    def stats(self) -> ShardStats:
+        """Running counters."""
+        return self._stats
+
+    async def start(self) -> None:
+        """Install the receive filter and open the control socket."""
+        from bac_py.transport.bip import BIPTransport
+
+        transport = self._app._transport
+        if not isinstance(transport, BIPTransport):
+            msg = "Sharding requires a BACnet/IP (IPv4) transport"
+            raise TypeError(msg)
+        self._transport = transport
+        self._running = True
+        if self.is_owner:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._control_path)
+            self._server = await asyncio.start_unix_server(
+                self._on_peer_connected, path=self._control_path
+            )
+            db = self._app.object_db
+            db.register_write_listener(self._on_property_written)
+            db.register_membership_listener(self._on_membership_changed)
+            self._app.register_dcc_listener(self._on_dcc_changed)
+            transport.set_receive_filter(self._owner_filter)
+        else:
+            # Event state is evaluated and reported by the owner only.
+            if self._app.event_engine is not None:
+                await self._app.event_engine.stop()
+            transport.set_receive_filter(self._worker_filter)
+            self._connect_task = asyncio.create_task(self._connect_loop())
+        logger.info(
+            "Shard worker %d started (%s)", self._index, "owner" if self.is_owner else "reader"
+        )
+
+    async def stop(self) -> None:
+        """Remove the receive filter and close the control socket."""
+        self._running = False
+        if self._transport is not None:
+            self._transport.set_receive_filter(None)
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self.is_owner:
+            db = self._app.object_db
+            db.unregister_write_listener(self._on_property_written)
+            db.unregister_membership_listener(self._on_membership_changed)
+            self._app.unregister_dcc_listener(self._on_dcc_changed)
+            if self._server is not None:
+                self._server.close()
+                self._server = None
+            for peer in list(self._peers):
+                peer.close()
+            for task in list(self._peer_tasks):
+                task.cancel()
+            for task in list(self._peer_tasks):
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self._control_path)
+        else:
+            if self._connect_task is not None:
+                self._connect_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._connect_task
+                self._connect_task = None
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    # ------------------------------------------------------------------
+    # Owner: receive path
+    # ------------------------------------------------------------------
+
+    def _is_duplicate(self, data: bytes, addr: tuple[str, int]) -> bool:
+        """Return whether *data* from *addr* was processed within the window."""
+        now = time.monotonic()
+        seen = self._seen
+        # Entries are in arrival order; drop expired ones from the front.
+        while seen:
+            key, expiry = next(iter(seen.items()))
+            if expiry > now:
+                break
+            del seen[key]
+        key = (addr, data)
+        if key in seen:
+            self._stats.duplicates_dropped += 1
+            return True
+        seen[key] = now + self._dedup_window
+        return False
+
+    def _owner_filter(self, data: bytes, addr: tuple[str, int]) -> bool:
+        """Drop repeats of owner-bound datagrams received on the socket."""
+        if _route(data) & _LOCAL:
+            self._stats.handled_locally += 1
+            return False
+        if self._is_duplicate(data, addr):
+            return True
+        self._stats.handled_locally += 1
+        return False
+
+    def _inject(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Process a datagram forwarded by another worker."""
+        if self._transport is None or self._is_duplicate(data, addr):
+            return
+        self._stats.injected += 1
+        self._transport.inject_datagram(data, addr)
+
+    async def _on_peer_connected(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one worker: send the current state, then read forwarded datagrams."""
+        task = asyncio.current_task()
+        if task is not None:
+            self._peer_tasks.add(task)
+        self._peers.add(writer)
+        self._stats.connected_workers = len(self._peers)
+        try:
+            snapshot = self._journal_snapshot()
+            if snapshot:
+                self._send_ops(writer, snapshot)
+            writer.write(_encode_frame(_FRAME_DCC, bytes([self._app.dcc_state])))
+            while True:
+                kind, payload = await _read_frame(reader)
+                if kind == _FRAME_DATAGRAM and len(payload) > 6:
+                    host = socket.inet_ntoa(payload[:4])
+                    port = (payload[4] << 8) | payload[5]
+                    self._inject(payload[6:], (host, port))
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self._peers.discard(writer)
+            self._stats.connected_workers = len(self._peers)
+            writer.close()
+            if task is not None:
+                self._peer_tasks.discard(task)
+
+    # ------------------------------------------------------------------
+    # Owner: replication
+    # ------------------------------------------------------------------
+
+    def _on_property_written(self, obj: BACnetObject, prop_id: PropertyIdentifier) -> None:
+        self._mark_dirty(obj.object_identifier, prop_id)
+
+    def _on_membership_changed(
+        self, object_id: ObjectIdentifier, obj: BACnetObject | None
+    ) -> None:
+        self._mark_dirty(object_id, None)
+
+    def _mark_dirty(self, object_id: ObjectIdentifier, prop_id: PropertyIdentifier | None) -> None:
+        """Queue a change for the next flush; changes in one tick coalesce."""
+        self._pending[(object_id, prop_id)] = None
+        if self._flush_handle is None and self._running:
+            self._flush_handle = asyncio.get_running_loop().call_soon(self._flush)
+
+    def _flush(self) -> None:
+        """Turn queued changes into ops, record them and send them to workers."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        db = self._app.object_db
+        membership: list[tuple[Any, ...]] = []
+        properties: list[tuple[Any, ...]] = []
+        for object_id, prop_id in pending:
+            obj = db.get(object_id)
+            op: tuple[Any, ...]
+            if prop_id is None:
+                if obj is None:
+                    op = ("remove", object_id)
+                else:
+                    op = (
+                        "add",
+                        object_id.object_type,
+                        object_id.instance_number,
+                        dict(obj._properties),
+                        _copy_priority_array(obj),
+                    )
+                # Add and remove replace everything known about the object.
+                self._journal[object_id] = {None: op}
+                membership.append(op)
+                continue
+            if obj is None:
+                continue
+            if prop_id in obj._properties:
+                op = (
+                    "set",
+                    object_id,
+                    prop_id,
+                    obj._properties[prop_id],
+                    _copy_priority_array(obj),
+                )
+            else:
+                op = ("del", object_id, prop_id)
+            self._journal.setdefault(object_id, {})[prop_id] = op
+            properties.append(op)
+        # Membership first: adding an object bumps the replica's
+        # Database_Revision, which the owner's value then overwrites.
+        ops = membership + properties
+        if ops:
+            for peer in list(self._peers):
+                self._send_ops(peer, ops)
+
+    def _on_dcc_changed(self, state: EnableDisable) -> None:
+        """Send a new DCC state to every worker; the owner runs the timer."""
+        frame = _encode_frame(_FRAME_DCC, bytes([state]))
+        for peer in list(self._peers):
+            peer.write(frame)
+
+    def _journal_snapshot(self) -> list[tuple[Any, ...]]:
+        """Return the latest op for everything changed since start."""
+        membership: list[tuple[Any, ...]] = []
+        properties: list[tuple[Any, ...]] = []
+        for entries in self._journal.values():
+            for prop_id, op in entries.items():
+                (membership if prop_id is None else properties).append(op)
+        return membership + properties
+
+    def _send_ops(self, writer: asyncio.StreamWriter, ops: list[tuple[Any, ...]]) -> None:
+        """Pickle *ops* and write them to one worker."""
+        try:
+            payload = pickle.dumps(ops, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Skip only the values that cannot be pickled.
+            picklable = []
+            for op in ops:
+                try:
+                    pickle.dumps(op)
+                except Exception:
+                    logger.warning("Cannot replicate %s", op[:3])
+                else:
+                    picklable.append(op)
+            ops = picklable
+            payload = pickle.dumps(ops, protocol=pickle.HIGHEST_PROTOCOL)
+        writer.write(_encode_frame(_FRAME_REPLICATE, payload))
+        self._stats.replication_ops_sent += len(ops)
+
+    # ------------------------------------------------------------------
+    # Worker: receive path
+    # ------------------------------------------------------------------
+
+    def _worker_filter(self, data: bytes, addr: tuple[str, int]) -> bool:
+        """Keep read requests; hand everything else to the owner."""
+        route = _route(data)
+        if route & _OWNER:
+            self._forward(data, addr)
+        if route & _LOCAL:
+            self._stats.handled_locally += 1
+            return False
+        return True
+
+    def _forward(self, data: bytes, addr: tuple[str, int]) -> None:
+        writer = self._writer
+        if writer is None or writer.transport.get_write_buffer_size() > _MAX_FORWARD_BUFFER:
+            self._stats.forward_dropped += 1
+            return
+        try:
+            packed = socket.inet_aton(addr[0]) + addr[1].to_bytes(2, "big")
+        except OSError:
+            self._stats.forward_dropped += 1
+            return
+        writer.write(_encode_frame(_FRAME_DATAGRAM, packed + data))
+        self._stats.forwarded += 1
+
+    async def _connect_loop(self) -> None:
+        """Stay connected to the owner, applying replicated changes."""
+        delay = 0.1
+        while self._running:
+            try:
+                reader, writer = await asyncio.open_unix_connection(self._control_path)
+            except OSError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 2.0)
+                continue
+            delay = 0.1
+            self._writer = writer
+            logger.debug("Shard worker %d connected to owner", self._index)
+            try:
+                while True:
+                    kind, payload = await _read_frame(reader)
+                    if kind == _FRAME_REPLICATE:
+                        self._apply_ops(pickle.loads(payload))
+                    elif kind == _FRAME_DCC and payload:
+                        self._app.set_dcc_state(EnableDisable(payload[0]))
+            except (asyncio.IncompleteReadError, ConnectionError):
+                logger.warning("Shard worker %d lost the owner connection", self._index)
+            finally:
+                self._writer = None
+                writer.close()
+
+    def _apply_ops(self, ops: list[tuple[Any, ...]]) -> None:
+        """Apply replicated changes to this worker's object database."""
+        db = self._app.object_db
+        for op in ops:
+            try:
+                _apply_op(db, op)
+            except Exception:
+                logger.warning("Failed to apply replicated change %s", op[:3], exc_info=True)
+            self._stats.replication_ops_applied += 1
+
+
+def _copy_priority_array(obj: BACnetObject) -> list[Any] | None:
+    priority_array = obj._priority_array
+    return list(priority_array) if priority_array is not None else None
+
+
+def _install_priority_array(obj: BACnetObject, priority_array: list[Any]) -> None:
+    # The object exposes the same list through both attributes.
+    obj._priority_array = priority_array
+    obj._properties[PropertyIdentifier.PRIORITY_ARRAY] = priority_array
+    obj.invalidate_encoded(PropertyIdentifier.PRIORITY_ARRAY)
+
+
+def _apply_op(db: Any, op: tuple[Any, ...]) -> None:
+    """Apply one replication op to an :class:`ObjectDatabase`."""
+    kind = op[0]
+    if kind == "set":
+        _, object_id, prop_id, value, priority_array = op
+        obj = db.get(object_id)
+        if obj is None:
+            return
+        if prop_id == PropertyIdentifier.OBJECT_NAME:
+            db._update_name_index(object_id, obj._properties.get(prop_id), value)
+        if prop_id == PropertyIdentifier.PRIORITY_ARRAY:
+            priority_array = value
+        obj._properties[prop_id] = value
+        obj.invalidate_encoded(prop_id)
+        if priority_array is not None:
+            _install_priority_array(obj, priority_array)
+    elif kind == "del":
+        _, object_id, prop_id = op
+        obj = db.get(object_id)
+        if obj is not None:
+            obj._properties.pop(prop_id, None)
+    elif kind == "add":
+        _, object_type, instance, properties, priority_array = op
+        obj = create_object(ObjectType(object_type), instance)
+        if obj.object_identifier in db:
+            db.remove(obj.object_identifier)
+        for prop_id in list(obj._properties):
+            if prop_id not in properties:
+                del obj._properties[prop_id]
+        for prop_id, value in properties.items():
+            obj._properties[prop_id] = value
+        if priority_array is not None:
+            _install_priority_array(obj, priority_array)
+        else:
+            obj._priority_array = None
+        db.add(obj)
+    elif kind == "remove":
+        if op[1] in db:
+            db.remove(op[1])
+
+
+# ----------------------------------------------------------------------
+# Supervisor
+# ----------------------------------------------------------------------
+
+
+def _worker_main(config: DeviceConfig, setup: ShardSetup, index: int, control_path: str) -> None:
+    """Entry point of a worker process."""
+    # The supervisor handles Ctrl-C and stops workers with SIGTERM.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    asyncio.run(_run_worker(config, setup, index, control_path))
+
+
+async def _run_worker(
+    config: DeviceConfig, setup: ShardSetup, index: int, control_path: str
+) -> None:
+    from bac_py.app.application import BACnetApplication
+
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+    app = BACnetApplication(config)
+    await app.start()
+    try:
+        result = setup(app, index)
+        if result is not None:
+            await result
+        worker = ShardWorker(app, index, control_path)
+        await worker.start()
+        try:
+            await stop.wait()
+        finally:
+            await worker.stop()
+    finally:
+        await app.stop()
+
+
+class ShardSupervisor:
+    """Run and supervise the worker processes of a sharded server.
+
+    Each worker binds ``config.port`` with ``SO_REUSEPORT``, calls
+    ``setup(app, index)`` on its started application to populate the
+    object database, then attaches a :class:`ShardWorker`.  Worker ``0``
+    is the owner; *setup* should start schedule, trend log and other
+    state-changing engines only there, and the other workers receive
+    their results through replication.  A worker that exits
+    is restarted; if the owner exits, every worker is restarted so the
+    replicas start again from the same state.
+
+    With the ``spawn`` start method *config* and *setup* must be
+    picklable, so *setup* should be a module-level function.
+
+    :param config: Device configuration for every worker.  Must use a
+        fixed BACnet/IP port.
+    :param setup: Called with each worker's started application and its
+        index; may be a coroutine function.
+    :param workers: Number of worker processes.  Defaults to the CPU count.
+    :param restart_delay: Seconds to wait before restarting a worker.
+    :param mp_context: :mod:`multiprocessing` start method, or ``None``
+        for the platform default.
+    """
+
+    def __init__(
+        self,
+        config: DeviceConfig,
+        setup: ShardSetup,
+        *,
+        workers: int | None = None,
+        restart_delay: float = 1.0,
+        mp_context: str | None = None,
+    ) -> None:
+        if not hasattr(socket, "SO_REUSEPORT"):
+            msg = "Sharding requires SO_REUSEPORT, which this platform lacks"
+            raise RuntimeError(msg)
+        if config.port == 0:
+            msg = "Sharding requires a fixed port; port 0 would bind each worker differently"
+            raise ValueError(msg)
+        if (
+            config.ipv6
+            or config.sc_config is not None
+            or config.ethernet_interface is not None
+            or config.router_config is not None
+        ):
+            msg = "Sharding supports only the BACnet/IP (IPv4) device transport"
+            raise ValueError(msg)
+        workers = workers if workers is not None else (os.cpu_count() or 1)
+        if workers < 1:
+            msg = f"workers must be >= 1, got {workers}"
+            raise ValueError(msg)
+        self._config = dataclasses.replace(config, reuse_port=True)
+        self._setup = setup
+        self._workers = workers
+        self._restart_delay = restart_delay
+        self._ctx: Any = multiprocessing.get_context(mp_context)
+        self._processes: list[multiprocessing.process.BaseProcess | None] = [None] * workers
+        self._restart_at: dict[int, float] = {}
+        self._control_dir: str | None = None
+        self._stopping = False
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes."""
+        return self._workers
+
+    @property
+    def control_path(self) -> str | None:
+        """Path of the owner's control socket while running."""
+        if self._control_dir is None:
+            return None
+        return os.path.join(self._control_dir, "owner.sock")
+
+    @property
+    def pids(self) -> list[int | None]:
+        """Process IDs of the workers, ``None`` for workers not running."""
+        return [p.pid if p is not None and p.is_alive() else None for p in self._processes]
+
+    def start(self) -> None:
+        """Start every worker process, the owner first."""
+        if self._control_dir is None:
+            self._control_dir = tempfile.mkdtemp(prefix="bac-py-shard-")
+        self._stopping = False
+        for index in range(self._workers):
+            self._spawn(index)
+
+    def supervise(self, timeout: float = 0.5) -> None:
+        """Wait up to *timeout* seconds for a worker to exit and restart it."""
+        if self._stopping:
+            return
+        sentinels = [p.sentinel for p in self._processes if p is not None]
+        if sentinels:
+            multiprocessing.connection.wait(sentinels, timeout)
+        now = time.monotonic()
+        for index, process in enumerate(self._processes):
+            if process is None or process.is_alive():
+                continue
+            logger.warning(
+                "Shard worker %d (pid %s) exited with code %s",
+                index,
+                process.pid,
+                process.exitcode,
+            )
+            self._processes[index] = None
+            self._restart_at[index] = now + self._restart_delay
+            if index == 0:
+                # Replicas of a lost owner's state cannot be trusted.
+                for other in range(1, self._workers):
+                    self._terminate(other)
+                    self._restart_at[other] = now + self._restart_delay
+        for index, when in sorted(self._restart_at.items()):
+            if when <= now and (index == 0 or self._processes[0] is not None):
+                del self._restart_at[index]
+                self._spawn(index)
+
+    def run(self) -> None:
+        """Start the workers and supervise them until SIGINT or SIGTERM."""
+        previous = signal.signal(signal.SIGTERM, lambda *_: self._request_stop())
+        self.start()
+        try:
+            while not self._stopping:
+                self.supervise()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            self.stop()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop every worker, waiting up to *timeout* seconds before killing."""
+        self._stopping = True
+        self._restart_at.clear()
+        for process in self._processes:
+            if process is not None and process.is_alive():
+                process.terminate()
+        deadline = time.monotonic() + timeout
+        for index, process in enumerate(self._processes):
+            if process is None:
+                continue
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                process.kill()
+                process.join()
+            self._processes[index] = None
+        if self._control_dir is not None:
+            shutil.rmtree(self._control_dir, ignore_errors=True)
+            self._control_dir = None
+
+    def _request_stop(self) -> None:
+        self._stopping = True
+
+    def _spawn(self, index: int) -> None:
+        control_path = self.control_path
+        assert control_path is not None
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(self._config, self._setup, index, control_path),
+            name=f"bac-py-shard-{index}",
+            daemon=True,
+        )
+        process.start()
+        self._processes[index] = process
+        logger.info("Started shard worker %d (pid %s)", index, process.pid)
+
+    def _terminate(self, index: int) -> None:
+        process = self._processes[index]
+        if process is None:
+            return
+        process.terminate()
+        process.join(5.0)
+        if process.is_alive():
+            process.kill()
+            process.join()
+        self._processes[index] = None
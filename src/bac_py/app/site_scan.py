@@ -0,0 +1,337 @@
+"""Streaming site scan: discovery, object lists, and property snapshots.
+
+:func:`scan_site` discovers the devices on a site (or takes a known
+device list), reads each device's object list with
+:meth:`~bac_py.app.client.BACnetClient.get_object_list`, and snapshots
+selected properties of every object with
+:meth:`~bac_py.app.client.BACnetClient.read_multiple`.  Per-device
+results are yielded as they complete, so memory use is bounded by the
+number of devices in flight rather than by the size of the site.
+
+Concurrency is bounded both globally and per BACnet network, so a scan
+does not flood the routers in front of large remote networks.  Timed-out
+devices are retried with exponential backoff, and a
+:class:`SiteScanCheckpoint` lets an interrupted scan resume without
+rescanning the devices it already finished.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from bac_py.app._gather import gather_or_cancel
+from bac_py.app._scheduler import RETRYABLE, object_name, run_per_network
+from bac_py.app.client import BACnetClient, ObjectListProgress
+from bac_py.encoding.primitives import decode_and_unwrap
+from bac_py.network.address import GLOBAL_BROADCAST
+from bac_py.services.errors import BACnetError, BACnetRejectError
+from bac_py.types.enums import ObjectType, PropertyIdentifier, RejectReason
+from bac_py.types.parsing import parse_property_identifier
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterable, Sequence
+
+    from bac_py.app.client import DiscoveredDevice
+    from bac_py.network.address import BACnetAddress
+    from bac_py.types.primitives import ObjectIdentifier
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SCAN_PROPERTIES: tuple[PropertyIdentifier, ...] = (
+    PropertyIdentifier.OBJECT_NAME,
+    PropertyIdentifier.PRESENT_VALUE,
+)
+"""Properties snapshotted for every object when *properties* is not given."""
+
+
+@dataclass(frozen=True, slots=True)
+class SiteScanResult:
+    """Outcome of scanning one device, yielded by :func:`scan_site`."""
+
+    device: DiscoveredDevice
+    """The scanned device."""
+
+    object_list: list[ObjectIdentifier]
+    """Objects in the device.  Partial if the scan failed part way."""
+
+    properties: dict[str, dict[str, object]] = field(default_factory=dict)
+    """Property snapshot in the :meth:`~bac_py.app.client.BACnetClient.read_multiple`
+    result format.  Properties the object does not have are ``None``."""
+
+    error: Exception | None = None
+    """Error that ended the scan of this device, or ``None`` on success."""
+
+    attempts: int = 1
+    """Number of attempts made, including retries."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the device was scanned successfully."""
+        return self.error is None
+
+
+class SiteScanCheckpoint:
+    """Device instances already scanned, optionally persisted to a JSON file.
+
+    Pass the same checkpoint (or one loaded from the same file) to a
+    later :func:`scan_site` call to skip the devices it already
+    completed.  Devices whose scan failed are not recorded and are
+    scanned again.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, save_interval: float = 5.0) -> None:
+        """Create a checkpoint, loading *path* if it exists.
+
+        :param path: JSON file to persist to, or ``None`` to keep the
+            checkpoint in memory only.
+        :param save_interval: Minimum seconds between automatic saves
+            while a scan is running.  The file is always saved when the
+            scan ends.
+        """
+        self._path = Path(path) if path is not None else None
+        self._save_interval = save_interval
+        self._completed: set[int] = set()
+        self._last_save = time.monotonic()
+        self._dirty = False
+        if self._path is not None and self._path.exists():
+            try:
+                data = json.loads(self._path.read_text())
+                self._completed = {int(i) for i in data["completed"]}
+            except (OSError, ValueError, KeyError, TypeError):
+                logger.warning("Ignoring unreadable scan checkpoint %s", self._path)
+
+    @property
+    def completed(self) -> frozenset[int]:
+        """Instance numbers of the devices scanned successfully."""
+        return frozenset(self._completed)
+
+    def __contains__(self, instance: object) -> bool:
+        return instance in self._completed
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def mark_completed(self, instance: int) -> None:
+        """Record a device as scanned, saving if the save interval elapsed."""
+        self._completed.add(instance)
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self._save_interval:
+            self.save()
+
+    def clear(self) -> None:
+        """Forget all completed devices (the file is rewritten on the next save)."""
+        self._completed.clear()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the checkpoint file if anything changed since the last save."""
+        self._last_save = time.monotonic()
+        if self._path is None or not self._dirty:
+            return
+        payload = {"version": 1, "completed": sorted(self._completed)}
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp.replace(self._path)
+        self._dirty = False
+
+
+async def scan_site(
+    client: BACnetClient,
+    *,
+    devices: Iterable[DiscoveredDevice] | None = None,
+    low_limit: int | None = None,
+    high_limit: int | None = None,
+    destination: BACnetAddress = GLOBAL_BROADCAST,
+    discover_timeout: float = 3.0,
+    properties: Sequence[str | int | PropertyIdentifier] | None = DEFAULT_SCAN_PROPERTIES,
+    max_concurrency: int = 32,
+    max_per_network: int = 4,
+    requests_per_device: int = 2,
+    retries: int = 2,
+    backoff: float = 1.0,
+    timeout: float | None = None,
+    use_cache: bool = False,
+    checkpoint: SiteScanCheckpoint | None = None,
+) -> AsyncIterator[SiteScanResult]:
+    """Scan every device on a site, yielding one result per device.
+
+    Devices are discovered with
+    :meth:`~bac_py.app.client.BACnetClient.discover` unless *devices*
+    is given.  Results are yielded in completion order.  Devices that
+    fail are yielded too, with :attr:`SiteScanResult.error` set.
+
+    Usage::
+
+        async for result in scan_site(client, max_per_network=2):
+            if result.ok:
+                store(result.device.instance, result.properties)
+
+    :param client: Client used to send the requests.
+    :param devices: Devices to scan instead of running discovery.
+    :param low_limit: Lower bound of the Who-Is instance range.
+    :param high_limit: Upper bound of the Who-Is instance range.
+    :param destination: Who-Is broadcast address.
+    :param discover_timeout: Seconds to wait for I-Am responses.
+    :param properties: Properties to read from every object, or
+        ``None`` to read object lists only.
+    :param max_concurrency: Maximum devices scanned at once.
+    :param max_per_network: Maximum devices scanned at once on any one
+        BACnet network.  Devices on the local network share one limit.
+    :param requests_per_device: Maximum requests in flight to one device.
+    :param retries: Retries for a device whose requests time out.
+    :param backoff: Delay in seconds before the first retry.  Doubles on
+        each further retry.
+    :param timeout: Optional caller-level timeout in seconds, applied to
+        each request.
+    :param use_cache: Reuse object lists cached in the application's
+        device cache.
+    :param checkpoint: Checkpoint to skip completed devices and record
+        newly completed ones.
+    :returns: Async iterator of :class:`SiteScanResult`.
+    :raises ValueError: If a concurrency limit is below 1 or *retries*
+        is negative.
+    """
+    if min(max_concurrency, max_per_network, requests_per_device) < 1:
+        msg = "Concurrency limits must be at least 1"
+        raise ValueError(msg)
+    if retries < 0:
+        msg = f"retries must be non-negative, got {retries}"
+        raise ValueError(msg)
+
+    if devices is None:
+        devices = await client.discover(
+            low_limit=low_limit,
+            high_limit=high_limit,
+            destination=destination,
+            timeout=discover_timeout,
+        )
+
+    prop_ids = [parse_property_identifier(p) for p in properties] if properties is not None else []
+
+    async def _job(device: DiscoveredDevice) -> SiteScanResult:
+        return await _scan_device(
+            client,
+            device,
+            prop_ids,
+            requests_per_device=requests_per_device,
+            retries=retries,
+            backoff=backoff,
+            timeout=timeout,
+            use_cache=use_cache,
+        )
+
+    async with aclosing(
+        run_per_network(
+            devices,
+            _job,
+            max_concurrency=max_concurrency,
+            max_per_network=max_per_network,
+            checkpoint=checkpoint,
+            name="scan_site",
+        )
+    ) as results:
+        async for result in results:
+            yield result
+
+
+async def _scan_device(
+    client: BACnetClient,
+    device: DiscoveredDevice,
+    properties: list[PropertyIdentifier],
+    *,
+    requests_per_device: int,
+    retries: int,
+    backoff: float,
+    timeout: float | None,
+    use_cache: bool,
+) -> SiteScanResult:
+    """Scan one device, retrying timeouts with exponential backoff."""
+    progress = ObjectListProgress()
+    object_list: list[ObjectIdentifier] | None = None
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            if object_list is None:
+                object_list = await client.get_object_list(
+                    device.address,
+                    device.instance,
+                    timeout=timeout,
+                    use_cache=use_cache,
+                    max_in_flight=requests_per_device,
+                    progress=progress,
+                )
+            snapshot: dict[str, dict[str, object]] = {}
+            if properties and object_list:
+                snapshot = await _read_snapshot(
+                    client, device.address, object_list, properties, requests_per_device, timeout
+                )
+            return SiteScanResult(device, object_list, snapshot, attempts=attempt)
+        except RETRYABLE as exc:
+            if attempt > retries:
+                logger.warning("scan of device %d failed: %s", device.instance, exc)
+                partial = object_list if object_list is not None else progress.object_list()
+                return SiteScanResult(device, partial, error=exc, attempts=attempt)
+            delay = backoff * 2 ** (attempt - 1)
+            logger.debug("device %d timed out, retrying in %.1fs", device.instance, delay)
+            await asyncio.sleep(delay)
+        except Exception as exc:
+            logger.warning("scan of device %d failed: %s", device.instance, exc)
+            partial = object_list if object_list is not None else progress.object_list()
+            return SiteScanResult(device, partial, error=exc, attempts=attempt)
+
+
+async def _read_snapshot(
+    client: BACnetClient,
+    address: BACnetAddress,
+    object_list: list[ObjectIdentifier],
+    properties: list[PropertyIdentifier],
+    max_in_flight: int,
+    timeout: float | None,
+) -> dict[str, dict[str, object]]:
+    """Read *properties* of every object, falling back to ReadProperty."""
+    specs: dict[
+        str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
+        list[str | int | PropertyIdentifier],
+    ] = {oid: list(properties) for oid in object_list}
+    try:
+        return await client.read_multiple(
+            address, specs, timeout=timeout, max_concurrency=max_in_flight
+        )
+    except BACnetRejectError as exc:
+        if exc.reason != RejectReason.UNRECOGNIZED_SERVICE:
+            raise
+
+    logger.debug("%s rejected RPM, reading snapshot with ReadProperty", address)
+    snapshot: dict[str, dict[str, object]] = {}
+    pending: deque[tuple[ObjectIdentifier, PropertyIdentifier, dict[str, object]]] = deque()
+    for oid in object_list:
+        values = snapshot.setdefault(object_name(oid), {})
+        pending.extend((oid, prop, values) for prop in properties)
+
+    async def _worker() -> None:
+        # A fixed pool of workers keeps both the requests in flight and the
+        # number of tasks at max_in_flight, however large the device.
+        while pending:
+            oid, prop, into = pending.popleft()
+            value: object = None
+            try:
+                ack = await client.read_property(address, oid, prop, timeout=timeout)
+            except BACnetError:
+                pass
+            else:
+                if ack.property_value:
+                    value = decode_and_unwrap(ack.property_value)
+            into[prop.name.lower().replace("_", "-")] = value
+
+    workers = min(max_in_flight, len(pending))
+    await gather_or_cancel([_worker() for _ in range(workers)])
+    return snapshot
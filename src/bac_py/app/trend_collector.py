@@ -0,0 +1,505 @@
+"""Incremental collection of remote log buffers.
+
+:class:`TrendCollector` pulls the records logged since the last run from
+Trend Log, Trend Log Multiple, and Event Log objects on other devices.  It
+keeps a high-water mark per log in a :class:`TrendCheckpoint`, pages
+through each buffer with ReadRange, and yields the decoded records as a
+stream of :class:`TrendBatch` objects.
+
+Logs are addressed by sequence number where possible.  The oldest and
+newest sequence numbers still buffered are derived from the log's
+Total_Record_Count and Record_Count, so records overwritten before they
+were collected are reported as a gap instead of going unnoticed.
+Devices that reject ReadRange by sequence number are read by position;
+the counts are re-read after each page, and a page read while the log
+wrapped is read again so that positions map to the right sequence
+numbers.  Logs without Total_Record_Count are read by time.
+
+Records are decoded according to the log's object type:
+:class:`~bac_py.types.constructed.BACnetLogRecord` for Trend Log,
+:class:`~bac_py.types.constructed.BACnetLogMultipleRecord` for Trend Log
+Multiple, and :class:`~bac_py.services.event_notification.BACnetEventLogRecord`
+for Event Log objects.
+
+Many logs are collected at once, bounded both globally and per device.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bac_py.encoding.primitives import decode_and_unwrap
+from bac_py.network.address import BACnetAddress
+from bac_py.services.errors import BACnetError, BACnetRejectError
+from bac_py.services.event_notification import BACnetEventLogRecord
+from bac_py.services.read_range import RangeByPosition, RangeBySequenceNumber, RangeByTime
+from bac_py.types.constructed import BACnetDateTime, BACnetLogMultipleRecord, BACnetLogRecord
+from bac_py.types.enums import ErrorClass, ObjectType, PropertyIdentifier
+from bac_py.types.primitives import ObjectIdentifier
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+
+    from bac_py.app.client import BACnetClient
+    from bac_py.services.read_range import ReadRangeACK
+
+logger = logging.getLogger(__name__)
+
+_LogKey = tuple[BACnetAddress, ObjectIdentifier]
+
+TrendRecord = BACnetLogRecord | BACnetLogMultipleRecord | BACnetEventLogRecord
+"""A decoded Log_Buffer record of any of the supported log object types."""
+
+_MAX_POSITION_RETRIES = 3
+"""Times a by-position page is re-read after the log wrapped during the read."""
+
+_RECORD_DECODERS: dict[ObjectType, Any] = {
+    ObjectType.TREND_LOG_MULTIPLE: BACnetLogMultipleRecord.decode,
+    ObjectType.EVENT_LOG: BACnetEventLogRecord.decode,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class TrendCursor:
+    """High-water mark of one remote log."""
+
+    sequence_number: int | None = None
+    """Sequence number of the newest record collected, or ``None`` if the
+    log is read by time."""
+
+    timestamp: BACnetDateTime | None = None
+    """Timestamp of the newest record collected."""
+
+
+@dataclass(frozen=True, slots=True)
+class TrendBatch:
+    """A page of records collected from one log, yielded by :meth:`TrendCollector.collect`."""
+
+    address: BACnetAddress
+    """Address of the device holding the log."""
+
+    object_identifier: ObjectIdentifier
+    """The log object."""
+
+    records: list[TrendRecord] = field(default_factory=list)
+    """Decoded records, oldest first.  The record type follows the log's
+    object type (see :data:`TrendRecord`)."""
+
+    first_sequence_number: int | None = None
+    """Sequence number of the first record, if the log numbers its records."""
+
+    missed: int = 0
+    """Records overwritten in the remote buffer before they could be
+    collected, immediately preceding this batch."""
+
+    reset: bool = False
+    """Whether the log was cleared or its numbering restarted since the
+    last collection; collection started over from the oldest record."""
+
+    error: Exception | None = None
+    """Error that ended collection of this log, or ``None``."""
+
+    cursor: TrendCursor | None = None
+    """High-water mark after this batch."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the batch was collected without error."""
+        return self.error is None
+
+
+class TrendCheckpoint:
+    """High-water marks of collected logs, optionally persisted to a JSON file.
+
+    Pass the same checkpoint (or one loaded from the same file) to a
+    later :class:`TrendCollector` to resume where it stopped instead of
+    collecting each log's history again.
+    """
+
+    def __init__(self, path: str | Path | None = None, *, save_interval: float = 5.0) -> None:
+        """Create a checkpoint, loading *path* if it exists.
+
+        :param path: JSON file to persist to, or ``None`` to keep the
+            checkpoint in memory only.
+        :param save_interval: Minimum seconds between automatic saves
+            while collecting.  The file is always saved when a collection
+            pass ends.
+        """
+        self._path = Path(path) if path is not None else None
+        self._save_interval = save_interval
+        self._cursors: dict[_LogKey, TrendCursor] = {}
+        self._last_save = time.monotonic()
+        self._dirty = False
+        if self._path is not None and self._path.exists():
+            try:
+                data = json.loads(self._path.read_text())
+                for entry in data["logs"]:
+                    key = (
+                        BACnetAddress.from_dict(entry["address"]),
+                        ObjectIdentifier.from_dict(entry["object"]),
+                    )
+                    timestamp = entry.get("timestamp")
+                    self._cursors[key] = TrendCursor(
+                        entry.get("sequence"),
+                        BACnetDateTime.from_dict(timestamp) if timestamp is not None else None,
+                    )
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                logger.warning("Ignoring unreadable trend checkpoint %s", self._path)
+                self._cursors.clear()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def get(
+        self, address: BACnetAddress, object_identifier: ObjectIdentifier
+    ) -> TrendCursor | None:
+        """Return the high-water mark of a log, or ``None`` if never collected."""
+        return self._cursors.get((address, object_identifier))
+
+    def update(
+        self,
+        address: BACnetAddress,
+        object_identifier: ObjectIdentifier,
+        cursor: TrendCursor,
+    ) -> None:
+        """Record a new high-water mark, saving if the save interval elapsed."""
+        self._cursors[(address, object_identifier)] = cursor
+        self._dirty = True
+        if time.monotonic() - self._last_save >= self._save_interval:
+            self.save()
+
+    def clear(self) -> None:
+        """Forget all high-water marks (the file is rewritten on the next save)."""
+        self._cursors.clear()
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the checkpoint file if anything changed since the last save."""
+        self._last_save = time.monotonic()
+        if self._path is None or not self._dirty:
+            return
+        logs = [
+            {
+                "address": address.to_dict(),
+                "object": oid.to_dict(),
+                "sequence": cursor.sequence_number,
+                "timestamp": cursor.timestamp.to_dict() if cursor.timestamp else None,
+            }
+            for (address, oid), cursor in self._cursors.items()
+        ]
+        payload = {"version": 1, "logs": logs}
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")))
+        tmp.replace(self._path)
+        self._dirty = False
+
+
+@dataclass(slots=True)
+class _LogDone:
+    address: BACnetAddress
+
+
+class TrendCollector:
+    """Collect new records from remote logs, resuming from a checkpoint.
+
+    Usage::
+
+        collector = TrendCollector(client, checkpoint=TrendCheckpoint("trends.json"))
+        while True:
+            async for batch in collector.collect(logs):
+                if batch.missed:
+                    print(f"{batch.object_identifier}: {batch.missed} records lost")
+                store(batch.address, batch.object_identifier, batch.records)
+            await asyncio.sleep(300)
+
+    A log's high-water mark advances when the consumer asks for the
+    batch after the one that carried it, so a batch that was being
+    processed when the program stopped is collected again on restart.
+
+    :param client: Client used to send the requests.
+    :param checkpoint: Where high-water marks are kept.  Defaults to an
+        in-memory checkpoint.
+    :param page_size: Records requested per ReadRange.  Devices return
+        fewer when the response would exceed their APDU limits.
+    :param max_concurrency: Maximum logs collected at once.
+    :param max_per_device: Maximum logs collected at once from one device.
+    :param timeout: Optional caller-level timeout in seconds, applied to
+        each request.
+    :raises ValueError: If *page_size* or a concurrency limit is below 1.
+    """
+
+    def __init__(
+        self,
+        client: BACnetClient,
+        *,
+        checkpoint: TrendCheckpoint | None = None,
+        page_size: int = 200,
+        max_concurrency: int = 32,
+        max_per_device: int = 2,
+        timeout: float | None = None,
+    ) -> None:
+        if min(page_size, max_concurrency, max_per_device) < 1:
+            msg = "page_size and concurrency limits must be at least 1"
+            raise ValueError(msg)
+        self._client = client
+        self._checkpoint = checkpoint if checkpoint is not None else TrendCheckpoint()
+        self._page_size = page_size
+        self._max_concurrency = max_concurrency
+        self._max_per_device = max_per_device
+        self._timeout = timeout
+        # Logs whose device rejected ReadRange by sequence number.
+        self._by_position: set[_LogKey] = set()
+
+    @property
+    def checkpoint(self) -> TrendCheckpoint:
+        """The high-water marks of every log collected."""
+        return self._checkpoint
+
+    async def collect(
+        self,
+        logs: Iterable[tuple[BACnetAddress, ObjectIdentifier]],
+    ) -> AsyncIterator[TrendBatch]:
+        """Collect the records logged since the last pass from each log.
+
+        Batches are yielded as pages arrive, interleaved across logs.  A
+        log whose collection fails yields one batch with
+        :attr:`TrendBatch.error` set and is retried on the next pass from
+        its last high-water mark.
+
+        :param logs: ``(device address, log object)`` pairs to collect.
+        :returns: Async iterator of :class:`TrendBatch`.
+        """
+        pending: dict[BACnetAddress, deque[ObjectIdentifier]] = {}
+        seen: set[_LogKey] = set()
+        for address, oid in logs:
+            if (address, oid) not in seen:
+                seen.add((address, oid))
+                pending.setdefault(address, deque()).append(oid)
+        logger.info("collect: %d logs on %d devices", len(seen), len(pending))
+
+        devices = deque(pending)
+        active: dict[BACnetAddress, int] = dict.fromkeys(pending, 0)
+        queue: asyncio.Queue[TrendBatch | _LogDone] = asyncio.Queue(self._max_concurrency)
+        tasks: set[asyncio.Task[None]] = set()
+        running = 0
+
+        async def _run(address: BACnetAddress, oid: ObjectIdentifier) -> None:
+            try:
+                await self._collect_log(address, oid, queue.put)
+            except Exception as exc:
+                logger.warning("collection of %s on %s failed: %s", oid, address, exc)
+                await queue.put(TrendBatch(address, oid, error=exc))
+            await queue.put(_LogDone(address))
+
+        def _launch() -> None:
+            nonlocal running
+            while running < self._max_concurrency:
+                for _ in range(len(devices)):
+                    address = devices[0]
+                    devices.rotate(-1)
+                    if pending[address] and active[address] < self._max_per_device:
+                        active[address] += 1
+                        running += 1
+                        task = asyncio.ensure_future(_run(address, pending[address].popleft()))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                        break
+                else:
+                    return
+
+        try:
+            _launch()
+            while running:
+                item = await queue.get()
+                if isinstance(item, _LogDone):
+                    running -= 1
+                    active[item.address] -= 1
+                    _launch()
+                    continue
+                yield item
+                if item.cursor is not None:
+                    self._checkpoint.update(item.address, item.object_identifier, item.cursor)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+            self._checkpoint.save()
+
+    # --- Internals ---
+
+    async def _collect_log(
+        self,
+        address: BACnetAddress,
+        oid: ObjectIdentifier,
+        put: Callable[[TrendBatch], Awaitable[None]],
+    ) -> None:
+        """Page through one log from its high-water mark, emitting batches."""
+        cursor = self._checkpoint.get(address, oid)
+        counts = await self._read_counts(address, oid)
+        if counts is None:
+            await self._collect_by_time(address, oid, cursor, put)
+            return
+
+        total, buffered = counts
+        oldest = total - buffered + 1
+        last = cursor.sequence_number if cursor is not None else None
+        reset = last is not None and last > total
+        if reset:
+            logger.info("log %s on %s was reset, collecting from the start", oid, address)
+        next_seq = oldest if last is None or reset else last + 1
+        missed = 0
+        if next_seq < oldest:
+            missed = oldest - next_seq
+            next_seq = oldest
+
+        key = (address, oid)
+        shifts = 0
+        while next_seq <= total:
+            count = min(self._page_size, total - next_seq + 1)
+            first = next_seq
+            if key not in self._by_position:
+                try:
+                    ack = await self._read_range(
+                        address, oid, RangeBySequenceNumber(next_seq, count)
+                    )
+                except (BACnetError, BACnetRejectError) as exc:
+                    if isinstance(exc, BACnetError) and exc.error_class != ErrorClass.SERVICES:
+                        raise
+                    logger.debug("%s rejected ReadRange by sequence, reading by position", address)
+                    self._by_position.add(key)
+                    continue
+                if ack.first_sequence_number is not None:
+                    first = ack.first_sequence_number
+            else:
+                ack = await self._read_range(
+                    address, oid, RangeByPosition(next_seq - oldest + 1, count)
+                )
+                # Positions are relative to the oldest record.  If the log
+                # overwrote records since the counts were read, the page may
+                # have been taken from shifted positions.
+                counts = await self._read_counts(address, oid)
+                shift = counts[0] - counts[1] + 1 - oldest if counts is not None else 0
+                if shift < 0:
+                    # Cleared or renumbered; the next pass detects the reset.
+                    break
+                if shift:
+                    oldest += shift
+                    if shifts < _MAX_POSITION_RETRIES:
+                        shifts += 1
+                        if next_seq < oldest:
+                            missed += oldest - next_seq
+                            next_seq = oldest
+                        continue
+                    # Still moving: assume the page came from the shifted
+                    # positions and report the records it stepped over.
+                    logger.warning("log %s on %s keeps wrapping during paging", oid, address)
+                    first = next_seq + shift
+                shifts = 0
+
+            records = _decode_records(oid, ack)
+            if not records:
+                # The rest was overwritten after the counts were read; the
+                # next pass reports the gap.
+                break
+            if first > next_seq:
+                missed += first - next_seq
+            last_seq = first + len(records) - 1
+            await put(
+                TrendBatch(
+                    address,
+                    oid,
+                    records,
+                    first_sequence_number=first,
+                    missed=missed,
+                    reset=reset,
+                    cursor=TrendCursor(last_seq, records[-1].timestamp),
+                )
+            )
+            missed = 0
+            reset = False
+            next_seq = last_seq + 1
+
+    async def _collect_by_time(
+        self,
+        address: BACnetAddress,
+        oid: ObjectIdentifier,
+        cursor: TrendCursor | None,
+        put: Callable[[TrendBatch], Awaitable[None]],
+    ) -> None:
+        """Page through a log without sequence numbers by timestamp."""
+        after = cursor.timestamp if cursor is not None else None
+        while True:
+            qualifier: RangeByPosition | RangeByTime
+            if after is None:
+                qualifier = RangeByPosition(1, self._page_size)
+            else:
+                qualifier = RangeByTime(after.date, after.time, self._page_size)
+            ack = await self._read_range(address, oid, qualifier)
+            records = _decode_records(oid, ack)
+            if not records:
+                return
+            after = records[-1].timestamp
+            await put(
+                TrendBatch(
+                    address,
+                    oid,
+                    records,
+                    first_sequence_number=ack.first_sequence_number,
+                    cursor=TrendCursor(None, after),
+                )
+            )
+            if not ack.result_flags.more_items:
+                return
+
+    async def _read_counts(
+        self, address: BACnetAddress, oid: ObjectIdentifier
+    ) -> tuple[int, int] | None:
+        """Read Total_Record_Count and Record_Count, or ``None`` if unsupported."""
+        values: list[int] = []
+        for prop in (PropertyIdentifier.TOTAL_RECORD_COUNT, PropertyIdentifier.RECORD_COUNT):
+            try:
+                ack = await self._client.read_property(address, oid, prop, timeout=self._timeout)
+            except BACnetError as exc:
+                if exc.error_class != ErrorClass.PROPERTY:
+                    raise
+                return None
+            value = decode_and_unwrap(ack.property_value)
+            if not isinstance(value, int):
+                return None
+            values.append(value)
+        total, buffered = values
+        return total, min(buffered, total)
+
+    async def _read_range(
+        self,
+        address: BACnetAddress,
+        oid: ObjectIdentifier,
+        qualifier: RangeByPosition | RangeBySequenceNumber | RangeByTime,
+    ) -> ReadRangeACK:
+        return await self._client.read_range(
+            address,
+            oid,
+            PropertyIdentifier.LOG_BUFFER,
+            range_qualifier=qualifier,
+            timeout=self._timeout,
+        )
+
+
+def _decode_records(oid: ObjectIdentifier, ack: ReadRangeACK) -> list[TrendRecord]:
+    """Decode the log records carried in a ReadRange-ACK for log *oid*."""
+    decode = _RECORD_DECODERS.get(oid.object_type, BACnetLogRecord.decode)
+    data = memoryview(ack.item_data)
+    records: list[TrendRecord] = []
+    offset = 0
+    while offset < len(data):
+        record, offset = decode(data, offset)
+        records.append(record)
+    return records
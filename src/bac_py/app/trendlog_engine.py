@@ -19,7 +19,6 @@ from typing import TYPE_CHECKING, Any
 
 from bac_py.types.constructed import BACnetDateTime, BACnetLogRecord
 from bac_py.types.enums import LoggingType, ObjectType, PropertyIdentifier
-from bac_py.types.primitives import BACnetDate, BACnetTime
 
 if TYPE_CHECKING:
     from bac_py.app.application import BACnetApplication
@@ -28,15 +27,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def _now_datetime() -> BACnetDateTime:
-    """Create a BACnetDateTime from the current wall-clock time."""
-    n = datetime.datetime.now()
-    return BACnetDateTime(
-        date=BACnetDate(n.year, n.month, n.day, n.isoweekday()),
-        time=BACnetTime(n.hour, n.minute, n.second, n.microsecond // 10000),
-    )
-
-
 def _datetime_to_float(dt: BACnetDateTime) -> float:
     """Convert a BACnetDateTime to a POSIX-ish float for comparison."""
     try:
@@ -233,7 +223,7 @@ class TrendLogEngine:
             with contextlib.suppress(Exception):
                 status_flags = target.read_property(PropertyIdentifier.STATUS_FLAGS)
             record = BACnetLogRecord(
-                timestamp=_now_datetime(),
+                timestamp=BACnetDateTime.now(),
                 log_datum=new_value,
                 status_flags=status_flags,
             )
@@ -304,7 +294,7 @@ class TrendLogEngine:
             status_flags = target.read_property(PropertyIdentifier.STATUS_FLAGS)
 
         record = BACnetLogRecord(
-            timestamp=_now_datetime(),
+            timestamp=BACnetDateTime.now(),
             log_datum=value,
             status_flags=status_flags,
         )
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from bac_py.encoding.apdu import (
     AbortPDU,
@@ -69,6 +71,196 @@ class ClientTransaction:
     segment_sender: SegmentSender | None = None
     segment_receiver: SegmentReceiver | None = None
     seg_retry_count: int = 0
+    sent_at: float | None = None
+
+
+@dataclass
+class RequestQueueStats:
+    """Counters for confirmed requests held back by outstanding-request limits."""
+
+    queue_depth: int = 0
+    """Requests currently waiting for a free slot."""
+
+    max_queue_depth: int = 0
+    """Highest queue depth observed."""
+
+    total_queued: int = 0
+    """Requests that had to wait for a slot."""
+
+    total_wait_time: float = 0.0
+    """Cumulative seconds spent waiting for slots."""
+
+    max_wait_time: float = 0.0
+    """Longest single wait in seconds."""
+
+
+class _RequestWindow:
+    """Outstanding-request window shared by one peer or one network.
+
+    Waiters are queued FIFO per destination.  When a slot frees up it is
+    handed to the destinations in round-robin order, so a burst to one
+    device behind a shared network window cannot starve its neighbours.
+
+    Slots are counted per destination so that, when a limit change moves
+    a destination under a different window, its in-flight requests and
+    waiters can be carried over.  ``moved`` then records where each
+    destination went (``None`` if no limit governs it any more), so slots
+    granted by this window are released against the right one.
+    """
+
+    __slots__ = ("active", "in_flight", "key", "limit", "moved", "waiters")
+
+    def __init__(self, key: object, limit: int) -> None:
+        self.key = key
+        self.limit = limit
+        self.in_flight = 0
+        self.active: dict[BACnetAddress, int] = {}
+        # Insertion order doubles as the round-robin ring.
+        self.waiters: dict[BACnetAddress, deque[asyncio.Future[_RequestWindow | None]]] = {}
+        self.moved: dict[BACnetAddress, _RequestWindow | None] | None = None
+
+    @property
+    def idle(self) -> bool:
+        return self.in_flight == 0 and not self.waiters
+
+    def try_acquire(self, destination: BACnetAddress) -> bool:
+        if self.in_flight < self.limit and not self.waiters:
+            self._grant(destination)
+            return True
+        return False
+
+    def enqueue(
+        self, destination: BACnetAddress, future: asyncio.Future[_RequestWindow | None]
+    ) -> None:
+        self.waiters.setdefault(destination, deque()).append(future)
+
+    def discard(
+        self, destination: BACnetAddress, future: asyncio.Future[_RequestWindow | None]
+    ) -> None:
+        queue = self.waiters.get(destination)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self.waiters[destination]
+
+    def release(self, destination: BACnetAddress) -> None:
+        """Free a slot held for *destination* and hand it to the next waiter."""
+        count = self.active.get(destination, 0)
+        if count == 0:
+            return
+        if count == 1:
+            del self.active[destination]
+        else:
+            self.active[destination] = count - 1
+        self.in_flight -= 1
+        self.wake()
+
+    def adopt(
+        self,
+        destination: BACnetAddress,
+        active: int,
+        waiters: deque[asyncio.Future[_RequestWindow | None]] | None,
+    ) -> None:
+        """Take over *destination*'s slots and waiters from another window."""
+        if active:
+            self.active[destination] = self.active.get(destination, 0) + active
+            self.in_flight += active
+        if waiters:
+            self.waiters.setdefault(destination, deque()).extend(waiters)
+
+    def wake(self) -> None:
+        """Hand free slots to waiters in round-robin order."""
+        while self.waiters and self.in_flight < self.limit:
+            destination = next(iter(self.waiters))
+            queue = self.waiters.pop(destination)
+            future = queue.popleft()
+            if queue:
+                # Rotate this destination to the back of the ring.
+                self.waiters[destination] = queue
+            if not future.done():
+                self._grant(destination)
+                future.set_result(self)
+
+    def _grant(self, destination: BACnetAddress) -> None:
+        self.in_flight += 1
+        self.active[destination] = self.active.get(destination, 0) + 1
+
+
+def _current_window(
+    window: _RequestWindow | None, destination: BACnetAddress
+) -> _RequestWindow | None:
+    """Follow *destination* through windows retired by limit changes."""
+    while window is not None and window.moved is not None:
+        window = window.moved.get(destination)
+    return window
+
+
+@dataclass(frozen=True, slots=True)
+class RTTEstimate:
+    """Snapshot of the round-trip time estimate for one peer."""
+
+    srtt: float
+    """Smoothed round-trip time in seconds."""
+
+    rttvar: float
+    """Round-trip time variation in seconds."""
+
+    timeout: float
+    """APDU timeout currently applied to the peer in seconds."""
+
+    samples: int
+    """Number of round-trip samples folded into the estimate."""
+
+
+class _RTTEstimator:
+    """Smoothed RTT and retransmission timeout for one peer.
+
+    Uses the Jacobson/Karels estimator from RFC 6298: the timeout is
+    ``SRTT + 4 * RTTVAR``, clamped to the configured bounds.
+    """
+
+    __slots__ = ("max_timeout", "min_timeout", "rttvar", "samples", "srtt", "timeout")
+
+    _ALPHA = 0.125
+    _BETA = 0.25
+    _K = 4.0
+
+    def __init__(self, min_timeout: float, max_timeout: float) -> None:
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.srtt = 0.0
+        self.rttvar = 0.0
+        self.timeout = max_timeout
+        self.samples = 0
+
+    def update(self, rtt: float) -> None:
+        if self.samples == 0:
+            self.srtt = rtt
+            self.rttvar = rtt / 2
+        else:
+            self.rttvar += self._BETA * (abs(self.srtt - rtt) - self.rttvar)
+            self.srtt += self._ALPHA * (rtt - self.srtt)
+        self.samples += 1
+        rto = self.srtt + self._K * self.rttvar
+        self.timeout = min(max(rto, self.min_timeout), self.max_timeout)
+
+    def backoff(self) -> None:
+        """Double the timeout after a response arrived only on a retry."""
+        self.timeout = min(self.timeout * 2, self.max_timeout)
+
+    def snapshot(self) -> RTTEstimate:
+        return RTTEstimate(
+            srtt=self.srtt, rttvar=self.rttvar, timeout=self.timeout, samples=self.samples
+        )
+
+
+# Bound on peers tracked by the adaptive timeout estimator; the least
+# recently updated peer is evicted first.
+_MAX_RTT_PEERS = 4096
 
 
 class ClientTSM:
@@ -88,6 +280,10 @@ class ClientTSM:
         max_segments: int | None = None,
         segment_timeout: float = 2.0,
         proposed_window_size: int = 16,
+        max_outstanding_per_peer: int | None = None,
+        adaptive_timeout: bool = False,
+        min_apdu_timeout: float = 0.25,
+        max_apdu_timeout: float | None = None,
     ) -> None:
         """Initialise the client TSM.
 
@@ -100,7 +296,31 @@ class ClientTSM:
             ``None`` for unlimited.
         :param segment_timeout: Seconds to wait between segments.
         :param proposed_window_size: Proposed segmentation window size (1-127).
+        :param max_outstanding_per_peer: Default limit on concurrent
+            confirmed requests to a single destination, or ``None`` for
+            no limit.  Requests beyond the limit wait in a FIFO queue.
+            Override per device or per network with
+            :meth:`set_request_limit`.
+        :param adaptive_timeout: When ``True``, derive each peer's APDU
+            timeout from measured round-trip times instead of using
+            *apdu_timeout* for every device.  Until a peer has been
+            measured, *apdu_timeout* (clamped to the bounds) is used.
+        :param min_apdu_timeout: Lower bound in seconds for adaptive
+            timeouts.
+        :param max_apdu_timeout: Upper bound in seconds for adaptive
+            timeouts, including retry backoff.  Defaults to
+            *apdu_timeout*.
+        :raises ValueError: If the adaptive timeout bounds are not
+            positive or *min_apdu_timeout* exceeds *max_apdu_timeout*.
         """
+        if max_apdu_timeout is None:
+            max_apdu_timeout = apdu_timeout
+        if adaptive_timeout and not 0 < min_apdu_timeout <= max_apdu_timeout:
+            msg = (
+                f"Adaptive timeout bounds must satisfy 0 < min <= max, "
+                f"got min={min_apdu_timeout} max={max_apdu_timeout}"
+            )
+            raise ValueError(msg)
         self._network = network
         self._timeout = apdu_timeout
         self._retries = apdu_retries
@@ -111,6 +331,259 @@ class ClientTSM:
         self._transactions: dict[tuple[BACnetAddress, int], ClientTransaction] = {}
         self._next_invoke_id = 0
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._default_peer_limit = max_outstanding_per_peer
+        self._peer_limits: dict[BACnetAddress, int] = {}
+        self._network_limits: dict[int | None, int] = {}
+        # Active windows keyed by destination (per-peer) or by
+        # ``("network", dnet)`` for shared network windows.
+        self._windows: dict[object, _RequestWindow] = {}
+        self._queue_stats = RequestQueueStats()
+        self._adaptive_timeout = adaptive_timeout
+        self._min_timeout = min_apdu_timeout
+        self._max_timeout = max_apdu_timeout
+        self._rtt: dict[BACnetAddress, _RTTEstimator] = {}
+
+    # --- Adaptive timeouts ---
+
+    def rtt_estimate(self, destination: BACnetAddress) -> RTTEstimate | None:
+        """Return the round-trip estimate for *destination*.
+
+        :returns: The current estimate, or ``None`` if adaptive timeouts
+            are disabled or the peer has not been measured yet.
+        """
+        estimator = self._rtt.get(destination)
+        return estimator.snapshot() if estimator is not None else None
+
+    def rtt_estimates(self) -> dict[BACnetAddress, RTTEstimate]:
+        """Return round-trip estimates for every measured peer."""
+        return {addr: est.snapshot() for addr, est in self._rtt.items()}
+
+    def reset_rtt_estimate(self, destination: BACnetAddress | None = None) -> None:
+        """Forget measured round-trip times.
+
+        :param destination: Peer to reset, or ``None`` to reset all peers.
+        """
+        if destination is None:
+            self._rtt.clear()
+        else:
+            self._rtt.pop(destination, None)
+
+    def _timeout_for(self, txn: ClientTransaction) -> float:
+        """Return the APDU timeout for the current attempt of *txn*."""
+        if not self._adaptive_timeout:
+            return self._timeout
+        estimator = self._rtt.get(txn.destination)
+        if estimator is not None:
+            base = estimator.timeout
+        else:
+            base = min(max(self._timeout, self._min_timeout), self._max_timeout)
+        # Exponential backoff on retries (RFC 6298 section 5.5).
+        backoff: float = base * 2.0**txn.retry_count
+        return min(backoff, self._max_timeout)
+
+    def _record_rtt(self, txn: ClientTransaction) -> None:
+        """Fold the round trip of a completed attempt into the estimate.
+
+        Per Karn's algorithm only responses to the first transmission are
+        sampled, since a response after a retry cannot be matched to a
+        specific transmission.  Such a response instead backs off the
+        peer's timeout so the next request can measure it cleanly.
+        """
+        if not self._adaptive_timeout or txn.state != ClientTransactionState.AWAIT_CONFIRMATION:
+            return
+        estimator = self._rtt.get(txn.destination)
+        if txn.retry_count > 0:
+            if estimator is not None:
+                estimator.backoff()
+            return
+        if txn.sent_at is None:
+            return
+        rtt = time.monotonic() - txn.sent_at
+        if estimator is None:
+            if len(self._rtt) >= _MAX_RTT_PEERS:
+                del self._rtt[next(iter(self._rtt))]
+            estimator = _RTTEstimator(self._min_timeout, self._max_timeout)
+        else:
+            # Move to the back so eviction drops the stalest peer.
+            del self._rtt[txn.destination]
+        self._rtt[txn.destination] = estimator
+        estimator.update(rtt)
+
+    # --- Outstanding-request limits ---
+
+    def set_request_limit(
+        self,
+        limit: int | None,
+        *,
+        address: BACnetAddress | None = None,
+        network: int | None = None,
+        local_network: bool = False,
+    ) -> None:
+        """Configure how many confirmed requests may be outstanding.
+
+        Exactly one scope applies to each request, resolved in order:
+        a device limit for its address, a shared limit for its network,
+        then the default per-peer limit.  A network limit is a single
+        window shared by every device on that network, with slots handed
+        out round-robin across devices.
+
+        Raising or removing a limit admits queued requests into the freed
+        slots straight away; lowering it lets requests already in flight
+        finish.  When a new scope takes over a destination, its queued and
+        in-flight requests move to that scope's window in order.
+
+        :param limit: Maximum concurrent requests (>= 1), or ``None`` to
+            remove the limit for the given scope.
+        :param address: Apply the limit to this device only.
+        :param network: Apply a shared limit to all devices on this
+            remote network number.
+        :param local_network: Apply a shared limit to all devices on the
+            local network (addresses without a network number).
+        :raises ValueError: If *limit* is less than 1 or more than one
+            scope is given.
+        """
+        if limit is not None and limit < 1:
+            msg = f"Request limit must be at least 1, got {limit}"
+            raise ValueError(msg)
+        scopes = (address is not None) + (network is not None) + local_network
+        if scopes > 1:
+            msg = "Specify at most one of address, network, or local_network"
+            raise ValueError(msg)
+        if address is not None:
+            table: dict[Any, int] = self._peer_limits
+            key: Any = address
+        elif network is not None or local_network:
+            table = self._network_limits
+            key = network
+        else:
+            self._default_peer_limit = limit
+            self._resize_windows()
+            return
+        if limit is None:
+            table.pop(key, None)
+        else:
+            table[key] = limit
+        self._resize_windows()
+
+    @property
+    def queue_stats(self) -> RequestQueueStats:
+        """Queueing counters for outstanding-request limits."""
+        return self._queue_stats
+
+    def queue_depth(self, destination: BACnetAddress) -> int:
+        """Return the number of requests waiting for a slot to *destination*."""
+        total = 0
+        for window in self._windows.values():
+            queue = window.waiters.get(destination)
+            if queue:
+                total += len(queue)
+        return total
+
+    def outstanding(self, destination: BACnetAddress) -> int:
+        """Return the number of active transactions to *destination*."""
+        return sum(1 for dest, _iid in self._transactions if dest == destination)
+
+    def _window_for(self, destination: BACnetAddress) -> tuple[object, int] | None:
+        """Resolve the window key and limit governing *destination*."""
+        limit = self._peer_limits.get(destination)
+        if limit is not None:
+            return destination, limit
+        limit = self._network_limits.get(destination.network)
+        if limit is not None:
+            return ("network", destination.network), limit
+        if self._default_peer_limit is not None:
+            return destination, self._default_peer_limit
+        return None
+
+    async def _acquire_slot(self, destination: BACnetAddress) -> _RequestWindow | None:
+        """Wait for a free slot in the window governing *destination*.
+
+        :returns: The window holding the acquired slot, or ``None`` when
+            no limit applies to *destination*.
+        """
+        resolved = self._window_for(destination)
+        if resolved is None:
+            return None
+        key, limit = resolved
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _RequestWindow(key, limit)
+        else:
+            window.limit = limit
+        if window.try_acquire(destination):
+            return window
+
+        loop = self._loop or asyncio.get_running_loop()
+        future: asyncio.Future[_RequestWindow | None] = loop.create_future()
+        window.enqueue(destination, future)
+        stats = self._queue_stats
+        stats.total_queued += 1
+        stats.queue_depth += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        started = time.monotonic()
+        logger.debug("TSM request to %s queued (window limit=%d)", destination, limit)
+        try:
+            # A limit change may move the waiter to another window, so the
+            # window that finally grants the slot is the future's result.
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was granted just before cancellation; pass it on.
+                self._release_slot(future.result(), destination)
+            else:
+                current = _current_window(window, destination)
+                if current is not None:
+                    current.discard(destination, future)
+                    self._drop_if_idle(current)
+            raise
+        finally:
+            waited = time.monotonic() - started
+            stats.queue_depth -= 1
+            stats.total_wait_time += waited
+            stats.max_wait_time = max(stats.max_wait_time, waited)
+
+    def _resize_windows(self) -> None:
+        """Apply changed limits to live windows, waking queued requests.
+
+        Each destination's in-flight slots and waiters are carried over,
+        in FIFO order, to the window that governs it under the new limits,
+        which then admits waiters only up to its own limit.  Destinations
+        no longer governed by any limit have their waiters admitted.
+        """
+        retired = self._windows
+        self._windows = {}
+        for window in retired.values():
+            window.moved = {}
+            for destination in {**window.active, **window.waiters}:
+                active = window.active.get(destination, 0)
+                waiters = window.waiters.get(destination)
+                resolved = self._window_for(destination)
+                if resolved is None:
+                    window.moved[destination] = None
+                    for future in waiters or ():
+                        if not future.done():
+                            future.set_result(None)
+                    continue
+                key, limit = resolved
+                target = self._windows.get(key)
+                if target is None:
+                    target = self._windows[key] = _RequestWindow(key, limit)
+                target.adopt(destination, active, waiters)
+                window.moved[destination] = target
+        for window in list(self._windows.values()):
+            window.wake()
+            self._drop_if_idle(window)
+
+    def _release_slot(self, window: _RequestWindow | None, destination: BACnetAddress) -> None:
+        current = _current_window(window, destination)
+        if current is None:
+            return
+        current.release(destination)
+        self._drop_if_idle(current)
+
+    def _drop_if_idle(self, window: _RequestWindow) -> None:
+        if window.idle and self._windows.get(window.key) is window:
+            del self._windows[window.key]
 
     def _allocate_invoke_id(self, destination: BACnetAddress) -> int:
         """Allocate the next available invoke ID (0-255) for the given peer."""
@@ -134,7 +607,10 @@ class ClientTSM:
         """Send a confirmed request and await the response.
 
         If the request data exceeds the max segment payload, the request
-        is automatically segmented per Clause 5.2.
+        is automatically segmented per Clause 5.2.  When an
+        outstanding-request limit applies to *destination* (see
+        :meth:`set_request_limit`), the call first waits in FIFO order
+        for a free slot.
 
         :param service_choice: Confirmed service choice number.
         :param request_data: Encoded service request bytes.
@@ -156,6 +632,27 @@ class ClientTSM:
         loop = self._loop
         if loop is None:
             loop = self._loop = asyncio.get_running_loop()
+        slot = await self._acquire_slot(destination)
+        if slot is None:
+            return await self._send_request(
+                service_choice, request_data, destination, effective_max_apdu, loop
+            )
+        try:
+            return await self._send_request(
+                service_choice, request_data, destination, effective_max_apdu, loop
+            )
+        finally:
+            self._release_slot(slot, destination)
+
+    async def _send_request(
+        self,
+        service_choice: int,
+        request_data: bytes,
+        destination: BACnetAddress,
+        effective_max_apdu: int,
+        loop: asyncio.AbstractEventLoop,
+    ) -> bytes:
+        """Run a single confirmed transaction once a slot is held."""
         invoke_id = self._allocate_invoke_id(destination)
         future: asyncio.Future[bytes] = loop.create_future()
 
@@ -196,6 +693,7 @@ class ClientTSM:
             if txn.state != ClientTransactionState.AWAIT_CONFIRMATION:
                 return
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             logger.debug("TSM transaction completed invoke_id=%s", invoke_id)
             txn.future.set_result(b"")
 
@@ -213,6 +711,7 @@ class ClientTSM:
             if txn.state != ClientTransactionState.AWAIT_CONFIRMATION:
                 return
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             logger.debug("TSM transaction completed invoke_id=%s", invoke_id)
             txn.future.set_result(data)
 
@@ -229,6 +728,7 @@ class ClientTSM:
         txn = self._transactions.get(key)
         if txn and not txn.future.done():
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             txn.future.set_exception(BACnetError(error_class, error_code, error_data))
 
     def handle_reject(
@@ -242,6 +742,7 @@ class ClientTSM:
         txn = self._transactions.get(key)
         if txn and not txn.future.done():
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             txn.future.set_exception(BACnetRejectError(reason))
 
     def handle_abort(
@@ -255,6 +756,7 @@ class ClientTSM:
         txn = self._transactions.get(key)
         if txn and not txn.future.done():
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             txn.future.set_exception(BACnetAbortError(reason))
 
     def handle_segment_ack(
@@ -305,6 +807,7 @@ class ClientTSM:
         if pdu.sequence_number == 0 and txn.state == ClientTransactionState.AWAIT_CONFIRMATION:
             # First segment of segmented response
             self._cancel_timeout(txn)
+            self._record_rtt(txn)
             receiver = SegmentReceiver.create(
                 first_segment_data=pdu.service_ack,
                 service_choice=pdu.service_choice,
@@ -384,6 +887,7 @@ class ClientTSM:
         apdu_bytes = encode_apdu(pdu)
         self._network.send(apdu_bytes, txn.destination, expecting_reply=True)
         txn.state = ClientTransactionState.AWAIT_CONFIRMATION
+        txn.sent_at = time.monotonic() if txn.retry_count == 0 else None
         self._start_timeout(txn)
 
     def _send_segmented_request(
@@ -469,7 +973,7 @@ class ClientTSM:
             txn.timeout_handle.cancel()
         loop = self._loop or asyncio.get_running_loop()
         key = (txn.destination, txn.invoke_id)
-        txn.timeout_handle = loop.call_later(self._timeout, self._on_timeout, key)
+        txn.timeout_handle = loop.call_later(self._timeout_for(txn), self._on_timeout, key)
 
     def _start_segment_timeout(
         self, txn: ClientTransaction, *, wait_for_seg: bool = False
@@ -811,6 +1315,30 @@ class ServerTSM:
         else:
             self._fill_and_send_response_window(txn)
 
+    def response_limit(self, source: BACnetAddress) -> int | None:
+        """Return the largest ComplexACK service data *source* will accept.
+
+        Derived from the max-APDU, segmentation and max-segments fields of
+        the requests *source* currently has in progress; the smallest wins
+        when there are several.
+
+        :param source: Address of the requesting client.
+        :returns: Maximum service-ack length in bytes, or ``None`` when no
+            request from *source* is in progress or its segmented response
+            size is unbounded.
+        """
+        limit: int | None = None
+        for (address, _), txn in self._transactions.items():
+            if address != source or txn.state != ServerTransactionState.AWAIT_RESPONSE:
+                continue
+            payload = compute_max_segment_payload(txn.client_max_apdu_length, "complex_ack")
+            if txn.segmented_response_accepted:
+                if txn.client_max_segments is None:
+                    continue
+                payload *= txn.client_max_segments
+            limit = payload if limit is None else min(limit, payload)
+        return limit
+
     def complete_transaction(
         self,
         txn: ServerTransaction,
@@ -27,9 +27,14 @@ from bac_py.app.client import (
     BDTEntryInfo,
     DiscoveredDevice,
     FDTEntryInfo,
+    ObjectListProgress,
     RouterInfo,
     UnconfiguredDevice,
 )
+from bac_py.app.file_transfer import DEFAULT_WINDOW
+from bac_py.app.fleet_backup import backup_fleet, restore_fleet
+from bac_py.app.site_scan import DEFAULT_SCAN_PROPERTIES
+from bac_py.app.trend_collector import TrendCollector
 from bac_py.network.address import GLOBAL_BROADCAST, parse_address
 from bac_py.types.enums import EnableDisable, MessagePriority, ReinitializedState
 from bac_py.types.parsing import (
@@ -39,8 +44,14 @@ from bac_py.types.parsing import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
-
+    from collections.abc import AsyncIterator, Callable, Iterable, Sequence
+    from pathlib import Path
+
+    from bac_py.app.device_cache import DeviceRecord
+    from bac_py.app.file_transfer import FileSink, FileSource
+    from bac_py.app.fleet_backup import FleetBackupResult
+    from bac_py.app.site_scan import SiteScanCheckpoint, SiteScanResult
+    from bac_py.app.trend_collector import TrendBatch, TrendCheckpoint
     from bac_py.network.address import BACnetAddress
     from bac_py.services.alarm_summary import (
         GetAlarmSummaryACK,
@@ -284,12 +295,17 @@ class Client:
             str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
             list[str | int | PropertyIdentifier],
         ],
+        timeout: float | None = None,
+        *,
+        max_concurrency: int = 4,
     ) -> dict[str, dict[str, object]]:
         """Read multiple properties from multiple objects.
 
         See :meth:`~bac_py.app.client.BACnetClient.read_multiple` for details.
         """
-        return await self._require_client().read_multiple(address, specs)
+        return await self._require_client().read_multiple(
+            address, specs, timeout=timeout, max_concurrency=max_concurrency
+        )
 
     async def write_multiple(
         self,
@@ -314,12 +330,35 @@ class Client:
         address: str | BACnetAddress,
         device_instance: int,
         timeout: float | None = None,
+        *,
+        use_cache: bool = False,
+        max_in_flight: int = 4,
+        progress: ObjectListProgress | None = None,
     ) -> list[ObjectIdentifier]:
         """Read the complete object list from a device.
 
         See :meth:`~bac_py.app.client.BACnetClient.get_object_list` for details.
         """
         return await self._require_client().get_object_list(
+            address,
+            device_instance,
+            timeout=timeout,
+            use_cache=use_cache,
+            max_in_flight=max_in_flight,
+            progress=progress,
+        )
+
+    async def refresh_device_cache(
+        self,
+        address: str | BACnetAddress,
+        device_instance: int | None = None,
+        timeout: float | None = None,
+    ) -> DeviceRecord:
+        """Revalidate a device's cached data against its database revision.
+
+        See :meth:`~bac_py.app.client.BACnetClient.refresh_device_cache` for details.
+        """
+        return await self._require_client().refresh_device_cache(
             address, device_instance, timeout=timeout
         )
 
@@ -377,6 +416,8 @@ class Client:
         timeout: float = 3.0,
         expected_count: int | None = None,
         enrich_timeout: float = 5.0,
+        *,
+        max_concurrency: int = 32,
     ) -> list[DiscoveredDevice]:
         """Discover devices and enrich with profile metadata (Annex X).
 
@@ -391,6 +432,7 @@ class Client:
         :param timeout: Seconds to wait for Who-Is responses.
         :param expected_count: Return early once this many devices respond.
         :param enrich_timeout: Per-device timeout for RPM enrichment.
+        :param max_concurrency: Maximum enrichment reads in flight at once.
         :returns: List of :class:`DiscoveredDevice` with profile metadata.
         """
         client = self._require_client()
@@ -402,6 +444,83 @@ class Client:
             timeout=timeout,
             expected_count=expected_count,
             enrich_timeout=enrich_timeout,
+            max_concurrency=max_concurrency,
+        )
+
+    def scan_site(
+        self,
+        *,
+        devices: Iterable[DiscoveredDevice] | None = None,
+        low_limit: int | None = None,
+        high_limit: int | None = None,
+        destination: str | BACnetAddress | None = None,
+        discover_timeout: float = 3.0,
+        properties: Sequence[str | int | PropertyIdentifier] | None = DEFAULT_SCAN_PROPERTIES,
+        max_concurrency: int = 32,
+        max_per_network: int = 4,
+        requests_per_device: int = 2,
+        retries: int = 2,
+        backoff: float = 1.0,
+        timeout: float | None = None,
+        use_cache: bool = False,
+        checkpoint: SiteScanCheckpoint | None = None,
+    ) -> AsyncIterator[SiteScanResult]:
+        """Scan a site's devices, object lists, and property values.
+
+        See :meth:`~bac_py.app.client.BACnetClient.scan_site`.  The
+        *destination* accepts an IP string (e.g. ``"192.168.1.255"``), a
+        :class:`BACnetAddress`, or ``None`` for global broadcast.
+        """
+        return self._require_client().scan_site(
+            devices=devices,
+            low_limit=low_limit,
+            high_limit=high_limit,
+            destination=_resolve_broadcast_destination(destination),
+            discover_timeout=discover_timeout,
+            properties=properties,
+            max_concurrency=max_concurrency,
+            max_per_network=max_per_network,
+            requests_per_device=requests_per_device,
+            retries=retries,
+            backoff=backoff,
+            timeout=timeout,
+            use_cache=use_cache,
+            checkpoint=checkpoint,
+        )
+
+    def collect_trends(
+        self,
+        logs: Iterable[
+            tuple[
+                str | BACnetAddress,
+                str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
+            ]
+        ],
+        *,
+        checkpoint: TrendCheckpoint | None = None,
+        page_size: int = 200,
+        max_concurrency: int = 32,
+        max_per_device: int = 2,
+        timeout: float | None = None,
+    ) -> AsyncIterator[TrendBatch]:
+        """Collect the records logged since the last pass from remote logs.
+
+        See :class:`~bac_py.app.trend_collector.TrendCollector`.  Each
+        entry of *logs* pairs a device address (IP string or
+        :class:`BACnetAddress`) with a log object identifier (e.g.
+        ``"trend-log,1"``).  Pass the same *checkpoint* on every pass to
+        resume from the previous high-water marks.
+        """
+        collector = TrendCollector(
+            self._require_client(),
+            checkpoint=checkpoint,
+            page_size=page_size,
+            max_concurrency=max_concurrency,
+            max_per_device=max_per_device,
+            timeout=timeout,
+        )
+        return collector.collect(
+            (parse_address(address), parse_object_identifier(oid)) for address, oid in logs
         )
 
     # --- Alarm management ---
@@ -626,6 +745,64 @@ class Client:
             timeout=timeout,
         )
 
+    def backup_fleet(
+        self,
+        devices: Iterable[DiscoveredDevice],
+        directory: str | Path,
+        *,
+        password: str | None = None,
+        max_concurrency: int = 16,
+        max_per_network: int = 4,
+        poll_interval: float = 1.0,
+        timeout: float | None = None,
+        checkpoint: SiteScanCheckpoint | None = None,
+    ) -> AsyncIterator[FleetBackupResult]:
+        """Back up many devices, streaming their files into *directory*.
+
+        See :func:`~bac_py.app.fleet_backup.backup_fleet`.  Yields one
+        :class:`~bac_py.app.fleet_backup.FleetBackupResult` per device as
+        it completes.
+        """
+        return backup_fleet(
+            self._require_client(),
+            devices,
+            directory,
+            password=password,
+            max_concurrency=max_concurrency,
+            max_per_network=max_per_network,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            checkpoint=checkpoint,
+        )
+
+    def restore_fleet(
+        self,
+        devices: Iterable[DiscoveredDevice],
+        directory: str | Path,
+        *,
+        password: str | None = None,
+        max_concurrency: int = 16,
+        max_per_network: int = 4,
+        poll_interval: float = 1.0,
+        timeout: float | None = None,
+        checkpoint: SiteScanCheckpoint | None = None,
+    ) -> AsyncIterator[FleetBackupResult]:
+        """Restore many devices from backups written by :meth:`backup_fleet`.
+
+        See :func:`~bac_py.app.fleet_backup.restore_fleet`.
+        """
+        return restore_fleet(
+            self._require_client(),
+            devices,
+            directory,
+            password=password,
+            max_concurrency=max_concurrency,
+            max_per_network=max_per_network,
+            poll_interval=poll_interval,
+            timeout=timeout,
+            checkpoint=checkpoint,
+        )
+
     # --- Audit ---
 
     async def query_audit_log(
@@ -1038,6 +1215,74 @@ class Client:
             timeout=timeout,
         )
 
+    async def download_file(
+        self,
+        address: str | BACnetAddress,
+        file_identifier: str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
+        sink: FileSink,
+        *,
+        window: int = DEFAULT_WINDOW,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+    ) -> int:
+        """Download a stream-access file with pipelined AtomicReadFile requests.
+
+        :param address: Target device address (IP string or
+            :class:`BACnetAddress`).
+        :param file_identifier: File object identifier (e.g. ``"file,1"``).
+        :param sink: Binary file object, or callable, receiving the
+            contents in order.
+        :param window: Requests kept in flight.
+        :param chunk_size: Bytes per read, or ``None`` to size from the
+            peer's max APDU and segmentation support.
+        :param timeout: Optional caller-level timeout per request in seconds.
+        :returns: Number of bytes downloaded.
+        """
+        client = self._require_client()
+        return await client.download_file(
+            parse_address(address),
+            parse_object_identifier(file_identifier),
+            sink,
+            window=window,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
+    async def upload_file(
+        self,
+        address: str | BACnetAddress,
+        file_identifier: str | tuple[str | ObjectType | int, int] | ObjectIdentifier,
+        source: FileSource,
+        *,
+        start: int = 0,
+        window: int = DEFAULT_WINDOW,
+        chunk_size: int | None = None,
+        timeout: float | None = None,
+    ) -> int:
+        """Upload to a stream-access file with pipelined AtomicWriteFile requests.
+
+        :param address: Target device address (IP string or
+            :class:`BACnetAddress`).
+        :param file_identifier: File object identifier (e.g. ``"file,1"``).
+        :param source: Bytes, or a binary file object, to upload.
+        :param start: File position to write the first byte at.
+        :param window: Requests kept in flight.
+        :param chunk_size: Bytes per write, or ``None`` to size from the
+            peer's max APDU.
+        :param timeout: Optional caller-level timeout per request in seconds.
+        :returns: Number of bytes uploaded.
+        """
+        client = self._require_client()
+        return await client.upload_file(
+            parse_address(address),
+            parse_object_identifier(file_identifier),
+            source,
+            start=start,
+            window=window,
+            chunk_size=chunk_size,
+            timeout=timeout,
+        )
+
     async def create_object(
         self,
         address: str | BACnetAddress,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import enum
 import logging
 import struct
+from typing import TYPE_CHECKING, Any
 
 from bac_py.encoding.tags import TagClass, encode_closing_tag, encode_opening_tag, encode_tag
 from bac_py.types.enums import ObjectType
@@ -16,6 +17,9 @@ from bac_py.types.primitives import (
     ObjectIdentifier,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = logging.getLogger(__name__)
 
 # Application tag numbers for primitive types
@@ -857,6 +861,25 @@ def decode_and_unwrap(data: bytes | memoryview) -> object:
 
 _CONSTRUCTED_ENCODERS: dict[type, object] | None = None
 
+# Encoders for types defined above the encoding layer; see
+# register_property_encoder().
+_REGISTERED_ENCODERS: dict[type, object] = {}
+
+
+def register_property_encoder(cls: type, encoder: Callable[[Any, bool], bytes]) -> None:
+    """Teach :func:`encode_property_value` to encode instances of *cls*.
+
+    For property value types defined in layers that the encoding package
+    must not import, such as a Trend Log's record buffer.  Matches the
+    exact type, like the built-in constructed-type table.
+
+    :param cls: The value type.
+    :param encoder: Callable ``(value, int_as_real) -> bytes``.
+    """
+    _REGISTERED_ENCODERS[cls] = encoder
+    if _CONSTRUCTED_ENCODERS is not None:
+        _CONSTRUCTED_ENCODERS[cls] = encoder
+
 
 def _build_constructed_encoders() -> dict[type, object]:
     """Build a type-to-encoder dispatch table for constructed BACnet types.
@@ -866,8 +889,7 @@ def _build_constructed_encoders() -> dict[type, object]:
     Each encoder is a callable ``(value, int_as_real) -> bytes``.
     """
     # Local import to break circular dependency with types.constructed
-    from typing import Any
-
+    from bac_py.types.audit_types import BACnetAuditLogRecord
     from bac_py.types.constructed import (
         BACnetAddress,
         BACnetCalendarEntry,
@@ -997,6 +1019,10 @@ def _build_constructed_encoders() -> dict[type, object]:
         result: bytes = v.encode()
         return result
 
+    def _enc_audit_log_record(v: Any, _iar: bool) -> bytes:
+        result: bytes = v.encode()
+        return result
+
     def _enc_priority_value(v: Any, iar: bool) -> bytes:
         if v.value is None:
             return encode_application_null()
@@ -1011,7 +1037,7 @@ def _build_constructed_encoders() -> dict[type, object]:
                 parts.append(encode_property_value(slot.value, int_as_real=iar))
         return b"".join(parts)
 
-    return {
+    encoders: dict[type, object] = {
         StatusFlags: _enc_status_flags,
         BACnetDateTime: _enc_datetime,
         BACnetDateRange: _enc_date_range,
@@ -1031,9 +1057,12 @@ def _build_constructed_encoders() -> dict[type, object]:
         BACnetCOVSubscription: _enc_cov_subscription,
         BACnetValueSource: _enc_value_source,
         BACnetDeviceObjectReference: _enc_dev_obj_ref,
+        BACnetAuditLogRecord: _enc_audit_log_record,
         BACnetPriorityValue: _enc_priority_value,
         BACnetPriorityArray: _enc_priority_array,
     }
+    encoders.update(_REGISTERED_ENCODERS)
+    return encoders
 
 
 def encode_property_value(value: object, *, int_as_real: bool = False) -> bytes:
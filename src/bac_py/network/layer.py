@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 from bac_py.network.address import BACnetAddress
@@ -22,11 +23,13 @@ from bac_py.network.messages import (
     encode_network_message,
 )
 from bac_py.network.npdu import NPDU, decode_npdu, encode_npdu
+from bac_py.network.pacing import SendPacer
 from bac_py.types.enums import NetworkMessageType, NetworkPriority
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from bac_py.network.pacing import PacingPolicy
     from bac_py.transport.port import TransportPort
 
 logger = logging.getLogger(__name__)
@@ -79,6 +82,7 @@ class NetworkLayer:
         *,
         network_number_configured: bool = False,
         cache_ttl: float = _DEFAULT_CACHE_TTL,
+        pacing: PacingPolicy | None = None,
     ) -> None:
         """Initialise the network layer.
 
@@ -90,6 +94,9 @@ class NetworkLayer:
             explicitly configured (prevents learning via
             Network-Number-Is messages).
         :param cache_ttl: Time-to-live in seconds for router cache entries.
+        :param pacing: Rate limits for sends to remote networks, or
+            ``None`` to send immediately.  See
+            :class:`~bac_py.network.pacing.SendPacer`.
         """
         self._transport = transport
         self._network_number = network_number
@@ -98,6 +105,7 @@ class NetworkLayer:
         self._cache_ttl = cache_ttl
         self._receive_callback: Callable[[bytes, BACnetAddress], None] | None = None
         self._network_message_listeners: dict[int, list[Callable[..., None]]] = {}
+        self._pacer = SendPacer(pacing) if pacing is not None else None
         transport.on_receive(self._on_npdu_received)
 
     @property
@@ -105,6 +113,11 @@ class NetworkLayer:
         """The local network number, or ``None`` if unknown."""
         return self._network_number
 
+    @property
+    def pacer(self) -> SendPacer | None:
+        """The outbound pacer for remote networks, or ``None`` if pacing is off."""
+        return self._pacer
+
     def on_receive(self, callback: Callable[[bytes, BACnetAddress], None]) -> None:
         """Register a callback for received application-layer APDUs.
 
@@ -219,7 +232,7 @@ class NetworkLayer:
             self._transport.send_unicast(npdu_bytes, destination.mac_address)
         else:
             # Remote destination (DNET is set, not global broadcast)
-            self._send_remote(npdu_bytes, destination)
+            self._send_remote(npdu_bytes, destination, priority)
 
     @property
     def local_address(self) -> object:
@@ -496,16 +509,23 @@ class NetworkLayer:
     # Remote send helpers
     # ------------------------------------------------------------------
 
-    def _send_remote(self, npdu_bytes: bytes, destination: BACnetAddress) -> None:
+    def _send_remote(
+        self,
+        npdu_bytes: bytes,
+        destination: BACnetAddress,
+        priority: NetworkPriority = NetworkPriority.NORMAL,
+    ) -> None:
         """Send an NPDU to a remote destination using the router cache.
 
         If a router is cached for the destination network, unicasts to it.
         Otherwise broadcasts the NPDU and issues a Who-Is-Router query to
-        populate the cache for future sends.
+        populate the cache for future sends.  When pacing is enabled the
+        NPDU goes through the :class:`~bac_py.network.pacing.SendPacer`.
 
         :param npdu_bytes: The encoded NPDU bytes to send.
         :param destination: Remote :class:`~bac_py.network.address.BACnetAddress`
             (must have a network number set).
+        :param priority: NPDU network priority, used by the pacer.
         :raises ValueError: If *destination* has no network number.
         """
         if destination.network is None:
@@ -519,13 +539,29 @@ class NetworkLayer:
                     destination.network,
                     router_mac.hex(),
                 )
-            self._transport.send_unicast(npdu_bytes, router_mac)
+            if self._pacer is not None:
+                self._pacer.submit(
+                    destination.network,
+                    router_mac,
+                    priority,
+                    partial(self._transport.send_unicast, npdu_bytes, router_mac),
+                )
+            else:
+                self._transport.send_unicast(npdu_bytes, router_mac)
         else:
             # Cache miss: broadcast NPDU (a router will pick it up)
             logger.warning(
                 "No cached router for network %d, broadcasting NPDU", destination.network
             )
-            self._transport.send_broadcast(npdu_bytes)
+            if self._pacer is not None:
+                self._pacer.submit(
+                    destination.network,
+                    None,
+                    priority,
+                    partial(self._transport.send_broadcast, npdu_bytes),
+                )
+            else:
+                self._transport.send_broadcast(npdu_bytes)
             # Also issue Who-Is-Router-To-Network to populate cache
             self._send_who_is_router(destination.network)
 
@@ -0,0 +1,432 @@
+"""Token-bucket pacing of outbound NPDUs per remote network and router.
+
+A remote network reached through an IP router may be a slow trunk (for
+example a 38.4 kbps MS/TP segment).  Bursts from discovery sweeps,
+polling or COV fan-out can overrun the router's buffers even though
+the local link has plenty of capacity.  :class:`SendPacer` holds
+outbound NPDUs in a queue per destination network and releases them
+at the configured rate of that network (DNET) and of the router MAC
+they are sent to.
+
+Queued NPDUs are released highest :class:`~bac_py.types.enums.NetworkPriority`
+first.  NPDUs at or above :attr:`PacingPolicy.bypass_priority`
+(life-safety by default) skip the queue entirely, but still use up
+tokens so paced traffic backs off behind them.
+
+A confirmed request's APDU timer starts when the request is handed to the
+network layer, not when the pacer releases it.  An NPDU that waits longer
+than :attr:`PacingPolicy.max_delay` is dropped instead of being sent after
+its transaction has already timed out and retried.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from bac_py.types.enums import NetworkPriority
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+_LANES = len(NetworkPriority)
+
+
+@dataclass(frozen=True, slots=True)
+class PacingRate:
+    """Sustained packet rate and burst size of one token bucket."""
+
+    rate: float
+    """NPDUs per second released once the burst is used up."""
+
+    burst: int = 1
+    """NPDUs that may be sent back-to-back after an idle period."""
+
+    def __post_init__(self) -> None:
+        """Validate the rate."""
+        if self.rate <= 0:
+            msg = f"rate must be > 0, got {self.rate}"
+            raise ValueError(msg)
+        if self.burst < 1:
+            msg = f"burst must be >= 1, got {self.burst}"
+            raise ValueError(msg)
+
+
+@dataclass(frozen=True, slots=True)
+class PacingPolicy:
+    """Outbound rate limits for remote networks and routers."""
+
+    network_rates: Mapping[int, PacingRate] = field(default_factory=dict)
+    """Rate per destination network number (DNET)."""
+
+    router_rates: Mapping[bytes, PacingRate] = field(default_factory=dict)
+    """Rate per router MAC address, shared by every network behind it."""
+
+    default_network_rate: PacingRate | None = None
+    """Rate for remote networks not listed in :attr:`network_rates`, or
+    ``None`` to leave them unpaced."""
+
+    default_router_rate: PacingRate | None = None
+    """Rate for routers not listed in :attr:`router_rates`, or ``None``
+    to leave them unpaced."""
+
+    max_queue: int = 256
+    """NPDUs held per destination network.  When the queue is full the
+    oldest NPDU of the lowest priority is dropped."""
+
+    bypass_priority: NetworkPriority = NetworkPriority.LIFE_SAFETY
+    """NPDUs at or above this priority are sent without queueing."""
+
+    max_delay: float | None = None
+    """Longest time in seconds an NPDU may wait in the queue.  An NPDU
+    expected to wait longer on arrival, or still queued after this long,
+    is dropped.  ``None`` means no limit; an application fills it in with
+    its APDU timeout, after which the transaction has already retried."""
+
+    def __post_init__(self) -> None:
+        """Validate the limits."""
+        if self.max_queue < 1:
+            msg = f"max_queue must be >= 1, got {self.max_queue}"
+            raise ValueError(msg)
+        if self.max_delay is not None and self.max_delay <= 0:
+            msg = f"max_delay must be > 0, got {self.max_delay}"
+            raise ValueError(msg)
+
+
+@dataclass
+class PacingStats:
+    """Pacing counters for one destination network."""
+
+    queue_depth: int = 0
+    """NPDUs currently waiting for tokens."""
+
+    max_queue_depth: int = 0
+    """Highest queue depth observed."""
+
+    sent: int = 0
+    """NPDUs handed to the transport, including bypassed ones."""
+
+    queued: int = 0
+    """NPDUs that had to wait for tokens."""
+
+    bypassed: int = 0
+    """NPDUs sent without queueing because of their priority."""
+
+    dropped: int = 0
+    """NPDUs discarded because the queue was full or the pacer closed."""
+
+    expired: int = 0
+    """NPDUs discarded because they would have waited longer than
+    :attr:`PacingPolicy.max_delay`."""
+
+    total_delay: float = 0.0
+    """Cumulative seconds queued NPDUs waited before being sent."""
+
+    max_delay: float = 0.0
+    """Longest single wait in seconds."""
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at :attr:`PacingRate.rate`.
+
+    Tokens may go negative when traffic bypasses the queue; paced
+    traffic then waits until the debt is repaid.
+    """
+
+    __slots__ = ("burst", "rate", "tokens", "updated")
+
+    def __init__(self, rate: PacingRate, now: float) -> None:
+        """Create a full bucket.
+
+        :param rate: Rate and burst size.
+        :param now: Current monotonic time.
+        """
+        self.rate = rate.rate
+        self.burst = float(rate.burst)
+        self.tokens = self.burst
+        self.updated = now
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float, needed: float = 1.0) -> float:
+        """Seconds until *needed* tokens are available (``0.0`` if they are now)."""
+        self._refill(now)
+        if self.tokens >= needed:
+            return 0.0
+        return (needed - self.tokens) / self.rate
+
+    def consume(self, now: float) -> None:
+        """Take one token, going into debt if none is available."""
+        self._refill(now)
+        self.tokens -= 1.0
+
+
+class _Lane:
+    """Priority queues and counters for one destination network."""
+
+    __slots__ = ("depth", "queues", "stats", "timer")
+
+    def __init__(self) -> None:
+        # One deque per NetworkPriority value; items are
+        # (send, router_mac, enqueued_at).
+        self.queues: tuple[deque[tuple[Callable[[], None], bytes | None, float]], ...] = tuple(
+            deque() for _ in range(_LANES)
+        )
+        self.depth = 0
+        self.stats = PacingStats()
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class SendPacer:
+    """Paces outbound NPDUs per destination network and router MAC.
+
+    Used by :class:`~bac_py.network.layer.NetworkLayer` and
+    :class:`~bac_py.network.router.NetworkRouter` for sends to remote
+    networks.  NPDUs to networks and routers without a configured rate
+    are sent immediately with no bookkeeping.
+    """
+
+    def __init__(self, policy: PacingPolicy) -> None:
+        """Create a pacer.
+
+        :param policy: Rates, queue limit and bypass priority.
+        """
+        self._policy = policy
+        self._network_rates: dict[int, PacingRate] = dict(policy.network_rates)
+        self._router_rates: dict[bytes, PacingRate] = dict(policy.router_rates)
+        self._network_buckets: dict[int, TokenBucket | None] = {}
+        self._router_buckets: dict[bytes, TokenBucket | None] = {}
+        self._lanes: dict[int, _Lane] = {}
+
+    @property
+    def policy(self) -> PacingPolicy:
+        """The policy this pacer was created with."""
+        return self._policy
+
+    def set_network_rate(self, network: int, rate: PacingRate | None) -> None:
+        """Set or clear the rate for one destination network.
+
+        :param network: Destination network number.
+        :param rate: New rate, or ``None`` to fall back to
+            :attr:`PacingPolicy.default_network_rate`.
+        """
+        if rate is None:
+            self._network_rates.pop(network, None)
+        else:
+            self._network_rates[network] = rate
+        self._network_buckets.pop(network, None)
+        self._kick(network)
+
+    def set_router_rate(self, router_mac: bytes, rate: PacingRate | None) -> None:
+        """Set or clear the rate for one router.
+
+        :param router_mac: MAC address of the router.
+        :param rate: New rate, or ``None`` to fall back to
+            :attr:`PacingPolicy.default_router_rate`.
+        """
+        if rate is None:
+            self._router_rates.pop(router_mac, None)
+        else:
+            self._router_rates[router_mac] = rate
+        self._router_buckets.pop(router_mac, None)
+        for network in list(self._lanes):
+            self._kick(network)
+
+    def stats(self, network: int) -> PacingStats | None:
+        """Counters for *network*, or ``None`` if nothing was paced for it."""
+        lane = self._lanes.get(network)
+        return lane.stats if lane is not None else None
+
+    def all_stats(self) -> dict[int, PacingStats]:
+        """Counters for every network that has been paced."""
+        return {network: lane.stats for network, lane in self._lanes.items()}
+
+    @property
+    def queue_depth(self) -> int:
+        """NPDUs waiting across all networks."""
+        return sum(lane.depth for lane in self._lanes.values())
+
+    def submit(
+        self,
+        network: int,
+        router_mac: bytes | None,
+        priority: NetworkPriority,
+        send: Callable[[], None],
+    ) -> None:
+        """Send an NPDU now or queue it until its buckets have tokens.
+
+        :param network: Destination network number (DNET).
+        :param router_mac: MAC of the router the NPDU is sent to, or
+            ``None`` when it is broadcast or the network is directly
+            connected.
+        :param priority: NPDU network priority.
+        :param send: Performs the transport send.
+        """
+        network_bucket = self._network_bucket(network)
+        router_bucket = self._router_bucket(router_mac) if router_mac is not None else None
+        if network_bucket is None and router_bucket is None:
+            send()
+            return
+
+        lane = self._lanes.get(network)
+        if lane is None:
+            lane = self._lanes[network] = _Lane()
+        stats = lane.stats
+        now = time.monotonic()
+
+        if priority >= self._policy.bypass_priority:
+            self._consume(network_bucket, router_bucket, now)
+            stats.bypassed += 1
+            stats.sent += 1
+            send()
+            return
+
+        if lane.depth == 0 and self._wait_time(network_bucket, router_bucket, now) == 0.0:
+            self._consume(network_bucket, router_bucket, now)
+            stats.sent += 1
+            send()
+            return
+
+        max_delay = self._policy.max_delay
+        if max_delay is not None:
+            # NPDUs of this priority or higher are released first.
+            needed = sum(len(q) for q in lane.queues[priority:]) + 1.0
+            if self._wait_time(network_bucket, router_bucket, now, needed) > max_delay:
+                stats.expired += 1
+                logger.debug("Pacing delay for network %d over max_delay, dropped NPDU", network)
+                return
+
+        if lane.depth >= self._policy.max_queue and not self._drop_lowest(lane, priority):
+            stats.dropped += 1
+            logger.debug("Pacing queue for network %d full, dropped NPDU", network)
+            return
+
+        lane.queues[priority].append((send, router_mac, now))
+        lane.depth += 1
+        stats.queued += 1
+        stats.queue_depth = lane.depth
+        if lane.depth > stats.max_queue_depth:
+            stats.max_queue_depth = lane.depth
+        if lane.timer is None:
+            self._drain(network)
+
+    def close(self) -> None:
+        """Cancel pending releases and discard every queued NPDU."""
+        for lane in self._lanes.values():
+            if lane.timer is not None:
+                lane.timer.cancel()
+                lane.timer = None
+            for queue in lane.queues:
+                queue.clear()
+            lane.stats.dropped += lane.depth
+            lane.depth = 0
+            lane.stats.queue_depth = 0
+
+    # -- Internals ----------------------------------------------------------
+
+    def _network_bucket(self, network: int) -> TokenBucket | None:
+        try:
+            return self._network_buckets[network]
+        except KeyError:
+            rate = self._network_rates.get(network, self._policy.default_network_rate)
+            bucket = TokenBucket(rate, time.monotonic()) if rate is not None else None
+            self._network_buckets[network] = bucket
+            return bucket
+
+    def _router_bucket(self, router_mac: bytes) -> TokenBucket | None:
+        try:
+            return self._router_buckets[router_mac]
+        except KeyError:
+            rate = self._router_rates.get(router_mac, self._policy.default_router_rate)
+            bucket = TokenBucket(rate, time.monotonic()) if rate is not None else None
+            self._router_buckets[router_mac] = bucket
+            return bucket
+
+    @staticmethod
+    def _wait_time(
+        network_bucket: TokenBucket | None,
+        router_bucket: TokenBucket | None,
+        now: float,
+        needed: float = 1.0,
+    ) -> float:
+        wait = network_bucket.wait_time(now, needed) if network_bucket is not None else 0.0
+        if router_bucket is not None:
+            wait = max(wait, router_bucket.wait_time(now, needed))
+        return wait
+
+    @staticmethod
+    def _consume(
+        network_bucket: TokenBucket | None, router_bucket: TokenBucket | None, now: float
+    ) -> None:
+        if network_bucket is not None:
+            network_bucket.consume(now)
+        if router_bucket is not None:
+            router_bucket.consume(now)
+
+    @staticmethod
+    def _drop_lowest(lane: _Lane, priority: int) -> bool:
+        """Drop the oldest NPDU at or below *priority* to make room."""
+        for level in range(priority + 1):
+            queue = lane.queues[level]
+            if queue:
+                queue.popleft()
+                lane.depth -= 1
+                lane.stats.dropped += 1
+                return True
+        return False
+
+    def _kick(self, network: int) -> None:
+        """Re-run a waiting lane after its rates changed."""
+        lane = self._lanes.get(network)
+        if lane is None or lane.depth == 0:
+            return
+        if lane.timer is not None:
+            lane.timer.cancel()
+            lane.timer = None
+        self._drain(network)
+
+    def _drain(self, network: int) -> None:
+        """Release queued NPDUs for *network* while tokens last."""
+        lane = self._lanes[network]
+        lane.timer = None
+        stats = lane.stats
+        network_bucket = self._network_bucket(network)
+        max_delay = self._policy.max_delay
+        now = time.monotonic()
+        while lane.depth:
+            queue = next(q for q in reversed(lane.queues) if q)
+            send, router_mac, enqueued_at = queue[0]
+            if max_delay is not None and now - enqueued_at > max_delay:
+                # Overtaken by higher priorities or a shared router bucket.
+                queue.popleft()
+                lane.depth -= 1
+                stats.expired += 1
+                continue
+            router_bucket = self._router_bucket(router_mac) if router_mac is not None else None
+            wait = self._wait_time(network_bucket, router_bucket, now)
+            if wait > 0.0:
+                lane.timer = asyncio.get_running_loop().call_later(wait, self._drain, network)
+                break
+            queue.popleft()
+            lane.depth -= 1
+            self._consume(network_bucket, router_bucket, now)
+            delay = now - enqueued_at
+            stats.total_delay += delay
+            if delay > stats.max_delay:
+                stats.max_delay = delay
+            stats.sent += 1
+            try:
+                send()
+            except Exception:
+                logger.warning("Paced send to network %d failed", network, exc_info=True)
+        stats.queue_depth = lane.depth
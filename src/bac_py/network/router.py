@@ -40,6 +40,7 @@ from bac_py.network.npdu import (
     encode_npdu,
     encode_npdu_local_delivery,
 )
+from bac_py.network.pacing import SendPacer
 from bac_py.types.enums import (
     NetworkMessageType,
     NetworkPriority,
@@ -50,11 +51,21 @@ from bac_py.types.enums import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from bac_py.network.pacing import PacingPolicy
     from bac_py.transport.port import TransportPort
 
 logger = logging.getLogger(__name__)
 _DEBUG = logging.DEBUG
 
+# NPCI control octet bits (Clause 6.2.2) used by the forwarding fast path.
+_CONTROL_NETWORK_MESSAGE = 0x80
+_CONTROL_DNET = 0x20
+_CONTROL_SNET = 0x08
+_CONTROL_KEEP = 0x07  # expecting-reply + priority; reserved bits are cleared
+
+# Initial size of the forwarding scratch buffer; grown on demand.
+_FORWARD_BUFFER_SIZE = 1536
+
 
 # ---------------------------------------------------------------------------
 # RouterPort
@@ -467,6 +478,8 @@ class NetworkRouter:
         *,
         application_port_id: int | None = None,
         application_callback: Callable[[bytes, BACnetAddress], None] | None = None,
+        pacing: PacingPolicy | None = None,
+        fast_forwarding: bool = True,
     ) -> None:
         """Initialise the network router.
 
@@ -480,10 +493,19 @@ class NetworkRouter:
         :param application_callback: Called with ``(apdu_bytes,
             source_address)`` when an APDU is delivered to the
             local application entity.
+        :param pacing: Rate limits for APDUs the local application
+            sends to remote networks, or ``None`` to send immediately.
+            Forwarded traffic is not paced.
+        :param fast_forwarding: Forward routed APDUs by rewriting the NPCI
+            bytes instead of decoding and re-encoding the NPDU.  See
+            :meth:`_fast_forward`.
         """
         self._routing_table = RoutingTable()
         self._application_port_id = application_port_id
         self._application_callback = application_callback
+        self._pacer = SendPacer(pacing) if pacing is not None else None
+        self._fast_forwarding = fast_forwarding
+        self._forward_buffer = bytearray(_FORWARD_BUFFER_SIZE)
 
         for port in ports:
             self._routing_table.add_port(port)
@@ -523,6 +545,8 @@ class NetworkRouter:
 
     async def stop(self) -> None:
         """Stop all port transports and cancel active routing table timers."""
+        if self._pacer is not None:
+            self._pacer.close()
         # Cancel any outstanding busy-timeout handles to prevent stale callbacks
         for entry in self._routing_table.get_all_entries():
             if entry.busy_timeout_handle is not None:
@@ -539,14 +563,28 @@ class NetworkRouter:
         """The router's routing table."""
         return self._routing_table
 
+    @property
+    def pacer(self) -> SendPacer | None:
+        """The outbound pacer for remote networks, or ``None`` if pacing is off."""
+        return self._pacer
+
     # -- Receive path -------------------------------------------------------
 
     def _on_port_receive(self, port_id: int, data: bytes, source_mac: bytes) -> None:
         """Handle a raw NPDU received on a port from the transport layer.
 
-        Decodes the NPDU and delegates to :meth:`_process_npdu`.  Malformed
+        Routed APDUs go through :meth:`_fast_forward`.  Everything else
+        is decoded and delegated to :meth:`_process_npdu`.  Malformed
         NPDUs are logged and silently dropped.
         """
+        if self._fast_forwarding:
+            try:
+                if self._fast_forward(port_id, data, source_mac):
+                    return
+            except Exception:
+                logger.warning("Error forwarding NPDU on port %d", port_id, exc_info=True)
+                return
+
         try:
             npdu = decode_npdu(memoryview(data))
         except (ValueError, IndexError):
@@ -592,6 +630,120 @@ class NetworkRouter:
         # Step 4/5: Routed unicast or directed broadcast
         self._forward_to_network(port_id, npdu, source_mac, dnet)
 
+    def _fast_forward(self, port_id: int, data: bytes, source_mac: bytes) -> bool:
+        """Forward a routed APDU without decoding it.
+
+        Parses only the control octet, DNET/DADR, SNET/SADR and hop count,
+        then writes the forwarded NPCI into a reusable buffer and copies
+        the APDU behind it unchanged.  The result is byte-for-byte what
+        :func:`~bac_py.network.npdu.encode_npdu` produces for the same
+        forwarded NPDU.
+
+        Network messages, local traffic, malformed headers and NPDUs that
+        cannot be routed (unknown, unreachable or busy DNET, which need a
+        Reject-Message-To-Network) are left to the decoding path.  The
+        local copy of a global broadcast is still decoded for the
+        application.
+
+        :returns: ``True`` if the NPDU was forwarded or dropped here,
+            ``False`` if it must take the decoding path.
+        """
+        length = len(data)
+        if length < 6 or data[0] != 1:
+            return False
+        control = data[1]
+        if control & _CONTROL_NETWORK_MESSAGE or not control & _CONTROL_DNET:
+            return False
+
+        dnet = (data[2] << 8) | data[3]
+        dest_end = 5 + data[4]
+        has_source = control & _CONTROL_SNET
+        if has_source:
+            if dest_end + 3 > length:
+                return False
+            snet = (data[dest_end] << 8) | data[dest_end + 1]
+            slen = data[dest_end + 2]
+            if snet == 0 or snet == 0xFFFF or slen == 0:
+                return False
+            source_end = dest_end + 3 + slen
+        else:
+            port = self._routing_table.get_port(port_id)
+            slen = len(source_mac)
+            if port is None or slen == 0:
+                return False
+            snet = port.network_number
+            source_end = dest_end
+        if source_end >= length:
+            return False  # truncated address or missing hop count
+        hop_count = data[source_end]
+
+        if dnet == 0xFFFF:
+            if self._application_callback is not None:
+                self._deliver_to_application(port_id, decode_npdu(memoryview(data)), source_mac)
+            dest_port = None
+            next_router_mac = None
+        else:
+            result = self._routing_table.get_port_for_network(dnet)
+            if result is None:
+                return False
+            dest_port, entry = result
+            if entry.reachability != NetworkReachability.REACHABLE:
+                return False
+            next_router_mac = entry.next_router_mac
+
+        # Directly-connected delivery strips DNET/DADR and the hop count;
+        # everything else keeps them and decrements the hop count.
+        local_delivery = dest_port is not None and next_router_mac is None
+        if not local_delivery:
+            if has_source and hop_count == 255 and logger.isEnabledFor(_DEBUG):
+                logger.debug("Routed NPDU from SNET %s has default hop count 255", snet)
+            if hop_count <= 1:
+                logger.debug("Hop count exhausted, discarding NPDU")
+                return True
+
+        source_len = 3 + slen
+        apdu_len = length - source_end - 1
+        total = 2 + source_len + apdu_len
+        if not local_delivery:
+            total += dest_end - 2 + 1
+        buf = self._forward_buffer
+        if total > len(buf):
+            buf = self._forward_buffer = bytearray(total)
+
+        buf[0] = 1
+        offset = 2
+        if local_delivery:
+            buf[1] = (control & _CONTROL_KEEP) | _CONTROL_SNET
+        else:
+            buf[1] = (control & _CONTROL_KEEP) | _CONTROL_DNET | _CONTROL_SNET
+            buf[2:dest_end] = data[2:dest_end]
+            offset = dest_end
+        if has_source:
+            buf[offset : offset + source_len] = data[dest_end:source_end]
+        else:
+            buf[offset] = snet >> 8
+            buf[offset + 1] = snet & 0xFF
+            buf[offset + 2] = slen
+            buf[offset + 3 : offset + source_len] = source_mac
+        offset += source_len
+        if not local_delivery:
+            buf[offset] = hop_count - 1
+            offset += 1
+        buf[offset:total] = memoryview(data)[source_end + 1 :]
+        encoded = bytes(memoryview(buf)[:total])
+
+        if dest_port is None:
+            for port in self._routing_table.get_all_ports():
+                if port.port_id != port_id:
+                    port.transport.send_broadcast(encoded)
+        elif next_router_mac is not None:
+            dest_port.transport.send_unicast(encoded, next_router_mac)
+        elif dest_end == 5:
+            dest_port.transport.send_broadcast(encoded)
+        else:
+            dest_port.transport.send_unicast(encoded, bytes(data[5:dest_end]))
+        return True
+
     # -- Local application delivery -----------------------------------------
 
     def _deliver_to_application(self, port_id: int, npdu: NPDU, source_mac: bytes) -> None:
@@ -1473,9 +1625,14 @@ class NetworkRouter:
         )
         encoded = encode_npdu(npdu)
 
+        transport = dest_port.transport
         if entry.next_router_mac is not None:
-            dest_port.transport.send_unicast(encoded, entry.next_router_mac)
+            send = partial(transport.send_unicast, encoded, entry.next_router_mac)
         elif len(destination.mac_address) == 0:
-            dest_port.transport.send_broadcast(encoded)
+            send = partial(transport.send_broadcast, encoded)
+        else:
+            send = partial(transport.send_unicast, encoded, destination.mac_address)
+        if self._pacer is None:
+            send()
         else:
-            dest_port.transport.send_unicast(encoded, destination.mac_address)
+            self._pacer.submit(dnet, entry.next_router_mac, priority, send)
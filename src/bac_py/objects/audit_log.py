@@ -12,6 +12,7 @@ from bac_py.objects.base import (
     standard_properties,
     status_properties,
 )
+from bac_py.objects.log_buffer import LogBufferMixin, LogRecordBuffer
 from bac_py.types.audit_types import BACnetAuditLogRecord, BACnetAuditNotification
 from bac_py.types.enums import (
     AuditLevel,
@@ -22,7 +23,7 @@ from bac_py.types.primitives import BitString
 
 
 @register_object_type
-class AuditLogObject(BACnetObject):
+class AuditLogObject(LogBufferMixin[LogRecordBuffer], BACnetObject):
     """BACnet Audit Log object (Clause 12.64, new in 2020).
 
     Circular buffer of audit log records with sequence numbering.
@@ -92,25 +93,18 @@ class AuditLogObject(BACnetObject):
     def __init__(self, instance_number: int, **initial_properties: Any) -> None:
         super().__init__(instance_number, **initial_properties)
         self._init_status_flags()
-        self._set_default(PropertyIdentifier.LOG_BUFFER, [])
+        self._init_log_buffer()
         self._sequence_counter = 0
 
     def append_record(self, notification: BACnetAuditNotification) -> BACnetAuditLogRecord | None:
         """Append an audit notification to the log buffer.
 
-        Handles circular buffer overflow (oldest records removed) and
+        Handles circular buffer overflow (oldest record overwritten) and
         stop-when-full behavior. Returns the record if it was added.
         """
         if not self._properties.get(PropertyIdentifier.LOG_ENABLE, False):
             return None
-
-        buffer: list[BACnetAuditLogRecord] = self._properties.get(
-            PropertyIdentifier.LOG_BUFFER, []
-        )
-        buffer_size = self._properties.get(PropertyIdentifier.BUFFER_SIZE, 100)
-        stop_when_full = self._properties.get(PropertyIdentifier.STOP_WHEN_FULL, False)
-
-        if stop_when_full and len(buffer) >= buffer_size:
+        if self._writable_log_buffer() is None:
             return None
 
         self._sequence_counter += 1
@@ -118,13 +112,7 @@ class AuditLogObject(BACnetObject):
             sequence_number=self._sequence_counter,
             notification=notification,
         )
-
-        if len(buffer) >= buffer_size:
-            # Circular: remove oldest
-            buffer.pop(0)
-
-        buffer.append(record)
-        self._properties[PropertyIdentifier.RECORD_COUNT] = len(buffer)
+        self._append_log_record(record)
         self._properties[PropertyIdentifier.TOTAL_RECORD_COUNT] = self._sequence_counter
         return record
 
@@ -139,10 +127,7 @@ class AuditLogObject(BACnetObject):
         :param count: Maximum number of records to return.
         :returns: Tuple of (matching records, no_more_items flag).
         """
-        buffer: list[BACnetAuditLogRecord] = self._properties.get(
-            PropertyIdentifier.LOG_BUFFER, []
-        )
-
+        buffer = self.log_buffer
         if start_at is not None:
             filtered = [r for r in buffer if r.sequence_number >= start_at]
         else:
@@ -311,12 +311,102 @@ def intrinsic_reporting_properties(
     return props
 
 
+class _PropertyStore(dict[PropertyIdentifier, Any]):
+    """Property dict that reports every mutation to its owning object.
+
+    Lets :class:`BACnetObject` invalidate cached encodings when code
+    assigns to ``_properties`` directly instead of going through
+    :meth:`BACnetObject.write_property`.  The callback receives the
+    property and whether the key was added or removed.
+    """
+
+    __slots__ = ("_on_change",)
+
+    def __init__(
+        self, on_change: Callable[[PropertyIdentifier, bool], None] | None = None
+    ) -> None:
+        super().__init__()
+        self._on_change = on_change
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle and copy as a plain dict: the callback is bound to the
+        # owning object, which rebuilds its store in __setstate__.
+        return dict, (dict(self),)
+
+    def __setitem__(self, key: PropertyIdentifier, value: Any) -> None:
+        added = key not in self
+        super().__setitem__(key, value)
+        on_change = getattr(self, "_on_change", None)
+        if on_change is not None:
+            on_change(key, added)
+
+    def __delitem__(self, key: PropertyIdentifier) -> None:
+        super().__delitem__(key)
+        on_change = getattr(self, "_on_change", None)
+        if on_change is not None:
+            on_change(key, True)
+
+    def pop(self, key: PropertyIdentifier, *default: Any) -> Any:
+        present = key in self
+        value = super().pop(key, *default)
+        if present and self._on_change is not None:
+            self._on_change(key, True)
+        return value
+
+    def popitem(self) -> tuple[PropertyIdentifier, Any]:
+        key, value = super().popitem()
+        if self._on_change is not None:
+            self._on_change(key, True)
+        return key, value
+
+    def setdefault(self, key: PropertyIdentifier, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def __ior__(self, other: Any) -> _PropertyStore:  # type: ignore[override,misc]
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        keys = list(self)
+        super().clear()
+        if self._on_change is not None:
+            for key in keys:
+                self._on_change(key, True)
+
+
+_MUTABLE_TYPES = (list, dict, set, bytearray)
+
+
+def _is_immutable(value: Any) -> bool:
+    """Return whether *value* cannot change without being reassigned."""
+    if isinstance(value, _MUTABLE_TYPES):
+        return False
+    params = getattr(type(value), "__dataclass_params__", None)
+    return params is None or params.frozen
+
+
 class BACnetObject:
     """Base class for all BACnet objects.
 
     Each subclass defines its property schema via class-level
     PROPERTY_DEFINITIONS. Properties are stored in a dict and
     accessed via typed read/write methods.
+
+    Encoded property values served by the server are cached per
+    ``(property, array_index)`` (see :meth:`get_encoded`).  Entries are
+    dropped whenever the stored value is assigned, and computed
+    properties are dropped when a property they derive from changes
+    (:attr:`_ENCODING_DEPENDENTS`).  Values held in mutable containers
+    are never cached.  Subclasses that compute a property in
+    :meth:`read_property` must declare its inputs in
+    :attr:`_ENCODING_DEPENDENTS`, or exclude it by overriding
+    :meth:`_encoding_cacheable`.
     """
 
     OBJECT_TYPE: ClassVar[ObjectType]
@@ -324,6 +414,26 @@ class BACnetObject:
     INTRINSIC_EVENT_ALGORITHM: ClassVar[EventType | None] = None
     """Event algorithm for intrinsic reporting, or ``None`` if not supported."""
 
+    _COMPUTED_PROPERTIES: ClassVar[frozenset[PropertyIdentifier]] = frozenset(
+        {
+            PropertyIdentifier.PROPERTY_LIST,
+            PropertyIdentifier.STATUS_FLAGS,
+            PropertyIdentifier.CURRENT_COMMAND_PRIORITY,
+        }
+    )
+    """Properties computed in :meth:`read_property` whose encoding may be
+    cached because their invalidation is covered by explicit rules."""
+
+    _ENCODING_DEPENDENTS: ClassVar[dict[PropertyIdentifier, tuple[PropertyIdentifier, ...]]] = {
+        PropertyIdentifier.EVENT_STATE: (PropertyIdentifier.STATUS_FLAGS,),
+        PropertyIdentifier.RELIABILITY: (PropertyIdentifier.STATUS_FLAGS,),
+        PropertyIdentifier.OUT_OF_SERVICE: (PropertyIdentifier.STATUS_FLAGS,),
+        PropertyIdentifier.PRIORITY_ARRAY: (PropertyIdentifier.CURRENT_COMMAND_PRIORITY,),
+    }
+    """Cached encodings to drop, in addition to the property itself, when a
+    stored property changes.  Property_List is dropped whenever a
+    property is added or removed."""
+
     def __init__(self, instance_number: int, **initial_properties: Any) -> None:
         """Initialize a BACnet object with default and overridden properties.
 
@@ -332,7 +442,8 @@ class BACnetObject:
             name (e.g., ``object_name="MyObject"``).
         """
         self._object_id = ObjectIdentifier(self.OBJECT_TYPE, instance_number)
-        self._properties: dict[PropertyIdentifier, Any] = {}
+        self._encoded_cache: dict[PropertyIdentifier, dict[int | None, bytes]] = {}
+        self._properties: dict[PropertyIdentifier, Any] = _PropertyStore(self._on_property_changed)
         self._priority_array: list[Any | None] | None = None
         self._write_lock = asyncio.Lock()
         self._object_db: ObjectDatabase | None = None
@@ -352,11 +463,101 @@ class BACnetObject:
             prop_id = PropertyIdentifier[key.upper()]
             self._properties[prop_id] = value
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_properties"] = dict(self._properties)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        properties = state.pop("_properties")
+        self.__dict__.update(state)
+        store = _PropertyStore(self._on_property_changed)
+        dict.update(store, properties)
+        self._properties = store
+
     @property
     def object_identifier(self) -> ObjectIdentifier:
         """The :class:`ObjectIdentifier` for this object."""
         return self._object_id
 
+    def get_encoded(
+        self,
+        prop_id: PropertyIdentifier,
+        array_index: int | None = None,
+    ) -> bytes | None:
+        """Return the cached application-tagged encoding of a property.
+
+        :param prop_id: Property identifier.
+        :param array_index: Optional array index.
+        :returns: The encoded value, or ``None`` if it is not cached.
+        """
+        entries = self._encoded_cache.get(prop_id)
+        if entries is None:
+            return None
+        return entries.get(array_index)
+
+    def cache_encoded(
+        self,
+        prop_id: PropertyIdentifier,
+        array_index: int | None,
+        encoded: bytes,
+    ) -> None:
+        """Cache the encoding of a value just returned by :meth:`read_property`.
+
+        Ignored for properties whose encoding cannot be kept valid (see
+        :meth:`_encoding_cacheable`).
+
+        :param prop_id: Property identifier that was read.
+        :param array_index: Array index that was read, or ``None``.
+        :param encoded: The application-tagged encoding of the value.
+        """
+        if self._encoding_cacheable(prop_id, array_index):
+            self._encoded_cache.setdefault(prop_id, {})[array_index] = encoded
+
+    def invalidate_encoded(self, prop_id: PropertyIdentifier | None = None) -> None:
+        """Drop cached encodings for *prop_id* and the properties derived from it.
+
+        Call after mutating a stored value in place (e.g. appending to a
+        list) outside :meth:`write_property`.
+
+        :param prop_id: Property whose encodings to drop, or ``None`` to
+            drop every cached encoding of this object.
+        """
+        cache = self._encoded_cache
+        if not cache:
+            return
+        if prop_id is None:
+            cache.clear()
+            return
+        cache.pop(prop_id, None)
+        for dependent in self._ENCODING_DEPENDENTS.get(prop_id, ()):
+            cache.pop(dependent, None)
+
+    def _on_property_changed(self, prop_id: PropertyIdentifier, keys_changed: bool) -> None:
+        """Invalidate cached encodings after ``_properties`` is mutated.
+
+        Also reports the change to the database's write listeners.
+        """
+        db = self._object_db
+        if db is not None and db._write_listeners:
+            db._notify_write_listeners(self, prop_id)
+        if not self._encoded_cache:
+            return
+        self.invalidate_encoded(prop_id)
+        if keys_changed:
+            self._encoded_cache.pop(PropertyIdentifier.PROPERTY_LIST, None)
+
+    def _encoding_cacheable(self, prop_id: PropertyIdentifier, array_index: int | None) -> bool:
+        """Return whether the encoding of *prop_id* can be cached.
+
+        Computed properties are cacheable when listed in
+        :attr:`_COMPUTED_PROPERTIES`; stored properties are cacheable when
+        their value is immutable, so it can only change by assignment.
+        """
+        if prop_id in self._COMPUTED_PROPERTIES:
+            return True
+        return _is_immutable(self._properties.get(prop_id))
+
     def _init_status_flags(self) -> None:
         """Initialize Status_Flags to a default :class:`StatusFlags` if not already set."""
         from bac_py.types.constructed import _NORMAL_STATUS_FLAGS
@@ -678,6 +879,8 @@ class BACnetObject:
             self._priority_array = [None] * 16
 
         idx = priority - 1
+        # The priority and value source arrays are updated in place.
+        self.invalidate_encoded(PropertyIdentifier.PRIORITY_ARRAY)
 
         if value is None:
             self._priority_array[idx] = None
@@ -737,6 +940,7 @@ class BACnetObject:
         if array_index < 1 or array_index > len(current):
             raise BACnetError(ErrorClass.PROPERTY, ErrorCode.INVALID_ARRAY_INDEX)
         current[array_index - 1] = value
+        self.invalidate_encoded(prop_id)
 
 
 class ObjectDatabase:
@@ -754,6 +958,10 @@ class ObjectDatabase:
             tuple[ObjectIdentifier, PropertyIdentifier],
             list[Callable[[PropertyIdentifier, Any, Any], None]],
         ] = {}
+        self._write_listeners: list[Callable[[BACnetObject, PropertyIdentifier], None]] = []
+        self._membership_listeners: list[
+            Callable[[ObjectIdentifier, BACnetObject | None], None]
+        ] = []
 
     def add(self, obj: BACnetObject) -> None:
         """Add an object to the database.
@@ -778,7 +986,11 @@ class ObjectDatabase:
             self._device_obj = obj
         obj._object_db = self
         self._increment_database_revision()
+        self._invalidate_object_list()
         logger.info("object added: %s", obj.object_identifier)
+        for listener in self._membership_listeners:
+            with contextlib.suppress(Exception):
+                listener(obj.object_identifier, obj)
 
     def remove(self, object_id: ObjectIdentifier) -> None:
         """Remove an object from the database.
@@ -803,7 +1015,11 @@ class ObjectDatabase:
         obj._object_db = None
         del self._objects[object_id]
         self._increment_database_revision()
+        self._invalidate_object_list()
         logger.info("object removed: %s", object_id)
+        for listener in self._membership_listeners:
+            with contextlib.suppress(Exception):
+                listener(object_id, None)
 
     def validate_name_unique(self, name: str, exclude: ObjectIdentifier | None = None) -> None:
         """Check that a name is unique within the database.
@@ -832,6 +1048,11 @@ class ObjectDatabase:
             del self._names[old_name]
         self._names[new_name] = object_id
 
+    def _invalidate_object_list(self) -> None:
+        """Drop the device's cached Object_List encoding after add/remove."""
+        if self._device_obj is not None:
+            self._device_obj.invalidate_encoded(PropertyIdentifier.OBJECT_LIST)
+
     def _increment_database_revision(self) -> None:
         """Increment Database_Revision on the Device object (Clause 12.11.23).
 
@@ -888,6 +1109,54 @@ class ObjectDatabase:
             if not cbs:
                 del self._change_callbacks[key]
 
+    def register_write_listener(
+        self, listener: Callable[[BACnetObject, PropertyIdentifier], None]
+    ) -> None:
+        """Register a callback fired when any object's stored properties change.
+
+        Unlike :meth:`register_change_callback` this covers every object in
+        the database, including ones added later, and every assignment to
+        ``_properties`` -- writes through :meth:`BACnetObject.write_property`
+        as well as updates made by engines and application code.  The
+        callback receives ``(obj, prop_id)``; the property may have been
+        removed.  In-place mutation of a stored list is not reported.
+
+        :param listener: Function to call after each assignment.
+        """
+        self._write_listeners.append(listener)
+
+    def unregister_write_listener(
+        self, listener: Callable[[BACnetObject, PropertyIdentifier], None]
+    ) -> None:
+        """Remove a callback added with :meth:`register_write_listener`."""
+        with contextlib.suppress(ValueError):
+            self._write_listeners.remove(listener)
+
+    def register_membership_listener(
+        self, listener: Callable[[ObjectIdentifier, BACnetObject | None], None]
+    ) -> None:
+        """Register a callback fired when an object is added or removed.
+
+        The callback receives ``(object_id, obj)`` after :meth:`add` and
+        ``(object_id, None)`` after :meth:`remove`.
+
+        :param listener: Function to call on add or remove.
+        """
+        self._membership_listeners.append(listener)
+
+    def unregister_membership_listener(
+        self, listener: Callable[[ObjectIdentifier, BACnetObject | None], None]
+    ) -> None:
+        """Remove a callback added with :meth:`register_membership_listener`."""
+        with contextlib.suppress(ValueError):
+            self._membership_listeners.remove(listener)
+
+    def _notify_write_listeners(self, obj: BACnetObject, prop_id: PropertyIdentifier) -> None:
+        """Pass a stored-property change to every write listener."""
+        for listener in self._write_listeners:
+            with contextlib.suppress(Exception):
+                listener(obj, prop_id)
+
     def _make_write_notifier(
         self, object_id: ObjectIdentifier
     ) -> Callable[[PropertyIdentifier, Any, Any], None]:
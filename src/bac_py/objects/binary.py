@@ -31,6 +31,11 @@ class _BinaryPolarityMixin:
     Present_Value returned to callers is inverted.
     """
 
+    _ENCODING_DEPENDENTS: ClassVar[dict[PropertyIdentifier, tuple[PropertyIdentifier, ...]]] = {
+        **BACnetObject._ENCODING_DEPENDENTS,
+        PropertyIdentifier.POLARITY: (PropertyIdentifier.PRESENT_VALUE,),
+    }
+
     def read_property(
         self,
         prop_id: PropertyIdentifier,
@@ -247,6 +247,18 @@ class DeviceObject(BACnetObject):
         )
         self._set_default(PropertyIdentifier.OBJECT_LIST, [])
 
+    def _encoding_cacheable(self, prop_id: PropertyIdentifier, array_index: int | None) -> bool:
+        """Cache the whole Object_List while the database invalidates it.
+
+        Elements of Object_List are not cached, and neither are the
+        Active_COV_Subscriptions served from the COV manager.
+        """
+        if prop_id == PropertyIdentifier.OBJECT_LIST:
+            return self._object_db is not None and array_index is None
+        if prop_id == PropertyIdentifier.ACTIVE_COV_SUBSCRIPTIONS:
+            return False
+        return super()._encoding_cacheable(prop_id, array_index)
+
     def read_property(
         self,
         prop_id: PropertyIdentifier,
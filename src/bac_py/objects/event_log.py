@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from bac_py.objects.base import (
     BACnetObject,
@@ -12,6 +12,7 @@ from bac_py.objects.base import (
     standard_properties,
     status_properties,
 )
+from bac_py.objects.log_buffer import LogBufferMixin, LogRecordBuffer
 from bac_py.types.constructed import BACnetDateTime
 from bac_py.types.enums import (
     LoggingType,
@@ -19,9 +20,12 @@ from bac_py.types.enums import (
     PropertyIdentifier,
 )
 
+if TYPE_CHECKING:
+    from bac_py.services.event_notification import BACnetEventLogRecord
+
 
 @register_object_type
-class EventLogObject(BACnetObject):
+class EventLogObject(LogBufferMixin[LogRecordBuffer], BACnetObject):
     """BACnet Event Log object (Clause 12.27).
 
     Stores event notification records in a circular buffer.
@@ -123,4 +127,16 @@ class EventLogObject(BACnetObject):
     def __init__(self, instance_number: int, **initial_properties: Any) -> None:
         super().__init__(instance_number, **initial_properties)
         self._init_status_flags()
-        self._set_default(PropertyIdentifier.LOG_BUFFER, [])
+        self._init_log_buffer()
+
+    def append_record(self, record: BACnetEventLogRecord) -> bool:
+        """Append a log record to the buffer.
+
+        Handles circular overwrite vs stop-when-full semantics.  The
+        buffer is resized first if Buffer_Size has changed.
+
+        Returns:
+            ``True`` if the record was appended, ``False`` if the buffer
+            is full and ``stop_when_full`` is set.
+        """
+        return self._append_log_record(record)
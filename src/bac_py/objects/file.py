@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar
+import mmap
+import sys
+from array import array
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar
 
 from bac_py.objects.base import (
     BACnetObject,
@@ -21,6 +26,10 @@ from bac_py.types.enums import (
     PropertyIdentifier,
 )
 
+if TYPE_CHECKING:
+    import os
+    from collections.abc import Sequence
+
 
 @register_object_type
 class FileObject(BACnetObject):
@@ -110,7 +119,7 @@ class FileObject(BACnetObject):
         else:
             self._properties[PropertyIdentifier.FILE_SIZE] = len(self._record_data)
 
-    def read_stream(self, start: int, count: int) -> tuple[bytes, bool]:
+    def read_stream(self, start: int, count: int) -> tuple[bytes | memoryview, bool]:
         """Read stream data from the file.
 
         :param start: Starting byte position.
@@ -158,7 +167,7 @@ class FileObject(BACnetObject):
         self._update_file_size()
         return start
 
-    def read_records(self, start: int, count: int) -> tuple[list[bytes], bool]:
+    def read_records(self, start: int, count: int) -> tuple[Sequence[bytes | memoryview], bool]:
         """Read records from the file.
 
         :param start: Starting record index.
@@ -208,3 +217,254 @@ class FileObject(BACnetObject):
 
         self._update_file_size()
         return start
+
+
+class _MappedData:
+    """A file on disk mapped into memory, grown on demand.
+
+    Empty files cannot be mapped, so the mapping is created on the
+    first write that gives the file a length.
+    """
+
+    def __init__(self, path: Path, *, writable: bool) -> None:
+        self._writable = writable
+        if writable:
+            path.touch(exist_ok=True)
+        self._file: BinaryIO = path.open("r+b" if writable else "rb")
+        self.size = path.stat().st_size
+        self._map: mmap.mmap | None = None
+        if self.size:
+            self._map = self._mmap()
+
+    def _mmap(self) -> mmap.mmap:
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        return mmap.mmap(self._file.fileno(), self.size, access=access)
+
+    def view(self, start: int, end: int) -> memoryview:
+        """Return bytes ``[start, end)`` of the file without copying."""
+        if self._map is None:
+            return memoryview(b"")
+        return memoryview(self._map)[start:end]
+
+    def write(self, start: int, data: bytes | memoryview) -> None:
+        """Write *data* at *start*, extending the file with zeros if needed."""
+        end = start + len(data)
+        if end > self.size:
+            self.reserve(end)
+        if data:
+            assert self._map is not None
+            self._map[start:end] = data
+
+    def reserve(self, size: int) -> None:
+        """Extend the file to *size* bytes and remap it."""
+        if size <= self.size:
+            return
+        if self._map is not None:
+            # Views handed out by view() keep the old mapping alive; it is
+            # released when the last of them is.
+            with suppress(BufferError):
+                self._map.close()
+        self._file.truncate(size)
+        self.size = size
+        self._map = self._mmap()
+
+    def flush(self) -> None:
+        """Write modified pages back to disk."""
+        if self._map is not None and self._writable:
+            self._map.flush()
+
+    def close(self) -> None:
+        """Unmap and close the file."""
+        self.flush()
+        if self._map is not None:
+            with suppress(BufferError):
+                self._map.close()
+            self._map = None
+        self._file.close()
+
+
+class MappedFileObject(FileObject):
+    """File object backed by a file on disk through :mod:`mmap`.
+
+    Unlike :class:`FileObject`, the contents are not held in memory.
+    :meth:`read_stream` and :meth:`read_records` return
+    :class:`memoryview` slices of the mapping, so AtomicReadFile copies
+    the data only when encoding the response, and writes are applied in
+    place.
+
+    Record files keep the records concatenated in the data file and an
+    index of ``(offset, length)`` pairs in a companion file.  A record
+    rewritten with a longer value is appended to the data file; the space
+    it occupied before is not reused.
+
+    The object is registered under the same object type as
+    :class:`FileObject`; create it directly and add it to the object
+    database.
+
+    :param instance_number: The BACnet instance number for this object.
+    :param path: File holding the data.  Created if it does not exist,
+        unless the object is read-only.
+    :param file_access_method: Stream or record access.
+    :param index_path: Record index file.  Defaults to *path* with
+        ``.idx`` appended.  Unused for stream access.
+    :param initial_properties: Additional property overrides.  Set
+        ``read_only=True`` to map the file read-only.
+    """
+
+    def __init__(
+        self,
+        instance_number: int,
+        path: str | os.PathLike[str],
+        *,
+        file_access_method: FileAccessMethod = FileAccessMethod.STREAM_ACCESS,
+        index_path: str | os.PathLike[str] | None = None,
+        **initial_properties: Any,
+    ) -> None:
+        path = Path(path)
+        writable = not initial_properties.get("read_only", False)
+        self._data = _MappedData(path, writable=writable)
+        self._index = array("Q")
+        self._index_file: BinaryIO | None = None
+        if file_access_method == FileAccessMethod.RECORD_ACCESS:
+            index = Path(index_path) if index_path is not None else Path(f"{path}.idx")
+            if writable:
+                index.touch(exist_ok=True)
+            if index.exists():
+                with index.open("rb") as f:
+                    self._index.frombytes(f.read())
+                if sys.byteorder != "little":
+                    self._index.byteswap()
+                if writable:
+                    self._index_file = index.open("r+b", buffering=0)
+        super().__init__(
+            instance_number, file_access_method=file_access_method, **initial_properties
+        )
+
+    def _update_file_size(self) -> None:
+        """Recalculate FILE_SIZE from the mapped data or record index."""
+        access_method = self._properties[PropertyIdentifier.FILE_ACCESS_METHOD]
+        if access_method == FileAccessMethod.STREAM_ACCESS:
+            self._properties[PropertyIdentifier.FILE_SIZE] = self._data.size
+        else:
+            self._properties[PropertyIdentifier.FILE_SIZE] = len(self._index) // 2
+
+    def _check_writable(self, access_method: FileAccessMethod) -> None:
+        if self._properties[PropertyIdentifier.FILE_ACCESS_METHOD] != access_method:
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.INVALID_FILE_ACCESS_METHOD)
+        if self._properties.get(PropertyIdentifier.READ_ONLY) or not self._data._writable:
+            raise BACnetError(ErrorClass.OBJECT, ErrorCode.FILE_ACCESS_DENIED)
+
+    def read_stream(self, start: int, count: int) -> tuple[memoryview, bool]:
+        """Read stream data from the file without copying.
+
+        :param start: Starting byte position.
+        :param count: Number of bytes to read.
+        :returns: Tuple of ``(data, end_of_file)``.
+        :raises BACnetError: If access method is not stream.
+        """
+        if (
+            self._properties[PropertyIdentifier.FILE_ACCESS_METHOD]
+            != FileAccessMethod.STREAM_ACCESS
+        ):
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.INVALID_FILE_ACCESS_METHOD)
+        size = self._data.size
+        return self._data.view(start, min(start + count, size)), start + count >= size
+
+    def write_stream(self, start: int, data: bytes) -> int:
+        """Write stream data to the file in place.
+
+        :param start: Starting byte position. Use ``-1`` to append.
+        :param data: Data to write.
+        :returns: The actual file start position used.
+        :raises BACnetError: If access method is not stream or file is read-only.
+        """
+        self._check_writable(FileAccessMethod.STREAM_ACCESS)
+        if start < 0:
+            start = self._data.size
+        self._data.write(start, data)
+        self._update_file_size()
+        return start
+
+    def read_records(self, start: int, count: int) -> tuple[list[memoryview], bool]:
+        """Read records from the file without copying.
+
+        :param start: Starting record index.
+        :param count: Number of records to read.
+        :returns: Tuple of ``(records, end_of_file)``.
+        :raises BACnetError: If access method is not record.
+        """
+        if (
+            self._properties[PropertyIdentifier.FILE_ACCESS_METHOD]
+            != FileAccessMethod.RECORD_ACCESS
+        ):
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.INVALID_FILE_ACCESS_METHOD)
+        index = self._index
+        total = len(index) // 2
+        records = [
+            self._data.view(index[2 * i], index[2 * i] + index[2 * i + 1])
+            for i in range(max(start, 0), min(start + count, total))
+        ]
+        return records, start + count >= total
+
+    def write_records(self, start: int, records: Sequence[bytes]) -> int:
+        """Write records to the file.
+
+        A record no longer than the one it replaces is written in place;
+        otherwise it is appended to the data file.
+
+        :param start: Starting record index. Use ``-1`` to append.
+        :param records: Records to write.
+        :returns: The actual file start record used.
+        :raises BACnetError: If access method is not record or file is read-only.
+        """
+        self._check_writable(FileAccessMethod.RECORD_ACCESS)
+        index = self._index
+        total = len(index) // 2
+        if start < 0:
+            start = total
+        first_changed = min(start, total)
+        end = start + len(records)
+        if end > total:
+            # Pad skipped records as empty and make room for new entries
+            index.extend([0, 0] * (end - total))
+
+        tail = self._data.size
+        placements: list[tuple[int, bytes]] = []
+        for i, record in enumerate(records, start):
+            if i < total and len(record) <= index[2 * i + 1]:
+                offset = index[2 * i]
+            else:
+                offset = tail
+                tail += len(record)
+            index[2 * i] = offset
+            index[2 * i + 1] = len(record)
+            placements.append((offset, record))
+        self._data.reserve(tail)
+        for offset, record in placements:
+            self._data.write(offset, record)
+        self._write_index(first_changed, end)
+        self._update_file_size()
+        return start
+
+    def _write_index(self, first: int, end: int) -> None:
+        """Persist index entries ``[first, end)``."""
+        assert self._index_file is not None
+        entries = self._index[2 * first : 2 * end]
+        if sys.byteorder != "little":
+            entries.byteswap()
+        self._index_file.seek(16 * first)
+        self._index_file.write(entries.tobytes())
+
+    def flush(self) -> None:
+        """Write modified data back to disk."""
+        self._data.flush()
+
+    def close(self) -> None:
+        """Unmap the data file and close both files.
+
+        The object must not be read or written afterwards.
+        """
+        self._data.close()
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
@@ -0,0 +1,290 @@
+"""Log_Buffer storage shared by the Trend Log, Trend Log Multiple, Event Log and Audit Log objects.
+
+:class:`LogBufferMixin` keeps an object's Log_Buffer in a ring buffer
+sized by Buffer_Size.  :class:`LogRecordBuffer` is a fixed-capacity ring
+of log records with a parallel column of timestamp sort keys, so
+ReadRange by time can bisect the buffer without decoding a timestamp per
+probe, and overwriting the oldest record is O(1).  Trend Log objects use
+the columnar :class:`~bac_py.objects.trendlog.TrendLogBuffer` instead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, overload
+
+from bac_py.encoding.primitives import (
+    encode_date,
+    encode_property_value,
+    encode_time,
+    register_property_encoder,
+)
+from bac_py.types.constructed import BACnetDateTime
+from bac_py.types.enums import PropertyIdentifier
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+def datetime_key(timestamp: BACnetDateTime) -> int:
+    """Return an integer that orders *timestamp* chronologically.
+
+    The key is built from the year, month, day and time; the day of week
+    is ignored.  Unspecified (``0xFF``) time fields count as zero.  It
+    uses the same layout as the ``timestamp_key()`` method of the log
+    buffers, so the two can be compared.
+    """
+    date = int.from_bytes(encode_date(timestamp.date))
+    return _packed_key(date, int.from_bytes(encode_time(timestamp.time)))
+
+
+def _packed_key(date: int, time: int) -> int:
+    """Combine a packed 4-byte date and time into a sort key."""
+    if time & 0x80808080:
+        # No valid time field reaches 0x80, so this is a wildcard octet.
+        time = int.from_bytes(bytes(0 if b == 0xFF else b for b in time.to_bytes(4)))
+    return ((date >> 8) << 32) | time
+
+
+def _record_key(record: Any) -> int:
+    """Return the :func:`datetime_key` of *record*'s timestamp, or 0 if it has none."""
+    timestamp = getattr(record, "timestamp", None)
+    return datetime_key(timestamp) if isinstance(timestamp, BACnetDateTime) else 0
+
+
+class LogRecordBuffer:
+    """Fixed-capacity ring buffer for log records of any type.
+
+    Records are kept as objects, alongside an integer column holding the
+    :func:`datetime_key` of each record's
+    ``timestamp`` (0 for records without a date-time timestamp).
+
+    When the buffer is full, :meth:`append` overwrites the oldest record
+    in O(1).  A capacity of ``0`` means the buffer grows without bound.
+
+    :param capacity: Maximum number of records, or ``0`` for unbounded.
+    :param records: Optional initial records, oldest first.
+    """
+
+    __slots__ = ("_capacity", "_keys", "_records", "_start")
+
+    def __init__(self, capacity: int = 0, records: Iterable[Any] = ()) -> None:
+        if capacity < 0:
+            msg = f"capacity must be >= 0, got {capacity}"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._start = 0
+        self._records: list[Any] = []
+        self._keys = array("Q")
+        for record in records:
+            self.append(record)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records held, or ``0`` for unbounded."""
+        return self._capacity
+
+    @property
+    def full(self) -> bool:
+        """Whether the next :meth:`append` overwrites the oldest record."""
+        return self._capacity > 0 and len(self._records) >= self._capacity
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __iter__(self) -> Iterator[Any]:
+        records = self._records
+        yield from records[self._start :]
+        yield from records[: self._start]
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        count = len(self._records)
+        if isinstance(index, slice):
+            return [self._records[self._slot(i)] for i in range(*index.indices(count))]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            msg = "LogRecordBuffer index out of range"
+            raise IndexError(msg)
+        return self._records[self._slot(index)]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LogRecordBuffer):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LogRecordBuffer(capacity={self._capacity}, records={len(self._records)})"
+
+    def encode(self) -> bytes:
+        """Encode the records, oldest first, as application-tagged bytes."""
+        return b"".join(encode_property_value(record) for record in self)
+
+    def append(self, record: Any) -> None:
+        """Append a record, overwriting the oldest one when full.
+
+        :param record: The record to store.
+        """
+        key = _record_key(record)
+        if self.full:
+            slot = self._start
+            self._start = (slot + 1) % self._capacity
+            self._records[slot] = record
+            self._keys[slot] = key
+            return
+        self._records.append(record)
+        self._keys.append(key)
+
+    def timestamp_key(self, index: int) -> int:
+        """Return the timestamp sort key of the record at *index*.
+
+        :param index: Logical index, 0 being the oldest record.
+        :returns: A key comparable with :func:`datetime_key`.
+        """
+        return self._keys[self._slot(index)]
+
+    def clear(self) -> None:
+        """Remove all records, keeping the capacity."""
+        self._start = 0
+        self._records = []
+        self._keys = array("Q")
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, dropping the oldest records if it shrinks.
+
+        :param capacity: New maximum number of records, or ``0`` for
+            unbounded.
+        """
+        if capacity < 0:
+            msg = f"capacity must be >= 0, got {capacity}"
+            raise ValueError(msg)
+        count = len(self._records)
+        keep = count if capacity == 0 else min(count, capacity)
+        start = self._start
+        self._records = (self._records[start:] + self._records[:start])[count - keep :]
+        self._keys = (self._keys[start:] + self._keys[:start])[count - keep :]
+        self._capacity = capacity
+        self._start = 0
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a storage slot."""
+        if self._start == 0:
+            return index
+        return (self._start + index) % len(self._records)
+
+
+register_property_encoder(LogRecordBuffer, lambda buffer, _iar: buffer.encode())
+
+
+class LogBuffer(Protocol):
+    """Ring buffer interface required by :class:`LogBufferMixin`."""
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records held, or ``0`` for unbounded."""
+        ...
+
+    @property
+    def full(self) -> bool:
+        """Whether the next :meth:`append` overwrites the oldest record."""
+        ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[Any]: ...
+
+    def append(self, record: Any) -> None:
+        """Append a record, overwriting the oldest one when full."""
+        ...
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, dropping the oldest records if it shrinks."""
+        ...
+
+
+class LogBufferMixin[B: LogBuffer]:
+    """Mixin keeping an object's Log_Buffer in a ring buffer.
+
+    The buffer's capacity follows Buffer_Size, and Record_Count and
+    Total_Record_Count are maintained as records are appended.  Reads of
+    the whole Log_Buffer return a list of records.  Subclasses choose the
+    buffer type with :attr:`_LOG_BUFFER_TYPE`.
+    """
+
+    _LOG_BUFFER_TYPE: ClassVar[type[Any]] = LogRecordBuffer
+    """Buffer class, called with the capacity and the initial records."""
+
+    _properties: dict[PropertyIdentifier, Any]
+
+    def _init_log_buffer(self) -> None:
+        """Move any initial Log_Buffer records into the ring buffer."""
+        self._properties[PropertyIdentifier.LOG_BUFFER] = self._LOG_BUFFER_TYPE(
+            self._properties.get(PropertyIdentifier.BUFFER_SIZE, 0),
+            self._properties.get(PropertyIdentifier.LOG_BUFFER) or (),
+        )
+
+    @property
+    def log_buffer(self) -> B:
+        """The ring buffer backing Log_Buffer."""
+        buf = self._properties.get(PropertyIdentifier.LOG_BUFFER)
+        if not isinstance(buf, self._LOG_BUFFER_TYPE):
+            buf = self._LOG_BUFFER_TYPE(
+                self._properties.get(PropertyIdentifier.BUFFER_SIZE, 0), buf or ()
+            )
+            self._properties[PropertyIdentifier.LOG_BUFFER] = buf
+        return buf  # type: ignore[no-any-return]
+
+    def read_property(
+        self,
+        prop_id: PropertyIdentifier,
+        array_index: int | None = None,
+    ) -> Any:
+        """Read property, materializing Log_Buffer as a list of records."""
+        if prop_id == PropertyIdentifier.LOG_BUFFER and array_index is None:
+            return list(self.log_buffer)
+        return super().read_property(prop_id, array_index)  # type: ignore[misc]
+
+    def _encoding_cacheable(self, prop_id: PropertyIdentifier, array_index: int | None) -> bool:
+        """Never cache Log_Buffer, which changes in place on every append."""
+        if prop_id == PropertyIdentifier.LOG_BUFFER:
+            return False
+        return super()._encoding_cacheable(prop_id, array_index)  # type: ignore[misc,no-any-return]
+
+    def _writable_log_buffer(self) -> B | None:
+        """Return the buffer resized to Buffer_Size, ready for an append.
+
+        :returns: The buffer, or ``None`` if it is full and
+            Stop_When_Full is set.
+        """
+        buf = self.log_buffer
+        buf_size: int = self._properties.get(PropertyIdentifier.BUFFER_SIZE, 0)
+        if buf.capacity != buf_size:
+            buf.resize(buf_size)
+        if buf.full and self._properties.get(PropertyIdentifier.STOP_WHEN_FULL, False):
+            return None
+        return buf
+
+    def _append_log_record(self, record: Any) -> bool:
+        """Append *record*, honouring Buffer_Size and Stop_When_Full.
+
+        :returns: ``True`` if the record was appended, ``False`` if the
+            buffer is full and Stop_When_Full is set.
+        """
+        buf = self._writable_log_buffer()
+        if buf is None:
+            return False
+        buf.append(record)
+        self._properties[PropertyIdentifier.RECORD_COUNT] = len(buf)
+        total = self._properties.get(PropertyIdentifier.TOTAL_RECORD_COUNT, 0)
+        self._properties[PropertyIdentifier.TOTAL_RECORD_COUNT] = total + 1
+        return True
@@ -2,8 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from array import array
+from typing import TYPE_CHECKING, Any, ClassVar, overload
 
+from bac_py.encoding.primitives import (
+    decode_date,
+    decode_time,
+    encode_date,
+    encode_property_value,
+    encode_time,
+    register_property_encoder,
+)
 from bac_py.objects.base import (
     BACnetObject,
     PropertyAccess,
@@ -12,10 +21,12 @@ from bac_py.objects.base import (
     standard_properties,
     status_properties,
 )
+from bac_py.objects.log_buffer import LogBufferMixin, _packed_key
 from bac_py.types.constructed import (
     BACnetDateTime,
     BACnetDeviceObjectPropertyReference,
     BACnetLogRecord,
+    StatusFlags,
 )
 from bac_py.types.enums import (
     LoggingType,
@@ -23,9 +34,258 @@ from bac_py.types.enums import (
     PropertyIdentifier,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+# Storage kinds for log_datum values.
+_DATUM_REAL = 0
+_DATUM_BOOL = 1
+_DATUM_INT = 2
+_DATUM_OBJECT = 3
+
+_MAX_EXACT_INT = 2**53
+_STATUS_PRESENT = 0x10
+
+
+class TrendLogBuffer:
+    """Fixed-capacity ring buffer for Trend Log records.
+
+    Records are stored column-wise in typed arrays: the packed date and
+    time, the logged value, and the status flags bits.  Real, Boolean and
+    integer values live in a ``double`` column; any other value (enums,
+    constructed types, ``None``) is kept in a side table for its slot.
+    :class:`~bac_py.types.constructed.BACnetLogRecord` objects are built
+    only when records are read.
+
+    When the buffer is full, :meth:`append` overwrites the oldest record
+    in O(1).  A capacity of ``0`` means the buffer grows without bound.
+
+    :param capacity: Maximum number of records, or ``0`` for unbounded.
+    :param records: Optional initial records, oldest first.
+    """
+
+    __slots__ = (
+        "_capacity",
+        "_count",
+        "_dates",
+        "_kinds",
+        "_objects",
+        "_start",
+        "_status",
+        "_times",
+        "_values",
+    )
+
+    def __init__(self, capacity: int = 0, records: Iterable[BACnetLogRecord] = ()) -> None:
+        if capacity < 0:
+            msg = f"capacity must be >= 0, got {capacity}"
+            raise ValueError(msg)
+        self._capacity = capacity
+        self._start = 0
+        self._count = 0
+        self._dates = array("I")
+        self._times = array("I")
+        self._values = array("d")
+        self._kinds = bytearray()
+        self._status = bytearray()
+        self._objects: dict[int, Any] = {}
+        for record in records:
+            self.append(record)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of records held, or ``0`` for unbounded."""
+        return self._capacity
+
+    @property
+    def full(self) -> bool:
+        """Whether the next :meth:`append` overwrites the oldest record."""
+        return self._capacity > 0 and self._count >= self._capacity
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[BACnetLogRecord]:
+        for i in range(self._count):
+            yield self._load(self._slot(i))
+
+    @overload
+    def __getitem__(self, index: int) -> BACnetLogRecord: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[BACnetLogRecord]: ...
+
+    def __getitem__(self, index: int | slice) -> BACnetLogRecord | list[BACnetLogRecord]:
+        if isinstance(index, slice):
+            return [self._load(self._slot(i)) for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            msg = "TrendLogBuffer index out of range"
+            raise IndexError(msg)
+        return self._load(self._slot(index))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TrendLogBuffer):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"TrendLogBuffer(capacity={self._capacity}, records={self._count})"
+
+    def encode(self) -> bytes:
+        """Encode the records, oldest first, as application-tagged bytes."""
+        return b"".join(encode_property_value(record) for record in self)
+
+    def append(self, record: BACnetLogRecord) -> None:
+        """Append a record, overwriting the oldest one when full.
+
+        :param record: The record to store.
+        :raises ValueError: If the timestamp cannot be encoded.
+        """
+        if self.full:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+            self._objects.pop(slot, None)
+            self._store(slot, record)
+            return
+        self._dates.append(0)
+        self._times.append(0)
+        self._values.append(0.0)
+        self._kinds.append(_DATUM_REAL)
+        self._status.append(0)
+        self._store(self._count, record)
+        self._count += 1
+
+    def timestamp_key(self, index: int) -> int:
+        """Return the sort key of the record at *index* without building it.
+
+        :param index: Logical index, 0 being the oldest record.
+        :returns: A key comparable with
+            :func:`~bac_py.objects.log_buffer.datetime_key`.
+        """
+        slot = self._slot(index)
+        return _packed_key(self._dates[slot], self._times[slot])
+
+    def clear(self) -> None:
+        """Remove all records, keeping the capacity."""
+        self._start = 0
+        self._count = 0
+        self._dates = array("I")
+        self._times = array("I")
+        self._values = array("d")
+        self._kinds = bytearray()
+        self._status = bytearray()
+        self._objects.clear()
+
+    def resize(self, capacity: int) -> None:
+        """Change the capacity, dropping the oldest records if it shrinks.
+
+        :param capacity: New maximum number of records, or ``0`` for
+            unbounded.
+        """
+        if capacity < 0:
+            msg = f"capacity must be >= 0, got {capacity}"
+            raise ValueError(msg)
+        keep = self._count if capacity == 0 else min(self._count, capacity)
+        first = self._count - keep
+        start = self._start
+        order = [self._slot(i) for i in range(first, self._count)]
+
+        def _rotate(column: Any) -> Any:
+            rotated = column[start:] + column[:start]
+            return rotated[first:]
+
+        self._dates = _rotate(self._dates)
+        self._times = _rotate(self._times)
+        self._values = _rotate(self._values)
+        self._kinds = _rotate(self._kinds)
+        self._status = _rotate(self._status)
+        self._objects = {
+            new: self._objects[old] for new, old in enumerate(order) if old in self._objects
+        }
+        self._capacity = capacity
+        self._start = 0
+        self._count = keep
+
+    def _slot(self, index: int) -> int:
+        """Map a logical index (0 = oldest) to a storage slot."""
+        if self._capacity == 0 or self._count < self._capacity:
+            return index
+        return (self._start + index) % self._capacity
+
+    def _store(self, slot: int, record: BACnetLogRecord) -> None:
+        """Write *record* into the columns at *slot*."""
+        timestamp = record.timestamp
+        self._dates[slot] = int.from_bytes(encode_date(timestamp.date))
+        self._times[slot] = int.from_bytes(encode_time(timestamp.time))
+
+        datum = record.log_datum
+        datum_type = type(datum)
+        if datum_type is float:
+            self._kinds[slot] = _DATUM_REAL
+            self._values[slot] = datum
+        elif datum_type is bool:
+            self._kinds[slot] = _DATUM_BOOL
+            self._values[slot] = float(datum)
+        elif datum_type is int and -_MAX_EXACT_INT <= datum <= _MAX_EXACT_INT:
+            self._kinds[slot] = _DATUM_INT
+            self._values[slot] = float(datum)
+        else:
+            self._kinds[slot] = _DATUM_OBJECT
+            self._values[slot] = 0.0
+            self._objects[slot] = datum
+
+        flags = record.status_flags
+        if flags is None:
+            self._status[slot] = 0
+        else:
+            self._status[slot] = (
+                _STATUS_PRESENT
+                | (flags.in_alarm << 3)
+                | (flags.fault << 2)
+                | (flags.overridden << 1)
+                | flags.out_of_service
+            )
+
+    def _load(self, slot: int) -> BACnetLogRecord:
+        """Materialize the record stored at *slot*."""
+        timestamp = BACnetDateTime(
+            date=decode_date(self._dates[slot].to_bytes(4)),
+            time=decode_time(self._times[slot].to_bytes(4)),
+        )
+        kind = self._kinds[slot]
+        datum: Any
+        if kind == _DATUM_REAL:
+            datum = self._values[slot]
+        elif kind == _DATUM_BOOL:
+            datum = bool(self._values[slot])
+        elif kind == _DATUM_INT:
+            datum = int(self._values[slot])
+        else:
+            datum = self._objects[slot]
+
+        bits = self._status[slot]
+        status_flags = None
+        if bits & _STATUS_PRESENT:
+            status_flags = StatusFlags(
+                in_alarm=bool(bits & 0x08),
+                fault=bool(bits & 0x04),
+                overridden=bool(bits & 0x02),
+                out_of_service=bool(bits & 0x01),
+            )
+        return BACnetLogRecord(timestamp=timestamp, log_datum=datum, status_flags=status_flags)
+
+
+register_property_encoder(TrendLogBuffer, lambda buffer, _iar: buffer.encode())
+
 
 @register_object_type
-class TrendLogObject(BACnetObject):
+class TrendLogObject(LogBufferMixin[TrendLogBuffer], BACnetObject):
     """BACnet Trend Log object (Clause 12.25).
 
     Provides historical data logging with buffer management.
@@ -34,6 +294,7 @@ class TrendLogObject(BACnetObject):
     """
 
     OBJECT_TYPE: ClassVar[ObjectType] = ObjectType.TREND_LOG
+    _LOG_BUFFER_TYPE = TrendLogBuffer
 
     PROPERTY_DEFINITIONS: ClassVar[dict[PropertyIdentifier, PropertyDefinition]] = {
         **standard_properties(),
@@ -139,7 +400,7 @@ class TrendLogObject(BACnetObject):
     def __init__(self, instance_number: int, **initial_properties: Any) -> None:
         super().__init__(instance_number, **initial_properties)
         self._init_status_flags()
-        self._set_default(PropertyIdentifier.LOG_BUFFER, [])
+        self._init_log_buffer()
         self._set_default(PropertyIdentifier.LOGGING_TYPE, LoggingType.POLLED)
 
     # --- Buffer management helpers ---
@@ -147,24 +408,11 @@ class TrendLogObject(BACnetObject):
     def append_record(self, record: BACnetLogRecord) -> bool:
         """Append a log record to the buffer.
 
-        Handles circular overwrite vs stop-when-full semantics.
+        Handles circular overwrite vs stop-when-full semantics.  The
+        buffer is resized first if Buffer_Size has changed.
 
         Returns:
             ``True`` if the record was appended, ``False`` if the buffer
             is full and ``stop_when_full`` is set.
         """
-        buf: list[BACnetLogRecord] = self._properties[PropertyIdentifier.LOG_BUFFER]
-        buf_size: int = self._properties.get(PropertyIdentifier.BUFFER_SIZE, 0)
-        stop_when_full: bool = self._properties.get(PropertyIdentifier.STOP_WHEN_FULL, False)
-
-        if buf_size > 0 and len(buf) >= buf_size:
-            if stop_when_full:
-                return False
-            # Circular: remove oldest
-            buf.pop(0)
-
-        buf.append(record)
-        self._properties[PropertyIdentifier.RECORD_COUNT] = len(buf)
-        total = self._properties.get(PropertyIdentifier.TOTAL_RECORD_COUNT, 0)
-        self._properties[PropertyIdentifier.TOTAL_RECORD_COUNT] = total + 1
-        return True
+        return self._append_log_record(record)
@@ -12,7 +12,8 @@ from bac_py.objects.base import (
     standard_properties,
     status_properties,
 )
-from bac_py.types.constructed import BACnetDateTime
+from bac_py.objects.log_buffer import LogBufferMixin, LogRecordBuffer
+from bac_py.types.constructed import BACnetDateTime, BACnetLogMultipleRecord
 from bac_py.types.enums import (
     LoggingType,
     ObjectType,
@@ -21,7 +22,7 @@ from bac_py.types.enums import (
 
 
 @register_object_type
-class TrendLogMultipleObject(BACnetObject):
+class TrendLogMultipleObject(LogBufferMixin[LogRecordBuffer], BACnetObject):
     """BACnet Trend Log Multiple object (Clause 12.30).
 
     Logs multiple properties simultaneously per sampling interval.
@@ -135,4 +136,16 @@ class TrendLogMultipleObject(BACnetObject):
     def __init__(self, instance_number: int, **initial_properties: Any) -> None:
         super().__init__(instance_number, **initial_properties)
         self._init_status_flags()
-        self._set_default(PropertyIdentifier.LOG_BUFFER, [])
+        self._init_log_buffer()
+
+    def append_record(self, record: BACnetLogMultipleRecord) -> bool:
+        """Append a log record to the buffer.
+
+        Handles circular overwrite vs stop-when-full semantics.  The
+        buffer is resized first if Buffer_Size has changed.
+
+        Returns:
+            ``True`` if the record was appended, ``False`` if the buffer
+            is full and ``stop_when_full`` is set.
+        """
+        return self._append_log_record(record)
@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from bac_py.services.errors import BACnetRejectError
 from bac_py.types.enums import RejectReason
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Coroutine, Generator
 
     from bac_py.network.address import BACnetAddress
 
@@ -27,40 +27,133 @@ type UnconfirmedHandler = Callable[
 ]
 
 
+def run_eagerly[T](coro: Coroutine[Any, Any, T]) -> tuple[bool, T | Coroutine[Any, Any, T]]:
+    """Run *coro* synchronously until it completes or first suspends.
+
+    Lets handlers that never wait on I/O finish on the receive path
+    without the cost of a task.  Exceptions raised before the first
+    suspension propagate to the caller.
+
+    :param coro: A coroutine that has not been started.
+    :returns: ``(True, result)`` if *coro* completed, otherwise
+        ``(False, rest)`` where awaiting the coroutine *rest* (typically
+        in a new task) resumes *coro* and returns its result.
+    """
+    try:
+        yielded = coro.send(None)
+    except StopIteration as stop:
+        return True, stop.value
+    return False, _resume(coro, yielded)
+
+
+class _Resume[T]:
+    """Awaitable that drives a suspended coroutine to completion."""
+
+    __slots__ = ("_coro", "_yielded")
+
+    def __init__(self, coro: Coroutine[Any, Any, T], yielded: Any) -> None:
+        self._coro = coro
+        self._yielded = yielded
+
+    def __await__(self) -> Generator[Any, Any, T]:
+        coro = self._coro
+        yielded = self._yielded
+        while True:
+            try:
+                sent = yield yielded
+            except GeneratorExit:
+                coro.close()
+                raise
+            except BaseException as exc:
+                try:
+                    yielded = coro.throw(exc)
+                except StopIteration as stop:
+                    return stop.value  # type: ignore[no-any-return]
+            else:
+                try:
+                    yielded = coro.send(sent)
+                except StopIteration as stop:
+                    return stop.value  # type: ignore[no-any-return]
+
+
+async def _resume[T](coro: Coroutine[Any, Any, T], yielded: Any) -> T:
+    return await _Resume(coro, yielded)
+
+
 class ServiceRegistry:
     """Registry for BACnet service request handlers.
 
     Maps service choice numbers to handler coroutines for both
     confirmed and unconfirmed services.
+
+    Handlers registered with ``inline=True`` are expected to complete
+    without suspending, as handlers that only touch the local object
+    database do.  The application runs them directly on the receive path
+    (see :func:`run_eagerly`) instead of creating a task per request; one
+    that does suspend is moved to a task at that point.
     """
 
     def __init__(self) -> None:
         self._confirmed: dict[int, ConfirmedHandler] = {}
         self._unconfirmed: dict[int, UnconfirmedHandler] = {}
+        self._inline_confirmed: set[int] = set()
+        self._inline_unconfirmed: set[int] = set()
 
     def register_confirmed(
         self,
         service_choice: int,
         handler: ConfirmedHandler,
+        *,
+        inline: bool = False,
     ) -> None:
         """Register a handler for a confirmed service.
 
         :param service_choice: Confirmed service choice number.
         :param handler: Async handler coroutine.
+        :param inline: Whether *handler* normally completes without
+            suspending and may run on the receive path.
         """
         self._confirmed[service_choice] = handler
+        if inline:
+            self._inline_confirmed.add(service_choice)
+        else:
+            self._inline_confirmed.discard(service_choice)
 
     def register_unconfirmed(
         self,
         service_choice: int,
         handler: UnconfirmedHandler,
+        *,
+        inline: bool = False,
     ) -> None:
         """Register a handler for an unconfirmed service.
 
         :param service_choice: Unconfirmed service choice number.
         :param handler: Async handler coroutine.
+        :param inline: Whether *handler* normally completes without
+            suspending and may run on the receive path.
         """
         self._unconfirmed[service_choice] = handler
+        if inline:
+            self._inline_unconfirmed.add(service_choice)
+        else:
+            self._inline_unconfirmed.discard(service_choice)
+
+    def is_inline_confirmed(self, service_choice: int) -> bool:
+        """Check whether a confirmed service's handler was registered inline.
+
+        :param service_choice: Confirmed service choice number.
+        :returns: ``True`` if the handler may run on the receive path.
+        """
+        return service_choice in self._inline_confirmed
+
+    def is_inline_unconfirmed(self, service_choice: int) -> bool:
+        """Check whether an unconfirmed service's handler was registered inline.
+
+        :param service_choice: Unconfirmed service choice number.
+        :returns: ``True`` if the handler may run on the receive path.
+        """
+        return service_choice in self._inline_unconfirmed
 
     async def dispatch_confirmed(
         self,
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any
 
 from bac_py.encoding.primitives import (
+    decode_bit_string,
     decode_boolean,
     decode_character_string,
     decode_object_identifier,
+    decode_real,
     decode_unsigned,
     encode_boolean,
     encode_character_string,
@@ -23,8 +26,9 @@ from bac_py.encoding.tags import (
     decode_tag,
     encode_closing_tag,
     encode_opening_tag,
+    extract_context_value,
 )
-from bac_py.types.constructed import BACnetTimeStamp
+from bac_py.types.constructed import BACnetDateTime, BACnetTimeStamp, _decode_log_timestamp
 from bac_py.types.enums import (
     EventState,
     EventType,
@@ -225,6 +229,68 @@ class EventNotificationRequest:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class BACnetEventLogRecord:
+    """BACnet EventLogRecord for EventLog.Log_Buffer (Clause 12.27).
+
+    ::
+
+        BACnetEventLogRecord ::= SEQUENCE {
+            timestamp [0] BACnetDateTime,
+            log-datum [1] CHOICE {
+                log-status   [0] BACnetLogStatus,
+                notification [1] ConfirmedEventNotification-Request,
+                time-change  [2] REAL
+            }
+        }
+    """
+
+    timestamp: BACnetDateTime
+    """When the entry was logged."""
+
+    log_datum: Any
+    """An :class:`EventNotificationRequest` for ``notification``, a
+    :class:`~bac_py.types.primitives.BitString` for ``log-status``, or a
+    float for ``time-change``."""
+
+    @classmethod
+    def decode(cls, data: memoryview | bytes, offset: int = 0) -> tuple[BACnetEventLogRecord, int]:
+        """Decode one record from a Log_Buffer or ReadRange item list.
+
+        :param data: Buffer to decode from.
+        :param offset: Starting byte offset.
+        :returns: Tuple of (decoded :class:`BACnetEventLogRecord`, new offset).
+        :raises ValueError: If the data is not an event log record.
+        """
+        data = as_memoryview(data)
+        timestamp, offset = _decode_log_timestamp(data, offset)
+        tag, offset = decode_tag(data, offset)
+        if not (tag.is_opening and tag.number == 1):
+            msg = f"Expected opening tag 1 for log-datum, got {tag}"
+            raise ValueError(msg)
+
+        tag, offset = decode_tag(data, offset)
+        log_datum: Any
+        if tag.is_opening and tag.number == 1:
+            enclosed, offset = extract_context_value(data, offset, 1)
+            log_datum = EventNotificationRequest.decode(enclosed)
+        elif tag.number == 0 and not tag.is_opening:
+            log_datum = decode_bit_string(data[offset : offset + tag.length])
+            offset += tag.length
+        elif tag.number == 2 and not tag.is_opening:
+            log_datum = decode_real(data[offset : offset + tag.length])
+            offset += tag.length
+        else:
+            msg = f"Invalid event log-datum choice: {tag}"
+            raise ValueError(msg)
+
+        closing, offset = decode_tag(data, offset)
+        if not (closing.is_closing and closing.number == 1):
+            msg = "Expected closing tag 1 after log-datum"
+            raise ValueError(msg)
+        return cls(timestamp=timestamp, log_datum=log_datum), offset
+
+
 @dataclass(frozen=True, slots=True)
 class AcknowledgeAlarmRequest:
     """AcknowledgeAlarm-Request per Clause 13.5.1.
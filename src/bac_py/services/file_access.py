@@ -6,6 +6,7 @@ AtomicReadFile (Clause 14.1), AtomicWriteFile (Clause 14.2).
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from bac_py.encoding.primitives import (
     decode_object_identifier,
@@ -20,10 +21,29 @@ from bac_py.encoding.primitives import (
     encode_context_tagged,
     encode_signed,
 )
-from bac_py.encoding.tags import as_memoryview, decode_tag, encode_closing_tag, encode_opening_tag
+from bac_py.encoding.tags import (
+    TagClass,
+    as_memoryview,
+    decode_tag,
+    encode_closing_tag,
+    encode_opening_tag,
+    encode_tag,
+)
 from bac_py.types.enums import ObjectType
 from bac_py.types.primitives import ObjectIdentifier
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_TAG_OCTET_STRING = 6
+
+
+def _extend_octet_string(buf: bytearray, value: bytes | memoryview) -> None:
+    """Append an application-tagged Octet String without an interim copy."""
+    buf.extend(encode_tag(_TAG_OCTET_STRING, TagClass.APPLICATION, len(value)))
+    buf.extend(value)
+
+
 # --- AtomicReadFile ---
 
 
@@ -145,7 +165,7 @@ class StreamReadACK:
     """Stream access result for AtomicReadFile-ACK."""
 
     file_start_position: int
-    file_data: bytes
+    file_data: bytes | memoryview
 
 
 @dataclass(frozen=True, slots=True)
@@ -154,7 +174,7 @@ class RecordReadACK:
 
     file_start_record: int
     returned_record_count: int
-    file_record_data: list[bytes]
+    file_record_data: Sequence[bytes | memoryview]
 
 
 @dataclass(frozen=True, slots=True)
@@ -193,14 +213,14 @@ class AtomicReadFileACK:
         if isinstance(self.access_method, StreamReadACK):
             buf.extend(encode_opening_tag(0))
             buf.extend(encode_application_signed(self.access_method.file_start_position))
-            buf.extend(encode_application_octet_string(self.access_method.file_data))
+            _extend_octet_string(buf, self.access_method.file_data)
             buf.extend(encode_closing_tag(0))
         else:
             buf.extend(encode_opening_tag(1))
             buf.extend(encode_application_signed(self.access_method.file_start_record))
             buf.extend(encode_application_unsigned(self.access_method.returned_record_count))
             for record in self.access_method.file_record_data:
-                buf.extend(encode_application_octet_string(record))
+                _extend_octet_string(buf, record)
             buf.extend(encode_closing_tag(1))
         return bytes(buf)
 
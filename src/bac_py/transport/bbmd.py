@@ -8,9 +8,11 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import heapq
 import json
 import logging
 import time
+from collections.abc import MutableMapping
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
@@ -19,7 +21,7 @@ from bac_py.transport.bvll import encode_bvll
 from bac_py.types.enums import BvlcFunction, BvlcResultCode
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, ItemsView, Iterator, KeysView, Sequence, ValuesView
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -80,6 +82,142 @@ class FDTEntry:
         return min(65535, max(0, int(self.expiry - time.monotonic())))
 
 
+@dataclass
+class BBMDFanoutStats:
+    """Broadcast fan-out counters for a :class:`BBMDManager`."""
+
+    broadcasts: int = 0
+    """Broadcasts wrapped in a Forwarded-NPDU and fanned out."""
+
+    peer_datagrams: int = 0
+    """Forwarded-NPDUs sent to BDT peers."""
+
+    fd_datagrams: int = 0
+    """Forwarded-NPDUs sent to registered foreign devices."""
+
+    max_fanout: int = 0
+    """Most destinations reached by a single broadcast."""
+
+    send_errors: int = 0
+    """Destinations the batched send reported as failed."""
+
+    fanout_time: float = 0.0
+    """Cumulative seconds spent sending fan-out datagrams."""
+
+    expired_entries: int = 0
+    """FDT entries purged because their TTL and grace period elapsed."""
+
+
+class ForeignDeviceTable(MutableMapping[BIPAddress, FDTEntry]):
+    """Foreign Device Table indexed for broadcast fan-out and expiry.
+
+    Behaves as a mapping of :class:`BIPAddress` to :class:`FDTEntry`.
+    Alongside the mapping it keeps a dense list of registered addresses
+    and their ``(host, port)`` socket addresses, ready to hand to a
+    batched send, plus the slot of each address in that list so a sender
+    can be excluded in O(1).  Expiry times are kept in a min-heap so
+    purging only touches entries that are actually due.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[BIPAddress, FDTEntry] = {}
+        self._slots: dict[BIPAddress, int] = {}
+        self._targets: list[BIPAddress] = []
+        self._sockaddrs: list[tuple[str, int]] = []
+        self._heap: list[tuple[float, int, BIPAddress]] = []
+        self._sequence = 0
+
+    def __getitem__(self, address: BIPAddress) -> FDTEntry:
+        return self._entries[address]
+
+    def __setitem__(self, address: BIPAddress, entry: FDTEntry) -> None:
+        if address not in self._entries:
+            self._slots[address] = len(self._targets)
+            self._targets.append(address)
+            self._sockaddrs.append((address.host, address.port))
+        self._entries[address] = entry
+        self._push_expiry(entry.expiry, address)
+
+    def __delitem__(self, address: BIPAddress) -> None:
+        del self._entries[address]
+        # Swap-remove keeps the target lists dense without shifting.
+        slot = self._slots.pop(address)
+        last = len(self._targets) - 1
+        if slot != last:
+            moved = self._targets[last]
+            self._targets[slot] = moved
+            self._sockaddrs[slot] = self._sockaddrs[last]
+            self._slots[moved] = slot
+        self._targets.pop()
+        self._sockaddrs.pop()
+
+    def __contains__(self, address: object) -> bool:
+        return address in self._entries
+
+    def __iter__(self) -> Iterator[BIPAddress]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def keys(self) -> KeysView[BIPAddress]:
+        """Return the registered foreign device addresses."""
+        return self._entries.keys()
+
+    def values(self) -> ValuesView[FDTEntry]:
+        """Return the :class:`FDTEntry` objects in registration order."""
+        return self._entries.values()
+
+    def items(self) -> ItemsView[BIPAddress, FDTEntry]:
+        """Return ``(address, entry)`` pairs in registration order."""
+        return self._entries.items()
+
+    @property
+    def targets(self) -> list[BIPAddress]:
+        """Registered addresses in fan-out order (do not mutate)."""
+        return self._targets
+
+    @property
+    def sockaddrs(self) -> list[tuple[str, int]]:
+        """``(host, port)`` of each entry in :attr:`targets` (do not mutate)."""
+        return self._sockaddrs
+
+    def slot(self, address: BIPAddress) -> int:
+        """Return the index of *address* in :attr:`targets`, or ``-1``."""
+        return self._slots.get(address, -1)
+
+    def pop_expired(self, now: float) -> list[BIPAddress]:
+        """Remove and return the addresses whose expiry is at or before *now*.
+
+        Heap records left behind by re-registrations (which push a new
+        expiry) are recognized as stale and discarded.
+        """
+        heap = self._heap
+        entries = self._entries
+        expired: list[BIPAddress] = []
+        while heap and heap[0][0] <= now:
+            expiry, _, address = heapq.heappop(heap)
+            entry = entries.get(address)
+            if entry is not None and entry.expiry == expiry:
+                del self[address]
+                expired.append(address)
+        return expired
+
+    def _push_expiry(self, expiry: float, address: BIPAddress) -> None:
+        heap = self._heap
+        self._sequence += 1
+        heapq.heappush(heap, (expiry, self._sequence, address))
+        # Periodic re-registration leaves one stale record per refresh;
+        # rebuild once they outnumber the live entries.
+        if len(heap) > 2 * len(self._entries) + 64:
+            self._heap = [
+                (entry.expiry, seq, addr)
+                for seq, (addr, entry) in enumerate(self._entries.items(), self._sequence + 1)
+            ]
+            self._sequence += len(self._entries)
+            heapq.heapify(self._heap)
+
+
 def _encode_bvlc_result(result_code: BvlcResultCode) -> bytes:
     """Encode a BVLC-Result message."""
     return encode_bvll(BvlcFunction.BVLC_RESULT, result_code.to_bytes(2, "big"))
@@ -132,6 +270,7 @@ class BBMDManager:
         global_address: BIPAddress | None = None,
         bdt_backup_path: Path | None = None,
         fdt_cleanup_interval: float = 10.0,
+        send_many_callback: Callable[[bytes, Sequence[tuple[str, int]], int], int] | None = None,
     ) -> None:
         """Initialize BBMD manager.
 
@@ -173,6 +312,15 @@ class BBMDManager:
         :param fdt_cleanup_interval: How often (in seconds) the FDT cleanup
             loop runs to purge expired foreign device entries.
             Defaults to 10 seconds.
+        :param send_many_callback: Optional batched send called with
+            ``(raw_bytes, destinations, exclude)``, where *destinations*
+            is a sequence of ``(host, port)`` socket addresses and
+            *exclude* is the index of one to skip (``-1`` for none), and
+            returning the number of destinations that failed.  When set,
+            each broadcast is fanned out with one call for the BDT peers
+            and one for the foreign devices, sharing a single prebuilt
+            Forwarded-NPDU, instead of one *send_callback* call per
+            destination.
         """
         self._local_address = local_address
         self._send = send_callback
@@ -189,7 +337,9 @@ class BBMDManager:
         self._bdt_forward_cache: list[BIPAddress] = []
         self._bdt_unicast_mask: dict[BIPAddress, bool] = {}
         self._bdt_peers: list[tuple[BDTEntry, BIPAddress]] = []
-        self._fdt: dict[BIPAddress, FDTEntry] = {}
+        self._send_many = send_many_callback
+        self._fdt = ForeignDeviceTable()
+        self._fanout_stats = BBMDFanoutStats()
         self._cleanup_task: asyncio.Task[None] | None = None
 
     @property
@@ -200,7 +350,12 @@ class BBMDManager:
     @property
     def fdt(self) -> dict[BIPAddress, FDTEntry]:
         """Current Foreign Device Table."""
-        return dict(self._fdt)
+        return dict(self._fdt.items())
+
+    @property
+    def fanout_stats(self) -> BBMDFanoutStats:
+        """Live broadcast fan-out counters."""
+        return self._fanout_stats
 
     @property
     def accept_fd_registrations(self) -> bool:
@@ -410,10 +565,7 @@ class BBMDManager:
         )
 
         # B3: Forward to all FDs except the originating device.
-        for fd in self._fdt.values():
-            if fd.address == originating_source:
-                continue
-            self._send(forwarded, fd.address)
+        self._fan_out(forwarded, [], exclude_fd=originating_source)
 
         # B1: Re-broadcast on the local wire when the Forwarded-NPDU
         # arrived via unicast (BDT all-ones mask for this peer).
@@ -482,20 +634,65 @@ class BBMDManager:
         )
 
         # Forward to BDT peers (self already excluded in _bdt_peers)
-        for _entry, dest in self._bdt_peers:
+        peers = [
+            dest
+            for _entry, dest in self._bdt_peers
             # B2: Don't forward back to the originating source.
-            if dest == originating_source:
-                continue
             # F1: Don't forward to our own global/NAT address (loop prevention).
-            if self._global_address is not None and dest == self._global_address:
-                continue
-            self._send(forwarded, dest)
+            if dest != originating_source and dest != self._global_address
+        ]
 
         # Forward to registered foreign devices
-        for fd in self._fdt.values():
-            if exclude_fd is not None and fd.address == exclude_fd:
-                continue
-            self._send(forwarded, fd.address)
+        self._fan_out(forwarded, peers, exclude_fd=exclude_fd)
+
+    def _fan_out(
+        self,
+        forwarded: bytes,
+        peers: list[BIPAddress],
+        *,
+        exclude_fd: BIPAddress | None = None,
+    ) -> None:
+        """Send one prebuilt Forwarded-NPDU to *peers* and all foreign devices.
+
+        The sending foreign device, if any, is skipped by its slot in the
+        FDT target list.  With a ``send_many_callback`` the peers and the
+        foreign devices are one batched send each, and the FDT address
+        list is passed as is with the slot to skip; otherwise
+        *send_callback* is called once per destination.
+
+        :param forwarded: Encoded Forwarded-NPDU frame.
+        :param peers: BDT forward addresses to send to.
+        :param exclude_fd: Optional foreign device to exclude (the sender).
+        """
+        fdt = self._fdt
+        slot = fdt.slot(exclude_fd) if exclude_fd is not None else -1
+        stats = self._fanout_stats
+        start = time.perf_counter()
+
+        if self._send_many is not None:
+            send_many = self._send_many
+            if peers:
+                stats.send_errors += send_many(forwarded, [(p.host, p.port) for p in peers], -1)
+            fd_dests = fdt.sockaddrs
+            fd_count = len(fd_dests) - (slot >= 0)
+            if fd_count:
+                stats.send_errors += send_many(forwarded, fd_dests, slot)
+        else:
+            fd_targets = fdt.targets
+            if slot >= 0:
+                fd_targets = fd_targets[:slot] + fd_targets[slot + 1 :]
+            send = self._send
+            for dest in peers:
+                send(forwarded, dest)
+            for dest in fd_targets:
+                send(forwarded, dest)
+            fd_count = len(fd_targets)
+
+        stats.broadcasts += 1
+        stats.peer_datagrams += len(peers)
+        stats.fd_datagrams += fd_count
+        stats.max_fanout = max(stats.max_fanout, len(peers) + fd_count)
+        stats.fanout_time += time.perf_counter() - start
 
     # --- Foreign device registration ---
 
@@ -656,11 +853,10 @@ class BBMDManager:
 
     def _purge_expired_fdt_entries(self) -> None:
         """Remove FDT entries whose TTL + grace period has elapsed."""
-        now = time.monotonic()
-        expired = [addr for addr, fd in self._fdt.items() if fd.expiry <= now]
+        expired = self._fdt.pop_expired(time.monotonic())
         for addr in expired:
-            del self._fdt[addr]
             logger.info("Purged expired FDT entry for %s:%d", addr.host, addr.port)
+        self._fanout_stats.expired_entries += len(expired)
 
     # --- BDT persistence ---
 
@@ -5,7 +5,9 @@ from __future__ import annotations
 import asyncio
 import logging
 import socket
-from typing import TYPE_CHECKING
+from collections import deque
+from itertools import chain, islice
+from typing import TYPE_CHECKING, Any
 
 from bac_py.network.address import BIPAddress, _cached_bip_address
 from bac_py.transport.bbmd import BDT_ENTRY_SIZE, FDT_ENTRY_SIZE, BBMDManager, BDTEntry, FDTEntry
@@ -14,7 +16,7 @@ from bac_py.transport.foreign_device import ForeignDeviceManager
 from bac_py.types.enums import BvlcFunction, BvlcResultCode
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
 
 logger = logging.getLogger(__name__)
 _DEBUG = logging.DEBUG
@@ -127,6 +129,183 @@ class _UDPProtocol(asyncio.DatagramProtocol):
             self._connection_lost_callback(exc)
 
 
+# Largest UDP payload; BVLL frames are far smaller but an oversized datagram
+# must be received whole so it is rejected by decode_bvll, not truncated.
+_RECV_BUFFER_SIZE = 65535
+
+# Default maximum datagrams drained from the socket per readiness callback.
+DEFAULT_BATCH_SIZE = 64
+
+
+class _BatchedUDPTransport:
+    """Non-blocking UDP socket that drains and flushes datagrams in batches.
+
+    Replaces the :class:`~asyncio.DatagramTransport` from
+    ``loop.create_datagram_endpoint``, which performs one ``recvfrom`` per
+    event-loop readiness callback.  Here a single callback drains up to
+    *batch_size* datagrams into a reusable buffer before returning to the
+    selector.  Sends go straight to the socket; datagrams that hit a full
+    socket buffer are queued and flushed together once it is writable.
+
+    Only the subset of the ``DatagramTransport`` API used by
+    :class:`BIPTransport` is implemented.
+    """
+
+    def __init__(
+        self,
+        sock: socket.socket,
+        loop: asyncio.AbstractEventLoop,
+        callback: Callable[[bytes, tuple[str, int]], None],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        self._sock: socket.socket | None = sock
+        self._fileno = sock.fileno()
+        self._loop = loop
+        self._callback = callback
+        self._batch_size = batch_size
+        self._buffer = bytearray(_RECV_BUFFER_SIZE)
+        self._view = memoryview(self._buffer)
+        self._send_queue: deque[tuple[bytes, tuple[str, int]]] = deque()
+        self._writer_registered = False
+        # Raises NotImplementedError on loops without add_reader (Proactor).
+        loop.add_reader(self._fileno, self._read_ready)
+
+    def get_extra_info(self, name: str, default: Any = None) -> Any:
+        """Return ``"socket"`` or ``"sockname"`` info like an asyncio transport."""
+        if self._sock is None:
+            return default
+        if name == "socket":
+            return self._sock
+        if name == "sockname":
+            return self._sock.getsockname()
+        return default
+
+    def is_closing(self) -> bool:
+        """Return ``True`` once :meth:`close` has been called."""
+        return self._sock is None
+
+    def sendto(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Send a datagram, queueing it if the socket buffer is full."""
+        sock = self._sock
+        if sock is None:
+            return
+        if not self._send_queue:
+            try:
+                sock.sendto(data, addr)
+                return
+            except (BlockingIOError, InterruptedError):
+                pass
+            except OSError as exc:
+                logger.warning("UDP transport error: %s", exc)
+                return
+        self._send_queue.append((bytes(data), addr))
+        if not self._writer_registered:
+            self._loop.add_writer(self._fileno, self._write_ready)
+            self._writer_registered = True
+
+    def sendmany(self, data: bytes, addrs: Sequence[tuple[str, int]], exclude: int = -1) -> int:
+        """Send one datagram to many destinations in a single pass.
+
+        Destinations that do not fit in the socket buffer are queued,
+        sharing one copy of *data*, and flushed once it is writable.
+
+        :param exclude: Index of a destination in *addrs* to skip, or
+            ``-1``.  Saves the caller copying the list to leave one out.
+        :returns: The number of destinations that failed with an error.
+        """
+        skip = 0 <= exclude < len(addrs)
+        targets: Iterator[tuple[str, int]] = iter(addrs)
+        if skip:
+            targets = chain(islice(addrs, exclude), islice(addrs, exclude + 1, None))
+        sock = self._sock
+        if sock is None:
+            return len(addrs) - skip
+        failed = 0
+        if not self._send_queue:
+            sendto = sock.sendto
+            error: OSError | None = None
+            blocked: tuple[str, int] | None = None
+            for addr in targets:
+                try:
+                    sendto(data, addr)
+                except (BlockingIOError, InterruptedError):
+                    blocked = addr
+                    break
+                except OSError as exc:
+                    failed += 1
+                    error = exc
+            if error is not None:
+                logger.warning(
+                    "UDP transport error on %d of %d destinations: %s", failed, len(addrs), error
+                )
+            if blocked is None:
+                return failed
+            targets = chain((blocked,), targets)
+        data = bytes(data)
+        self._send_queue.extend((data, addr) for addr in targets)
+        if not self._writer_registered:
+            self._loop.add_writer(self._fileno, self._write_ready)
+            self._writer_registered = True
+        return failed
+
+    def close(self) -> None:
+        """Stop reading, flush what the socket accepts, and close it."""
+        sock = self._sock
+        if sock is None:
+            return
+        self._loop.remove_reader(self._fileno)
+        if self._send_queue:
+            self._write_ready()
+        if self._writer_registered:
+            self._loop.remove_writer(self._fileno)
+            self._writer_registered = False
+        if self._send_queue:
+            logger.debug("Dropped %d queued datagrams on close", len(self._send_queue))
+            self._send_queue.clear()
+        self._sock = None
+        sock.close()
+
+    def _read_ready(self) -> None:
+        """Drain up to *batch_size* datagrams from the socket."""
+        recvfrom_into = self._sock.recvfrom_into  # type: ignore[union-attr]
+        buffer = self._buffer
+        view = self._view
+        callback = self._callback
+        for _ in range(self._batch_size):
+            try:
+                nbytes, addr = recvfrom_into(buffer)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                # ICMP errors (e.g. port unreachable) surface on the next
+                # receive; report and keep draining like error_received.
+                logger.warning("UDP transport error: %s", exc)
+                continue
+            try:
+                callback(bytes(view[:nbytes]), addr)
+            except Exception:
+                logger.warning("Error processing datagram from %s", addr, exc_info=True)
+            if self._sock is None:
+                return  # Closed by the callback
+
+    def _write_ready(self) -> None:
+        """Flush queued datagrams until the socket buffer fills again."""
+        sock = self._sock
+        queue = self._send_queue
+        while queue and sock is not None:
+            data, addr = queue[0]
+            try:
+                sock.sendto(data, addr)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                logger.warning("UDP transport error: %s", exc)
+            queue.popleft()
+        if self._writer_registered:
+            self._loop.remove_writer(self._fileno)
+            self._writer_registered = False
+
+
 class BIPTransport:
     """BACnet/IP transport using asyncio UDP.
 
@@ -142,6 +321,9 @@ class BIPTransport:
         multicast_enabled: bool = False,
         multicast_address: str = "239.255.186.192",
         multicast_ttl: int = 32,
+        batched_io: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        reuse_port: bool = False,
     ) -> None:
         """Initialize the BACnet/IP transport.
 
@@ -152,15 +334,32 @@ class BIPTransport:
         :param multicast_enabled: Enable IPv4 multicast per Annex J.8.
         :param multicast_address: Multicast group address (default ``239.255.186.192``).
         :param multicast_ttl: Multicast TTL (hop limit). Defaults to 32.
+        :param batched_io: Drive the socket directly from the event loop's
+            selector and drain up to *batch_size* datagrams per wakeup
+            instead of one.  Reduces per-packet overhead under broadcast
+            storms.  Falls back to the standard datagram endpoint on event
+            loops without ``add_reader`` (e.g. the Windows proactor).
+        :param batch_size: Maximum datagrams received per readiness
+            callback when *batched_io* is enabled.
+        :param reuse_port: Set ``SO_REUSEPORT`` so several processes can
+            bind the same port and the kernel spreads unicast traffic
+            between them (see :mod:`bac_py.app.sharding`).
         """
+        if batch_size < 1:
+            msg = f"batch_size must be >= 1, got {batch_size}"
+            raise ValueError(msg)
         self._interface = interface
         self._port = port
         self._broadcast_address = broadcast_address
         self._multicast_enabled = multicast_enabled
         self._multicast_address = multicast_address
         self._multicast_ttl = multicast_ttl
+        self._batched_io = batched_io
+        self._batch_size = batch_size
+        self._reuse_port = reuse_port
+        self._receive_filter: Callable[[bytes, tuple[str, int]], bool] | None = None
         self._protocol: _UDPProtocol | None = None
-        self._transport: asyncio.DatagramTransport | None = None
+        self._transport: asyncio.DatagramTransport | _BatchedUDPTransport | None = None
         self._receive_callback: Callable[[bytes, bytes], None] | None = None
         self._local_address: BIPAddress | None = None
         self._bbmd: BBMDManager | None = None
@@ -174,16 +373,18 @@ class BIPTransport:
         if self._transport is not None:
             return  # Already started
         loop = asyncio.get_running_loop()
-        transport, protocol = await loop.create_datagram_endpoint(
-            lambda: _UDPProtocol(self._on_datagram_received, self._on_connection_lost),
-            local_addr=(self._interface, self._port),
-            allow_broadcast=True,
-        )
-        self._transport = transport
-        self._protocol = protocol
+        if not (self._batched_io and self._start_batched(loop)):
+            transport, protocol = await loop.create_datagram_endpoint(
+                lambda: _UDPProtocol(self._on_datagram_received, self._on_connection_lost),
+                local_addr=(self._interface, self._port),
+                allow_broadcast=True,
+                reuse_port=self._reuse_port or None,
+            )
+            self._transport = transport
+            self._protocol = protocol
 
         # Discover actual bound address
-        sock = self._transport.get_extra_info("socket")
+        sock = self._transport.get_extra_info("socket")  # type: ignore[union-attr]
         addr: tuple[str, int] = sock.getsockname()
         host = addr[0]
         # Update port to actual bound value (matters when port=0 was passed
@@ -207,7 +408,42 @@ class BIPTransport:
             except OSError:
                 logger.warning("Failed to join multicast group %s", self._multicast_address)
 
-        logger.info("BIPTransport started on %s:%d", host, addr[1])
+        logger.info(
+            "BIPTransport started on %s:%d%s",
+            host,
+            addr[1],
+            " (batched I/O)" if self.batched_io else "",
+        )
+
+    def _start_batched(self, loop: asyncio.AbstractEventLoop) -> bool:
+        """Bind a non-blocking socket and attach a :class:`_BatchedUDPTransport`.
+
+        :returns: ``False`` if the event loop cannot watch raw sockets, in
+            which case the caller uses the standard datagram endpoint.
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            if self._reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.setblocking(False)
+            sock.bind((self._interface, self._port))
+            self._transport = _BatchedUDPTransport(
+                sock, loop, self._on_datagram_received, self._batch_size
+            )
+        except NotImplementedError:
+            sock.close()
+            logger.warning("Event loop does not support add_reader; batched I/O disabled")
+            return False
+        except BaseException:
+            sock.close()
+            raise
+        return True
+
+    @property
+    def batched_io(self) -> bool:
+        """Whether the running transport drains datagrams in batches."""
+        return isinstance(self._transport, _BatchedUDPTransport)
 
     async def stop(self) -> None:
         """Close UDP socket and stop BBMD/foreign device if attached."""
@@ -248,6 +484,31 @@ class BIPTransport:
         """
         self._receive_callback = callback
 
+    def set_receive_filter(
+        self, receive_filter: Callable[[bytes, tuple[str, int]], bool] | None
+    ) -> None:
+        """Install a hook that sees every raw datagram before BVLL decoding.
+
+        Used by :class:`~bac_py.app.sharding.ShardWorker` to hand traffic
+        to another process.
+
+        :param receive_filter: Called with ``(datagram, (host, port))``;
+            returning ``True`` consumes the datagram.  ``None`` removes
+            the filter.
+        """
+        self._receive_filter = receive_filter
+
+    def inject_datagram(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Process a datagram as if it had arrived on this socket.
+
+        The receive filter is bypassed.  Replies go out through this
+        transport to *addr*.
+
+        :param data: Complete BVLL datagram.
+        :param addr: ``(host, port)`` of the original sender.
+        """
+        self._process_datagram(data, addr)
+
     def send_unicast(self, npdu: bytes, mac_address: bytes) -> None:
         """Send a directed message (Original-Unicast-NPDU).
 
@@ -323,7 +584,12 @@ class BIPTransport:
         """The attached BBMD manager, or ``None`` if not configured."""
         return self._bbmd
 
-    async def attach_bbmd(self, bdt_entries: list[BDTEntry] | None = None) -> BBMDManager:
+    async def attach_bbmd(
+        self,
+        bdt_entries: list[BDTEntry] | None = None,
+        *,
+        max_fdt_entries: int = 128,
+    ) -> BBMDManager:
         """Attach a BBMD manager to this transport.
 
         Creates and starts a :class:`BBMDManager` integrated with this
@@ -336,6 +602,8 @@ class BIPTransport:
 
         :param bdt_entries: Optional initial BDT entries.  If ``None``,
             the BBMD starts with an empty BDT.
+        :param max_fdt_entries: Maximum number of registered foreign
+            devices.
         :returns: The attached :class:`BBMDManager` instance.
         :raises RuntimeError: If transport not started or BBMD already attached.
         """
@@ -351,6 +619,8 @@ class BIPTransport:
             send_callback=self._send_raw,
             local_broadcast_callback=self._bbmd_local_deliver,
             broadcast_address=BIPAddress(host=self._broadcast_address, port=self._port),
+            max_fdt_entries=max_fdt_entries,
+            send_many_callback=self._send_raw_many,
         )
         if bdt_entries:
             self._bbmd.set_bdt(bdt_entries)
@@ -596,6 +866,28 @@ class BIPTransport:
         if self._transport is not None:
             self._transport.sendto(data, (destination.host, destination.port))
 
+    def _send_raw_many(
+        self, data: bytes, destinations: Sequence[tuple[str, int]], exclude: int = -1
+    ) -> int:
+        """Send the same raw BVLL data to many ``(host, port)`` destinations.
+
+        Used as the batched send callback for :class:`BBMDManager`
+        broadcast fan-out.
+
+        :param exclude: Index in *destinations* to skip, or ``-1``.
+        :returns: The number of destinations that failed.
+        """
+        transport = self._transport
+        if transport is None:
+            return len(destinations)
+        if isinstance(transport, _BatchedUDPTransport):
+            return transport.sendmany(data, destinations, exclude)
+        sendto = transport.sendto
+        for index, addr in enumerate(destinations):
+            if index != exclude:
+                sendto(data, addr)
+        return 0
+
     def _bbmd_local_deliver(self, npdu: bytes, source: BIPAddress) -> None:
         """Deliver an NPDU to the local receive callback (BBMD callback).
 
@@ -625,6 +917,16 @@ class BIPTransport:
     def _on_datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
         """Process incoming UDP datagram.
 
+        Offers the datagram to the receive filter, if any, before
+        :meth:`_process_datagram`.
+        """
+        if self._receive_filter is not None and self._receive_filter(data, addr):
+            return
+        self._process_datagram(data, addr)
+
+    def _process_datagram(self, data: bytes, addr: tuple[str, int]) -> None:
+        """Decode a BVLL datagram and dispatch it.
+
         When a BBMD is attached, BVLC messages are first passed through
         :meth:`BBMDManager.handle_bvlc` before reaching the normal
         receive path.  This ensures BVLC management messages
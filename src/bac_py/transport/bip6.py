@@ -354,7 +354,12 @@ class BIP6Transport:
         """The attached BBMD6 manager, or ``None`` if not configured."""
         return self._bbmd
 
-    async def attach_bbmd(self, bdt_entries: list[BDT6Entry] | None = None) -> BBMD6Manager:
+    async def attach_bbmd(
+        self,
+        bdt_entries: list[BDT6Entry] | None = None,
+        *,
+        max_fdt_entries: int = 128,
+    ) -> BBMD6Manager:
         """Attach an IPv6 BBMD manager to this transport.
 
         Creates and starts a :class:`BBMD6Manager` integrated with this
@@ -363,6 +368,8 @@ class BIP6Transport:
         also forwarded to BDT peers and foreign devices.
 
         :param bdt_entries: Optional initial BDT entries.
+        :param max_fdt_entries: Maximum number of registered foreign
+            devices.
         :returns: The attached :class:`BBMD6Manager` instance.
         :raises RuntimeError: If transport not started or BBMD already attached.
         """
@@ -379,6 +386,7 @@ class BIP6Transport:
             send_callback=self._send_raw,
             local_broadcast_callback=self._bbmd_local_deliver,
             multicast_send_callback=self._send_multicast,
+            max_fdt_entries=max_fdt_entries,
         )
         if bdt_entries:
             self._bbmd.set_bdt(bdt_entries)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -147,6 +148,18 @@ class BACnetDateTime:
             time=BACnetTime.from_dict(data["time"]),
         )
 
+    @classmethod
+    def now(cls) -> BACnetDateTime:
+        """Create a :class:`BACnetDateTime` from the current local wall-clock time.
+
+        :returns: The current date (with day of week) and time to the hundredth.
+        """
+        n = datetime.datetime.now()
+        return cls(
+            date=BACnetDate(n.year, n.month, n.day, n.isoweekday()),
+            time=BACnetTime(n.hour, n.minute, n.second, n.microsecond // 10000),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class BACnetTimeStamp:
@@ -1087,6 +1100,94 @@ class BACnetPrescale:
         )
 
 
+def _decode_log_choice(
+    data: memoryview,
+    offset: int,
+    decoders: dict[int, Any],
+    *,
+    null_tag: int,
+    failure_tag: int,
+) -> tuple[Any, int]:
+    """Decode one context-tagged value CHOICE used in Clause 21 log records.
+
+    :param decoders: Primitive decoder for each context tag number.
+    :param null_tag: Context tag of the ``null-value`` choice.
+    :param failure_tag: Context tag of the constructed ``failure`` choice.
+        Any other constructed choice is treated as ``any-value``.
+    :returns: Tuple of (decoded value, new offset).
+    """
+    from bac_py.encoding.primitives import decode_and_unwrap, decode_enumerated
+    from bac_py.encoding.tags import decode_tag, extract_context_value
+    from bac_py.types.enums import ErrorClass, ErrorCode
+
+    tag, offset = decode_tag(data, offset)
+    if tag.is_opening:
+        enclosed, offset = extract_context_value(data, offset, tag.number)
+        if tag.number == failure_tag:
+            # failure: Error ::= SEQUENCE { error-class, error-code }
+            cls_tag, pos = decode_tag(enclosed, 0)
+            error_class = decode_enumerated(enclosed[pos : pos + cls_tag.length])
+            code_tag, pos = decode_tag(enclosed, pos + cls_tag.length)
+            error_code = decode_enumerated(enclosed[pos : pos + code_tag.length])
+            return (ErrorClass(error_class), ErrorCode(error_code)), offset
+        # any-value and anything unrecognised
+        return decode_and_unwrap(enclosed), offset
+
+    content = data[offset : offset + tag.length]
+    offset += tag.length
+    if tag.number == null_tag:
+        return None, offset
+    decoder = decoders.get(tag.number)
+    if decoder is None:
+        msg = f"Invalid log-datum choice: {tag.number}"
+        raise ValueError(msg)
+    return decoder(content), offset
+
+
+def _decode_log_datum(data: memoryview, offset: int) -> tuple[Any, int]:
+    """Decode the log-datum CHOICE of a Clause 21 BACnetLogRecord."""
+    from bac_py.encoding.primitives import (
+        decode_bit_string,
+        decode_boolean,
+        decode_enumerated,
+        decode_real,
+        decode_signed,
+        decode_unsigned,
+    )
+
+    decoders: dict[int, Any] = {
+        0: decode_bit_string,
+        1: decode_boolean,
+        2: decode_real,
+        3: decode_enumerated,
+        4: decode_unsigned,
+        5: decode_signed,
+        6: decode_bit_string,
+        9: decode_real,
+    }
+    return _decode_log_choice(data, offset, decoders, null_tag=7, failure_tag=8)
+
+
+def _decode_log_timestamp(data: memoryview, offset: int) -> tuple[BACnetDateTime, int]:
+    """Decode the ``timestamp [0] BACnetDateTime`` opening a Clause 21 log record."""
+    from bac_py.encoding.primitives import decode_date, decode_time
+    from bac_py.encoding.tags import decode_tag
+
+    tag, new_offset = decode_tag(data, offset)
+    if not (tag.is_opening and tag.number == 0):
+        msg = f"Expected opening tag 0 for log record timestamp, got {tag}"
+        raise ValueError(msg)
+    tag, new_offset = decode_tag(data, new_offset)
+    date = decode_date(data[new_offset : new_offset + tag.length])
+    tag, new_offset = decode_tag(data, new_offset + tag.length)
+    time = decode_time(data[new_offset : new_offset + tag.length])
+    closing, offset = decode_tag(data, new_offset + tag.length)
+    if not (closing.is_closing and closing.number == 0):
+        msg = "Expected closing tag 0 after log record timestamp"
+        raise ValueError(msg)
+    return BACnetDateTime(date=date, time=time), offset
+
+
 @dataclass(frozen=True, slots=True)
 class BACnetLogRecord:
     """BACnet LogRecord for TrendLog.Log_Buffer (Clause 12.25).
@@ -1125,6 +1226,84 @@ class BACnetLogRecord:
             parts.append(encode_context_bit_string(1, self.status_flags.to_bit_string()))
         return b"".join(parts)
 
+    @classmethod
+    def decode(cls, data: memoryview | bytes, offset: int = 0) -> tuple[BACnetLogRecord, int]:
+        """Decode one record from a Log_Buffer or ReadRange item list.
+
+        Accepts both the context-tagged BACnetLogRecord of Clause 21 sent
+        by other devices and the application-tagged form produced by
+        :meth:`encode`.
+
+        For the Clause 21 form, a ``log-status`` datum decodes to a
+        :class:`BitString`, a ``failure`` to an ``(ErrorClass, ErrorCode)``
+        tuple, and ``any-value`` to its unwrapped application value(s).
+
+        :param data: Buffer to decode from.
+        :param offset: Starting byte offset.
+        :returns: Tuple of (decoded :class:`BACnetLogRecord`, new offset).
+        :raises ValueError: If the data is not a log record.
+        """
+        from bac_py.encoding.primitives import (
+            decode_application_value,
+            decode_bit_string,
+            decode_date,
+            decode_time,
+        )
+        from bac_py.encoding.tags import TagClass, decode_tag
+
+        if isinstance(data, bytes):
+            data = memoryview(data)
+
+        tag, new_offset = decode_tag(data, offset)
+        if tag.cls == TagClass.APPLICATION:
+            # Application-tagged form: date, time, datum, [1] status flags
+            if tag.number != 10:
+                msg = f"Expected date to start a log record, got application tag {tag.number}"
+                raise ValueError(msg)
+            date = decode_date(data[new_offset : new_offset + tag.length])
+            tag, new_offset = decode_tag(data, new_offset + tag.length)
+            time = decode_time(data[new_offset : new_offset + tag.length])
+            offset = new_offset + tag.length
+            tag, new_offset = decode_tag(data, offset)
+            length = 0 if tag.number == 1 else tag.length
+            datum = decode_application_value(data[offset : new_offset + length])
+            offset = new_offset + length
+            status_flags = None
+            if offset < len(data):
+                tag, new_offset = decode_tag(data, offset)
+                if tag.cls == TagClass.CONTEXT and tag.number == 1 and not tag.is_opening:
+                    status_flags = StatusFlags.from_bit_string(
+                        decode_bit_string(data[new_offset : new_offset + tag.length])
+                    )
+                    offset = new_offset + tag.length
+            timestamp = BACnetDateTime(date=date, time=time)
+            return cls(timestamp=timestamp, log_datum=datum, status_flags=status_flags), offset
+
+        if not (tag.is_opening and tag.number == 0):
+            msg = f"Expected opening tag 0 for BACnetLogRecord, got {tag}"
+            raise ValueError(msg)
+        timestamp, offset = _decode_log_timestamp(data, offset)
+
+        tag, offset = decode_tag(data, offset)
+        if not (tag.is_opening and tag.number == 1):
+            msg = f"Expected opening tag 1 for log-datum, got {tag}"
+            raise ValueError(msg)
+        datum, offset = _decode_log_datum(data, offset)
+        closing, offset = decode_tag(data, offset)
+        if not (closing.is_closing and closing.number == 1):
+            msg = "Expected closing tag 1 after log-datum"
+            raise ValueError(msg)
+
+        status_flags = None
+        if offset < len(data):
+            tag, new_offset = decode_tag(data, offset)
+            if tag.cls == TagClass.CONTEXT and tag.number == 2 and not tag.is_opening:
+                status_flags = StatusFlags.from_bit_string(
+                    decode_bit_string(data[new_offset : new_offset + tag.length])
+                )
+                offset = new_offset + tag.length
+        return cls(timestamp=timestamp, log_datum=datum, status_flags=status_flags), offset
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to a JSON-serializable dictionary.
 
@@ -1159,6 +1338,96 @@ class BACnetLogRecord:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class BACnetLogMultipleRecord:
+    """BACnet LogMultipleRecord for TrendLogMultiple.Log_Buffer (Clause 12.30).
+
+    ::
+
+        BACnetLogMultipleRecord ::= SEQUENCE {
+            timestamp [0] BACnetDateTime,
+            log-data  [1] BACnetLogData
+        }
+    """
+
+    timestamp: BACnetDateTime
+    """When the values were logged."""
+
+    log_data: Any
+    """The logged data.  A list with one value per monitored property for
+    ``log-data``, a :class:`BitString` for ``log-status``, or a float for
+    ``time-change``.  A property that could not be read appears in the list
+    as an ``(ErrorClass, ErrorCode)`` tuple."""
+
+    @classmethod
+    def decode(
+        cls, data: memoryview | bytes, offset: int = 0
+    ) -> tuple[BACnetLogMultipleRecord, int]:
+        """Decode one Clause 21 record from a Log_Buffer or ReadRange item list.
+
+        :param data: Buffer to decode from.
+        :param offset: Starting byte offset.
+        :returns: Tuple of (decoded :class:`BACnetLogMultipleRecord`, new offset).
+        :raises ValueError: If the data is not a log-multiple record.
+        """
+        from bac_py.encoding.primitives import (
+            decode_bit_string,
+            decode_boolean,
+            decode_enumerated,
+            decode_real,
+            decode_signed,
+            decode_unsigned,
+        )
+        from bac_py.encoding.tags import decode_tag
+
+        if isinstance(data, bytes):
+            data = memoryview(data)
+        timestamp, offset = _decode_log_timestamp(data, offset)
+        tag, offset = decode_tag(data, offset)
+        if not (tag.is_opening and tag.number == 1):
+            msg = f"Expected opening tag 1 for log-data, got {tag}"
+            raise ValueError(msg)
+
+        tag, new_offset = decode_tag(data, offset)
+        log_data: Any
+        if tag.is_opening and tag.number == 1:
+            decoders: dict[int, Any] = {
+                0: decode_boolean,
+                1: decode_real,
+                2: decode_enumerated,
+                3: decode_unsigned,
+                4: decode_signed,
+                5: decode_bit_string,
+            }
+            values: list[Any] = []
+            offset = new_offset
+            while True:
+                tag, new_offset = decode_tag(data, offset)
+                if tag.is_closing and tag.number == 1:
+                    offset = new_offset
+                    break
+                value, offset = _decode_log_choice(
+                    data, offset, decoders, null_tag=6, failure_tag=7
+                )
+                values.append(value)
+            log_data = values
+        elif tag.number == 0 and not tag.is_opening:
+            log_data = decode_bit_string(data[new_offset : new_offset + tag.length])
+            offset = new_offset + tag.length
+        elif tag.number == 2 and not tag.is_opening:
+            log_data = decode_real(data[new_offset : new_offset + tag.length])
+            offset = new_offset + tag.length
+        else:
+            msg = f"Invalid log-data choice: {tag}"
+            raise ValueError(msg)
+
+        closing, offset = decode_tag(data, offset)
+        if not (closing.is_closing and closing.number == 1):
+            msg = "Expected closing tag 1 after log-data"
+            raise ValueError(msg)
+        return cls(timestamp=timestamp, log_data=log_data), offset
+
+
 @dataclass(frozen=True, slots=True)
 class BACnetRecipientProcess:
     """BACnet RecipientProcess -- identifies a subscriber process (Clause 12.11.39).
@@ -0,0 +1,109 @@
+"""Tests for inbound request admission control."""
+
+import pytest
+
+from bac_py.app.admission import AdmissionController, AdmissionPolicy
+from bac_py.network.address import BACnetAddress
+
+A = BACnetAddress(mac_address=b"\x0a\x00\x00\x01\xba\xc0")
+B = BACnetAddress(mac_address=b"\x0a\x00\x00\x02\xba\xc0")
+C = BACnetAddress(mac_address=b"\x0a\x00\x00\x03\xba\xc0")
+
+
+class _Recorder:
+    def __init__(self):
+        self.started: list[str] = []
+
+    def __call__(self, name):
+        return lambda: self.started.append(name)
+
+
+class TestAdmissionPolicy:
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_concurrent": 0}, "max_concurrent"),
+            ({"max_per_source": 0}, "max_per_source"),
+            ({"max_queue": -1}, "max_queue"),
+        ],
+    )
+    def test_invalid(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            AdmissionPolicy(**kwargs)
+
+
+class TestAdmissionController:
+    def test_admits_up_to_global_limit(self):
+        rec = _Recorder()
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=2, max_per_source=2))
+        assert ctl.submit(A, rec("a1"))
+        assert ctl.submit(B, rec("b1"))
+        assert ctl.submit(C, rec("c1"))
+        assert rec.started == ["a1", "b1"]
+        assert ctl.stats.active == 2
+        assert ctl.stats.queue_depth == 1
+
+        ctl.release(A)
+        assert rec.started == ["a1", "b1", "c1"]
+        assert ctl.stats.queued == 1
+        assert ctl.stats.queue_depth == 0
+        assert ctl.stats.max_wait >= 0
+
+    def test_per_source_limit_does_not_block_others(self):
+        rec = _Recorder()
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=4, max_per_source=1))
+        ctl.submit(A, rec("a1"))
+        ctl.submit(A, rec("a2"))
+        ctl.submit(B, rec("b1"))
+        assert rec.started == ["a1", "b1"]
+
+        ctl.release(B)
+        assert rec.started == ["a1", "b1"]
+        ctl.release(A)
+        assert rec.started == ["a1", "b1", "a2"]
+
+    def test_round_robin_between_sources(self):
+        rec = _Recorder()
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=1, max_per_source=1))
+        ctl.submit(C, rec("c0"))
+        for name in ("a1", "a2", "a3"):
+            ctl.submit(A, rec(name))
+        ctl.submit(B, rec("b1"))
+
+        for source in (C, A, B, A):
+            ctl.release(source)
+        assert rec.started == ["c0", "a1", "b1", "a2", "a3"]
+
+    def test_overflow_when_queue_full(self):
+        rec = _Recorder()
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=1, max_per_source=1, max_queue=1))
+        assert ctl.submit(A, rec("a1"))
+        assert ctl.submit(B, rec("b1"))
+        assert not ctl.submit(C, rec("c1"))
+        assert ctl.stats.overflowed == 1
+        assert rec.started == ["a1"]
+
+    def test_zero_queue_overflows_immediately(self):
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=1, max_queue=0))
+        assert ctl.submit(A, lambda: None)
+        assert not ctl.submit(B, lambda: None)
+
+    def test_clear_discards_waiting(self):
+        rec = _Recorder()
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=1))
+        ctl.submit(A, rec("a1"))
+        ctl.submit(B, rec("b1"))
+        ctl.clear()
+        ctl.release(A)
+        assert rec.started == ["a1"]
+        assert ctl.stats.active == 0
+        assert ctl.stats.queue_depth == 0
+
+    def test_try_acquire(self):
+        ctl = AdmissionController(AdmissionPolicy(max_concurrent=2, max_per_source=1))
+        assert ctl.try_acquire(A)
+        assert not ctl.try_acquire(A)
+        assert ctl.stats.active == 1
+        ctl.release(A)
+        assert ctl.stats.active == 0
+        assert ctl.stats.admitted == 1
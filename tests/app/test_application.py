@@ -5,14 +5,16 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from bac_py.app.admission import AdmissionController, AdmissionPolicy, OverflowPolicy
 from bac_py.app.application import (
     BACnetApplication,
     DeviceConfig,
-    DeviceInfo,
     ForeignDeviceStatus,
     RouterConfig,
     RouterPortConfig,
 )
+from bac_py.app.device_cache import DeviceRecord
+from bac_py.app.server import DefaultServerHandlers
 from bac_py.encoding.apdu import (
     AbortPDU,
     ComplexAckPDU,
@@ -23,15 +25,27 @@ from bac_py.encoding.apdu import (
     UnconfirmedRequestPDU,
     encode_apdu,
 )
+from bac_py.encoding.primitives import encode_application_real
 from bac_py.network.address import BACnetAddress
+from bac_py.network.layer import NetworkLayer
+from bac_py.network.pacing import PacingPolicy, PacingRate
+from bac_py.objects.analog import AnalogValueObject
+from bac_py.objects.base import ObjectDatabase
+from bac_py.objects.device import DeviceObject
+from bac_py.services.common import BACnetPropertyValue
 from bac_py.services.errors import BACnetAbortError, BACnetError, BACnetRejectError
 from bac_py.services.who_is import IAmRequest
+from bac_py.services.write_property_multiple import (
+    WriteAccessSpecification,
+    WritePropertyMultipleRequest,
+)
 from bac_py.transport.bip import BIPTransport
 from bac_py.types.enums import (
     AbortReason,
     ConfirmedServiceChoice,
     EnableDisable,
     ObjectType,
+    PropertyIdentifier,
     RejectReason,
     Segmentation,
     UnconfirmedServiceChoice,
@@ -413,9 +427,12 @@ class TestDeviceInfoCache:
             segmentation_supported=Segmentation.NONE,
             vendor_id=99,
         )
-        app._device_info_cache[source] = DeviceInfo(
-            max_apdu_length=iam.max_apdu_length,
-            segmentation_supported=int(iam.segmentation_supported),
+        app.device_cache.put(
+            DeviceRecord(
+                source,
+                max_apdu_length=iam.max_apdu_length,
+                segmentation_supported=int(iam.segmentation_supported),
+            )
         )
 
         info = app.get_device_info(source)
@@ -508,6 +525,63 @@ class TestPropertyGettersAndState:
         oid = app.device_object_identifier
         assert oid == ObjectIdentifier(ObjectType.DEVICE, 42)
 
+    def test_set_request_limit_requires_start(self):
+        """set_request_limit raises before the client TSM exists."""
+        app = BACnetApplication(DeviceConfig(instance_number=1))
+        assert app.request_queue_stats is None
+        with pytest.raises(RuntimeError, match="not started"):
+            app.set_request_limit(2)
+
+    def test_set_request_limit_forwards_to_tsm(self):
+        """set_request_limit delegates to the client TSM."""
+        app = _make_started_app()
+        app.set_request_limit(2, network=5)
+        app._client_tsm.set_request_limit.assert_called_once_with(
+            2, address=None, network=5, local_network=False
+        )
+        assert app.request_queue_stats is app._client_tsm.queue_stats
+
+    def test_set_send_rate_requires_pacing(self):
+        """set_send_rate raises when pacing is not enabled."""
+        app = BACnetApplication(DeviceConfig(instance_number=1))
+        assert app.send_pacing_stats is None
+        with pytest.raises(RuntimeError, match="not enabled"):
+            app.set_send_rate(PacingRate(10), network=5)
+
+    def test_set_send_rate_updates_pacer(self):
+        """set_send_rate changes network and router rates on the pacer."""
+        app = BACnetApplication(DeviceConfig(instance_number=1))
+        app._network = NetworkLayer(MagicMock(), pacing=PacingPolicy())
+        pacer = app._network.pacer
+        app.set_send_rate(PacingRate(1), network=5)
+        router = BACnetAddress(mac_address=b"\x0a\x00\x00\x01\xba\xc0")
+        app.set_send_rate(PacingRate(2), router=router)
+        assert pacer._network_rates[5] == PacingRate(1)
+        assert pacer._router_rates[router.mac_address] == PacingRate(2)
+        with pytest.raises(ValueError, match="exactly one"):
+            app.set_send_rate(PacingRate(1))
+        assert app.send_pacing_stats == {}
+
+    def test_pacing_queue_delay_capped_at_apdu_timeout(self):
+        """An unset max_delay is taken from the APDU timeout; a set one is kept."""
+        policy = PacingPolicy(default_network_rate=PacingRate(10))
+        app = BACnetApplication(
+            DeviceConfig(instance_number=1, apdu_timeout=3000, send_pacing=policy)
+        )
+        assert app._pacing_policy().max_delay == 3.0
+        explicit = PacingPolicy(default_network_rate=PacingRate(10), max_delay=0.5)
+        app = BACnetApplication(DeviceConfig(instance_number=1, send_pacing=explicit))
+        assert app._pacing_policy() is explicit
+        assert BACnetApplication(DeviceConfig(instance_number=1))._pacing_policy() is None
+
+    def test_get_rtt_estimate(self):
+        """get_rtt_estimate returns None before start and delegates after."""
+        addr = BACnetAddress(mac_address=b"\x01\x02\x03\x04\xba\xc0")
+        assert BACnetApplication(DeviceConfig(instance_number=1)).get_rtt_estimate(addr) is None
+        app = _make_started_app()
+        assert app.get_rtt_estimate(addr) is app._client_tsm.rtt_estimate.return_value
+        app._client_tsm.rtt_estimate.assert_called_once_with(addr)
+
     def test_set_dcc_state_no_duration(self):
         """Set DCC state without duration."""
         app = BACnetApplication(DeviceConfig(instance_number=1))
@@ -1290,9 +1364,12 @@ class TestAPDUDispatch:
         app = _make_started_app()
         dest = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
         # Cache says peer only accepts 480 bytes
-        app._device_info_cache[dest] = DeviceInfo(
-            max_apdu_length=480,
-            segmentation_supported=int(Segmentation.NONE),
+        app.device_cache.put(
+            DeviceRecord(
+                dest,
+                max_apdu_length=480,
+                segmentation_supported=int(Segmentation.NONE),
+            )
         )
 
         await app.confirmed_request(dest, 12, b"\x00")
@@ -1317,9 +1394,12 @@ class TestAPDUDispatch:
 
         dest = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
         # Remote accepts more than local
-        app._device_info_cache[dest] = DeviceInfo(
-            max_apdu_length=2000,
-            segmentation_supported=int(Segmentation.BOTH),
+        app.device_cache.put(
+            DeviceRecord(
+                dest,
+                max_apdu_length=2000,
+                segmentation_supported=int(Segmentation.BOTH),
+            )
         )
 
         await app.confirmed_request(dest, 12, b"\x00")
@@ -1399,6 +1479,256 @@ class TestAPDUDispatch:
 # ==================== Section 1E: Context Manager & Lifecycle ====================
 
 
+def _confirmed_request_bytes(invoke_id: int) -> bytes:
+    return encode_apdu(
+        ConfirmedRequestPDU(
+            segmented=False,
+            more_follows=False,
+            segmented_response_accepted=False,
+            max_segments=None,
+            max_apdu_length=1476,
+            invoke_id=invoke_id,
+            sequence_number=None,
+            proposed_window_size=None,
+            service_choice=ConfirmedServiceChoice.READ_PROPERTY,
+            service_request=b"",
+        )
+    )
+
+
+class TestInboundAdmission:
+    """Admission control on the inbound request path."""
+
+    def _make_app(self, overflow=OverflowPolicy.ABORT):
+        app = _make_started_app()
+        app._admission = AdmissionController(
+            AdmissionPolicy(max_concurrent=1, max_per_source=1, max_queue=1, overflow=overflow)
+        )
+        app._spawn_task = MagicMock(side_effect=lambda coro: coro.close())
+        return app
+
+    def test_overflow_aborts_out_of_resources(self):
+        app = self._make_app()
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        for invoke_id in range(3):
+            app._on_apdu_received(_confirmed_request_bytes(invoke_id), source)
+
+        assert app._spawn_task.call_count == 1
+        app._network.send.assert_called_once()
+        response = app._network.send.call_args.args[0]
+        assert response == encode_apdu(
+            AbortPDU(sent_by_server=True, invoke_id=2, abort_reason=AbortReason.OUT_OF_RESOURCES)
+        )
+        assert app.admission.stats.overflowed == 1
+
+    def test_overflow_reject(self):
+        app = self._make_app(OverflowPolicy.REJECT)
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        for invoke_id in range(3):
+            app._on_apdu_received(_confirmed_request_bytes(invoke_id), source)
+        response = app._network.send.call_args.args[0]
+        assert response == encode_apdu(RejectPDU(invoke_id=2, reject_reason=RejectReason.OTHER))
+
+    def test_overflow_drop(self):
+        app = self._make_app(OverflowPolicy.DROP)
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        for invoke_id in range(3):
+            app._on_apdu_received(_confirmed_request_bytes(invoke_id), source)
+        app._network.send.assert_not_called()
+        assert app.admission.stats.overflowed == 1
+
+    def test_unconfirmed_overflow_dropped(self):
+        app = self._make_app()
+        app.service_registry.register_unconfirmed(UnconfirmedServiceChoice.WHO_IS, AsyncMock())
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        who_is = encode_apdu(
+            UnconfirmedRequestPDU(
+                service_choice=UnconfirmedServiceChoice.WHO_IS, service_request=b""
+            )
+        )
+        for _ in range(3):
+            app._on_apdu_received(who_is, source)
+        app._network.send.assert_not_called()
+        assert app.admission.stats.overflowed == 1
+
+    def test_segmented_overflow_completes_transaction(self):
+        app = self._make_app(OverflowPolicy.DROP)
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        for invoke_id in range(2):
+            app._on_apdu_received(_confirmed_request_bytes(invoke_id), source)
+        txn = MagicMock(invoke_id=9)
+        app._server_tsm.receive_confirmed_request.return_value = (txn, b"\x01")
+        pdu = MagicMock(spec=ConfirmedRequestPDU)
+        pdu.service_choice = 12
+
+        app._handle_segmented_request(pdu, source)
+
+        app._network.send.assert_called_once()
+        app._server_tsm.complete_transaction.assert_called_once()
+        assert app._server_tsm.complete_transaction.call_args.args[0] is txn
+
+    async def test_slot_released_after_handler(self):
+        app = _make_started_app()
+        app._admission = AdmissionController(AdmissionPolicy())
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app._server_tsm.receive_confirmed_request.return_value = None
+        app._on_apdu_received(_confirmed_request_bytes(1), source)
+        assert app.admission.stats.active == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert app.admission.stats.active == 0
+
+    async def test_unbounded_by_default(self):
+        app = _make_started_app()
+        assert app.admission is None
+        app._server_tsm.receive_confirmed_request.return_value = None
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        for invoke_id in range(200):
+            app._on_apdu_received(_confirmed_request_bytes(invoke_id), source)
+        assert len(app._background_tasks) == 200
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert not app._background_tasks
+        app._network.send.assert_not_called()
+
+
+class TestInlineDispatch:
+    """Inline handlers run on the receive path without a task."""
+
+    def test_inline_confirmed_runs_without_task(self):
+        app = _make_started_app()
+        app._admission = AdmissionController(AdmissionPolicy())
+        app._spawn_task = MagicMock(side_effect=lambda coro: coro.close())
+        txn = MagicMock(invoke_id=1)
+        app._server_tsm.receive_confirmed_request.return_value = (txn, b"")
+
+        async def handler(sc, data, source):
+            return b"\x01"
+
+        app.service_registry.register_confirmed(
+            ConfirmedServiceChoice.READ_PROPERTY, handler, inline=True
+        )
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app._on_apdu_received(_confirmed_request_bytes(1), source)
+
+        app._spawn_task.assert_not_called()
+        app._network.send.assert_called_once()
+        app._server_tsm.complete_transaction.assert_called_once()
+        assert app.admission.stats.admitted == 1
+        assert app.admission.stats.active == 0
+
+    async def test_inline_handler_that_suspends_moves_to_task(self):
+        app = _make_started_app()
+        txn = MagicMock(invoke_id=1)
+        app._server_tsm.receive_confirmed_request.return_value = (txn, b"")
+
+        async def handler(sc, data, source):
+            await asyncio.sleep(0)
+            return None
+
+        app.service_registry.register_confirmed(
+            ConfirmedServiceChoice.READ_PROPERTY, handler, inline=True
+        )
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app._on_apdu_received(_confirmed_request_bytes(1), source)
+
+        assert len(app._background_tasks) == 1
+        app._network.send.assert_not_called()
+        await asyncio.sleep(0.01)
+        app._network.send.assert_called_once()
+
+    async def test_inline_flood_respects_admission_limits(self):
+        app = _make_started_app()
+        app._admission = AdmissionController(
+            AdmissionPolicy(max_concurrent=4, max_per_source=2, max_queue=3)
+        )
+        db = ObjectDatabase()
+        device = DeviceObject(1, object_name="dev", vendor_name="v", vendor_identifier=1)
+        db.add(device)
+        av = AnalogValueObject(1)
+        db.add(av)
+        DefaultServerHandlers(app, db, device).register()
+
+        def receive(pdu, source):
+            return MagicMock(invoke_id=pdu.invoke_id), pdu.service_request
+
+        app._server_tsm.receive_confirmed_request.side_effect = receive
+        wpm = WritePropertyMultipleRequest(
+            [
+                WriteAccessSpecification(
+                    av.object_identifier,
+                    [
+                        BACnetPropertyValue(
+                            PropertyIdentifier.PRESENT_VALUE, value=encode_application_real(1.0)
+                        )
+                    ],
+                )
+            ]
+        ).encode()
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+
+        # Inline WPM suspends on the object's write lock and keeps its slot.
+        await av._write_lock.acquire()
+        for invoke_id in range(6):
+            app._on_apdu_received(
+                encode_apdu(
+                    ConfirmedRequestPDU(
+                        segmented=False,
+                        more_follows=False,
+                        segmented_response_accepted=False,
+                        max_segments=None,
+                        max_apdu_length=1476,
+                        invoke_id=invoke_id,
+                        sequence_number=None,
+                        proposed_window_size=None,
+                        service_choice=ConfirmedServiceChoice.WRITE_PROPERTY_MULTIPLE,
+                        service_request=wpm,
+                    )
+                ),
+                source,
+            )
+        stats = app.admission.stats
+        assert stats.active == 2
+        assert stats.queue_depth == 3
+        assert stats.overflowed == 1
+        assert len(app._background_tasks) == 2
+
+        av._write_lock.release()
+        for _ in range(20):
+            await asyncio.sleep(0)
+        assert stats.active == 0
+        assert stats.admitted == 5
+        assert not app._background_tasks
+
+    def test_unconfirmed_without_handler_runs_listeners_inline(self):
+        app = _make_started_app()
+        app._spawn_task = MagicMock(side_effect=lambda coro: coro.close())
+        listener = MagicMock()
+        app.register_temporary_handler(UnconfirmedServiceChoice.I_HAVE, listener)
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app._on_apdu_received(
+            encode_apdu(
+                UnconfirmedRequestPDU(
+                    service_choice=UnconfirmedServiceChoice.I_HAVE, service_request=b"\x01"
+                )
+            ),
+            source,
+        )
+        listener.assert_called_once_with(b"\x01", source)
+        app._spawn_task.assert_not_called()
+
+    def test_inline_infrastructure_error_logged(self, caplog):
+        app = _make_started_app()
+        app._server_tsm.receive_confirmed_request.side_effect = RuntimeError("boom")
+        app.service_registry.register_confirmed(
+            ConfirmedServiceChoice.READ_PROPERTY, AsyncMock(), inline=True
+        )
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        with caplog.at_level(logging.ERROR, logger="bac_py.app.application"):
+            app._on_apdu_received(_confirmed_request_bytes(1), source)
+        assert "Inline request handling failed" in caplog.text
+
+
 class TestLifecycle:
     """Test context manager, run(), stop() lifecycle methods."""
 
@@ -1774,22 +2104,26 @@ class TestCOVAndTaskManagement:
         await app._handle_unconfirmed_cov_notification(2, notif.encode(), source)
         callback.assert_called_once()
 
-    async def test_send_confirmed_cov_notification_spawns_task(self):
-        """send_confirmed_cov_notification creates a background task."""
+    async def test_send_confirmed_cov_notification_queues_delivery(self):
+        """send_confirmed_cov_notification goes through the delivery queue."""
         app = _make_started_app()
         dest = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
         app.send_confirmed_cov_notification(b"\x00", dest, 1)
-        assert len(app._background_tasks) == 1
+        assert app.notification_delivery.stats(dest).in_flight == 1
         # Let the task complete
         await asyncio.sleep(0.01)
+        await app.notification_delivery.close()
 
     async def test_send_confirmed_cov_failure_logged(self):
-        """_send_confirmed_cov logs failure without propagating."""
+        """A failed confirmed COV notification is counted without propagating."""
         app = _make_started_app()
         app._client_tsm.send_request = AsyncMock(side_effect=RuntimeError("network error"))
         dest = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
         # Should not raise
-        await app._send_confirmed_cov(b"\x00", dest, 1)
+        app.send_confirmed_cov_notification(b"\x00", dest, 1)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert app.notification_delivery.stats(dest).failed == 1
 
 
 # ==================== Section 2: Coverage gap tests ====================
@@ -1957,7 +2291,7 @@ class TestDeviceInfoCachePaths:
         )
         await app._handle_i_am_for_cache(UnconfirmedServiceChoice.I_AM, iam.encode(), source)
 
-        info = app._device_info_cache.get(source)
+        info = app.get_device_info(source)
         assert info is not None
         assert info.max_apdu_length == 480
         assert info.segmentation_supported == int(Segmentation.BOTH)
@@ -1969,7 +2303,7 @@ class TestDeviceInfoCachePaths:
 
         # Malformed data should not raise
         await app._handle_i_am_for_cache(UnconfirmedServiceChoice.I_AM, b"\xff\xff", source)
-        assert source not in app._device_info_cache
+        assert source not in app.device_cache
 
     async def test_confirmed_request_uses_cached_max_apdu(self):
         """confirmed_request constrains APDU size using cached device info."""
@@ -1977,9 +2311,12 @@ class TestDeviceInfoCachePaths:
         source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
 
         # Populate cache with a device that has smaller max APDU
-        app._device_info_cache[source] = DeviceInfo(
-            max_apdu_length=480,
-            segmentation_supported=int(Segmentation.BOTH),
+        app.device_cache.put(
+            DeviceRecord(
+                source,
+                max_apdu_length=480,
+                segmentation_supported=int(Segmentation.BOTH),
+            )
         )
 
         await app.confirmed_request(
@@ -1999,14 +2336,86 @@ class TestDeviceInfoCachePaths:
 
         assert app.get_device_info(source) is None
 
-        app._device_info_cache[source] = DeviceInfo(
-            max_apdu_length=480,
-            segmentation_supported=0,
+        app.device_cache.put(
+            DeviceRecord(
+                source,
+                max_apdu_length=480,
+                segmentation_supported=0,
+            )
         )
         info = app.get_device_info(source)
         assert info is not None
         assert info.max_apdu_length == 480
 
+    async def test_i_am_records_instance_and_vendor(self):
+        """I-Am caching stores the device instance and vendor id."""
+        app = _make_started_app()
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        iam = IAmRequest(
+            object_identifier=ObjectIdentifier(ObjectType.DEVICE, 1234),
+            max_apdu_length=480,
+            segmentation_supported=Segmentation.NONE,
+            vendor_id=42,
+        )
+        await app._handle_i_am_for_cache(UnconfirmedServiceChoice.I_AM, iam.encode(), source)
+
+        record = app.device_cache.find_by_instance(1234)
+        assert record is not None
+        assert record.address == source
+        assert record.vendor_id == 42
+
+    async def test_unrecognized_service_reject_is_cached(self):
+        """A reject for an unrecognized service marks it failed for the peer."""
+        app = _make_started_app()
+        dest = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app._client_tsm.send_request = AsyncMock(
+            side_effect=BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+        )
+        with pytest.raises(BACnetRejectError):
+            await app.confirmed_request(dest, ConfirmedServiceChoice.READ_RANGE, b"")
+        assert app.device_cache.is_service_failed(dest, ConfirmedServiceChoice.READ_RANGE)
+
+        app._client_tsm.send_request = AsyncMock(
+            side_effect=BACnetRejectError(RejectReason.INVALID_TAG)
+        )
+        with pytest.raises(BACnetRejectError):
+            await app.confirmed_request(dest, ConfirmedServiceChoice.READ_PROPERTY, b"")
+        assert not app.device_cache.is_service_failed(dest, ConfirmedServiceChoice.READ_PROPERTY)
+
+    async def test_stop_flushes_persistent_cache(self, tmp_path):
+        """stop() flushes the device cache to its backend and closes it."""
+        from bac_py.app.device_cache import JSONDeviceCacheBackend
+
+        path = tmp_path / "devices.json"
+        app = BACnetApplication(
+            DeviceConfig(instance_number=1, device_cache_backend=JSONDeviceCacheBackend(path))
+        )
+        source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+        app.device_cache.put(DeviceRecord(source, max_apdu_length=480, segmentation_supported=3))
+
+        await app.stop()
+
+        assert len(app.device_cache) == 0
+        assert app.device_cache.load() == 1
+        assert app.get_device_info(source).max_apdu_length == 480
+
+    async def test_flush_loop_flushes_periodically(self):
+        """The flush loop writes cache changes every interval."""
+        app = BACnetApplication(
+            DeviceConfig(
+                instance_number=1,
+                device_cache_backend=MagicMock(),
+                device_cache_flush_interval=0.01,
+            )
+        )
+        app.device_cache.flush = MagicMock(side_effect=[OSError("disk")] + [1] * 100)
+        task = asyncio.create_task(app._flush_device_cache_loop())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert app.device_cache.flush.call_count >= 2
+
 
 # ---------------------------------------------------------------------------
 # Additional coverage tests for BACnetApplication
@@ -2248,7 +2657,7 @@ class TestHandleSegmentedRequestDispatch:
         source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
 
         # Mock _spawn_task to avoid asyncio.create_task needing a real loop
-        app._spawn_task = MagicMock()
+        app._spawn_task = MagicMock(side_effect=lambda coro: coro.close())
         app._handle_segmented_request(pdu, source)
         app._spawn_task.assert_called_once()
 
@@ -2261,7 +2670,7 @@ class TestHandleSegmentedRequestDispatch:
         pdu = MagicMock(spec=ConfirmedRequestPDU)
         source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
 
-        app._spawn_task = MagicMock()
+        app._spawn_task = MagicMock(side_effect=lambda coro: coro.close())
         app._handle_segmented_request(pdu, source)
         app._spawn_task.assert_not_called()
 
@@ -2276,7 +2685,7 @@ class TestRouterBBMDConfig:
         """Router port with bbmd_config calls transport.attach_bbmd."""
         from bac_py.app.application import BBMDConfig
 
-        bbmd_cfg = BBMDConfig(bdt_entries=[])
+        bbmd_cfg = BBMDConfig(bdt_entries=[], max_fdt_entries=2000)
         router_cfg = DeviceConfig(
             instance_number=1,
             router_config=RouterConfig(
@@ -2305,7 +2714,7 @@ class TestRouterBBMDConfig:
 
             await app.start()
             try:
-                mock_t.attach_bbmd.assert_called_once_with(None)
+                mock_t.attach_bbmd.assert_called_once_with(None, max_fdt_entries=2000)
             finally:
                 await app.stop()
 
@@ -2458,7 +2867,7 @@ class TestMemoryCleanupOnStop:
         assert len(app._unconfirmed_listeners) == 0
 
     async def test_stop_clears_device_info_cache(self):
-        """stop() should clear _device_info_cache."""
+        """stop() should clear the device cache."""
         app = _make_started_app()
         app._event_engine = None
         app._cov_manager = None
@@ -2468,28 +2877,32 @@ class TestMemoryCleanupOnStop:
 
         # Populate cache
         source = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
-        app._device_info_cache[source] = DeviceInfo(max_apdu_length=480, segmentation_supported=0)
-        assert len(app._device_info_cache) == 1
+        app.device_cache.put(DeviceRecord(source, max_apdu_length=480, segmentation_supported=0))
+        assert len(app.device_cache) == 1
 
         await app.stop()
-        assert len(app._device_info_cache) == 0
+        assert len(app.device_cache) == 0
 
 
 class TestDeviceInfoCacheEviction:
-    """Test FIFO eviction when device info cache exceeds 1000 entries."""
+    """Test LRU eviction when the device cache exceeds 1000 entries."""
 
-    async def test_cache_evicts_oldest_entries_at_limit(self):
-        """When cache hits 1000 entries, oldest 100 are evicted."""
+    async def test_cache_evicts_least_recently_used_at_limit(self):
+        """When the cache is full, the least recently used entry is evicted."""
         app = _make_started_app()
 
         # Fill cache to exactly 1000 entries
         for i in range(1000):
             mac = i.to_bytes(4, "big") + b"\xba\xc0"
             source = BACnetAddress(mac_address=mac)
-            app._device_info_cache[source] = DeviceInfo(
-                max_apdu_length=480, segmentation_supported=0
+            app.device_cache.put(
+                DeviceRecord(source, max_apdu_length=480, segmentation_supported=0)
             )
-        assert len(app._device_info_cache) == 1000
+        assert len(app.device_cache) == 1000
+
+        # Touch the oldest entry so the second-oldest becomes the LRU
+        first_source = BACnetAddress(mac_address=(0).to_bytes(4, "big") + b"\xba\xc0")
+        assert app.get_device_info(first_source) is not None
 
         # Add one more via _handle_i_am_for_cache to trigger eviction
         new_source = BACnetAddress(mac_address=b"\xff\xff\xff\xff\xba\xc0")
@@ -2501,14 +2914,11 @@ class TestDeviceInfoCacheEviction:
         )
         await app._handle_i_am_for_cache(UnconfirmedServiceChoice.I_AM, iam.encode(), new_source)
 
-        # Should have evicted 100 oldest, then added 1 = 901
-        assert len(app._device_info_cache) == 901
-        # The new entry should be present
-        assert app._device_info_cache.get(new_source) is not None
-        # The first entry (oldest) should be evicted
-        first_mac = (0).to_bytes(4, "big") + b"\xba\xc0"
-        first_source = BACnetAddress(mac_address=first_mac)
-        assert first_source not in app._device_info_cache
+        assert len(app.device_cache) == 1000
+        assert app.get_device_info(new_source) is not None
+        assert first_source in app.device_cache
+        second_source = BACnetAddress(mac_address=(1).to_bytes(4, "big") + b"\xba\xc0")
+        assert second_source not in app.device_cache
 
     async def test_cache_under_limit_no_eviction(self):
         """Under 1000 entries, no eviction occurs."""
@@ -2517,8 +2927,8 @@ class TestDeviceInfoCacheEviction:
         for i in range(10):
             mac = i.to_bytes(4, "big") + b"\xba\xc0"
             source = BACnetAddress(mac_address=mac)
-            app._device_info_cache[source] = DeviceInfo(
-                max_apdu_length=480, segmentation_supported=0
+            app.device_cache.put(
+                DeviceRecord(source, max_apdu_length=480, segmentation_supported=0)
             )
 
         new_source = BACnetAddress(mac_address=b"\xff\xff\xff\xff\xba\xc0")
@@ -2531,7 +2941,7 @@ class TestDeviceInfoCacheEviction:
         await app._handle_i_am_for_cache(UnconfirmedServiceChoice.I_AM, iam.encode(), new_source)
 
         # All 11 entries should be present (10 + 1 new)
-        assert len(app._device_info_cache) == 11
+        assert len(app.device_cache) == 11
 
 
 class TestConfirmedRequestDispatchLine933:
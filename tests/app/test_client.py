@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from bac_py.app.application import DeviceConfig, DeviceInfo
 from bac_py.app.client import BACnetClient
 from bac_py.encoding.primitives import (
     decode_real,
@@ -16,7 +17,7 @@ from bac_py.encoding.primitives import (
     encode_application_unsigned,
 )
 from bac_py.encoding.tags import TagClass, decode_tag
-from bac_py.network.address import BACnetAddress, BIPAddress
+from bac_py.network.address import BACnetAddress, BIPAddress, parse_address
 from bac_py.services.alarm_summary import (
     AlarmSummary,
     GetAlarmSummaryACK,
@@ -594,6 +595,8 @@ class TestReadMultiple:
     def _make_app(self):
         app = MagicMock()
         app.confirmed_request = AsyncMock()
+        app.config = DeviceConfig(instance_number=1)
+        app.get_device_info = MagicMock(return_value=None)
         return app
 
     async def test_read_multiple_basic(self):
@@ -736,6 +739,133 @@ class TestReadMultiple:
         assert props["present-value"] == pytest.approx(72.5)
         assert props["units"] == 62
 
+    @staticmethod
+    def _echo_rpm(app, *, abort_above=None, abort_reason=None):
+        """Answer every RPM with the instance number of each requested object.
+
+        Requests with more than *abort_above* property references are
+        aborted with *abort_reason*.
+        """
+        from bac_py.services.errors import BACnetAbortError
+        from bac_py.services.read_property_multiple import ReadPropertyMultipleRequest
+        from bac_py.types.enums import AbortReason
+
+        requests = []
+        in_flight = 0
+        peak = 0
+
+        async def respond(*, destination, service_choice, service_data, timeout=None):
+            nonlocal in_flight, peak
+            request = ReadPropertyMultipleRequest.decode(service_data)
+            requests.append(request)
+            refs = sum(
+                len(spec.list_of_property_references) for spec in request.list_of_read_access_specs
+            )
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if abort_above is not None and refs > abort_above:
+                raise BACnetAbortError(abort_reason or AbortReason.SEGMENTATION_NOT_SUPPORTED)
+            return ReadPropertyMultipleACK(
+                list_of_read_access_results=[
+                    ReadAccessResult(
+                        object_identifier=spec.object_identifier,
+                        list_of_results=[
+                            ReadResultElement(
+                                property_identifier=ref.property_identifier,
+                                property_value=encode_application_unsigned(
+                                    spec.object_identifier.instance_number
+                                ),
+                            )
+                            for ref in spec.list_of_property_references
+                        ],
+                    )
+                    for spec in request.list_of_read_access_specs
+                ]
+            ).encode()
+
+        app.confirmed_request = AsyncMock(side_effect=respond)
+        return requests, lambda: peak
+
+    @staticmethod
+    def _many_specs(objects=50):
+        return {f"av,{i}": ["pv", "name", "units", "status", "desc"] for i in range(objects)}
+
+    async def test_read_multiple_splits_for_small_peer(self):
+        app = self._make_app()
+        app.get_device_info = MagicMock(return_value=DeviceInfo(480, Segmentation.NONE))
+        requests, _ = self._echo_rpm(app)
+        client = BACnetClient(app)
+
+        result = await client.read_multiple("192.168.1.100", self._many_specs(100))
+
+        assert len(requests) > 1
+        assert all(len(r.encode()) <= 480 - 6 for r in requests)
+        assert len(result) == 100
+        assert list(result) == [f"analog-value,{i}" for i in range(100)]
+        assert all(len(props) == 5 for props in result.values())
+        assert result["analog-value,42"]["present-value"] == 42
+
+    async def test_read_multiple_segmenting_peer_uses_fewer_requests(self):
+        app = self._make_app()
+        requests, _ = self._echo_rpm(app)
+        client = BACnetClient(app)
+        app.get_device_info = MagicMock(return_value=DeviceInfo(1476, Segmentation.NONE))
+        await client.read_multiple("192.168.1.100", self._many_specs())
+        unsegmented = len(requests)
+
+        requests.clear()
+        app.get_device_info = MagicMock(return_value=DeviceInfo(1476, Segmentation.BOTH))
+        await client.read_multiple("192.168.1.100", self._many_specs())
+        assert len(requests) < unsegmented
+
+    async def test_read_multiple_bounded_concurrency(self):
+        app = self._make_app()
+        app.get_device_info = MagicMock(return_value=DeviceInfo(206, Segmentation.NONE))
+        requests, peak = self._echo_rpm(app)
+        client = BACnetClient(app)
+
+        await client.read_multiple("192.168.1.100", self._many_specs(), max_concurrency=2)
+
+        assert len(requests) > 2
+        assert peak() == 2
+
+    async def test_read_multiple_halves_on_segmentation_abort(self):
+        app = self._make_app()
+        requests, _ = self._echo_rpm(app, abort_above=20)
+        client = BACnetClient(app)
+
+        result = await client.read_multiple("192.168.1.100", self._many_specs(10))
+
+        assert len(result) == 10
+        assert all(len(props) == 5 for props in result.values())
+        assert len(requests) > 1
+
+    async def test_read_multiple_other_abort_propagates(self):
+        from bac_py.services.errors import BACnetAbortError
+        from bac_py.types.enums import AbortReason
+
+        app = self._make_app()
+        requests, _ = self._echo_rpm(app, abort_above=0, abort_reason=AbortReason.OUT_OF_RESOURCES)
+        client = BACnetClient(app)
+
+        with pytest.raises(BACnetAbortError):
+            await client.read_multiple("192.168.1.100", self._many_specs(10))
+        assert len(requests) == 1
+
+    async def test_read_multiple_single_property_abort_propagates(self):
+        from bac_py.services.errors import BACnetAbortError
+
+        app = self._make_app()
+        requests, _ = self._echo_rpm(app, abort_above=0)
+        client = BACnetClient(app)
+
+        with pytest.raises(BACnetAbortError):
+            await client.read_multiple("192.168.1.100", {"ai,1": ["pv", "name"]})
+        # Full request, then the first half (one property) fails too.
+        assert len(requests) == 2
+
 
 class TestPropertyTypeHints:
     """Test that _encode_for_write uses _PROPERTY_TYPE_HINTS for non-PV properties."""
@@ -1549,6 +1679,244 @@ class TestGetObjectList:
         call_kwargs = app.confirmed_request.call_args
         assert call_kwargs.kwargs["service_choice"] == ConfirmedServiceChoice.READ_PROPERTY
 
+    @staticmethod
+    def _cached_app():
+        from bac_py.app.device_cache import DeviceCache
+
+        app = MagicMock()
+        app.confirmed_request = AsyncMock()
+        app.device_cache = DeviceCache()
+        return app
+
+    @staticmethod
+    def _object_list_ack(*instances):
+        data = b"".join(
+            encode_application_object_id(int(ObjectType.ANALOG_INPUT), i) for i in instances
+        )
+        return ReadPropertyACK(
+            object_identifier=ObjectIdentifier(ObjectType.DEVICE, 1),
+            property_identifier=PropertyIdentifier.OBJECT_LIST,
+            property_value=data,
+        ).encode()
+
+    @staticmethod
+    def _revision_ack(revision):
+        return ReadPropertyACK(
+            object_identifier=ObjectIdentifier(ObjectType.DEVICE, 1),
+            property_identifier=PropertyIdentifier.DATABASE_REVISION,
+            property_value=encode_application_unsigned(revision),
+        ).encode()
+
+    async def test_get_object_list_use_cache(self):
+        app = self._cached_app()
+        app.confirmed_request.return_value = self._object_list_ack(1, 2)
+        client = BACnetClient(app)
+        addr = parse_address("192.168.1.100")
+
+        first = await client.get_object_list(addr, 1)
+        assert app.device_cache.get(addr).object_list == first
+
+        app.confirmed_request.reset_mock()
+        assert await client.get_object_list(addr, 1, use_cache=True) == first
+        app.confirmed_request.assert_not_called()
+
+        await client.get_object_list(addr, 1)
+        app.confirmed_request.assert_called_once()
+
+    async def test_refresh_device_cache_rereads_on_revision_change(self):
+        app = self._cached_app()
+        client = BACnetClient(app)
+        addr = parse_address("192.168.1.100")
+
+        app.confirmed_request.side_effect = [self._revision_ack(3), self._object_list_ack(1)]
+        record = await client.refresh_device_cache(addr, 1)
+        assert record.database_revision == 3
+        assert record.object_list == [ObjectIdentifier(ObjectType.ANALOG_INPUT, 1)]
+
+        # Unchanged revision: one read, cached object list kept.
+        app.confirmed_request.side_effect = [self._revision_ack(3)]
+        record = await client.refresh_device_cache(addr, 1)
+        assert len(record.object_list) == 1
+
+        # Changed revision: object list is read again.
+        app.confirmed_request.side_effect = [self._revision_ack(4), self._object_list_ack(1, 2)]
+        record = await client.refresh_device_cache(addr)
+        assert record.database_revision == 4
+        assert len(record.object_list) == 2
+
+    async def test_refresh_device_cache_needs_instance(self):
+        client = BACnetClient(self._cached_app())
+        with pytest.raises(ValueError, match="device_instance"):
+            await client.refresh_device_cache("192.168.1.100")
+
+    async def test_unknown_property_is_cached(self):
+        from bac_py.services.errors import BACnetError
+
+        app = self._cached_app()
+        app.confirmed_request.side_effect = BACnetError(
+            ErrorClass.PROPERTY, ErrorCode.UNKNOWN_PROPERTY
+        )
+        client = BACnetClient(app)
+        addr = parse_address("192.168.1.100")
+        oid = ObjectIdentifier(ObjectType.ANALOG_INPUT, 1)
+
+        with pytest.raises(BACnetError):
+            await client.read_property(addr, oid, PropertyIdentifier.DESCRIPTION)
+        assert app.device_cache.is_property_failed(addr, oid, PropertyIdentifier.DESCRIPTION)
+
+
+class TestGetObjectListPipelined:
+    """Tests for the pipelined get_object_list fallback."""
+
+    @staticmethod
+    def _device(app, count, *, reject_rpm=False, fail_at=None, bad_indices=()):
+        """Simulate a non-segmenting device whose object list has *count* entries.
+
+        The request numbered *fail_at* (1-based, element requests only)
+        times out.
+        """
+        from bac_py.app.device_cache import DeviceCache
+        from bac_py.services.errors import BACnetAbortError, BACnetRejectError, BACnetTimeoutError
+        from bac_py.services.read_property import ReadPropertyRequest
+        from bac_py.services.read_property_multiple import ReadPropertyMultipleRequest
+        from bac_py.types.enums import AbortReason, RejectReason
+
+        app.config = DeviceConfig(instance_number=1)
+        app.get_device_info = MagicMock(return_value=DeviceInfo(480, int(Segmentation.NONE)))
+        app.device_cache = DeviceCache()
+        device = ObjectIdentifier(ObjectType.DEVICE, 1)
+        stats = {"rp": [], "rpm": [], "in_flight": 0, "peak": 0}
+
+        def element(index):
+            return encode_application_object_id(int(ObjectType.ANALOG_INPUT), index)
+
+        async def respond(*, destination, service_choice, service_data, timeout=None):
+            if service_choice == ConfirmedServiceChoice.READ_PROPERTY:
+                request = ReadPropertyRequest.decode(service_data)
+                index = request.property_array_index
+                if index is None:
+                    raise BACnetAbortError(AbortReason.SEGMENTATION_NOT_SUPPORTED)
+                value = encode_application_unsigned(count) if index == 0 else element(index)
+                if index:
+                    stats["rp"].append(index)
+                ack = ReadPropertyACK(device, PropertyIdentifier.OBJECT_LIST, index, value)
+            else:
+                if reject_rpm:
+                    raise BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+                request = ReadPropertyMultipleRequest.decode(service_data)
+                stats["rpm"].append(len(service_data))
+                results = []
+                for ref in request.list_of_read_access_specs[0].list_of_property_references:
+                    index = ref.property_array_index
+                    if index in bad_indices:
+                        results.append(
+                            ReadResultElement(
+                                PropertyIdentifier.OBJECT_LIST,
+                                index,
+                                property_access_error=(
+                                    ErrorClass.PROPERTY,
+                                    ErrorCode.INVALID_ARRAY_INDEX,
+                                ),
+                            )
+                        )
+                    else:
+                        results.append(
+                            ReadResultElement(
+                                PropertyIdentifier.OBJECT_LIST,
+                                index,
+                                property_value=element(index),
+                            )
+                        )
+                ack = ReadPropertyMultipleACK([ReadAccessResult(device, results)])
+            stats["in_flight"] += 1
+            stats["peak"] = max(stats["peak"], stats["in_flight"])
+            await asyncio.sleep(0)
+            stats["in_flight"] -= 1
+            if fail_at is not None and len(stats["rp"]) + len(stats["rpm"]) == fail_at:
+                raise BACnetTimeoutError("timed out")
+            return ack.encode()
+
+        app.confirmed_request = AsyncMock(side_effect=respond)
+        return stats
+
+    @staticmethod
+    def _expected(count, skip=()):
+        return [
+            ObjectIdentifier(ObjectType.ANALOG_INPUT, i)
+            for i in range(1, count + 1)
+            if i not in skip
+        ]
+
+    async def test_elements_packed_into_rpm(self):
+        app = MagicMock()
+        stats = self._device(app, 1000)
+        client = BACnetClient(app)
+
+        result = await client.get_object_list("192.168.1.100", 1, max_in_flight=3)
+
+        assert result == self._expected(1000)
+        assert stats["rp"] == []
+        assert 1 < len(stats["rpm"]) < 100
+        assert all(size <= 480 - 4 for size in stats["rpm"])
+        assert 1 < stats["peak"] <= 3
+
+    async def test_rpm_rejected_falls_back_to_read_property(self):
+        app = MagicMock()
+        stats = self._device(app, 20, reject_rpm=True)
+        client = BACnetClient(app)
+
+        result = await client.get_object_list("192.168.1.100", 1, max_in_flight=5)
+
+        assert result == self._expected(20)
+        assert sorted(stats["rp"]) == list(range(1, 21))
+        assert 1 < stats["peak"] <= 5
+        addr = parse_address("192.168.1.100")
+        assert app.device_cache.is_service_failed(
+            addr, ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+        )
+
+    async def test_element_errors_are_skipped(self):
+        app = MagicMock()
+        self._device(app, 10, bad_indices={4, 7})
+        client = BACnetClient(app)
+
+        result = await client.get_object_list("192.168.1.100", 1)
+
+        assert result == self._expected(10, skip={4, 7})
+
+    async def test_resume_after_failure(self):
+        from bac_py.app.client import ObjectListProgress
+        from bac_py.services.errors import BACnetTimeoutError
+
+        app = MagicMock()
+        stats = self._device(app, 500, fail_at=3)
+        client = BACnetClient(app)
+        progress = ObjectListProgress()
+
+        with pytest.raises(BACnetTimeoutError):
+            await client.get_object_list("192.168.1.100", 1, max_in_flight=1, progress=progress)
+        assert progress.count == 500
+        assert 0 < len(progress.elements) < 500
+        assert not progress.complete
+        done = len(progress.elements)
+
+        stats = self._device(app, 500)
+        result = await client.get_object_list("192.168.1.100", 1, progress=progress)
+
+        assert result == self._expected(500)
+        assert progress.complete
+        # Only the missing elements were requested; count and list not re-read.
+        assert all(
+            call.kwargs["service_choice"] == ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+            for call in app.confirmed_request.call_args_list
+        )
+        assert len(stats["rpm"]) < len(self._expected(500)) - done
+
+    async def test_invalid_max_in_flight(self):
+        client = BACnetClient(MagicMock())
+        with pytest.raises(ValueError, match="max_in_flight"):
+            await client.get_object_list("192.168.1.100", 1, max_in_flight=0)
+
 
 class TestAcknowledgeAlarm:
     """Tests for acknowledge_alarm() confirmed service."""
@@ -1862,6 +2230,8 @@ class TestConvenienceWrappers:
         app.unregister_temporary_handler = MagicMock()
         app.register_cov_callback = MagicMock()
         app.unregister_cov_callback = MagicMock()
+        app.config = DeviceConfig(instance_number=1)
+        app.get_device_info = MagicMock(return_value=None)
         return app
 
     # --- write_multiple ---
@@ -2770,6 +3140,9 @@ class TestBackupRestore:
         app.unconfirmed_request = MagicMock()
         app.register_temporary_handler = MagicMock()
         app.unregister_temporary_handler = MagicMock()
+        app.config.max_apdu_length = 1476
+        app.config.max_segments = None
+        app.get_device_info.return_value = None
         client = BACnetClient(app)
         return client
 
@@ -2862,9 +3235,8 @@ class TestBackupRestore:
         """_download_file reads a file in a single chunk (end_of_file=True)."""
         from bac_py.services.file_access import AtomicReadFileACK, StreamReadACK
 
-        app = MagicMock()
-        app.confirmed_request = AsyncMock()
-        client = BACnetClient(app)
+        client = self._make_client()
+        app = client.app
 
         file_oid = ObjectIdentifier(ObjectType.FILE, 1)
 
@@ -2885,9 +3257,8 @@ class TestBackupRestore:
         """_download_file reads a file across multiple chunks."""
         from bac_py.services.file_access import AtomicReadFileACK, StreamReadACK
 
-        app = MagicMock()
-        app.confirmed_request = AsyncMock()
-        client = BACnetClient(app)
+        client = self._make_client()
+        app = client.app
 
         file_oid = ObjectIdentifier(ObjectType.FILE, 1)
 
@@ -2907,7 +3278,8 @@ class TestBackupRestore:
         )
         app.confirmed_request.side_effect = [chunk1.encode(), chunk2.encode()]
 
-        data = await client._download_file(PEER, file_oid)
+        data = bytearray()
+        await client.download_file(PEER, file_oid, data.extend, window=1, chunk_size=6)
         assert data == b"chunk1chunk2"
         assert app.confirmed_request.call_count == 2
 
@@ -3508,6 +3880,8 @@ class TestGetObjectListFallback:
         app.unconfirmed_request = MagicMock()
         app.register_temporary_handler = MagicMock()
         app.unregister_temporary_handler = MagicMock()
+        # Device without ReadPropertyMultiple: elements are read singly
+        app.device_cache.is_service_failed.return_value = True
         client = BACnetClient(app)
 
         # First call (full list) raises segmentation-not-supported
@@ -3611,6 +3985,34 @@ class TestDiscoverExtendedRPMErrorHandling:
         assert result[0].profile_name is None
         assert result[0].profile_location is None
 
+    async def test_discover_extended_bounds_concurrency(self):
+        """discover_extended keeps at most max_concurrency enrichment reads in flight."""
+        app = MagicMock()
+        client = BACnetClient(app)
+        devices = []
+        for i in range(10):
+            dev = MagicMock()
+            dev.instance = i
+            devices.append(dev)
+        client.discover = AsyncMock(return_value=devices)
+
+        in_flight = 0
+        peak = 0
+
+        async def rpm(address, specs, timeout=None):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return ReadPropertyMultipleACK(list_of_read_access_results=[])
+
+        client.read_property_multiple = rpm
+
+        result = await client.discover_extended(timeout=0.1, max_concurrency=3)
+        assert len(result) == 10
+        assert peak == 3
+
 
 class TestGetEventInformationPagination:
     """Test get_event_information with pagination."""
@@ -3685,6 +4087,8 @@ class TestReadMultipleNonePropertyValue:
         app.unconfirmed_request = MagicMock()
         app.register_temporary_handler = MagicMock()
         app.unregister_temporary_handler = MagicMock()
+        app.config = DeviceConfig(instance_number=1)
+        app.get_device_info = MagicMock(return_value=None)
 
         # Craft a ReadPropertyMultipleACK with empty property_value
         ack = ReadPropertyMultipleACK(
@@ -3724,6 +4128,8 @@ class TestGetObjectListSegmentationFallback:
         app.unconfirmed_request = MagicMock()
         app.register_temporary_handler = MagicMock()
         app.unregister_temporary_handler = MagicMock()
+        # Device without ReadPropertyMultiple: elements are read singly
+        app.device_cache.is_service_failed.return_value = True
         client = BACnetClient(app)
 
         # First call: raises segmentation not supported
@@ -5,7 +5,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from bac_py.app.cov import COVManager
+from bac_py.app.cov import COVCoalescing, COVManager
+from bac_py.encoding.primitives import encode_application_real
 from bac_py.network.address import BACnetAddress
 from bac_py.objects.analog import AnalogValueObject
 from bac_py.objects.base import ObjectDatabase
@@ -13,6 +14,7 @@ from bac_py.objects.binary import BinaryValueObject
 from bac_py.objects.multistate import MultiStateValueObject
 from bac_py.services.cov import (
     BACnetPropertyReference,
+    COVNotificationMultipleRequest,
     COVNotificationRequest,
     COVReference,
     COVSubscriptionSpecification,
@@ -2273,3 +2275,241 @@ class TestCOVIncrementThresholdBranches:
         av._properties[PropertyIdentifier.PRESENT_VALUE] = 60.0
         cov.check_and_notify(av, PropertyIdentifier.PRESENT_VALUE)
         app.unconfirmed_request.assert_called_once()
+
+
+class TestCOVCoalescing:
+    """Tests for coalesced COV notification delivery."""
+
+    def _subscribe(self, app, cov, db, av, *, process_id=42, confirmed=False, lifetime=None):
+        request = SubscribeCOVRequest(
+            subscriber_process_identifier=process_id,
+            monitored_object_identifier=av.object_identifier,
+            issue_confirmed_notifications=confirmed,
+            lifetime=lifetime,
+        )
+        _subscribe_and_reset(app, cov, SUBSCRIBER, request, db)
+
+    def _setup(self, count=3, **coalescing):
+        app = _make_app()
+        app.object_db = db = ObjectDatabase()
+        cov = COVManager(
+            app,
+            coalescing=COVCoalescing(
+                **{"max_notification_delay": 60.0, "use_multiple": True, **coalescing}
+            ),
+        )
+        objects = []
+        for i in range(1, count + 1):
+            av = AnalogValueObject(i)
+            db.add(av)
+            objects.append(av)
+        return app, db, cov, objects
+
+    def _change(self, cov, av, value):
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, value)
+        cov.check_and_notify(av, PropertyIdentifier.PRESENT_VALUE)
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError, match="max_notification_delay"):
+            COVCoalescing(max_notification_delay=-1)
+        with pytest.raises(ValueError, match="max_batch_size"):
+            COVCoalescing(max_batch_size=0)
+
+    async def test_changes_batched_into_multiple(self):
+        app, db, cov, objects = self._setup()
+        for av in objects:
+            self._subscribe(app, cov, db, av, lifetime=300)
+
+        for av in objects:
+            self._change(cov, av, 10.0)
+        app.unconfirmed_request.assert_not_called()
+
+        cov.flush_pending()
+        app.unconfirmed_request.assert_called_once()
+        kwargs = app.unconfirmed_request.call_args.kwargs
+        assert (
+            kwargs["service_choice"]
+            == UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION_MULTIPLE
+        )
+        request = COVNotificationMultipleRequest.decode(kwargs["service_data"])
+        assert request.subscriber_process_identifier == 42
+        assert 0 < request.time_remaining <= 300
+        assert [n.monitored_object_identifier for n in request.list_of_cov_notifications] == [
+            av.object_identifier for av in objects
+        ]
+        values = request.list_of_cov_notifications[0].list_of_values
+        assert [v.property_identifier for v in values] == [
+            PropertyIdentifier.PRESENT_VALUE,
+            PropertyIdentifier.STATUS_FLAGS,
+        ]
+
+    async def test_repeated_changes_send_latest_value(self):
+        app, db, cov, objects = self._setup(count=1, use_multiple=False)
+        av = objects[0]
+        self._subscribe(app, cov, db, av)
+
+        for value in (1.0, 2.0, 3.0):
+            self._change(cov, av, value)
+        cov.flush_pending()
+
+        app.unconfirmed_request.assert_called_once()
+        kwargs = app.unconfirmed_request.call_args.kwargs
+        assert kwargs["service_choice"] == UnconfirmedServiceChoice.UNCONFIRMED_COV_NOTIFICATION
+        notification = COVNotificationRequest.decode(kwargs["service_data"])
+        assert notification.list_of_values[0].value == encode_application_real(3.0)
+        sub = next(iter(cov._subscriptions.values()))
+        assert sub.last_present_value == 3.0
+
+        # Already reported: no new notification without a further change
+        cov.check_and_notify(av, PropertyIdentifier.PRESENT_VALUE)
+        cov.flush_pending()
+        app.unconfirmed_request.assert_called_once()
+
+    async def test_fallback_sends_one_notification_per_object(self):
+        app, db, cov, objects = self._setup(use_multiple=None)
+        for av in objects:
+            self._subscribe(app, cov, db, av, confirmed=True)
+            self._change(cov, av, 5.0)
+        cov.flush_pending()
+
+        assert app.send_confirmed_cov_notification.call_count == 3
+        for call in app.send_confirmed_cov_notification.call_args_list:
+            assert call.args[2] == ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION
+
+    @staticmethod
+    def _property_multiple_request(object_ids):
+        return SubscribeCOVPropertyMultipleRequest(
+            subscriber_process_identifier=7,
+            list_of_cov_subscription_specifications=[
+                COVSubscriptionSpecification(
+                    monitored_object_identifier=object_id,
+                    list_of_cov_references=[
+                        COVReference(
+                            monitored_property=BACnetPropertyReference(
+                                property_identifier=int(PropertyIdentifier.PRESENT_VALUE),
+                            ),
+                        ),
+                    ],
+                )
+                for object_id in object_ids
+            ],
+            issue_confirmed_notifications=True,
+        )
+
+    async def test_property_multiple_subscriber_gets_multiple(self):
+        app, db, cov, objects = self._setup(count=2, use_multiple=None)
+        request = self._property_multiple_request([av.object_identifier for av in objects])
+        cov.subscribe_property_multiple(SUBSCRIBER, request, db)
+        app.send_confirmed_cov_notification.reset_mock()
+
+        for av in objects:
+            av.write_property(PropertyIdentifier.PRESENT_VALUE, 9.0)
+            cov.check_and_notify_property(av, PropertyIdentifier.PRESENT_VALUE)
+        cov.flush_pending()
+
+        app.send_confirmed_cov_notification.assert_called_once()
+        encoded, address, choice = app.send_confirmed_cov_notification.call_args.args
+        assert address == SUBSCRIBER
+        assert choice == ConfirmedServiceChoice.CONFIRMED_COV_NOTIFICATION_MULTIPLE
+        request = COVNotificationMultipleRequest.decode(encoded)
+        assert request.time_remaining == 0
+        assert len(request.list_of_cov_notifications) == 2
+
+    async def test_multiple_subscriber_forgotten_after_unsubscribe(self):
+        _app, db, cov, objects = self._setup(count=2, use_multiple=None)
+        request = self._property_multiple_request([av.object_identifier for av in objects])
+        cov.subscribe_property_multiple(SUBSCRIBER, request, db)
+        assert SUBSCRIBER in cov._multiple_subscribers
+
+        pv = int(PropertyIdentifier.PRESENT_VALUE)
+        cov.unsubscribe_property(SUBSCRIBER, 7, objects[0].object_identifier, pv)
+        assert SUBSCRIBER in cov._multiple_subscribers
+        cov.unsubscribe_property(SUBSCRIBER, 7, objects[1].object_identifier, pv)
+        assert not cov._multiple_subscribers
+        assert not cov._property_sub_counts
+
+    async def test_multiple_subscriber_forgotten_after_expiry_and_removal(self):
+        _app, db, cov, objects = self._setup(count=2, use_multiple=None)
+        request = self._property_multiple_request([av.object_identifier for av in objects])
+        cov.subscribe_property_multiple(SUBSCRIBER, request, db)
+        # Re-subscribing replaces the subscriptions without counting them twice.
+        cov.subscribe_property_multiple(SUBSCRIBER, request, db)
+        assert cov._property_sub_counts == {SUBSCRIBER: 2}
+
+        first_key = next(
+            k for k in cov._property_subscriptions if k[2] == objects[0].object_identifier
+        )
+        cov._on_property_subscription_expired(first_key)
+        assert SUBSCRIBER in cov._multiple_subscribers
+        db.remove(objects[1].object_identifier)
+        cov.remove_object_subscriptions(objects[1].object_identifier)
+        assert not cov._multiple_subscribers
+        assert not cov._property_sub_counts
+
+    async def test_failed_property_multiple_not_remembered(self):
+        _app, db, cov, _ = self._setup(count=1, use_multiple=None)
+        request = self._property_multiple_request([ObjectIdentifier(ObjectType.ANALOG_VALUE, 99)])
+        with pytest.raises(BACnetError):
+            cov.subscribe_property_multiple(SUBSCRIBER, request, db)
+        assert not cov._multiple_subscribers
+
+    async def test_full_batch_sent_immediately(self):
+        app, db, cov, objects = self._setup(count=4, max_batch_size=2)
+        for av in objects:
+            self._subscribe(app, cov, db, av)
+        for av in objects[:3]:
+            self._change(cov, av, 1.0)
+
+        app.unconfirmed_request.assert_called_once()
+        request = COVNotificationMultipleRequest.decode(
+            app.unconfirmed_request.call_args.kwargs["service_data"]
+        )
+        assert len(request.list_of_cov_notifications) == 2
+        assert len(cov._pending_batches) == 1
+
+    async def test_delay_timer_flushes(self):
+        app, db, cov, objects = self._setup(count=2, max_notification_delay=0.01)
+        for av in objects:
+            self._subscribe(app, cov, db, av)
+            self._change(cov, av, 1.0)
+        app.unconfirmed_request.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        app.unconfirmed_request.assert_called_once()
+        assert not cov._pending_batches
+
+    async def test_separate_batches_per_process(self):
+        app, db, cov, objects = self._setup(count=2)
+        self._subscribe(app, cov, db, objects[0], process_id=1)
+        self._subscribe(app, cov, db, objects[1], process_id=2)
+        for av in objects:
+            self._change(cov, av, 1.0)
+        cov.flush_pending()
+        assert app.unconfirmed_request.call_count == 2
+
+    async def test_cancelled_subscription_skipped(self):
+        app, db, cov, objects = self._setup(count=2)
+        for av in objects:
+            self._subscribe(app, cov, db, av)
+            self._change(cov, av, 1.0)
+        cov.unsubscribe(SUBSCRIBER, 42, objects[0].object_identifier)
+        db.remove(objects[1].object_identifier)
+        cov.flush_pending()
+        app.unconfirmed_request.assert_not_called()
+
+    async def test_per_subscriber_override(self):
+        app, db, cov, objects = self._setup(count=1)
+        cov.set_coalescing(SUBSCRIBER, None)
+        self._subscribe(app, cov, db, objects[0])
+        self._change(cov, objects[0], 1.0)
+        app.unconfirmed_request.assert_called_once()
+        assert not cov._pending_batches
+
+    async def test_shutdown_drops_pending(self):
+        app, db, cov, objects = self._setup(count=1)
+        self._subscribe(app, cov, db, objects[0])
+        self._change(cov, objects[0], 1.0)
+        cov.shutdown()
+        assert not cov._pending_batches
+        cov.flush_pending()
+        app.unconfirmed_request.assert_not_called()
@@ -0,0 +1,245 @@
+"""Tests for the peer device capability cache and its backends."""
+
+import json
+
+import pytest
+
+from bac_py.app.device_cache import (
+    DeviceCache,
+    DeviceCacheBackend,
+    DeviceInfo,
+    DeviceRecord,
+    JSONDeviceCacheBackend,
+    SQLiteDeviceCacheBackend,
+)
+from bac_py.network.address import BACnetAddress
+from bac_py.types.enums import ObjectType, PropertyIdentifier, Segmentation
+from bac_py.types.primitives import ObjectIdentifier
+
+AI1 = ObjectIdentifier(ObjectType.ANALOG_INPUT, 1)
+AV2 = ObjectIdentifier(ObjectType.ANALOG_VALUE, 2)
+
+
+def _addr(i: int, network: int | None = None) -> BACnetAddress:
+    return BACnetAddress(network=network, mac_address=bytes([10, 0, 0, i, 0xBA, 0xC0]))
+
+
+def _i_am(cache: DeviceCache, address: BACnetAddress, instance: int, **kwargs) -> DeviceRecord:
+    kwargs.setdefault("max_apdu_length", 480)
+    kwargs.setdefault("segmentation_supported", int(Segmentation.NONE))
+    kwargs.setdefault("vendor_id", 7)
+    return cache.update_from_i_am(address, device_instance=instance, **kwargs)
+
+
+class MemoryBackend:
+    """In-memory backend recording every call."""
+
+    def __init__(self, records=None):
+        self.rows = {r.address: r.to_dict() for r in records or []}
+        self.saves: list[list[BACnetAddress]] = []
+        self.deletes: list[list[BACnetAddress]] = []
+        self.closed = False
+
+    def load(self):
+        return [DeviceRecord.from_dict(row) for row in self.rows.values()]
+
+    def save(self, records):
+        self.saves.append([r.address for r in records])
+        for r in records:
+            self.rows[r.address] = r.to_dict()
+
+    def delete(self, addresses):
+        self.deletes.append(list(addresses))
+        for a in addresses:
+            self.rows.pop(a, None)
+
+    def close(self):
+        self.closed = True
+
+
+class TestDeviceCache:
+    def test_update_from_i_am(self):
+        cache = DeviceCache()
+        record = _i_am(cache, _addr(1), 100, max_apdu_length=1476)
+        assert record.device_instance == 100
+        assert record.vendor_id == 7
+        assert cache.get_device_info(_addr(1)) == DeviceInfo(1476, int(Segmentation.NONE))
+        assert cache.find_by_instance(100) is record
+        assert cache.get_device_info(_addr(2)) is None
+
+    def test_record_without_i_am_has_no_device_info(self):
+        cache = DeviceCache()
+        cache.set_object_list(_addr(1), [AI1])
+        assert cache.get(_addr(1)).object_list == [AI1]
+        assert cache.get_device_info(_addr(1)) is None
+
+    def test_lru_eviction(self):
+        cache = DeviceCache(max_entries=3)
+        for i in range(3):
+            _i_am(cache, _addr(i), i)
+        cache.get(_addr(0))
+        _i_am(cache, _addr(3), 3)
+        assert _addr(1) not in cache
+        assert {r.device_instance for r in cache} == {0, 2, 3}
+        assert cache.find_by_instance(1) is None
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            DeviceCache(max_entries=0)
+
+    def test_new_instance_at_address_discards_data(self):
+        cache = DeviceCache()
+        _i_am(cache, _addr(1), 100)
+        cache.set_object_list(_addr(1), [AI1])
+        cache.mark_service_failed(_addr(1), 14)
+        record = _i_am(cache, _addr(1), 200)
+        assert record.object_list is None
+        assert record.failed_services == set()
+        assert cache.find_by_instance(100) is None
+        assert cache.find_by_instance(200) is record
+
+    def test_device_moved_drops_old_address(self):
+        cache = DeviceCache()
+        _i_am(cache, _addr(1), 100)
+        _i_am(cache, _addr(2), 100)
+        assert _addr(1) not in cache
+        assert cache.find_by_instance(100).address == _addr(2)
+
+    def test_database_revision_invalidates(self):
+        cache = DeviceCache()
+        address = _addr(1)
+        assert cache.set_database_revision(address, 5) is False
+        cache.set_object_list(address, [AI1, AV2])
+        cache.mark_property_failed(address, AI1, PropertyIdentifier.DESCRIPTION)
+        cache.mark_service_failed(address, 14)
+
+        assert cache.set_database_revision(address, 5) is False
+        assert cache.get(address).object_list == [AI1, AV2]
+
+        assert cache.set_database_revision(address, 6) is True
+        record = cache.get(address)
+        assert record.object_list is None
+        assert record.failed_properties == set()
+        assert record.failed_services == {14}
+        assert record.database_revision == 6
+
+    def test_failed_properties_and_services(self):
+        cache = DeviceCache()
+        address = _addr(1)
+        assert not cache.is_property_failed(address, AI1, PropertyIdentifier.DESCRIPTION)
+        cache.mark_property_failed(address, AI1, PropertyIdentifier.DESCRIPTION)
+        assert cache.is_property_failed(address, AI1, PropertyIdentifier.DESCRIPTION)
+        assert not cache.is_service_failed(address, 14)
+        cache.mark_service_failed(address, 14)
+        assert cache.is_service_failed(address, 14)
+
+    def test_record_round_trip(self):
+        record = DeviceRecord(
+            _addr(1, network=5),
+            max_apdu_length=480,
+            segmentation_supported=int(Segmentation.BOTH),
+            device_instance=100,
+            vendor_id=7,
+            database_revision=3,
+            object_list=[AI1, AV2],
+            failed_properties={(AI1, PropertyIdentifier.DESCRIPTION)},
+            failed_services={14},
+            updated=123.5,
+        )
+        data = json.loads(json.dumps(record.to_dict()))
+        assert DeviceRecord.from_dict(data) == record
+
+
+class TestDeviceCachePersistence:
+    def test_flush_writes_only_changes(self):
+        backend = MemoryBackend()
+        cache = DeviceCache(backend)
+        _i_am(cache, _addr(1), 1)
+        _i_am(cache, _addr(2), 2)
+        assert cache.flush() == 2
+        assert cache.flush() == 0
+
+        cache.set_object_list(_addr(2), [AI1])
+        # Repeating an identical I-Am is not a change.
+        _i_am(cache, _addr(1), 1)
+        assert cache.flush() == 1
+        assert backend.saves[-1] == [_addr(2)]
+
+    def test_eviction_deletes_from_backend(self):
+        backend = MemoryBackend()
+        cache = DeviceCache(backend, max_entries=1)
+        _i_am(cache, _addr(1), 1)
+        cache.flush()
+        _i_am(cache, _addr(2), 2)
+        cache.flush()
+        assert backend.deletes == [[_addr(1)]]
+        assert list(backend.rows) == [_addr(2)]
+
+    def test_failed_flush_is_retried(self):
+        backend = MemoryBackend()
+        cache = DeviceCache(backend)
+        _i_am(cache, _addr(1), 1)
+
+        def fail(records):
+            raise OSError("disk full")
+
+        backend.save = fail
+        with pytest.raises(OSError, match="disk full"):
+            cache.flush()
+        del backend.save
+        assert cache.flush() == 1
+
+    def test_load_keeps_most_recent(self):
+        records = [
+            DeviceRecord(_addr(i), max_apdu_length=480, segmentation_supported=3, updated=i)
+            for i in range(5)
+        ]
+        cache = DeviceCache(MemoryBackend(records), max_entries=3)
+        assert cache.load() == 3
+        assert [r.address for r in cache] == [_addr(2), _addr(3), _addr(4)]
+        # Dropped records are removed from the backend on the next flush.
+        cache.flush()
+        assert len(cache.backend.rows) == 3
+
+    def test_load_without_backend(self):
+        assert DeviceCache().load() == 0
+
+    @pytest.mark.parametrize(
+        "make_backend",
+        [
+            lambda p: JSONDeviceCacheBackend(p / "devices.json"),
+            lambda p: SQLiteDeviceCacheBackend(p / "devices.db"),
+        ],
+        ids=["json", "sqlite"],
+    )
+    def test_backend_survives_restart(self, tmp_path, make_backend):
+        backend = make_backend(tmp_path)
+        assert isinstance(backend, DeviceCacheBackend)
+        cache = DeviceCache(backend)
+        _i_am(cache, _addr(1), 100, max_apdu_length=1476)
+        _i_am(cache, _addr(2, network=7), 200)
+        cache.set_database_revision(_addr(1), 9)
+        cache.set_object_list(_addr(1), [AI1, AV2])
+        cache.mark_service_failed(_addr(2, network=7), 14)
+        cache.flush()
+        cache.remove(_addr(2, network=7))
+        cache.flush()
+        backend.close()
+
+        restored = DeviceCache(make_backend(tmp_path))
+        assert restored.load() == 1
+        record = restored.get(_addr(1))
+        assert record.max_apdu_length == 1476
+        assert record.database_revision == 9
+        assert record.object_list == [AI1, AV2]
+        assert restored.find_by_instance(100) is record
+        restored.backend.close()
+
+    def test_json_backend_ignores_corrupt_file(self, tmp_path):
+        path = tmp_path / "devices.json"
+        path.write_text("{not json")
+        cache = DeviceCache(JSONDeviceCacheBackend(path))
+        assert cache.load() == 0
+        _i_am(cache, _addr(1), 1)
+        cache.flush()
+        assert json.loads(path.read_text())["devices"][0]["device_instance"] == 1
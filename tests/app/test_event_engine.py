@@ -22,6 +22,7 @@ from bac_py.types.constructed import (
     BACnetDeviceObjectPropertyReference,
 )
 from bac_py.types.enums import (
+    ConfirmedServiceChoice,
     EventState,
     EventType,
     LifeSafetyState,
@@ -66,20 +67,6 @@ class TestEventEngineLifecycle:
         engine = EventEngine(app, scan_interval=0.01)
         await engine.stop()  # Should not raise
 
-    @pytest.mark.asyncio
-    async def test_stop_clears_pending_confirmed_tasks(self):
-        """Stop should cancel and clear _pending_confirmed_tasks."""
-        app = _make_app()
-        engine = EventEngine(app, scan_interval=0.01)
-        await engine.start()
-        # Simulate pending tasks
-        dummy_task = asyncio.create_task(asyncio.sleep(999))
-        engine._pending_confirmed_tasks.add(dummy_task)
-        assert len(engine._pending_confirmed_tasks) == 1
-        await engine.stop()
-        assert len(engine._pending_confirmed_tasks) == 0
-        assert dummy_task.cancelling() or dummy_task.cancelled()
-
     @pytest.mark.asyncio
     async def test_double_start(self):
         """Calling start twice does not create duplicate tasks."""
@@ -2605,14 +2592,13 @@ class TestNotificationDispatchCoverage:
 
         engine._send_notification_confirmed(notification, dest)
 
-    async def test_confirmed_sends_task_in_event_loop(self):
-        """Confirmed notification creates an asyncio task (lines 1257-1260)."""
+    async def test_confirmed_queued_for_delivery(self):
+        """Confirmed notification is queued on the application delivery queue."""
         from bac_py.network.address import BACnetAddress
         from bac_py.types.constructed import BACnetRecipient
         from bac_py.types.primitives import BACnetTime
 
         app = _make_app()
-        app.confirmed_request = AsyncMock()
         engine = self._make_engine(app)
 
         notification = MagicMock()
@@ -2631,21 +2617,9 @@ class TestNotificationDispatchCoverage:
 
         engine._send_notification_confirmed(notification, dest)
 
-        # Allow the task to complete
-        import asyncio
-
-        await asyncio.sleep(0.05)
-
-        assert app.confirmed_request.called
-
-    async def test_send_confirmed_async_failure(self):
-        """_send_confirmed_async handles exception (lines 1274-1275)."""
-        app = _make_app()
-        app.confirmed_request = AsyncMock(side_effect=RuntimeError("net error"))
-        engine = self._make_engine(app)
-
-        # Should not raise
-        await engine._send_confirmed_async(b"\x00", MagicMock())
+        app.send_confirmed_notification.assert_called_once_with(
+            b"\x00", target_addr, ConfirmedServiceChoice.CONFIRMED_EVENT_NOTIFICATION
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -3830,3 +3804,231 @@ class TestRemainingBranches:
         EventEngine._sync_state_machine(sm, ee)
         # event_enable should remain default since "not-a-list" fails isinstance check
         assert sm.event_enable == [True, True, True]
+
+
+# ---------------------------------------------------------------------------
+# Change-driven evaluation
+# ---------------------------------------------------------------------------
+
+
+class TestChangeDrivenEvaluation:
+    """Intrinsic reporting driven by ObjectDatabase change callbacks."""
+
+    @staticmethod
+    def _make_av(instance: int = 1, *, time_delay: int = 0) -> AnalogValueObject:
+        av = AnalogValueObject(
+            instance,
+            high_limit=80.0,
+            low_limit=10.0,
+            deadband=5.0,
+            event_enable=[True, True, True],
+            time_delay=time_delay,
+        )
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 50.0
+        return av
+
+    @staticmethod
+    def _count_evaluations(engine: EventEngine) -> list[ObjectIdentifier]:
+        evaluated: list[ObjectIdentifier] = []
+        original = engine._evaluate_intrinsic
+
+        def _spy(obj, now):
+            evaluated.append(obj.object_identifier)
+            original(obj, now)
+
+        engine._evaluate_intrinsic = _spy  # type: ignore[method-assign]
+        return evaluated
+
+    def test_only_changed_objects_evaluated(self):
+        app = _make_app()
+        objs = [self._make_av(i) for i in range(1, 6)]
+        for obj in objs:
+            app.object_db.add(obj)
+        engine = EventEngine(app, change_driven=True)
+        evaluated = self._count_evaluations(engine)
+
+        engine._evaluate_cycle()
+        assert len(evaluated) == 5
+
+        evaluated.clear()
+        engine._evaluate_cycle()
+        assert evaluated == []
+
+        objs[2].write_property(PropertyIdentifier.PRESENT_VALUE, 85.0)
+        engine._evaluate_cycle()
+        assert evaluated == [objs[2].object_identifier]
+        assert app.unconfirmed_request.called
+
+    def test_limit_change_triggers_evaluation(self):
+        app = _make_app()
+        av = self._make_av()
+        app.object_db.add(av)
+        engine = EventEngine(app, change_driven=True)
+        engine._evaluate_cycle()
+        assert not app.unconfirmed_request.called
+
+        av.write_property(PropertyIdentifier.HIGH_LIMIT, 40.0)
+        engine._evaluate_cycle()
+        assert av._properties[PropertyIdentifier.EVENT_STATE] == EventState.HIGH_LIMIT
+
+    def test_polarity_change_triggers_evaluation(self):
+        from typing import ClassVar
+
+        from bac_py.objects.base import PropertyAccess, PropertyDefinition
+        from bac_py.objects.binary import BinaryInputObject
+        from bac_py.types.enums import BinaryPV, Polarity
+
+        class _WritablePolarityInput(BinaryInputObject):
+            PROPERTY_DEFINITIONS: ClassVar[dict[PropertyIdentifier, PropertyDefinition]] = {
+                **BinaryInputObject.PROPERTY_DEFINITIONS,
+                PropertyIdentifier.POLARITY: PropertyDefinition(
+                    PropertyIdentifier.POLARITY,
+                    Polarity,
+                    PropertyAccess.READ_WRITE,
+                    required=True,
+                    default=Polarity.NORMAL,
+                ),
+            }
+
+        app = _make_app()
+        bi = _WritablePolarityInput(
+            1, alarm_value=BinaryPV.ACTIVE, event_enable=[True, True, True], time_delay=0
+        )
+        bi._properties[PropertyIdentifier.PRESENT_VALUE] = BinaryPV.INACTIVE
+        app.object_db.add(bi)
+        engine = EventEngine(app, change_driven=True)
+        engine._evaluate_cycle()
+        assert bi._properties[PropertyIdentifier.EVENT_STATE] == EventState.NORMAL
+
+        # Reversing polarity turns the read Present_Value ACTIVE
+        bi.write_property(PropertyIdentifier.POLARITY, Polarity.REVERSE)
+        engine._evaluate_cycle()
+        assert bi._properties[PropertyIdentifier.EVENT_STATE] == EventState.OFFNORMAL
+
+    def test_time_delay_fires_from_timer_heap(self):
+        app = _make_app()
+        av = self._make_av(time_delay=10)
+        app.object_db.add(av)
+        engine = EventEngine(app, change_driven=True)
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 85.0)
+
+        engine._evaluate_changed(100.0)
+        assert engine._deadlines == {av.object_identifier: 110.0}
+        evaluated = self._count_evaluations(engine)
+
+        engine._evaluate_changed(105.0)
+        assert evaluated == []
+        assert not app.unconfirmed_request.called
+
+        engine._evaluate_changed(110.0)
+        assert evaluated == [av.object_identifier]
+        assert app.unconfirmed_request.called
+        assert engine._deadlines == {}
+
+    def test_cleared_condition_cancels_timer(self):
+        app = _make_app()
+        av = self._make_av(time_delay=10)
+        app.object_db.add(av)
+        engine = EventEngine(app, change_driven=True)
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 85.0)
+        engine._evaluate_changed(100.0)
+
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 50.0)
+        engine._evaluate_changed(105.0)
+        assert engine._deadlines == {}
+
+        evaluated = self._count_evaluations(engine)
+        engine._evaluate_changed(110.0)
+        assert evaluated == []
+        assert not app.unconfirmed_request.called
+
+    def test_objects_added_and_removed(self):
+        app = _make_app()
+        db = app.object_db
+        engine = EventEngine(app, change_driven=True)
+        engine._evaluate_cycle()
+
+        av = self._make_av()
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 85.0
+        db.add(av)
+        engine._evaluate_cycle()
+        assert app.unconfirmed_request.called
+        assert (av.object_identifier, PropertyIdentifier.PRESENT_VALUE) in db._change_callbacks
+
+        db.remove(av.object_identifier)
+        engine._evaluate_cycle()
+        assert av.object_identifier not in engine._watches
+        assert not any(oid == av.object_identifier for oid, _ in db._change_callbacks)
+
+    def test_object_recreated_under_same_identifier(self):
+        app = _make_app()
+        db = app.object_db
+        untouched = self._make_av(1)
+        db.add(untouched)
+        db.add(self._make_av(2))
+        engine = EventEngine(app, change_driven=True)
+        engine._evaluate_cycle()
+
+        db.remove(ObjectIdentifier(ObjectType.ANALOG_VALUE, 2))
+        replacement = self._make_av(2)
+        db.add(replacement)
+        engine._evaluate_cycle()
+        assert engine._watched_objects[replacement.object_identifier] is replacement
+
+        replacement.write_property(PropertyIdentifier.PRESENT_VALUE, 95.0)
+        untouched.write_property(PropertyIdentifier.PRESENT_VALUE, 95.0)
+        engine._evaluate_cycle()
+        assert replacement._properties[PropertyIdentifier.EVENT_STATE] == EventState.HIGH_LIMIT
+        assert untouched._properties[PropertyIdentifier.EVENT_STATE] == EventState.HIGH_LIMIT
+
+    def test_resync_enabled_by_default(self):
+        engine = EventEngine(_make_app(), change_driven=True)
+        assert engine._resync_interval == 60.0
+
+    def test_notify_changed_for_direct_updates(self):
+        app = _make_app()
+        av = self._make_av()
+        app.object_db.add(av)
+        engine = EventEngine(app, change_driven=True)
+        engine._evaluate_cycle()
+
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 85.0
+        engine._evaluate_cycle()
+        assert not app.unconfirmed_request.called
+
+        engine.notify_changed(av.object_identifier)
+        engine._evaluate_cycle()
+        assert app.unconfirmed_request.called
+
+    def test_resync_reevaluates_everything(self):
+        app = _make_app()
+        av = self._make_av()
+        app.object_db.add(av)
+        engine = EventEngine(app, change_driven=True, resync_interval=60.0)
+        engine._evaluate_changed(0.0)
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 85.0
+
+        engine._evaluate_changed(30.0)
+        assert not app.unconfirmed_request.called
+        engine._evaluate_changed(60.0)
+        assert app.unconfirmed_request.called
+
+    async def test_stop_unregisters_callbacks(self):
+        app = _make_app()
+        db = app.object_db
+        db.add(self._make_av())
+        engine = EventEngine(app, scan_interval=0.01, change_driven=True)
+        assert engine.change_driven
+        await engine.start()
+        await asyncio.sleep(0.03)
+        assert db._change_callbacks
+        await engine.stop()
+        assert db._change_callbacks == {}
+        assert engine._watches == {}
+
+    def test_scan_mode_registers_no_callbacks(self):
+        app = _make_app()
+        app.object_db.add(self._make_av())
+        engine = EventEngine(app)
+        engine._evaluate_cycle()
+        assert app.object_db._change_callbacks == {}
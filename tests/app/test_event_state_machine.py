@@ -377,6 +377,18 @@ class TestTimeDelayNormal:
         sm_without = EventStateMachine(time_delay=10.0, time_delay_normal=None)
         assert sm_without.effective_time_delay_normal == 10.0
 
+    def test_pending_deadline(self) -> None:
+        sm = EventStateMachine(time_delay=5.0, time_delay_normal=2.0)
+        assert sm.pending_deadline is None
+
+        sm.evaluate(EventState.HIGH_LIMIT, NO_FAULT, 10.0)
+        assert sm.pending_deadline == 15.0
+        sm.evaluate(EventState.HIGH_LIMIT, NO_FAULT, 15.0)
+        assert sm.pending_deadline is None
+
+        sm.evaluate(None, NO_FAULT, 20.0)
+        assert sm.pending_deadline == 22.0
+
     def test_fault_clear_to_normal_uses_time_delay_normal(self) -> None:
         """When clearing from FAULT to NORMAL, time_delay_normal governs the delay."""
         sm = EventStateMachine(
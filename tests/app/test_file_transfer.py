@@ -0,0 +1,181 @@
+"""Tests for windowed file download and upload."""
+
+import asyncio
+import io
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from bac_py.app.device_cache import DeviceInfo
+from bac_py.app.file_transfer import download_file, stream_chunk_sizes, upload_file
+from bac_py.network.address import BACnetAddress
+from bac_py.objects.file import FileObject
+from bac_py.services.errors import BACnetAbortError, BACnetError
+from bac_py.services.file_access import (
+    AtomicReadFileACK,
+    AtomicWriteFileACK,
+    StreamReadACK,
+)
+from bac_py.types.enums import (
+    AbortReason,
+    ErrorClass,
+    ErrorCode,
+    ObjectType,
+    PropertyIdentifier,
+    Segmentation,
+)
+from bac_py.types.primitives import ObjectIdentifier
+
+PEER = BACnetAddress(mac_address=b"\x0a\x00\x00\x01\xba\xc0")
+FILE = ObjectIdentifier(ObjectType.FILE, 1)
+
+
+class FakeClient:
+    """Serves AtomicReadFile/AtomicWriteFile from a local File object."""
+
+    def __init__(self, data=b"", *, max_chunk=None, device_info=None, error_past_eof=False):
+        self.file = FileObject(1)
+        self.file.write_stream(0, data)
+        self.max_chunk = max_chunk
+        self.error_past_eof = error_past_eof
+        self.requests: list[tuple[int, int]] = []
+        self.in_flight = 0
+        self.peak = 0
+        self.app = SimpleNamespace(
+            config=SimpleNamespace(max_apdu_length=1476, max_segments=None),
+            get_device_info=lambda address: device_info,
+        )
+        self.rng = random.Random(7)
+
+    async def _exchange(self, start, count):
+        self.requests.append((start, count))
+        if self.max_chunk is not None and count > self.max_chunk:
+            raise BACnetAbortError(AbortReason.SEGMENTATION_NOT_SUPPORTED)
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        # Random latency so replies complete out of order
+        await asyncio.sleep(self.rng.random() / 500)
+        self.in_flight -= 1
+
+    async def atomic_read_file(self, address, file_identifier, access_method, timeout=None):
+        start = access_method.file_start_position
+        count = access_method.requested_octet_count
+        await self._exchange(start, count)
+        size = self.file.read_property(PropertyIdentifier.FILE_SIZE)
+        if self.error_past_eof and start > size:
+            raise BACnetError(ErrorClass.SERVICES, ErrorCode.INVALID_FILE_START_POSITION)
+        data, eof = self.file.read_stream(start, count)
+        return AtomicReadFileACK(eof, StreamReadACK(start, data))
+
+    async def atomic_write_file(self, address, file_identifier, access_method, timeout=None):
+        await self._exchange(access_method.file_start_position, len(access_method.file_data))
+        start = self.file.write_stream(access_method.file_start_position, access_method.file_data)
+        return AtomicWriteFileACK(is_stream=True, file_start=start)
+
+    @property
+    def contents(self):
+        return bytes(self.file.read_stream(0, 1 << 30)[0])
+
+
+def _payload(size):
+    return bytes(random.Random(size).randrange(256) for _ in range(size))
+
+
+class TestChunkSizes:
+    def test_unknown_peer_uses_local_apdu(self):
+        read, write = stream_chunk_sizes(FakeClient().app, PEER)
+        assert read < 1476
+        assert write < 1476
+
+    def test_segmenting_peer_gets_larger_reads(self):
+        info = DeviceInfo(max_apdu_length=480, segmentation_supported=Segmentation.BOTH)
+        read, write = stream_chunk_sizes(FakeClient(device_info=info).app, PEER)
+        assert read > 480
+        assert write < 480
+
+
+class TestDownload:
+    async def test_reassembles_out_of_order(self):
+        data = _payload(20_000)
+        client = FakeClient(data)
+        out = io.BytesIO()
+        size = await download_file(client, PEER, FILE, out, window=4, chunk_size=500)
+        assert size == 20_000
+        assert out.getvalue() == data
+        assert client.peak > 1
+        assert client.peak <= 4
+
+    async def test_small_file_single_request(self):
+        client = FakeClient(b"config")
+        chunks = []
+        await download_file(client, PEER, FILE, chunks.append)
+        assert b"".join(chunks) == b"config"
+        assert len(client.requests) == 1
+
+    async def test_empty_file(self):
+        chunks = []
+        assert await download_file(FakeClient(), PEER, FILE, chunks.append) == 0
+        assert chunks == []
+
+    async def test_async_sink(self):
+        data = _payload(3000)
+        received = bytearray()
+
+        async def sink(chunk):
+            await asyncio.sleep(0)
+            received.extend(chunk)
+
+        await download_file(FakeClient(data), PEER, FILE, sink, chunk_size=256)
+        assert received == data
+
+    async def test_errors_past_eof_ignored(self):
+        data = _payload(1000)
+        client = FakeClient(data, error_past_eof=True)
+        out = io.BytesIO()
+        await download_file(client, PEER, FILE, out, window=8, chunk_size=100)
+        assert out.getvalue() == data
+
+    async def test_shrinks_aborted_chunks(self):
+        data = _payload(5000)
+        client = FakeClient(data, max_chunk=400)
+        out = io.BytesIO()
+        await download_file(client, PEER, FILE, out, chunk_size=1400)
+        assert out.getvalue() == data
+        assert max(count for _, count in client.requests[-5:]) <= 400
+
+    async def test_error_within_file_raises(self):
+        class Failing(FakeClient):
+            async def atomic_read_file(
+                self, address, file_identifier, access_method, timeout=None
+            ):
+                if access_method.file_start_position == 200:
+                    raise BACnetError(ErrorClass.OBJECT, ErrorCode.FILE_ACCESS_DENIED)
+                return await super().atomic_read_file(address, file_identifier, access_method)
+
+        with pytest.raises(BACnetError):
+            await download_file(Failing(_payload(1000)), PEER, FILE, io.BytesIO(), chunk_size=100)
+
+    async def test_invalid_window(self):
+        with pytest.raises(ValueError, match="window"):
+            await download_file(FakeClient(), PEER, FILE, io.BytesIO(), window=0)
+
+
+class TestUpload:
+    async def test_uploads_bytes_windowed(self):
+        data = _payload(10_000)
+        client = FakeClient()
+        assert await upload_file(client, PEER, FILE, data, chunk_size=700) == 10_000
+        assert client.contents == data
+        assert client.peak > 1
+
+    async def test_uploads_file_object_at_offset(self):
+        client = FakeClient(b"header:")
+        await upload_file(client, PEER, FILE, io.BytesIO(b"payload"), start=7)
+        assert client.contents == b"header:payload"
+
+    async def test_shrinks_aborted_chunks(self):
+        data = _payload(3000)
+        client = FakeClient(max_chunk=300)
+        await upload_file(client, PEER, FILE, io.BytesIO(data), chunk_size=1000)
+        assert client.contents == data
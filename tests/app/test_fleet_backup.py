@@ -0,0 +1,315 @@
+"""Tests for fleet-wide backup and restore."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from bac_py.app.client import DiscoveredDevice
+from bac_py.app.fleet_backup import MANIFEST_NAME, backup_fleet, restore_fleet
+from bac_py.app.site_scan import SiteScanCheckpoint
+from bac_py.encoding.primitives import encode_property_value
+from bac_py.network.address import BACnetAddress
+from bac_py.objects.file import FileObject
+from bac_py.services.errors import BACnetError, BACnetTimeoutError
+from bac_py.services.file_access import (
+    AtomicReadFileACK,
+    AtomicWriteFileACK,
+    StreamReadACK,
+)
+from bac_py.services.read_property import ReadPropertyACK
+from bac_py.types.enums import (
+    BackupAndRestoreState,
+    ErrorClass,
+    ErrorCode,
+    ObjectType,
+    PropertyIdentifier,
+    ReinitializedState,
+    Segmentation,
+)
+from bac_py.types.primitives import ObjectIdentifier
+
+
+class FakeDevice:
+    """Device running the Clause 19.1 backup and restore state machine."""
+
+    def __init__(self, instance, network=None, *, files=2, polls_to_ready=2):
+        self.address = BACnetAddress(
+            network=network, mac_address=bytes([10, 0, 0, instance % 256, 0xBA, 0xC0])
+        )
+        self.instance = instance
+        self.files = {}
+        for n in range(1, files + 1):
+            f = FileObject(n)
+            f.write_stream(0, f"device {instance} file {n} ".encode() * 40)
+            self.files[ObjectIdentifier(ObjectType.FILE, n)] = f
+        self.polls_to_ready = polls_to_ready
+        self.state = BackupAndRestoreState.IDLE
+        self.polls = 0
+        self.reinits: list[ReinitializedState] = []
+        self.fail_read = False
+        self.fail_write = False
+        self.timeouts = 0
+
+    def discovered(self):
+        return DiscoveredDevice(
+            address=self.address,
+            instance=self.instance,
+            vendor_id=1,
+            max_apdu_length=1476,
+            segmentation_supported=Segmentation.NONE,
+        )
+
+    def reinitialize(self, state):
+        self.reinits.append(state)
+        self.polls = 0
+        if state in (ReinitializedState.START_BACKUP, ReinitializedState.START_RESTORE):
+            self.state = BackupAndRestoreState.IDLE
+            self.ready = (
+                BackupAndRestoreState.PERFORMING_A_BACKUP
+                if state == ReinitializedState.START_BACKUP
+                else BackupAndRestoreState.PERFORMING_A_RESTORE
+            )
+        else:
+            self.state = BackupAndRestoreState.IDLE
+
+    def poll_state(self):
+        self.polls += 1
+        if self.polls >= self.polls_to_ready and self.reinits:
+            self.state = self.ready
+        return self.state
+
+
+class FakeClient:
+    """Client stub dispatching to :class:`FakeDevice` instances."""
+
+    def __init__(self, devices):
+        self.devices = {d.address: d for d in devices}
+        self.app = SimpleNamespace(
+            config=SimpleNamespace(max_apdu_length=1476, max_segments=None),
+            get_device_info=lambda address: None,
+        )
+        self.active: dict[int | None, int] = {}
+        self.peak: dict[int | None, int] = {}
+        self.state_reads: list[float] = []
+
+    async def reinitialize_device(self, address, state, password=None, timeout=None):
+        device = self.devices[address]
+        network = address.network
+        self.active[network] = self.active.get(network, 0) + 1
+        self.peak[network] = max(self.peak.get(network, 0), self.active[network])
+        try:
+            await asyncio.sleep(0.001)
+            if device.timeouts and state == ReinitializedState.START_BACKUP:
+                device.timeouts -= 1
+                raise BACnetTimeoutError("no response")
+            device.reinitialize(state)
+        finally:
+            self.active[network] -= 1
+
+    async def read_property(self, address, oid, prop, timeout=None):
+        device = self.devices[address]
+        await asyncio.sleep(0)
+        if prop == PropertyIdentifier.BACKUP_AND_RESTORE_STATE:
+            self.state_reads.append(asyncio.get_running_loop().time())
+            value = encode_property_value(device.poll_state())
+        else:
+            assert prop == PropertyIdentifier.CONFIGURATION_FILES
+            value = encode_property_value(list(device.files))
+        return ReadPropertyACK(oid, prop, property_value=value)
+
+    async def atomic_read_file(self, address, file_identifier, access_method, timeout=None):
+        device = self.devices[address]
+        if device.fail_read:
+            raise BACnetError(ErrorClass.OBJECT, ErrorCode.FILE_ACCESS_DENIED)
+        start = access_method.file_start_position
+        data, eof = device.files[file_identifier].read_stream(
+            start, access_method.requested_octet_count
+        )
+        await asyncio.sleep(0)
+        return AtomicReadFileACK(eof, StreamReadACK(start, data))
+
+    async def atomic_write_file(self, address, file_identifier, access_method, timeout=None):
+        device = self.devices[address]
+        if device.fail_write:
+            raise BACnetError(ErrorClass.OBJECT, ErrorCode.FILE_ACCESS_DENIED)
+        await asyncio.sleep(0)
+        f = device.files.setdefault(file_identifier, FileObject(file_identifier.instance_number))
+        start = f.write_stream(access_method.file_start_position, access_method.file_data)
+        return AtomicWriteFileACK(is_stream=True, file_start=start)
+
+
+def _contents(f):
+    return bytes(f.read_stream(0, 1 << 20)[0])
+
+
+async def _run(stream):
+    return {r.device.instance: r async for r in stream}
+
+
+class TestBackupFleet:
+    async def test_streams_files_to_disk(self, tmp_path):
+        devices = [FakeDevice(i, network=i % 2 or None) for i in range(1, 7)]
+        client = FakeClient(devices)
+        results = await _run(
+            backup_fleet(
+                client,
+                [d.discovered() for d in devices],
+                tmp_path,
+                max_per_network=2,
+                poll_interval=0.01,
+            )
+        )
+        assert all(r.ok for r in results.values())
+        assert max(client.peak.values()) <= 2
+        for device in devices:
+            result = results[device.instance]
+            assert result.path == tmp_path / str(device.instance)
+            assert result.files == list(device.files)
+            assert device.reinits == [
+                ReinitializedState.START_BACKUP,
+                ReinitializedState.END_BACKUP,
+            ]
+            manifest = json.loads((result.path / MANIFEST_NAME).read_text())
+            assert [e["object"] for e in manifest["files"]] == ["file,1", "file,2"]
+            for entry, f in zip(manifest["files"], device.files.values(), strict=True):
+                assert (result.path / entry["name"]).read_bytes() == _contents(f)
+        assert not list(tmp_path.glob("*.partial"))
+
+    async def test_state_polled_in_shared_rounds(self, tmp_path):
+        devices = [FakeDevice(i, polls_to_ready=3) for i in range(1, 5)]
+        client = FakeClient(devices)
+        await _run(
+            backup_fleet(client, [d.discovered() for d in devices], tmp_path, poll_interval=0.05)
+        )
+        # Reads within a round land together; rounds are a poll interval apart
+        rounds = []
+        for t in client.state_reads:
+            if not rounds or t - rounds[-1] > 0.02:
+                rounds.append(t)
+        assert len(client.state_reads) == 12
+        assert len(rounds) <= 4
+
+    async def test_failure_keeps_previous_backup(self, tmp_path):
+        device = FakeDevice(1)
+        client = FakeClient([device])
+        await _run(backup_fleet(client, [device.discovered()], tmp_path, poll_interval=0.01))
+        previous = (tmp_path / "1" / MANIFEST_NAME).read_text()
+
+        device.fail_read = True
+        device.reinits.clear()
+        result = (
+            await _run(backup_fleet(client, [device.discovered()], tmp_path, poll_interval=0.01))
+        )[1]
+        assert not result.ok
+        assert result.phase == "transfer"
+        assert result.path is None
+        assert device.reinits[-1] == ReinitializedState.END_BACKUP
+        assert (tmp_path / "1" / MANIFEST_NAME).read_text() == previous
+        assert not (tmp_path / "1.partial").exists()
+
+    async def test_prepare_timeout(self, tmp_path):
+        device = FakeDevice(1, polls_to_ready=1000)
+        result = (
+            await _run(
+                backup_fleet(
+                    FakeClient([device]),
+                    [device.discovered()],
+                    tmp_path,
+                    poll_interval=0.01,
+                    prepare_timeout=0.05,
+                    retries=0,
+                )
+            )
+        )[1]
+        assert result.phase == "prepare"
+        assert isinstance(result.error, BACnetTimeoutError)
+
+    async def test_retries_timeouts(self, tmp_path):
+        device = FakeDevice(1)
+        device.timeouts = 1
+        result = (
+            await _run(
+                backup_fleet(
+                    FakeClient([device]),
+                    [device.discovered()],
+                    tmp_path,
+                    poll_interval=0.01,
+                    backoff=0.01,
+                )
+            )
+        )[1]
+        assert result.ok
+        assert result.attempts == 2
+
+    async def test_checkpoint_skips_completed(self, tmp_path):
+        devices = [FakeDevice(1), FakeDevice(2)]
+        checkpoint = SiteScanCheckpoint(tmp_path / "backup.json")
+        checkpoint.mark_completed(1)
+        results = await _run(
+            backup_fleet(
+                FakeClient(devices),
+                [d.discovered() for d in devices],
+                tmp_path / "out",
+                poll_interval=0.01,
+                checkpoint=checkpoint,
+            )
+        )
+        assert list(results) == [2]
+        assert devices[0].reinits == []
+        assert SiteScanCheckpoint(tmp_path / "backup.json").completed == {1, 2}
+
+    async def test_invalid_limits(self, tmp_path):
+        with pytest.raises(ValueError, match="Concurrency"):
+            await _run(backup_fleet(FakeClient([]), [], tmp_path, max_per_network=0))
+
+
+class TestRestoreFleet:
+    async def test_round_trip(self, tmp_path):
+        source = [FakeDevice(1), FakeDevice(2, files=3)]
+        await _run(
+            backup_fleet(
+                FakeClient(source), [d.discovered() for d in source], tmp_path, poll_interval=0.01
+            )
+        )
+
+        targets = [FakeDevice(1, files=0), FakeDevice(2, files=0)]
+        results = await _run(
+            restore_fleet(
+                FakeClient(targets),
+                [d.discovered() for d in targets],
+                tmp_path,
+                poll_interval=0.01,
+            )
+        )
+        for src, dst in zip(source, targets, strict=True):
+            assert results[dst.instance].ok
+            assert results[dst.instance].size == sum(len(_contents(f)) for f in src.files.values())
+            assert {oid: _contents(f) for oid, f in dst.files.items()} == {
+                oid: _contents(f) for oid, f in src.files.items()
+            }
+            assert dst.reinits == [
+                ReinitializedState.START_RESTORE,
+                ReinitializedState.END_RESTORE,
+            ]
+
+    async def test_missing_backup_not_contacted(self, tmp_path):
+        device = FakeDevice(5)
+        result = (
+            await _run(restore_fleet(FakeClient([device]), [device.discovered()], tmp_path))
+        )[5]
+        assert result.phase == "load"
+        assert device.reinits == []
+
+    async def test_failure_aborts_restore(self, tmp_path):
+        device = FakeDevice(1)
+        client = FakeClient([device])
+        await _run(backup_fleet(client, [device.discovered()], tmp_path, poll_interval=0.01))
+
+        device.fail_write = True
+        result = (
+            await _run(restore_fleet(client, [device.discovered()], tmp_path, poll_interval=0.01))
+        )[1]
+        assert result.phase == "transfer"
+        assert device.reinits[-1] == ReinitializedState.ABORT_RESTORE
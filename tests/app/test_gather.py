@@ -0,0 +1,34 @@
+"""Tests for the shared concurrent fan-out helper (app/_gather.py)."""
+
+import asyncio
+
+import pytest
+
+from bac_py.app._gather import gather_or_cancel
+
+
+class TestGatherOrCancel:
+    async def test_returns_results_in_order(self):
+        async def value(v, delay):
+            await asyncio.sleep(delay)
+            return v
+
+        assert await gather_or_cancel([value(1, 0.02), value(2, 0), value(3, 0.01)]) == [1, 2, 3]
+
+    async def test_failure_cancels_and_awaits_the_rest(self):
+        finished = []
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            finally:
+                finished.append("slow")
+
+        async def boom():
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await gather_or_cancel([slow(), boom(), slow()])
+        # Both siblings ran their cleanup before the error reached the caller.
+        assert finished == ["slow", "slow"]
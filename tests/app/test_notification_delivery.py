@@ -0,0 +1,244 @@
+"""Tests for flow-controlled confirmed notification delivery."""
+
+import asyncio
+
+import pytest
+
+from bac_py.app.notification_delivery import DeliveryPolicy, NotificationDelivery
+from bac_py.network.address import BACnetAddress
+from bac_py.services.errors import BACnetError, BACnetTimeoutError
+from bac_py.types.enums import ErrorClass, ErrorCode
+
+PEER = BACnetAddress(mac_address=b"\xc0\xa8\x01\x01\xba\xc0")
+PEER2 = BACnetAddress(mac_address=b"\xc0\xa8\x01\x02\xba\xc0")
+
+
+class FakeSender:
+    """Confirmed-request stub whose responses are released by the test."""
+
+    def __init__(self):
+        self.sent: list[tuple[BACnetAddress, bytes]] = []
+        self.pending: list[asyncio.Future[None]] = []
+        self.fail_with: Exception | None = None
+        self.hold = True
+
+    async def __call__(self, *, destination, service_choice, service_data):
+        self.sent.append((destination, service_data))
+        if self.fail_with is not None:
+            raise self.fail_with
+        if self.hold:
+            future = asyncio.get_running_loop().create_future()
+            self.pending.append(future)
+            await future
+
+    def release_all(self):
+        for future in self.pending:
+            if not future.done():
+                future.set_result(None)
+        self.pending.clear()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestDeliveryPolicy:
+    def test_defaults_valid(self):
+        policy = DeliveryPolicy()
+        assert policy.max_in_flight >= 1
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"max_in_flight": 0}, "max_in_flight"),
+            ({"max_queue": 0}, "max_queue"),
+            ({"failure_threshold": 0}, "failure_threshold"),
+            ({"backoff": 0}, "backoff"),
+            ({"backoff": 10, "max_backoff": 5}, "backoff"),
+        ],
+    )
+    def test_invalid(self, kwargs, match):
+        with pytest.raises(ValueError, match=match):
+            DeliveryPolicy(**kwargs)
+
+
+class TestNotificationDelivery:
+    async def test_window_limits_in_flight(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender, DeliveryPolicy(max_in_flight=2))
+        for i in range(5):
+            delivery.submit(PEER, 1, bytes([i]))
+        await _settle()
+
+        assert len(sender.sent) == 2
+        stats = delivery.stats(PEER)
+        assert stats.in_flight == 2
+        assert stats.queue_depth == 3
+
+        sender.release_all()
+        await _settle()
+        assert len(sender.sent) == 4
+        sender.release_all()
+        await _settle()
+        sender.release_all()
+        await _settle()
+
+        assert [data for _, data in sender.sent] == [bytes([i]) for i in range(5)]
+        assert stats.delivered == 5
+        assert stats.queue_depth == 0
+        assert stats.max_queue_depth == 3
+        assert stats.mean_latency >= 0
+        await delivery.close()
+
+    async def test_recipients_independent(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender, DeliveryPolicy(max_in_flight=1))
+        delivery.submit(PEER, 1, b"a")
+        delivery.submit(PEER, 1, b"b")
+        delivery.submit(PEER2, 1, b"c")
+        await _settle()
+        assert [dest for dest, _ in sender.sent] == [PEER, PEER2]
+        assert set(delivery.all_stats()) == {PEER, PEER2}
+        await delivery.close()
+
+    async def test_keyed_notification_superseded(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender, DeliveryPolicy(max_in_flight=1))
+        delivery.submit(PEER, 1, b"first", key="ai-1")
+        delivery.submit(PEER, 1, b"old", key="ai-1")
+        delivery.submit(PEER, 1, b"other", key="ai-2")
+        delivery.submit(PEER, 1, b"new", key="ai-1")
+        await _settle()
+
+        stats = delivery.stats(PEER)
+        assert stats.superseded == 1
+        assert stats.queue_depth == 2
+        for _ in range(3):
+            sender.release_all()
+            await _settle()
+        assert [data for _, data in sender.sent] == [b"first", b"new", b"other"]
+        await delivery.close()
+
+    async def test_full_queue_drops_oldest(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender, DeliveryPolicy(max_in_flight=1, max_queue=2))
+        for data in (b"sent", b"a", b"b", b"c"):
+            delivery.submit(PEER, 1, data, key=data)
+        await _settle()
+
+        stats = delivery.stats(PEER)
+        assert stats.dropped == 1
+        # The dropped entry's key no longer supersedes anything
+        delivery.submit(PEER, 1, b"a2", key=b"a")
+        assert stats.superseded == 0
+        assert stats.dropped == 2
+        await delivery.close()
+
+    async def test_error_response_keeps_breaker_closed(self):
+        sender = FakeSender()
+        sender.fail_with = BACnetError(ErrorClass.SERVICES, ErrorCode.SERVICE_REQUEST_DENIED)
+        delivery = NotificationDelivery(sender, DeliveryPolicy(failure_threshold=1))
+        delivery.submit(PEER, 1, b"x")
+        stats = delivery.stats(PEER)
+        await _settle()
+
+        assert stats.failed == 1
+        assert not stats.breaker_open
+        await delivery.close()
+
+    async def test_idle_recipient_forgotten(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender, DeliveryPolicy(max_in_flight=1))
+        delivery.submit(PEER, 1, b"a")
+        delivery.submit(PEER, 1, b"b")
+        await _settle()
+        stats = delivery.stats(PEER)
+
+        sender.release_all()
+        await _settle()
+        # One still in flight: the recipient is kept.
+        assert delivery.stats(PEER) is stats
+        sender.release_all()
+        await _settle()
+        assert stats.delivered == 2
+        assert delivery.stats(PEER) is None
+        assert delivery.all_stats() == {}
+
+        # A later notification starts a fresh entry.
+        delivery.submit(PEER, 1, b"c")
+        assert delivery.stats(PEER) is not stats
+        await delivery.close()
+
+    async def test_failing_recipient_kept_until_it_answers(self):
+        sender = FakeSender()
+        sender.hold = False
+        sender.fail_with = BACnetTimeoutError("timeout")
+        delivery = NotificationDelivery(sender, DeliveryPolicy(failure_threshold=3))
+        delivery.submit(PEER, 1, b"a")
+        await _settle()
+        # The failure counts toward the breaker, so it is remembered.
+        assert delivery.stats(PEER).failed == 1
+
+        sender.fail_with = None
+        delivery.submit(PEER, 1, b"b")
+        await _settle()
+        assert delivery.stats(PEER) is None
+        await delivery.close()
+
+    async def test_breaker_opens_and_recovers(self):
+        sender = FakeSender()
+        sender.hold = False
+        sender.fail_with = BACnetTimeoutError("timeout")
+        policy = DeliveryPolicy(max_in_flight=1, failure_threshold=2, backoff=0.02)
+        delivery = NotificationDelivery(sender, policy)
+        for i in range(4):
+            delivery.submit(PEER, 1, bytes([i]))
+        await _settle()
+
+        stats = delivery.stats(PEER)
+        assert stats.breaker_open
+        assert stats.breaker_trips == 1
+        assert len(sender.sent) == 2
+        assert stats.queue_depth == 2
+
+        # Still open: nothing else is sent
+        delivery.submit(PEER, 1, b"late")
+        await _settle()
+        assert len(sender.sent) == 2
+
+        # Head end comes back; the probe succeeds and the queue drains
+        sender.fail_with = None
+        await asyncio.sleep(0.05)
+        await _settle()
+        assert not stats.breaker_open
+        assert len(sender.sent) == 5
+        assert stats.delivered == 3
+        await delivery.close()
+
+    async def test_failed_probe_doubles_backoff(self):
+        sender = FakeSender()
+        sender.hold = False
+        sender.fail_with = BACnetTimeoutError("timeout")
+        policy = DeliveryPolicy(failure_threshold=1, backoff=0.02, max_backoff=0.03)
+        delivery = NotificationDelivery(sender, policy)
+        for i in range(4):
+            delivery.submit(PEER, 1, bytes([i]))
+        await _settle()
+        recipient = delivery._recipients[PEER]
+        assert recipient.backoff == 0.02
+
+        await asyncio.sleep(0.03)
+        await _settle()
+        assert recipient.backoff == 0.03
+        assert delivery.stats(PEER).breaker_trips == 2
+        await delivery.close()
+
+    async def test_close_cancels_and_clears(self):
+        sender = FakeSender()
+        delivery = NotificationDelivery(sender)
+        delivery.submit(PEER, 1, b"x")
+        await _settle()
+        await delivery.close()
+        assert delivery.stats(PEER) is None
+        assert sender.pending[0].cancelled()
@@ -0,0 +1,502 @@
+"""Tests for the batched RPM polling engine."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bac_py.app.application import DeviceInfo
+from bac_py.app.device_cache import DeviceCache
+from bac_py.app.polling_engine import (
+    PollingEngine,
+    PollPoint,
+    PollResult,
+    _build_access_specs,
+    _build_batches,
+)
+from bac_py.encoding.primitives import encode_application_real
+from bac_py.network.address import parse_address
+from bac_py.services.errors import (
+    BACnetAbortError,
+    BACnetError,
+    BACnetRejectError,
+    BACnetTimeoutError,
+)
+from bac_py.services.read_property import ReadPropertyACK
+from bac_py.services.read_property_multiple import (
+    ReadAccessResult,
+    ReadPropertyMultipleACK,
+    ReadPropertyMultipleRequest,
+    ReadResultElement,
+)
+from bac_py.types.enums import (
+    AbortReason,
+    ConfirmedServiceChoice,
+    ErrorClass,
+    ErrorCode,
+    ObjectType,
+    PropertyIdentifier,
+    RejectReason,
+)
+from bac_py.types.primitives import ObjectIdentifier
+
+ADDR_A = "192.168.1.10"
+ADDR_B = "192.168.1.11"
+
+
+def _make_app(max_apdu: int = 1476, device_info: DeviceInfo | None = None):
+    app = MagicMock()
+    app.config.max_apdu_length = max_apdu
+    app.get_device_info = MagicMock(return_value=device_info)
+    app.confirmed_request = AsyncMock()
+    app.device_cache = DeviceCache()
+    return app
+
+
+def _rpm_responder(values: dict | None = None, errors: set | None = None):
+    """Build a confirmed_request side effect that answers RPM requests."""
+    values = values or {}
+    errors = errors or set()
+    requests: list[ReadPropertyMultipleRequest] = []
+
+    async def _respond(destination, service_choice, service_data, timeout=None):
+        req = ReadPropertyMultipleRequest.decode(service_data)
+        requests.append(req)
+        results = []
+        for spec in req.list_of_read_access_specs:
+            elems = []
+            for ref in spec.list_of_property_references:
+                key = (spec.object_identifier, ref.property_identifier)
+                if key in errors:
+                    elems.append(
+                        ReadResultElement(
+                            property_identifier=ref.property_identifier,
+                            property_array_index=ref.property_array_index,
+                            property_access_error=(
+                                ErrorClass.PROPERTY,
+                                ErrorCode.UNKNOWN_PROPERTY,
+                            ),
+                        )
+                    )
+                else:
+                    elems.append(
+                        ReadResultElement(
+                            property_identifier=ref.property_identifier,
+                            property_array_index=ref.property_array_index,
+                            property_value=encode_application_real(values.get(key, 1.0)),
+                        )
+                    )
+            results.append(
+                ReadAccessResult(object_identifier=spec.object_identifier, list_of_results=elems)
+            )
+        return ReadPropertyMultipleACK(list_of_read_access_results=results).encode()
+
+    return _respond, requests
+
+
+def _point(instance: int, prop=PropertyIdentifier.PRESENT_VALUE, address=ADDR_A, index=None):
+    return PollPoint(
+        address=parse_address(address),
+        object_identifier=ObjectIdentifier(ObjectType.ANALOG_INPUT, instance),
+        property_identifier=prop,
+        interval=1.0,
+        array_index=index,
+    )
+
+
+class TestBuildBatches:
+    def test_single_batch_when_small(self):
+        points = [_point(i) for i in range(10)]
+        batches = _build_batches(points, 1476)
+        assert len(batches) == 1
+        assert batches[0] == points
+
+    def test_splits_by_max_apdu(self):
+        points = [_point(i) for i in range(200)]
+        small = _build_batches(points, 480)
+        large = _build_batches(points, 1476)
+        assert len(small) > len(large) >= 1
+        assert [p for batch in small for p in batch] == points
+
+    def test_estimated_response_fits(self):
+        points = [_point(i) for i in range(500)]
+        for batch in _build_batches(points, 480):
+            # Every batch of distinct objects stays under the max payload
+            assert len(batch) * (7 + 7 + 10) <= 480 - 5
+
+    def test_duplicate_keys_share_batch(self):
+        p1 = _point(1)
+        p2 = PollPoint(
+            address=p1.address,
+            object_identifier=p1.object_identifier,
+            property_identifier=p1.property_identifier,
+            interval=5.0,
+        )
+        batches = _build_batches([p1, p2], 1476)
+        assert batches == [[p1, p2]]
+        specs = _build_access_specs(batches[0])
+        assert len(specs) == 1
+        assert len(specs[0].list_of_property_references) == 1
+
+    def test_access_specs_grouped_per_object(self):
+        points = [
+            _point(1, PropertyIdentifier.PRESENT_VALUE),
+            _point(2, PropertyIdentifier.PRESENT_VALUE),
+            _point(1, PropertyIdentifier.STATUS_FLAGS),
+        ]
+        specs = _build_access_specs(points)
+        assert [s.object_identifier.instance_number for s in specs] == [1, 2]
+        assert len(specs[0].list_of_property_references) == 2
+
+
+class TestPointRegistration:
+    def test_add_point_parses_strings(self):
+        engine = PollingEngine(_make_app())
+        point = engine.add_point(ADDR_A, "ai,1", "pv", 5.0)
+        assert point.object_identifier == ObjectIdentifier(ObjectType.ANALOG_INPUT, 1)
+        assert point.property_identifier == PropertyIdentifier.PRESENT_VALUE
+        assert point.interval == 5.0
+        assert engine.points == [point]
+
+    def test_add_point_rejects_non_positive_interval(self):
+        engine = PollingEngine(_make_app())
+        with pytest.raises(ValueError, match="positive"):
+            engine.add_point(ADDR_A, "ai,1", "pv", 0)
+
+    def test_remove_point(self):
+        engine = PollingEngine(_make_app())
+        point = engine.add_point(ADDR_A, "ai,1", "pv", 5.0)
+        engine.remove_point(point)
+        assert engine.points == []
+        # Stale heap entry is skipped
+        assert engine._collect_due(float("inf")) == {}
+
+
+class TestScheduling:
+    def test_collect_due_groups_by_device(self):
+        engine = PollingEngine(_make_app())
+        a1 = engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        a2 = engine.add_point(ADDR_A, "ai,2", "pv", 10.0)
+        b1 = engine.add_point(ADDR_B, "ai,1", "pv", 10.0)
+        due = engine._collect_due(max(engine._points.values()))
+        assert due[a1.address] == [a1, a2]
+        assert due[b1.address] == [b1]
+
+    def test_rescheduled_after_interval(self):
+        engine = PollingEngine(_make_app())
+        point = engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        start = engine._points[point]
+        engine._collect_due(start)
+        assert engine._points[point] == start + 10.0
+        assert engine._collect_due(start + 5.0) == {}
+        assert engine._collect_due(start + 10.0) == {point.address: [point]}
+
+    def test_busy_device_counts_overrun(self):
+        engine = PollingEngine(_make_app())
+        point = engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        engine._busy.add(point.address)
+        assert engine._collect_due(engine._points[point]) == {}
+        assert engine.stats.overruns == 1
+
+
+class TestPolling:
+    async def test_poll_now_uses_single_rpm_per_device(self):
+        app = _make_app()
+        responder, _requests = _rpm_responder(
+            {
+                (
+                    ObjectIdentifier(ObjectType.ANALOG_INPUT, 2),
+                    PropertyIdentifier.PRESENT_VALUE,
+                ): 42.0
+            }
+        )
+        app.confirmed_request.side_effect = responder
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        for i in range(1, 6):
+            engine.add_point(ADDR_A, f"ai,{i}", "pv", 10.0)
+        engine.add_point(ADDR_B, "ai,1", "pv", 10.0)
+
+        await engine.poll_now()
+
+        assert app.confirmed_request.await_count == 2
+        for call in app.confirmed_request.call_args_list:
+            assert call.kwargs["service_choice"] == ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+        assert len(received) == 6
+        assert all(r.error is None for r in received)
+        by_instance = {
+            (str(r.point.address), r.point.object_identifier.instance_number): r.value
+            for r in received
+        }
+        assert by_instance[(f"{ADDR_A}:47808", 2)] == pytest.approx(42.0)
+        assert engine.stats.requests_sent == 2
+        assert engine.stats.points_polled == 6
+
+    async def test_batches_sized_from_device_info(self):
+        info = DeviceInfo(max_apdu_length=206, segmentation_supported=3)
+        app = _make_app(device_info=info)
+        responder, requests = _rpm_responder()
+        app.confirmed_request.side_effect = responder
+        engine = PollingEngine(app)
+        for i in range(1, 41):
+            engine.add_point(ADDR_A, f"ai,{i}", "pv", 10.0)
+
+        await engine.poll_now()
+
+        assert len(requests) == len(_build_batches(engine.points, 206)) > 1
+        app.get_device_info.assert_called()
+
+    async def test_property_error_reported_per_point(self):
+        app = _make_app()
+        bad = (ObjectIdentifier(ObjectType.ANALOG_INPUT, 2), PropertyIdentifier.PRESENT_VALUE)
+        responder, _ = _rpm_responder(errors={bad})
+        app.confirmed_request.side_effect = responder
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        engine.add_point(ADDR_A, "ai,2", "pv", 10.0)
+
+        await engine.poll_now()
+
+        errors = [r for r in received if r.error is not None]
+        assert len(errors) == 1
+        assert isinstance(errors[0].error, BACnetError)
+        assert errors[0].error.error_code == ErrorCode.UNKNOWN_PROPERTY
+        assert engine.stats.errors == 1
+
+    async def test_request_failure_reported_on_all_points(self):
+        app = _make_app()
+        app.confirmed_request.side_effect = BACnetTimeoutError("timeout")
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        engine.add_point(ADDR_A, "ai,2", "pv", 10.0)
+
+        await engine.poll_now()
+
+        assert len(received) == 2
+        assert all(isinstance(r.error, BACnetTimeoutError) for r in received)
+
+    async def test_rpm_unsupported_falls_back_to_read_property(self):
+        app = _make_app()
+        oid = ObjectIdentifier(ObjectType.ANALOG_INPUT, 1)
+
+        async def _respond(destination, service_choice, service_data, timeout=None):
+            if service_choice == ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE:
+                raise BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+            return ReadPropertyACK(
+                object_identifier=oid,
+                property_identifier=PropertyIdentifier.PRESENT_VALUE,
+                property_value=encode_application_real(7.0),
+            ).encode()
+
+        app.confirmed_request.side_effect = _respond
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+
+        await engine.poll_now()
+        assert received[0].value == pytest.approx(7.0)
+
+        # Second poll goes straight to ReadProperty
+        app.confirmed_request.reset_mock()
+        await engine.poll_now()
+        choices = [c.kwargs["service_choice"] for c in app.confirmed_request.call_args_list]
+        assert choices == [ConfirmedServiceChoice.READ_PROPERTY]
+        assert app.device_cache.is_service_failed(
+            parse_address(ADDR_A), ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+        )
+
+    async def test_rpm_failure_known_to_device_cache(self):
+        app = _make_app()
+        app.device_cache.mark_service_failed(
+            parse_address(ADDR_A), ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE
+        )
+        app.confirmed_request.return_value = ReadPropertyACK(
+            object_identifier=ObjectIdentifier(ObjectType.ANALOG_INPUT, 1),
+            property_identifier=PropertyIdentifier.PRESENT_VALUE,
+            property_value=encode_application_real(7.0),
+        ).encode()
+        engine = PollingEngine(app)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+
+        await engine.poll_now()
+        choices = [c.kwargs["service_choice"] for c in app.confirmed_request.call_args_list]
+        assert choices == [ConfirmedServiceChoice.READ_PROPERTY]
+
+    @pytest.mark.parametrize(
+        "reason",
+        [
+            AbortReason.BUFFER_OVERFLOW,
+            AbortReason.SEGMENTATION_NOT_SUPPORTED,
+            AbortReason.APDU_TOO_LONG,
+        ],
+    )
+    async def test_oversize_abort_halves_batch(self, reason):
+        app = _make_app(device_info=DeviceInfo(max_apdu_length=1476, segmentation_supported=3))
+        responder, _ = _rpm_responder()
+        sizes: list[int] = []
+
+        async def _respond(destination, service_choice, service_data, timeout=None):
+            size = len(ReadPropertyMultipleRequest.decode(service_data).list_of_read_access_specs)
+            sizes.append(size)
+            if size > 5:
+                raise BACnetAbortError(reason)
+            return await responder(destination, service_choice, service_data, timeout)
+
+        app.confirmed_request.side_effect = _respond
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        for i in range(1, 21):
+            engine.add_point(ADDR_A, f"ai,{i}", "pv", 10.0)
+
+        await engine.poll_now()
+        # 20 -> 2 x 10 -> 4 x 5, after 1 + 2 aborted requests
+        assert sizes == [20, 10, 5, 5, 10, 5, 5]
+        assert len(received) == 20
+        assert all(r.error is None for r in received)
+
+        # The next cycle starts from the smaller batch size
+        sizes.clear()
+        await engine.poll_now()
+        assert sizes == [5, 5, 5, 5]
+        assert len(received) == 40
+        assert all(r.error is None for r in received)
+
+    async def test_oversize_abort_on_single_property_reports_error(self):
+        app = _make_app()
+        app.confirmed_request.side_effect = BACnetAbortError(AbortReason.BUFFER_OVERFLOW)
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+
+        await engine.poll_now()
+        assert len(received) == 1
+        assert isinstance(received[0].error, BACnetAbortError)
+        assert app.confirmed_request.await_count == 1
+
+    async def test_rpm_rejected_once_per_cycle(self):
+        info = DeviceInfo(max_apdu_length=206, segmentation_supported=3)
+        app = _make_app(device_info=info)
+
+        async def _respond(destination, service_choice, service_data, timeout=None):
+            if service_choice == ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE:
+                raise BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+            return ReadPropertyACK(
+                object_identifier=ObjectIdentifier(ObjectType.ANALOG_INPUT, 1),
+                property_identifier=PropertyIdentifier.PRESENT_VALUE,
+                property_value=encode_application_real(7.0),
+            ).encode()
+
+        app.confirmed_request.side_effect = _respond
+        received: list[PollResult] = []
+        engine = PollingEngine(app, callback=received.append)
+        for i in range(1, 41):
+            engine.add_point(ADDR_A, f"ai,{i}", "pv", 10.0)
+        assert len(_build_batches(engine.points, 206)) > 1
+
+        await engine.poll_now()
+
+        choices = [c.kwargs["service_choice"] for c in app.confirmed_request.call_args_list]
+        assert choices.count(ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE) == 1
+        assert choices.count(ConfirmedServiceChoice.READ_PROPERTY) == 40
+        assert len(received) == 40
+        assert all(r.error is None for r in received)
+
+    async def test_poll_now_marks_devices_busy(self):
+        app = _make_app()
+        responder, _ = _rpm_responder()
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def _slow(*args, **kwargs):
+            started.set()
+            await release.wait()
+            return await responder(*args, **kwargs)
+
+        app.confirmed_request.side_effect = _slow
+        engine = PollingEngine(app)
+        point = engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+
+        task = asyncio.ensure_future(engine.poll_now())
+        await started.wait()
+        assert point.address in engine._busy
+        # The scheduler does not start a second poll of the same device.
+        assert engine._collect_due(engine._points[point]) == {}
+        assert engine.stats.overruns == 1
+        # Nor does another poll_now().
+        await engine.poll_now()
+        assert app.confirmed_request.await_count == 1
+
+        release.set()
+        await task
+        assert not engine._busy
+
+    async def test_callback_errors_are_contained(self):
+        app = _make_app()
+        responder, _ = _rpm_responder()
+        app.confirmed_request.side_effect = responder
+
+        def _bad_callback(result):
+            raise RuntimeError("boom")
+
+        engine = PollingEngine(app, callback=_bad_callback)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        await engine.poll_now()
+        assert engine.stats.points_polled == 1
+
+
+class TestResultsIterator:
+    async def test_results_stream(self):
+        app = _make_app()
+        responder, _ = _rpm_responder()
+        app.confirmed_request.side_effect = responder
+        engine = PollingEngine(app, scan_interval=0.01)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        engine.add_point(ADDR_A, "ai,2", "pv", 10.0)
+
+        async def _consume():
+            collected = []
+            async for result in engine.results():
+                collected.append(result)
+                if len(collected) == 2:
+                    break
+            return collected
+
+        consumer = asyncio.create_task(_consume())
+        await asyncio.sleep(0)
+        await engine.start()
+        try:
+            collected = await asyncio.wait_for(consumer, 2.0)
+        finally:
+            await engine.stop()
+
+        assert {r.point.object_identifier.instance_number for r in collected} == {1, 2}
+        assert engine._queues == []
+
+    async def test_full_queue_drops_results(self):
+        app = _make_app()
+        responder, _ = _rpm_responder()
+        app.confirmed_request.side_effect = responder
+        engine = PollingEngine(app, result_queue_size=1)
+        engine.add_point(ADDR_A, "ai,1", "pv", 10.0)
+        engine.add_point(ADDR_A, "ai,2", "pv", 10.0)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        engine._queues.append(queue)
+
+        await engine.poll_now()
+
+        assert queue.qsize() == 1
+        assert engine.stats.results_dropped == 1
+
+
+class TestLifecycle:
+    async def test_start_stop_idempotent(self):
+        engine = PollingEngine(_make_app())
+        await engine.start()
+        task = engine._task
+        await engine.start()
+        assert engine._task is task
+        await engine.stop()
+        assert engine._task is None
+        await engine.stop()
@@ -0,0 +1,101 @@
+"""Tests for ReadPropertyMultiple size estimation and splitting."""
+
+from bac_py.app._rpm_batching import (
+    DEFAULT_RESPONSE_SEGMENTS,
+    halve_read_access_specs,
+    rpm_size_limits,
+    split_read_access_specs,
+)
+from bac_py.app.application import DeviceInfo
+from bac_py.services.read_property_multiple import (
+    PropertyReference,
+    ReadAccessSpecification,
+    ReadPropertyMultipleRequest,
+)
+from bac_py.types.enums import ObjectType, PropertyIdentifier, Segmentation
+from bac_py.types.primitives import ObjectIdentifier
+
+PROPS = [
+    PropertyIdentifier.PRESENT_VALUE,
+    PropertyIdentifier.OBJECT_NAME,
+    PropertyIdentifier.UNITS,
+    PropertyIdentifier.STATUS_FLAGS,
+]
+
+
+def _specs(objects: int, props: list[PropertyIdentifier] = PROPS) -> list[ReadAccessSpecification]:
+    return [
+        ReadAccessSpecification(
+            ObjectIdentifier(ObjectType.ANALOG_INPUT, i),
+            [PropertyReference(p) for p in props],
+        )
+        for i in range(objects)
+    ]
+
+
+def _flatten(chunks):
+    return [
+        (spec.object_identifier, ref)
+        for chunk in chunks
+        for spec in chunk
+        for ref in spec.list_of_property_references
+    ]
+
+
+class TestSplitReadAccessSpecs:
+    def test_fits_in_one_chunk(self):
+        specs = _specs(3)
+        assert split_read_access_specs(specs, 1470, 1470) == [specs]
+
+    def test_empty(self):
+        assert split_read_access_specs([], 100, 100) == [[]]
+
+    def test_preserves_order_and_respects_request_budget(self):
+        specs = _specs(40)
+        chunks = split_read_access_specs(specs, 200, 10_000)
+        assert len(chunks) > 1
+        assert _flatten(chunks) == _flatten([specs])
+        for chunk in chunks:
+            assert len(ReadPropertyMultipleRequest(chunk).encode()) <= 200
+
+    def test_splits_object_across_chunks(self):
+        many = [PropertyIdentifier(i) for i in range(1, 41)]
+        specs = _specs(1, many)
+        chunks = split_read_access_specs(specs, 1470, 200)
+        assert len(chunks) > 1
+        assert all(len(chunk) == 1 for chunk in chunks)
+        assert all(chunk[0].object_identifier == specs[0].object_identifier for chunk in chunks)
+        assert _flatten(chunks) == _flatten([specs])
+
+    def test_oversized_reference_gets_own_chunk(self):
+        specs = _specs(2, [PropertyIdentifier.PRESENT_VALUE, PropertyIdentifier.ALL])
+        chunks = split_read_access_specs(specs, 1470, 100)
+        assert [len(_flatten([c])) for c in chunks] == [1, 1, 1, 1]
+
+
+class TestHalveReadAccessSpecs:
+    def test_halves_by_reference_count(self):
+        specs = _specs(3)
+        first, second = halve_read_access_specs(specs)
+        assert len(_flatten([first])) == 6
+        assert len(_flatten([second])) == 6
+        assert _flatten([first, second]) == _flatten([specs])
+
+    def test_single_reference_cannot_split(self):
+        assert halve_read_access_specs(_specs(1, [PropertyIdentifier.PRESENT_VALUE])) is None
+
+
+class TestRpmSizeLimits:
+    def test_unknown_peer_uses_local_or_default(self):
+        assert rpm_size_limits(1476, None) == (1470, 1471)
+        assert rpm_size_limits(1476, None, default_max_apdu=480) == (474, 475)
+
+    def test_peer_without_segmentation(self):
+        info = DeviceInfo(max_apdu_length=206, segmentation_supported=Segmentation.RECEIVE)
+        assert rpm_size_limits(1476, info) == (200, 201)
+
+    def test_segmenting_peer_allows_multi_segment_response(self):
+        info = DeviceInfo(max_apdu_length=480, segmentation_supported=Segmentation.BOTH)
+        assert rpm_size_limits(1476, info) == (474, 475 * DEFAULT_RESPONSE_SEGMENTS)
+        assert rpm_size_limits(1476, info, max_segments=4) == (474, 475 * 4)
+        assert rpm_size_limits(1476, info, allow_segmentation=False) == (474, 475)
@@ -6,6 +6,7 @@ import datetime
 import pytest
 
 from bac_py.app.schedule_engine import ScheduleEngine, _now_tuple, _time_tuple
+from bac_py.objects.base import ObjectDatabase
 from bac_py.objects.calendar import CalendarObject
 from bac_py.objects.schedule import ScheduleObject
 from bac_py.types.constructed import (
@@ -38,6 +39,18 @@ class _FakeObjectDB:
     def get_objects_of_type(self, obj_type: ObjectType) -> list[object]:
         return [o for o in self._objects.values() if getattr(o, "OBJECT_TYPE", None) == obj_type]
 
+    def register_change_callback(self, oid, prop, callback) -> None:
+        pass
+
+    def unregister_change_callback(self, oid, prop, callback) -> None:
+        pass
+
+    def register_membership_listener(self, listener) -> None:
+        pass
+
+    def unregister_membership_listener(self, listener) -> None:
+        pass
+
 
 class _FakeApp:
     def __init__(self, db: _FakeObjectDB) -> None:
@@ -403,7 +416,7 @@ class TestLifecycle:
 
     @pytest.mark.asyncio
     async def test_run_loop_executes_cycle(self):
-        """_run_loop() calls _evaluate_cycle at least once before being stopped."""
+        """_run_loop() evaluates due objects at least once before being stopped."""
         db = _FakeObjectDB()
         cal = CalendarObject(1)
         cal._properties[PropertyIdentifier.DATE_LIST] = [
@@ -430,7 +443,7 @@ class TestLifecycle:
 
 class TestEvaluateCycleSchedules:
     def test_evaluate_cycle_processes_schedules(self):
-        """_evaluate_cycle evaluates Schedule objects (covering line 106)."""
+        """_evaluate_cycle evaluates Schedule objects."""
         db = _FakeObjectDB()
         sched = ScheduleObject(1)
         sched._properties[PropertyIdentifier.SCHEDULE_DEFAULT] = 99.0
@@ -881,3 +894,182 @@ class TestWeeklyScheduleShortList:
         today = datetime.date(2024, 2, 15)  # Thursday
         engine._evaluate_schedule(sched, today, datetime.time(10, 0), db)
         assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 60.0
+
+
+# ---------------------------------------------------------------------------
+# Next-transition scheduling
+# ---------------------------------------------------------------------------
+
+MONDAY = datetime.date(2024, 2, 12)
+
+
+def _at(hour: int, minute: int = 0, day: datetime.date = MONDAY) -> datetime.datetime:
+    return datetime.datetime.combine(day, datetime.time(hour, minute))
+
+
+def _office_schedule(instance: int = 1) -> ScheduleObject:
+    day = [
+        BACnetTimeValue(time=BACnetTime(8, 0, 0, 0), value=72.0),
+        BACnetTimeValue(time=BACnetTime(18, 0, 0, 0), value=60.0),
+    ]
+    sched = ScheduleObject(instance)
+    sched._properties[PropertyIdentifier.WEEKLY_SCHEDULE] = [day] * 5 + [[], []]
+    sched._properties[PropertyIdentifier.SCHEDULE_DEFAULT] = 55.0
+    return sched
+
+
+class TestNextTransition:
+    def test_next_weekly_entry(self):
+        sched = _office_schedule()
+        assert ScheduleEngine._next_transition(sched, MONDAY, datetime.time(6, 0)) == _at(8)
+        assert ScheduleEngine._next_transition(sched, MONDAY, datetime.time(8, 0)) == _at(18)
+
+    def test_none_after_last_entry(self):
+        sched = _office_schedule()
+        assert ScheduleEngine._next_transition(sched, MONDAY, datetime.time(19, 0)) is None
+
+    def test_includes_exception_times(self):
+        sched = _office_schedule()
+        sched._properties[PropertyIdentifier.EXCEPTION_SCHEDULE] = [
+            BACnetSpecialEvent(
+                period=BACnetCalendarEntry(choice=0, value=BACnetDate(2024, 12, 25, 0xFF)),
+                list_of_time_values=(BACnetTimeValue(time=BACnetTime(9, 30, 0, 0), value=0.0),),
+                event_priority=1,
+            ),
+        ]
+        assert ScheduleEngine._next_transition(sched, MONDAY, datetime.time(8, 0)) == _at(9, 30)
+
+
+class TestEvaluateDue:
+    def _engine(self, *objects):
+        db = ObjectDatabase()
+        for obj in objects:
+            db.add(obj)
+        return _make_engine(db), db  # type: ignore[arg-type]
+
+    def test_evaluates_only_due_schedules(self, monkeypatch):
+        sched = _office_schedule()
+        engine, _ = self._engine(sched)
+        evaluated = []
+        original = engine._evaluate_schedule
+        monkeypatch.setattr(
+            engine,
+            "_evaluate_schedule",
+            lambda s, *args: evaluated.append(args[1]) or original(s, *args),
+        )
+
+        assert engine._evaluate_due(_at(6)) == _at(8)
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+        assert engine._evaluate_due(_at(7)) == _at(8)
+        assert len(evaluated) == 1
+
+        assert engine._evaluate_due(_at(8)) == _at(18)
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+        assert len(evaluated) == 2
+
+        # Nothing left today: sleep until midnight
+        assert engine._evaluate_due(_at(18, 5)) == _at(0, day=MONDAY + datetime.timedelta(1))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 60.0
+
+    def test_midnight_reevaluates_all(self):
+        sched = _office_schedule()
+        engine, _ = self._engine(sched)
+        engine._evaluate_due(_at(19))
+        saturday = MONDAY + datetime.timedelta(5)
+        sched._properties[PropertyIdentifier.PRESENT_VALUE] = None
+        engine._evaluate_due(_at(0, day=saturday))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+
+    def test_write_invalidates(self):
+        sched = _office_schedule()
+        engine, _ = self._engine(sched)
+        engine._evaluate_due(_at(10))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+
+        sched.write_property(PropertyIdentifier.WEEKLY_SCHEDULE, [[]] * 7)
+        engine._evaluate_due(_at(10, 1))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+
+    def test_calendar_write_reevaluates_schedules(self):
+        cal = CalendarObject(1)
+        sched = _office_schedule()
+        sched._properties[PropertyIdentifier.EXCEPTION_SCHEDULE] = [
+            BACnetSpecialEvent(
+                period=cal.object_identifier,
+                list_of_time_values=(BACnetTimeValue(time=BACnetTime(0, 0, 0, 0), value=0.0),),
+                event_priority=1,
+            ),
+        ]
+        engine, _ = self._engine(cal, sched)
+        engine._evaluate_due(_at(10))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+
+        cal.write_property(
+            PropertyIdentifier.DATE_LIST,
+            [BACnetCalendarEntry(choice=0, value=BACnetDate(2024, 2, 12, 0xFF))],
+        )
+        engine._evaluate_due(_at(10, 1))
+        assert cal.read_property(PropertyIdentifier.PRESENT_VALUE) is True
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 0.0
+
+    def test_added_and_removed_objects(self):
+        engine, db = self._engine()
+        engine._evaluate_due(_at(10))
+        sched = _office_schedule()
+        db.add(sched)
+        engine._evaluate_due(_at(10, 1))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+
+        db.remove(sched.object_identifier)
+        engine._evaluate_due(_at(10, 2))
+        assert engine._watch.schedules == {}
+        assert db._change_callbacks == {}
+
+    def test_wake_without_membership_change_skips_database_scan(self):
+        from bac_py.objects.analog import AnalogValueObject
+
+        sched = _office_schedule()
+        engine, db = self._engine(sched)
+        engine._evaluate_due(_at(7))
+        scans = []
+        original = db.get_objects_of_type
+        db.get_objects_of_type = lambda obj_type: scans.append(obj_type) or original(obj_type)
+        engine._evaluate_due(_at(8))
+        assert scans == []
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+
+        db.add(AnalogValueObject(99))
+        engine._evaluate_due(_at(8, 1))
+        assert scans == []
+
+    async def test_stop_unregisters_membership_listener(self):
+        engine, db = self._engine()
+        engine._evaluate_due(_at(10))
+        assert db._membership_listeners
+        await engine.stop()
+        assert db._membership_listeners == []
+
+    def test_invalidate_direct_assignment(self):
+        sched = _office_schedule()
+        engine, _ = self._engine(sched)
+        engine._evaluate_due(_at(10))
+        sched._properties[PropertyIdentifier.WEEKLY_SCHEDULE] = [[]] * 7
+        engine._evaluate_due(_at(10, 1))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 72.0
+
+        engine.invalidate(sched.object_identifier)
+        engine._evaluate_due(_at(10, 2))
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+
+    async def test_write_wakes_run_loop(self):
+        sched = _office_schedule()
+        engine, _ = self._engine(sched)
+        engine._scan_interval = 60.0
+        await engine.start()
+        await asyncio.sleep(0.01)
+        sched.write_property(PropertyIdentifier.SCHEDULE_DEFAULT, 50.0)
+        sched.write_property(PropertyIdentifier.WEEKLY_SCHEDULE, [[]] * 7)
+        await asyncio.sleep(0.01)
+        assert sched.read_property(PropertyIdentifier.PRESENT_VALUE) == 50.0
+        await engine.stop()
+        assert engine._watch.schedules == {}
@@ -0,0 +1,96 @@
+"""Tests for the shared per-network device scheduler (app/_scheduler.py)."""
+
+import asyncio
+from contextlib import aclosing
+from dataclasses import dataclass
+
+from bac_py.app._scheduler import object_name, run_per_network
+from bac_py.app.client import DiscoveredDevice
+from bac_py.app.site_scan import SiteScanCheckpoint
+from bac_py.network.address import BACnetAddress
+from bac_py.types.enums import ObjectType, Segmentation
+from bac_py.types.primitives import ObjectIdentifier
+
+
+def _device(instance: int, network: int | None = None) -> DiscoveredDevice:
+    return DiscoveredDevice(
+        address=BACnetAddress(network=network, mac_address=instance.to_bytes(2, "big")),
+        instance=instance,
+        vendor_id=7,
+        max_apdu_length=480,
+        segmentation_supported=Segmentation.NONE,
+    )
+
+
+@dataclass
+class _Outcome:
+    instance: int
+    ok: bool = True
+
+
+class TestRunPerNetwork:
+    async def test_limits_per_network_and_globally(self):
+        devices = [_device(i, network=1) for i in range(6)] + [_device(10 + i) for i in range(6)]
+        active: dict[int | None, int] = {}
+        peak: dict[int | None, int] = {}
+        peak_total = 0
+
+        async def job(device):
+            nonlocal peak_total
+            network = device.address.network
+            active[network] = active.get(network, 0) + 1
+            peak[network] = max(peak.get(network, 0), active[network])
+            peak_total = max(peak_total, sum(active.values()))
+            await asyncio.sleep(0.01)
+            active[network] -= 1
+            return _Outcome(device.instance)
+
+        results = [
+            r async for r in run_per_network(devices, job, max_concurrency=3, max_per_network=2)
+        ]
+        assert sorted(r.instance for r in results) == [*range(6), *range(10, 16)]
+        assert peak == {1: 2, None: 2}
+        assert peak_total == 3
+
+    async def test_checkpoint_skips_and_records_devices(self):
+        checkpoint = SiteScanCheckpoint()
+        checkpoint.mark_completed(1)
+        seen = []
+
+        async def job(device):
+            seen.append(device.instance)
+            return _Outcome(device.instance, ok=device.instance != 3)
+
+        devices = [_device(1), _device(2), _device(2), _device(3)]
+        async for _ in run_per_network(
+            devices, job, max_concurrency=4, max_per_network=4, checkpoint=checkpoint
+        ):
+            pass
+        assert sorted(seen) == [2, 3]
+        assert checkpoint.completed == {1, 2}
+
+    async def test_close_cancels_running_jobs(self):
+        cancelled = []
+
+        async def job(device):
+            if device.instance == 0:
+                return _Outcome(0)
+            try:
+                await asyncio.sleep(10)
+            finally:
+                cancelled.append(device.instance)
+            return _Outcome(device.instance)
+
+        devices = [_device(i) for i in range(3)]
+        async with aclosing(
+            run_per_network(devices, job, max_concurrency=3, max_per_network=3)
+        ) as results:
+            async for result in results:
+                assert result.instance == 0
+                break
+        assert sorted(cancelled) == [1, 2]
+
+
+def test_object_name():
+    oid = ObjectIdentifier(ObjectType.ANALOG_INPUT, 7)
+    assert object_name(oid) == "analog-input,7"
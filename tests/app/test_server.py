@@ -22,7 +22,7 @@ from bac_py.services.alarm_summary import (
     GetEventInformationACK,
     GetEventInformationRequest,
 )
-from bac_py.services.errors import BACnetError
+from bac_py.services.errors import BACnetError, BACnetRejectError
 from bac_py.services.event_notification import (
     AcknowledgeAlarmRequest,
     EventNotificationRequest,
@@ -42,6 +42,7 @@ from bac_py.types.enums import (
     NotifyType,
     ObjectType,
     PropertyIdentifier,
+    RejectReason,
     Segmentation,
 )
 from bac_py.types.primitives import BitString, ObjectIdentifier
@@ -61,6 +62,7 @@ def _make_app(device_instance: int = 1):
     app.config.password = None
     app.service_registry = MagicMock()
     app.unconfirmed_request = MagicMock()
+    app.response_limit.return_value = None
 
     db = ObjectDatabase()
     device = DeviceObject(
@@ -85,6 +87,7 @@ def _make_app_and_handlers(device_instance: int = 1):
     app.config.password = None
     app.service_registry = MagicMock()
     app.unconfirmed_request = MagicMock()
+    app.response_limit.return_value = None
 
     db = ObjectDatabase()
     device = DeviceObject(
@@ -111,6 +114,7 @@ def _make_app_with_list_prop(device_instance: int = 1):
     app.config.password = None
     app.service_registry = MagicMock()
     app.unconfirmed_request = MagicMock()
+    app.response_limit.return_value = None
     app.cov_manager = None
 
     db = ObjectDatabase()
@@ -256,6 +260,77 @@ class TestHandleReadProperty:
         assert ack.object_identifier.object_type == ObjectType.DEVICE
 
 
+class TestEncodedPropertyCache:
+    @staticmethod
+    async def _read(handlers, obj_id, prop):
+        request = ReadPropertyRequest(object_identifier=obj_id, property_identifier=prop)
+        result = await handlers.handle_read_property(12, request.encode(), SOURCE)
+        return ReadPropertyACK.decode(result).property_value
+
+    async def test_static_property_encoded_once(self):
+        _app, _db, device, handlers = _make_app_and_handlers()
+        encoded = await self._read(
+            handlers, device.object_identifier, PropertyIdentifier.OBJECT_NAME
+        )
+        assert device.get_encoded(PropertyIdentifier.OBJECT_NAME) == encoded
+
+        handlers._read_object_property = MagicMock(side_effect=AssertionError("not cached"))
+        again = await self._read(
+            handlers, device.object_identifier, PropertyIdentifier.OBJECT_NAME
+        )
+        assert again == encoded
+
+    async def test_write_property_request_refreshes_value(self):
+        _app, db, _device, handlers = _make_app_and_handlers()
+        ai = AnalogInputObject(1, object_name="ai-1")
+        db.add(ai)
+        before = await self._read(handlers, ai.object_identifier, PropertyIdentifier.OBJECT_NAME)
+
+        write = WritePropertyRequest(
+            object_identifier=ai.object_identifier,
+            property_identifier=PropertyIdentifier.OBJECT_NAME,
+            property_value=_encode_property_value("renamed"),
+        )
+        await handlers.handle_write_property(15, write.encode(), SOURCE)
+
+        after = await self._read(handlers, ai.object_identifier, PropertyIdentifier.OBJECT_NAME)
+        assert after != before
+        assert after == _encode_property_value("renamed")
+
+    async def test_object_list_tracks_database(self):
+        _app, db, device, handlers = _make_app_and_handlers()
+        first = await self._read(
+            handlers, device.object_identifier, PropertyIdentifier.OBJECT_LIST
+        )
+        db.add(AnalogInputObject(1, object_name="ai-1"))
+        second = await self._read(
+            handlers, device.object_identifier, PropertyIdentifier.OBJECT_LIST
+        )
+        assert len(second) > len(first)
+
+    async def test_rpm_uses_cache(self):
+        from bac_py.services.read_property_multiple import (
+            PropertyReference,
+            ReadAccessSpecification,
+            ReadPropertyMultipleACK,
+            ReadPropertyMultipleRequest,
+        )
+
+        _app, _db, device, handlers = _make_app_and_handlers()
+        device.cache_encoded(PropertyIdentifier.OBJECT_NAME, None, b"\x75\x02\x00X")
+        request = ReadPropertyMultipleRequest(
+            [
+                ReadAccessSpecification(
+                    device.object_identifier, [PropertyReference(PropertyIdentifier.OBJECT_NAME)]
+                )
+            ]
+        )
+        result = await handlers.handle_read_property_multiple(14, request.encode(), SOURCE)
+        ack = ReadPropertyMultipleACK.decode(result)
+        elem = ack.list_of_read_access_results[0].list_of_results[0]
+        assert elem.property_value == b"\x75\x02\x00X"
+
+
 # ---------------------------------------------------------------------------
 # WriteProperty handler tests
 # ---------------------------------------------------------------------------
@@ -886,6 +961,272 @@ class TestHandleReadRange:
         assert exc_info.value.error_code == ErrorCode.UNKNOWN_OBJECT
 
 
+def _trend_log(records: int, buffer_size: int):
+    """Trend Log that has logged *records* one-minute samples."""
+    from bac_py.objects.trendlog import TrendLogObject
+    from bac_py.types.constructed import BACnetDateTime, BACnetLogRecord
+    from bac_py.types.primitives import BACnetDate, BACnetTime
+
+    tl = TrendLogObject(1, buffer_size=buffer_size)
+    for i in range(records):
+        tl.append_record(
+            BACnetLogRecord(
+                timestamp=BACnetDateTime(
+                    BACnetDate(2024, 6, 1, 6), BACnetTime(i // 60, i % 60, 0, 0)
+                ),
+                log_datum=float(i),
+            )
+        )
+    return tl
+
+
+def _hourly_trend_log():
+    """Trend Log with records at 10:00, 11:00 and 12:00 on a Friday."""
+    from bac_py.objects.trendlog import TrendLogObject
+    from bac_py.types.constructed import BACnetDateTime, BACnetLogRecord
+    from bac_py.types.primitives import BACnetDate, BACnetTime
+
+    tl = TrendLogObject(1, buffer_size=10)
+    for hour in (10, 11, 12):
+        tl.append_record(
+            BACnetLogRecord(
+                timestamp=BACnetDateTime(BACnetDate(2026, 10, 16, 5), BACnetTime(hour, 0, 0, 0)),
+                log_datum=float(hour),
+            )
+        )
+    return tl
+
+
+async def _read_log_range(handlers, obj_id, qualifier):
+    from bac_py.services.read_range import ReadRangeACK, ReadRangeRequest
+
+    request = ReadRangeRequest(
+        object_identifier=obj_id,
+        property_identifier=PropertyIdentifier.LOG_BUFFER,
+        range=qualifier,
+    )
+    return ReadRangeACK.decode(await handlers.handle_read_range(26, request.encode(), SOURCE))
+
+
+class TestReadRangeLogBuffer:
+    """ReadRange by sequence number and by time on log buffers."""
+
+    TL = ObjectIdentifier(ObjectType.TREND_LOG, 1)
+
+    async def test_by_sequence_after_wrap(self):
+        from bac_py.services.read_range import RangeBySequenceNumber
+
+        _, db, _, handlers = _make_app_and_handlers()
+        # 150 records logged into a 100-record buffer: sequence 51..150 remain
+        db.add(_trend_log(150, 100))
+
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(140, 5))
+        assert ack.item_count == 5
+        assert ack.first_sequence_number == 140
+        assert not ack.result_flags.first_item
+        assert not ack.result_flags.last_item
+        assert ack.result_flags.more_items
+
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(148, 10))
+        assert ack.item_count == 3
+        assert ack.first_sequence_number == 148
+        assert ack.result_flags.last_item
+        assert not ack.result_flags.more_items
+
+    async def test_by_sequence_negative_count(self):
+        from bac_py.services.read_range import RangeBySequenceNumber
+
+        _, db, _, handlers = _make_app_and_handlers()
+        db.add(_trend_log(150, 100))
+
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(53, -5))
+        assert ack.item_count == 3
+        assert ack.first_sequence_number == 51
+        assert ack.result_flags.first_item
+
+    @pytest.mark.parametrize("reference", [50, 151])
+    async def test_by_sequence_outside_buffer(self, reference):
+        from bac_py.services.read_range import RangeBySequenceNumber
+
+        _, db, _, handlers = _make_app_and_handlers()
+        db.add(_trend_log(150, 100))
+
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(reference, 5))
+        assert ack.item_count == 0
+        assert ack.first_sequence_number is None
+        assert not ack.result_flags.first_item
+        assert not ack.result_flags.last_item
+
+    async def test_by_time(self):
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        _, db, _, handlers = _make_app_and_handlers()
+        db.add(_trend_log(150, 100))
+        date = BACnetDate(2024, 6, 1, 6)
+
+        # Records strictly newer than 01:30 start at minute 91 (sequence 92)
+        ack = await _read_log_range(
+            handlers, self.TL, RangeByTime(date, BACnetTime(1, 30, 0, 0), 4)
+        )
+        assert ack.item_count == 4
+        assert ack.first_sequence_number == 92
+
+        # Records strictly older than 01:30 end at minute 89 (sequence 90)
+        ack = await _read_log_range(
+            handlers, self.TL, RangeByTime(date, BACnetTime(1, 30, 0, 0), -4)
+        )
+        assert ack.item_count == 4
+        assert ack.first_sequence_number == 87
+
+        # Nothing is newer than the last record
+        ack = await _read_log_range(
+            handlers, self.TL, RangeByTime(date, BACnetTime(3, 0, 0, 0), 4)
+        )
+        assert ack.item_count == 0
+
+    async def test_by_time_reference_without_weekday(self):
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        _, db, _, handlers = _make_app_and_handlers()
+        db.add(_hourly_trend_log())
+        # Day of week and seconds unspecified
+        date = BACnetDate(2026, 10, 16, 0xFF)
+        time = BACnetTime(10, 30, 0xFF, 0xFF)
+
+        ack = await _read_log_range(handlers, self.TL, RangeByTime(date, time, 5))
+        assert ack.item_count == 2
+        assert ack.first_sequence_number == 2
+
+        ack = await _read_log_range(handlers, self.TL, RangeByTime(date, time, -5))
+        assert ack.item_count == 1
+        assert ack.first_sequence_number == 1
+
+    def test_time_window_on_record_list_ignores_weekday(self):
+        from bac_py.app.server import _reference_key, _time_window
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        records = _hourly_trend_log().read_property(PropertyIdentifier.LOG_BUFFER)
+        reference = _reference_key(
+            RangeByTime(BACnetDate(2026, 10, 16, 0xFF), BACnetTime(10, 30, 0, 0), 5)
+        )
+        assert _time_window(records, reference, 5) == (1, 3)
+        assert _time_window(records, reference, -5) == (0, 1)
+
+    @pytest.mark.parametrize(
+        "date",
+        [(0xFF, 6, 1), (2024, 0xFF, 1), (2024, 13, 1), (2024, 6, 0xFF), (2024, 6, 32)],
+    )
+    async def test_by_time_unspecified_date_rejected(self, date):
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        _, db, _, handlers = _make_app_and_handlers()
+        db.add(_trend_log(10, 100))
+        with pytest.raises(BACnetRejectError) as exc_info:
+            await _read_log_range(
+                handlers,
+                self.TL,
+                RangeByTime(BACnetDate(*date, 0xFF), BACnetTime(0, 0, 0, 0), 1),
+            )
+        assert exc_info.value.reason == RejectReason.PARAMETER_OUT_OF_RANGE
+
+    async def test_truncated_to_response_limit(self):
+        from bac_py.services.read_range import RangeBySequenceNumber, ReadRangeACK
+
+        app, db, _, handlers = _make_app_and_handlers()
+        db.add(_trend_log(150, 100))
+        app.response_limit.return_value = 200
+
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(51, 100))
+        assert 0 < ack.item_count < 100
+        assert ack.first_sequence_number == 51
+        assert ack.result_flags.more_items
+        assert len(ReadRangeACK.encode(ack)) <= 200
+
+        # A negative count keeps the records nearest the reference
+        ack = await _read_log_range(handlers, self.TL, RangeBySequenceNumber(150, -100))
+        assert ack.result_flags.last_item
+        assert ack.result_flags.more_items
+        assert ack.first_sequence_number == 151 - ack.item_count
+
+    async def test_audit_log_by_sequence(self):
+        from bac_py.objects.audit_log import AuditLogObject
+        from bac_py.services.read_range import RangeBySequenceNumber
+        from bac_py.types.audit_types import BACnetAuditNotification
+
+        _, db, _, handlers = _make_app_and_handlers()
+        audit_log = AuditLogObject(1, log_enable=True, buffer_size=3)
+        for _ in range(5):
+            audit_log.append_record(BACnetAuditNotification())
+        db.add(audit_log)
+
+        ack = await _read_log_range(
+            handlers, audit_log.object_identifier, RangeBySequenceNumber(4, 2)
+        )
+        assert ack.item_count == 2
+        assert ack.first_sequence_number == 4
+        assert ack.result_flags.last_item
+
+    def test_time_window_on_log_record_buffer_after_wrap(self):
+        from bac_py.app.server import _reference_key, _time_window
+        from bac_py.objects.trendlog_multiple import TrendLogMultipleObject
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.constructed import BACnetDateTime, BACnetLogMultipleRecord
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        tlm = TrendLogMultipleObject(1, buffer_size=10)
+        date = BACnetDate(2024, 6, 1, 6)
+        for i in range(15):
+            tlm.append_record(
+                BACnetLogMultipleRecord(
+                    timestamp=BACnetDateTime(date, BACnetTime(0, i, 0, 0)),
+                    log_data=[float(i)],
+                )
+            )
+        # Minutes 5..14 remain; newer than 00:09 starts at index 5 (00:10)
+        reference = _reference_key(RangeByTime(date, BACnetTime(0, 9, 0, 0), 3))
+        assert _time_window(tlm.log_buffer, reference, 3) == (5, 8)
+        assert _time_window(tlm.log_buffer, reference, -10) == (0, 4)
+
+    async def test_by_time_without_timestamps_raises(self):
+        from bac_py.objects.audit_log import AuditLogObject
+        from bac_py.services.read_range import RangeByTime
+        from bac_py.types.audit_types import BACnetAuditNotification
+        from bac_py.types.primitives import BACnetDate, BACnetTime
+
+        _, db, _, handlers = _make_app_and_handlers()
+        audit_log = AuditLogObject(1, log_enable=True)
+        audit_log.append_record(BACnetAuditNotification())
+        db.add(audit_log)
+
+        with pytest.raises(BACnetError) as exc_info:
+            await _read_log_range(
+                handlers,
+                audit_log.object_identifier,
+                RangeByTime(BACnetDate(2024, 6, 1, 6), BACnetTime(0, 0, 0, 0), 1),
+            )
+        assert exc_info.value.error_code == ErrorCode.OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED
+
+    async def test_by_sequence_on_plain_list_raises(self):
+        from bac_py.services.read_range import (
+            RangeBySequenceNumber,
+            ReadRangeRequest,
+        )
+
+        _, _, _, handlers = _make_app_and_handlers()
+        request = ReadRangeRequest(
+            object_identifier=ObjectIdentifier(ObjectType.DEVICE, 1),
+            property_identifier=PropertyIdentifier.OBJECT_LIST,
+            range=RangeBySequenceNumber(1, 1),
+        )
+        with pytest.raises(BACnetError) as exc_info:
+            await handlers.handle_read_range(26, request.encode(), SOURCE)
+        assert exc_info.value.error_code == ErrorCode.OPTIONAL_FUNCTIONALITY_NOT_SUPPORTED
+
+
 # ---------------------------------------------------------------------------
 # DeviceCommunicationControl handler tests
 # ---------------------------------------------------------------------------
@@ -0,0 +1,484 @@
+"""Tests for multi-process BACnet/IP sharding (app/sharding.py)."""
+
+import asyncio
+import pickle
+import socket
+import struct
+
+import pytest
+
+from bac_py.app.application import BACnetApplication, DeviceConfig
+from bac_py.app.server import DefaultServerHandlers
+from bac_py.app.sharding import (
+    _FRAME_HEADER,
+    _FRAME_REPLICATE,
+    _LOCAL,
+    _OWNER,
+    ShardSupervisor,
+    ShardWorker,
+    _apply_op,
+    _route,
+    _run_worker,
+)
+from bac_py.encoding.apdu import ConfirmedRequestPDU, encode_apdu
+from bac_py.encoding.primitives import encode_application_real
+from bac_py.network.npdu import NPDU, encode_npdu
+from bac_py.objects.analog import AnalogValueObject
+from bac_py.objects.base import ObjectDatabase
+from bac_py.objects.device import DeviceObject
+from bac_py.services.read_property import ReadPropertyRequest
+from bac_py.services.read_property_multiple import (
+    PropertyReference,
+    ReadAccessSpecification,
+    ReadPropertyMultipleRequest,
+)
+from bac_py.services.write_property import WritePropertyRequest
+from bac_py.transport.bvll import encode_bvll
+from bac_py.types.enums import (
+    BvlcFunction,
+    ConfirmedServiceChoice,
+    EnableDisable,
+    ObjectType,
+    PropertyIdentifier,
+)
+from bac_py.types.primitives import ObjectIdentifier
+
+AV1 = ObjectIdentifier(ObjectType.ANALOG_VALUE, 1)
+DEVICE = ObjectIdentifier(ObjectType.DEVICE, 100)
+
+
+def _confirmed(service_choice: int, request: bytes = b"", *, segmented: bool = False) -> bytes:
+    apdu = encode_apdu(
+        ConfirmedRequestPDU(
+            segmented=segmented,
+            more_follows=False,
+            segmented_response_accepted=True,
+            max_segments=None,
+            max_apdu_length=1476,
+            invoke_id=7,
+            sequence_number=0 if segmented else None,
+            proposed_window_size=1 if segmented else None,
+            service_choice=service_choice,
+            service_request=request,
+        )
+    )
+    return encode_npdu(NPDU(expecting_reply=True, apdu=apdu))
+
+
+def _unicast(npdu: bytes) -> bytes:
+    return encode_bvll(BvlcFunction.ORIGINAL_UNICAST_NPDU, npdu)
+
+
+def _read_request(
+    object_id: ObjectIdentifier = AV1,
+    prop_id: PropertyIdentifier = PropertyIdentifier.PRESENT_VALUE,
+) -> bytes:
+    req = ReadPropertyRequest(object_id, prop_id)
+    return _unicast(_confirmed(ConfirmedServiceChoice.READ_PROPERTY, req.encode()))
+
+
+def _write_request(value: float) -> bytes:
+    req = WritePropertyRequest(
+        AV1, PropertyIdentifier.PRESENT_VALUE, encode_application_real(value)
+    )
+    return _unicast(_confirmed(ConfirmedServiceChoice.WRITE_PROPERTY, req.encode()))
+
+
+class TestRoute:
+    def test_read_property_is_local(self):
+        assert _route(_read_request()) == _LOCAL
+
+    def test_read_property_multiple_is_local(self):
+        data = _unicast(_confirmed(ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE))
+        assert _route(data) == _LOCAL
+
+    def test_device_read_goes_to_owner(self):
+        # Only the owner's COV manager knows the active subscriptions.
+        data = _read_request(DEVICE, PropertyIdentifier.ACTIVE_COV_SUBSCRIPTIONS)
+        assert _route(data) == _OWNER
+
+    def test_read_multiple_naming_device_goes_to_owner(self):
+        req = ReadPropertyMultipleRequest(
+            [
+                ReadAccessSpecification(
+                    AV1, [PropertyReference(PropertyIdentifier.PRESENT_VALUE)]
+                ),
+                ReadAccessSpecification(
+                    DEVICE, [PropertyReference(PropertyIdentifier.ACTIVE_COV_SUBSCRIPTIONS)]
+                ),
+            ]
+        )
+        data = _unicast(_confirmed(ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE, req.encode()))
+        assert _route(data) == _OWNER
+
+    def test_read_multiple_without_device_is_local(self):
+        req = ReadPropertyMultipleRequest(
+            [ReadAccessSpecification(AV1, [PropertyReference(PropertyIdentifier.ALL)])]
+        )
+        data = _unicast(_confirmed(ConfirmedServiceChoice.READ_PROPERTY_MULTIPLE, req.encode()))
+        assert _route(data) == _LOCAL
+
+    def test_segmented_read_is_local(self):
+        data = _unicast(_confirmed(ConfirmedServiceChoice.READ_PROPERTY, segmented=True))
+        assert _route(data) == _LOCAL
+
+    def test_write_goes_to_owner(self):
+        assert _route(_write_request(1.0)) == _OWNER
+
+    @pytest.mark.parametrize(
+        "service",
+        [
+            ConfirmedServiceChoice.SUBSCRIBE_COV,
+            ConfirmedServiceChoice.WRITE_PROPERTY_MULTIPLE,
+            ConfirmedServiceChoice.CREATE_OBJECT,
+            ConfirmedServiceChoice.READ_RANGE,
+        ],
+    )
+    def test_other_confirmed_services_go_to_owner(self, service):
+        assert _route(_unicast(_confirmed(service))) == _OWNER
+
+    def test_broadcast_goes_to_owner(self):
+        npdu = _confirmed(ConfirmedServiceChoice.READ_PROPERTY)
+        data = encode_bvll(BvlcFunction.ORIGINAL_BROADCAST_NPDU, npdu)
+        assert _route(data) == _OWNER
+
+    def test_unconfirmed_goes_to_owner(self):
+        npdu = encode_npdu(NPDU(apdu=b"\x10\x08"))  # Who-Is
+        assert _route(_unicast(npdu)) == _OWNER
+
+    def test_network_message_goes_to_owner(self):
+        assert _route(_unicast(b"\x01\x80\x00")) == _OWNER
+
+    def test_bvlc_management_goes_to_owner(self):
+        data = encode_bvll(BvlcFunction.READ_BROADCAST_DISTRIBUTION_TABLE, b"")
+        assert _route(data) == _OWNER
+
+    def test_routed_read_is_local(self):
+        # DNET 5, 1-byte DADR, SNET 6, 1-byte SADR, hop count, then RP.
+        npdu = (
+            b"\x01\x2c\x00\x05\x01\x0a\x00\x06\x01\x0b\xff"
+            + _confirmed(ConfirmedServiceChoice.READ_PROPERTY)[2:]
+        )
+        assert _route(_unicast(npdu)) == _LOCAL
+
+    def test_client_segment_ack_goes_to_both(self):
+        assert _route(_unicast(b"\x01\x00\x40\x07\x00\x01")) == _LOCAL | _OWNER
+
+    def test_client_abort_goes_to_both(self):
+        assert _route(_unicast(b"\x01\x00\x70\x07\x00")) == _LOCAL | _OWNER
+
+    def test_server_abort_goes_to_owner(self):
+        assert _route(_unicast(b"\x01\x00\x71\x07\x00")) == _OWNER
+
+    def test_simple_ack_goes_to_owner(self):
+        assert _route(_unicast(b"\x01\x00\x20\x07\x0f")) == _OWNER
+
+    def test_truncated_goes_to_owner(self):
+        assert _route(b"\x81\x0a\x00\x05\x01") == _OWNER
+        assert _route(_unicast(b"\x01\x20\x00")) == _OWNER
+
+
+class _FakeWriter:
+    def __init__(self) -> None:
+        self.frames: list[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.frames.append(data)
+
+    def ops(self) -> list[tuple]:
+        ops = []
+        for frame in self.frames:
+            _length, kind = _FRAME_HEADER.unpack(frame[: _FRAME_HEADER.size])
+            assert kind == _FRAME_REPLICATE
+            ops.extend(pickle.loads(frame[_FRAME_HEADER.size :]))
+        return ops
+
+
+class _FakeApp:
+    def __init__(self) -> None:
+        self.object_db = ObjectDatabase()
+
+
+def _populate(db: ObjectDatabase) -> None:
+    db.add(DeviceObject(100, object_name="dev"))
+    db.add(AnalogValueObject(1, object_name="av-1", commandable=True))
+
+
+class TestReplication:
+    async def _owner(self) -> tuple[ShardWorker, _FakeWriter]:
+        app = _FakeApp()
+        _populate(app.object_db)
+        owner = ShardWorker(app, 0, "/unused")  # type: ignore[arg-type]
+        owner._running = True
+        app.object_db.register_write_listener(owner._on_property_written)
+        app.object_db.register_membership_listener(owner._on_membership_changed)
+        writer = _FakeWriter()
+        owner._peers.add(writer)  # type: ignore[arg-type]
+        return owner, writer
+
+    async def test_changes_in_one_tick_coalesce(self):
+        owner, writer = await self._owner()
+        av = owner._app.object_db.get(AV1)
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 1.0, priority=8)
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 2.0, priority=8)
+        await asyncio.sleep(0)
+        ops = writer.ops()
+        keys = [op[:3] for op in ops]
+        assert len(keys) == len(set(keys))
+        pv_ops = [op for op in ops if op[:3] == ("set", AV1, PropertyIdentifier.PRESENT_VALUE)]
+        assert len(pv_ops) == 1
+        assert pv_ops[0][3] == 2.0
+        assert owner.stats.replication_ops_sent == len(ops)
+
+    async def test_replica_matches_owner(self):
+        owner, writer = await self._owner()
+        db = owner._app.object_db
+        db.get(AV1).write_property(PropertyIdentifier.PRESENT_VALUE, 42.0, priority=8)
+        db.get(AV1).write_property(PropertyIdentifier.OBJECT_NAME, "renamed")
+        db.add(AnalogValueObject(2, object_name="av-2", present_value=3.0))
+        await asyncio.sleep(0)
+
+        replica = ObjectDatabase()
+        _populate(replica)
+        for op in writer.ops():
+            _apply_op(replica, op)
+
+        av = replica.get(AV1)
+        assert av.read_property(PropertyIdentifier.PRESENT_VALUE) == 42.0
+        assert av.read_property(PropertyIdentifier.PRIORITY_ARRAY)[7] is not None
+        assert replica._names["renamed"] == AV1
+        av2 = replica.get(ObjectIdentifier(ObjectType.ANALOG_VALUE, 2))
+        assert av2.read_property(PropertyIdentifier.PRESENT_VALUE) == 3.0
+        device = ObjectIdentifier(ObjectType.DEVICE, 100)
+        assert replica.get(device).read_property(PropertyIdentifier.DATABASE_REVISION) == db.get(
+            device
+        ).read_property(PropertyIdentifier.DATABASE_REVISION)
+
+    async def test_remove_is_replicated(self):
+        owner, writer = await self._owner()
+        owner._app.object_db.remove(AV1)
+        await asyncio.sleep(0)
+        replica = ObjectDatabase()
+        _populate(replica)
+        for op in writer.ops():
+            _apply_op(replica, op)
+        assert AV1 not in replica
+
+    async def test_journal_snapshot_for_late_worker(self):
+        owner, _writer = await self._owner()
+        db = owner._app.object_db
+        db.get(AV1).write_property(PropertyIdentifier.PRESENT_VALUE, 7.0)
+        db.add(AnalogValueObject(2, object_name="av-2"))
+        await asyncio.sleep(0)
+        snapshot = owner._journal_snapshot()
+        # Membership ops come first so Database_Revision ends up correct.
+        assert snapshot[0][0] == "add"
+        replica = ObjectDatabase()
+        _populate(replica)
+        for op in snapshot:
+            _apply_op(replica, op)
+        assert replica.get(AV1).read_property(PropertyIdentifier.PRESENT_VALUE) == 7.0
+        assert ObjectIdentifier(ObjectType.ANALOG_VALUE, 2) in replica
+
+    async def test_unpicklable_values_are_skipped(self):
+        owner, writer = await self._owner()
+        av = owner._app.object_db.get(AV1)
+        av._properties[PropertyIdentifier.DESCRIPTION] = lambda: None
+        av._properties[PropertyIdentifier.PRESENT_VALUE] = 9.0
+        await asyncio.sleep(0)
+        assert [op[2] for op in writer.ops()] == [PropertyIdentifier.PRESENT_VALUE]
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _start_app(port: int) -> BACnetApplication:
+    app = BACnetApplication(
+        DeviceConfig(instance_number=100, interface="127.0.0.1", port=port, reuse_port=True)
+    )
+    await app.start()
+    device = DeviceObject(100, object_name="dev")
+    app.object_db.add(device)
+    app.object_db.add(AnalogValueObject(1, object_name="av-1", commandable=True))
+    DefaultServerHandlers(app, app.object_db, device).register()
+    return app
+
+
+class TestShardWorkerIntegration:
+    """Owner and reader worker in one process sharing a port."""
+
+    async def test_write_via_reader_is_applied_by_owner_and_replicated(self, tmp_path):
+        port = _free_port()
+        control = str(tmp_path / "owner.sock")
+        owner_app = await _start_app(port)
+        reader_app = await _start_app(port)
+        owner = ShardWorker(owner_app, 0, control)
+        reader = ShardWorker(reader_app, 1, control)
+        loop = asyncio.get_running_loop()
+        client = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        client.bind(("127.0.0.1", 0))
+        client.setblocking(False)
+        try:
+            await owner.start()
+            await reader.start()
+            for _ in range(100):
+                if owner.stats.connected_workers == 1 and reader._writer is not None:
+                    break
+                await asyncio.sleep(0.01)
+            assert reader_app.event_engine is not None
+
+            # Deliver a write as if the kernel had handed it to the reader.
+            client_addr = client.getsockname()
+            reader_app._transport._on_datagram_received(_write_request(55.0), client_addr)
+            reply, source = await asyncio.wait_for(loop.sock_recvfrom(client, 1500), 2.0)
+            assert source[1] == port
+            assert reply[6] >> 4 == 2  # Simple-ACK from the owner
+            assert reader.stats.forwarded == 1
+            assert owner.stats.injected == 1
+
+            owner_av = owner_app.object_db.get(AV1)
+            assert owner_av.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+            reader_av = reader_app.object_db.get(AV1)
+            for _ in range(100):
+                if reader_av.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0:
+                    break
+                await asyncio.sleep(0.01)
+            assert reader_av.read_property(PropertyIdentifier.PRESENT_VALUE) == 55.0
+
+            # Reads are answered by the reader itself.
+            reader_app._transport._on_datagram_received(_read_request(), client_addr)
+            reply, _ = await asyncio.wait_for(loop.sock_recvfrom(client, 1500), 2.0)
+            assert reply[6] >> 4 == 3  # Complex-ACK
+            assert reader.stats.handled_locally == 1
+            assert reader.stats.forwarded == 1
+        finally:
+            client.close()
+            await reader.stop()
+            await owner.stop()
+            await reader_app.stop()
+            await owner_app.stop()
+
+    async def test_dcc_state_is_copied_to_workers(self, tmp_path):
+        port = _free_port()
+        control = str(tmp_path / "owner.sock")
+        owner_app = await _start_app(port)
+        reader_app = await _start_app(port)
+        late_app = await _start_app(port)
+        owner = ShardWorker(owner_app, 0, control)
+        reader = ShardWorker(reader_app, 1, control)
+        late = ShardWorker(late_app, 2, control)
+
+        async def wait_for(predicate):
+            for _ in range(200):
+                if predicate():
+                    return
+                await asyncio.sleep(0.01)
+
+        try:
+            await owner.start()
+            await reader.start()
+            await wait_for(lambda: owner.stats.connected_workers == 1)
+
+            owner_app.set_dcc_state(EnableDisable.DISABLE, duration=5)
+            await wait_for(lambda: reader_app.dcc_state == EnableDisable.DISABLE)
+            assert reader_app.dcc_state == EnableDisable.DISABLE
+            # Only the owner runs the duration timer.
+            assert reader_app._dcc_timer is None
+
+            # A worker that connects later gets the current state.
+            await late.start()
+            await wait_for(lambda: late_app.dcc_state == EnableDisable.DISABLE)
+            assert late_app.dcc_state == EnableDisable.DISABLE
+
+            owner_app._dcc_timer_expired()
+            await wait_for(
+                lambda: (
+                    reader_app.dcc_state == EnableDisable.ENABLE
+                    and late_app.dcc_state == EnableDisable.ENABLE
+                )
+            )
+            assert reader_app.dcc_state == EnableDisable.ENABLE
+            assert late_app.dcc_state == EnableDisable.ENABLE
+        finally:
+            await late.stop()
+            await reader.stop()
+            await owner.stop()
+            await late_app.stop()
+            await reader_app.stop()
+            await owner_app.stop()
+
+    async def test_owner_drops_duplicate_broadcast_copies(self, tmp_path):
+        port = _free_port()
+        owner_app = await _start_app(port)
+        owner = ShardWorker(owner_app, 0, str(tmp_path / "owner.sock"))
+        try:
+            await owner.start()
+            who_is = encode_bvll(
+                BvlcFunction.ORIGINAL_BROADCAST_NPDU, encode_npdu(NPDU(apdu=b"\x10\x08"))
+            )
+            addr = ("127.0.0.1", 40000)
+            assert owner._owner_filter(who_is, addr) is False
+            owner._inject(who_is, addr)
+            assert owner.stats.duplicates_dropped == 1
+            assert owner.stats.injected == 0
+        finally:
+            await owner.stop()
+            await owner_app.stop()
+
+    async def test_requires_bip_transport(self, tmp_path):
+        app = _FakeApp()
+        app._transport = None  # type: ignore[attr-defined]
+        worker = ShardWorker(app, 1, str(tmp_path / "owner.sock"))  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            await worker.start()
+
+
+class TestRunWorker:
+    async def test_setup_receives_worker_index(self, tmp_path):
+        calls = []
+
+        async def setup(app, index):
+            calls.append((app, index))
+
+        config = DeviceConfig(
+            instance_number=100, interface="127.0.0.1", port=_free_port(), reuse_port=True
+        )
+        task = asyncio.create_task(_run_worker(config, setup, 1, str(tmp_path / "owner.sock")))
+        for _ in range(200):
+            if calls:
+                break
+            await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert len(calls) == 1
+        assert isinstance(calls[0][0], BACnetApplication)
+        assert calls[0][1] == 1
+
+
+class TestShardSupervisorValidation:
+    def test_port_zero_rejected(self):
+        with pytest.raises(ValueError, match="fixed port"):
+            ShardSupervisor(DeviceConfig(instance_number=1, port=0), lambda app, index: None)
+
+    def test_ipv6_rejected(self):
+        with pytest.raises(ValueError, match="IPv4"):
+            ShardSupervisor(DeviceConfig(instance_number=1, ipv6=True), lambda app, index: None)
+
+    def test_worker_count_validated(self):
+        with pytest.raises(ValueError, match="workers"):
+            ShardSupervisor(DeviceConfig(instance_number=1), lambda app, index: None, workers=0)
+
+    def test_config_gets_reuse_port(self):
+        sup = ShardSupervisor(DeviceConfig(instance_number=1), lambda app, index: None, workers=2)
+        assert sup._config.reuse_port
+        assert sup.workers == 2
+        assert sup.control_path is None
+        assert sup.pids == [None, None]
+
+
+def test_frame_header_layout():
+    assert _FRAME_HEADER.size == struct.calcsize(">IB")
@@ -0,0 +1,278 @@
+"""Tests for the streaming site scan."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from bac_py.app.client import BACnetClient, DiscoveredDevice
+from bac_py.app.site_scan import SiteScanCheckpoint, scan_site
+from bac_py.encoding.primitives import encode_application_character_string
+from bac_py.network.address import BACnetAddress
+from bac_py.services.errors import BACnetError, BACnetRejectError, BACnetTimeoutError
+from bac_py.services.read_property import ReadPropertyACK
+from bac_py.types.enums import (
+    ErrorClass,
+    ErrorCode,
+    ObjectType,
+    PropertyIdentifier,
+    RejectReason,
+    Segmentation,
+)
+from bac_py.types.primitives import ObjectIdentifier
+
+
+def _device(instance: int, network: int | None = None) -> DiscoveredDevice:
+    return DiscoveredDevice(
+        address=BACnetAddress(network=network, mac_address=instance.to_bytes(2, "big")),
+        instance=instance,
+        vendor_id=7,
+        max_apdu_length=480,
+        segmentation_supported=Segmentation.NONE,
+    )
+
+
+def _objects(instance: int) -> list[ObjectIdentifier]:
+    return [
+        ObjectIdentifier(ObjectType.DEVICE, instance),
+        ObjectIdentifier(ObjectType.ANALOG_INPUT, 1),
+    ]
+
+
+class FakeClient:
+    """Client stub tracking concurrency per network."""
+
+    def __init__(self, *, failures=None):
+        self.failures = dict(failures or {})
+        self.active: dict[int | None, int] = {}
+        self.peak: dict[int | None, int] = {}
+        self.total = 0
+        self.peak_total = 0
+        self.progress_objects: dict[int, set[int]] = {}
+        self.discover = AsyncMock(return_value=[])
+
+    async def _enter(self, network):
+        self.active[network] = self.active.get(network, 0) + 1
+        self.peak[network] = max(self.peak.get(network, 0), self.active[network])
+        self.total += 1
+        self.peak_total = max(self.peak_total, self.total)
+        await asyncio.sleep(0.001)
+        self.active[network] -= 1
+        self.total -= 1
+
+    async def get_object_list(self, address, device_instance, **kwargs):
+        self.progress_objects.setdefault(device_instance, set()).add(id(kwargs["progress"]))
+        await self._enter(address.network)
+        failure = self.failures.get(device_instance)
+        if failure:
+            exc, remaining = failure
+            if remaining:
+                self.failures[device_instance] = (exc, remaining - 1)
+                raise exc
+        return _objects(device_instance)
+
+    async def read_multiple(self, address, specs, **kwargs):
+        return {
+            f"{oid.object_type.name.lower().replace('_', '-')},{oid.instance_number}": {
+                "object-name": f"obj-{oid.instance_number}"
+            }
+            for oid in specs
+        }
+
+
+async def _collect(agen):
+    return [result async for result in agen]
+
+
+class TestScanSite:
+    async def test_scans_discovered_devices(self):
+        client = FakeClient()
+        client.discover.return_value = [_device(1), _device(2, network=5)]
+
+        results = await _collect(scan_site(client, discover_timeout=0.5))
+
+        client.discover.assert_awaited_once()
+        assert client.discover.call_args.kwargs["timeout"] == 0.5
+        assert sorted(r.device.instance for r in results) == [1, 2]
+        for result in results:
+            assert result.ok
+            assert result.attempts == 1
+            assert result.object_list == _objects(result.device.instance)
+            assert result.properties["analog-input,1"] == {"object-name": "obj-1"}
+
+    async def test_object_lists_only(self):
+        client = FakeClient()
+        client.read_multiple = AsyncMock()
+        results = await _collect(scan_site(client, devices=[_device(1)], properties=None))
+        assert results[0].properties == {}
+        client.read_multiple.assert_not_called()
+
+    async def test_concurrency_limits(self):
+        client = FakeClient()
+        devices = [_device(i, network=(i % 3) or None) for i in range(30)]
+
+        results = await _collect(
+            scan_site(client, devices=devices, max_concurrency=5, max_per_network=2)
+        )
+
+        assert len(results) == 30
+        assert client.peak_total <= 5
+        assert all(peak <= 2 for peak in client.peak.values())
+        assert client.peak_total > 2
+
+    async def test_duplicate_devices_scanned_once(self):
+        client = FakeClient()
+        results = await _collect(scan_site(client, devices=[_device(1), _device(1)]))
+        assert len(results) == 1
+
+    async def test_timeout_retried_with_same_progress(self):
+        client = FakeClient(failures={1: (BACnetTimeoutError("timeout"), 2)})
+
+        results = await _collect(scan_site(client, devices=[_device(1)], backoff=0.001))
+
+        assert results[0].ok
+        assert results[0].attempts == 3
+        assert len(client.progress_objects[1]) == 1
+
+    async def test_retries_exhausted(self):
+        client = FakeClient(failures={1: (BACnetTimeoutError("timeout"), 5)})
+
+        results = await _collect(
+            scan_site(client, devices=[_device(1), _device(2)], retries=1, backoff=0.001)
+        )
+
+        by_instance = {r.device.instance: r for r in results}
+        assert isinstance(by_instance[1].error, BACnetTimeoutError)
+        assert by_instance[1].attempts == 2
+        assert by_instance[2].ok
+
+    async def test_protocol_error_not_retried(self):
+        error = BACnetError(ErrorClass.OBJECT, ErrorCode.UNKNOWN_OBJECT)
+        client = FakeClient(failures={1: (error, 5)})
+
+        results = await _collect(scan_site(client, devices=[_device(1)], backoff=0.001))
+
+        assert results[0].error is error
+        assert results[0].attempts == 1
+
+    async def test_checkpoint_resume(self, tmp_path):
+        path = tmp_path / "scan.json"
+        client = FakeClient(failures={2: (BACnetTimeoutError("timeout"), 5)})
+        devices = [_device(i) for i in range(1, 4)]
+
+        checkpoint = SiteScanCheckpoint(path)
+        await _collect(scan_site(client, devices=devices, retries=0, checkpoint=checkpoint))
+        assert json.loads(path.read_text())["completed"] == [1, 3]
+
+        client = FakeClient()
+        resumed = SiteScanCheckpoint(path)
+        results = await _collect(scan_site(client, devices=devices, checkpoint=resumed))
+        assert [r.device.instance for r in results] == [2]
+        assert resumed.completed == {1, 2, 3}
+        assert json.loads(path.read_text())["completed"] == [1, 2, 3]
+
+    def test_checkpoint_ignores_corrupt_file(self, tmp_path):
+        path = tmp_path / "scan.json"
+        path.write_text("{oops")
+        assert len(SiteScanCheckpoint(path)) == 0
+
+    async def test_early_close_cancels_running_scans(self):
+        client = FakeClient()
+        cancelled = []
+
+        async def slow(address, device_instance, **kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(device_instance)
+                raise
+
+        async def fast(address, device_instance, **kwargs):
+            if device_instance == 1:
+                return []
+            return await slow(address, device_instance, **kwargs)
+
+        client.get_object_list = fast
+        agen = scan_site(client, devices=[_device(1), _device(2), _device(3)])
+        first = await agen.__anext__()
+        assert first.device.instance == 1
+        await agen.aclose()
+        assert sorted(cancelled) == [2, 3]
+
+    async def test_invalid_limits(self):
+        with pytest.raises(ValueError, match="at least 1"):
+            await _collect(scan_site(FakeClient(), devices=[], max_per_network=0))
+        with pytest.raises(ValueError, match="retries"):
+            await _collect(scan_site(FakeClient(), devices=[], retries=-1))
+
+
+class TestScanSiteClient:
+    async def test_rpm_rejected_falls_back_to_read_property(self):
+        app = MagicMock()
+        client = BACnetClient(app)
+        client.get_object_list = AsyncMock(return_value=_objects(1))
+        client.read_multiple = AsyncMock(
+            side_effect=BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+        )
+
+        async def read_property(address, oid, prop, timeout=None):
+            if prop == PropertyIdentifier.PRESENT_VALUE:
+                raise BACnetError(ErrorClass.PROPERTY, ErrorCode.UNKNOWN_PROPERTY)
+            return ReadPropertyACK(
+                oid,
+                prop,
+                property_value=encode_application_character_string(f"n{oid.instance_number}"),
+            )
+
+        client.read_property = read_property
+
+        results = await _collect(client.scan_site(devices=[_device(1)]))
+
+        assert results[0].ok
+        assert results[0].properties == {
+            "device,1": {"object-name": "n1", "present-value": None},
+            "analog-input,1": {"object-name": "n1", "present-value": None},
+        }
+
+    async def test_read_property_fallback_is_bounded(self):
+        app = MagicMock()
+        client = BACnetClient(app)
+        objects = [ObjectIdentifier(ObjectType.ANALOG_INPUT, i) for i in range(200)]
+        client.get_object_list = AsyncMock(return_value=objects)
+        client.read_multiple = AsyncMock(
+            side_effect=BACnetRejectError(RejectReason.UNRECOGNIZED_SERVICE)
+        )
+        active = peak = 0
+
+        async def read_property(address, oid, prop, timeout=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return ReadPropertyACK(
+                oid, prop, property_value=encode_application_character_string("x")
+            )
+
+        client.read_property = read_property
+        tasks_before = len(asyncio.all_tasks())
+        task_peak = 0
+
+        async def _watch():
+            nonlocal task_peak
+            while True:
+                task_peak = max(task_peak, len(asyncio.all_tasks()) - tasks_before)
+                await asyncio.sleep(0)
+
+        watcher = asyncio.ensure_future(_watch())
+        try:
+            results = await _collect(client.scan_site(devices=[_device(1)], requests_per_device=4))
+        finally:
+            watcher.cancel()
+
+        assert results[0].ok
+        assert len(results[0].properties) == 200
+        assert peak == 4
+        # The watcher, the device scan, and one task per worker.
+        assert task_peak <= 4 + 3
@@ -0,0 +1,427 @@
+"""Tests for incremental remote log collection."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from bac_py.app.server import DefaultServerHandlers
+from bac_py.app.trend_collector import TrendCheckpoint, TrendCollector, TrendCursor
+from bac_py.encoding.primitives import (
+    encode_application_date,
+    encode_application_enumerated,
+    encode_application_time,
+    encode_context_bit_string,
+    encode_context_tagged,
+    encode_property_value,
+    encode_real,
+    encode_unsigned,
+)
+from bac_py.encoding.tags import encode_closing_tag, encode_opening_tag
+from bac_py.network.address import BACnetAddress
+from bac_py.objects.base import ObjectDatabase
+from bac_py.objects.device import DeviceObject
+from bac_py.objects.trendlog import TrendLogObject
+from bac_py.services.errors import BACnetError, BACnetRejectError
+from bac_py.services.event_notification import BACnetEventLogRecord, EventNotificationRequest
+from bac_py.services.read_property import ReadPropertyACK
+from bac_py.services.read_range import (
+    RangeBySequenceNumber,
+    ReadRangeACK,
+    ReadRangeRequest,
+    ResultFlags,
+)
+from bac_py.types.constructed import (
+    BACnetDateTime,
+    BACnetLogMultipleRecord,
+    BACnetLogRecord,
+    BACnetTimeStamp,
+)
+from bac_py.types.enums import (
+    ErrorClass,
+    ErrorCode,
+    EventState,
+    EventType,
+    NotifyType,
+    ObjectType,
+    RejectReason,
+)
+from bac_py.types.primitives import BACnetDate, BACnetTime, BitString, ObjectIdentifier
+
+DEV_A = BACnetAddress(mac_address=b"\x0a\x00\x00\x01\xba\xc0")
+DEV_B = BACnetAddress(mac_address=b"\x0a\x00\x00\x02\xba\xc0")
+
+
+def _record(i: int) -> BACnetLogRecord:
+    return BACnetLogRecord(
+        timestamp=BACnetDateTime(BACnetDate(2024, 6, 1, 6), BACnetTime(i // 60, i % 60, 0, 0)),
+        log_datum=float(i),
+    )
+
+
+class FakeDevice:
+    """Remote device serving ReadRange from real Trend Log objects."""
+
+    def __init__(self, *, by_sequence=True, response_limit=None, counts=True):
+        app = MagicMock()
+        app.response_limit.return_value = response_limit
+        self.db = ObjectDatabase()
+        device = DeviceObject(1, object_name="dev", vendor_name="v", vendor_identifier=1)
+        self.db.add(device)
+        self.handlers = DefaultServerHandlers(app, self.db, device)
+        self.by_sequence = by_sequence
+        self.counts = counts
+        self.ranges = []
+        self.before_range = None
+
+    def add_log(self, instance, records, buffer_size=100):
+        tl = TrendLogObject(instance, buffer_size=buffer_size)
+        for i in range(records):
+            tl.append_record(_record(i))
+        self.db.add(tl)
+        return tl
+
+
+class FakeClient:
+    """Client stub dispatching to :class:`FakeDevice` handlers."""
+
+    def __init__(self, devices):
+        self.devices = devices
+        self.active = {}
+        self.peak = {}
+
+    async def read_property(self, address, oid, prop, timeout=None):
+        device = self.devices[address]
+        if not device.counts:
+            raise BACnetError(ErrorClass.PROPERTY, ErrorCode.UNKNOWN_PROPERTY)
+        value = device.db.get(oid).read_property(prop)
+        return ReadPropertyACK(oid, prop, property_value=encode_property_value(value))
+
+    async def read_range(self, address, oid, prop, range_qualifier=None, timeout=None):
+        device = self.devices[address]
+        device.ranges.append(range_qualifier)
+        if isinstance(range_qualifier, RangeBySequenceNumber) and not device.by_sequence:
+            raise BACnetRejectError(RejectReason.PARAMETER_OUT_OF_RANGE)
+        self.active[address] = self.active.get(address, 0) + 1
+        self.peak[address] = max(self.peak.get(address, 0), self.active[address])
+        await asyncio.sleep(0.001)
+        self.active[address] -= 1
+        if device.before_range is not None:
+            device.before_range()
+        request = ReadRangeRequest(oid, prop, range=range_qualifier)
+        data = await device.handlers.handle_read_range(26, request.encode(), address)
+        return ReadRangeACK.decode(data)
+
+
+TL1 = ObjectIdentifier(ObjectType.TREND_LOG, 1)
+TL2 = ObjectIdentifier(ObjectType.TREND_LOG, 2)
+
+
+async def _collect(collector, logs):
+    return [batch async for batch in collector.collect(logs)]
+
+
+def _values(batches):
+    return [r.log_datum for batch in batches for r in batch.records]
+
+
+class TestTrendCollector:
+    async def test_pages_and_resumes(self):
+        device = FakeDevice()
+        tl = device.add_log(1, 25)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=10)
+
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert [len(b.records) for b in batches] == [10, 10, 5]
+        assert [b.first_sequence_number for b in batches] == [1, 11, 21]
+        assert _values(batches) == [float(i) for i in range(25)]
+        assert collector.checkpoint.get(DEV_A, TL1).sequence_number == 25
+
+        # Only records logged since the last pass are collected
+        for i in range(25, 28):
+            tl.append_record(_record(i))
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [25.0, 26.0, 27.0]
+        assert batches[0].missed == 0
+
+        assert await _collect(collector, [(DEV_A, TL1)]) == []
+
+    async def test_reports_overwritten_records(self):
+        device = FakeDevice()
+        tl = device.add_log(1, 10, buffer_size=10)
+        collector = TrendCollector(FakeClient({DEV_A: device}))
+        await _collect(collector, [(DEV_A, TL1)])
+
+        for i in range(10, 25):
+            tl.append_record(_record(i))
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert batches[0].missed == 5
+        assert batches[0].first_sequence_number == 16
+        assert _values(batches) == [float(i) for i in range(15, 25)]
+
+    async def test_detects_reset(self):
+        device = FakeDevice()
+        device.add_log(1, 10)
+        collector = TrendCollector(FakeClient({DEV_A: device}))
+        await _collect(collector, [(DEV_A, TL1)])
+
+        device.db.remove(TL1)
+        device.add_log(1, 3)
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert batches[0].reset
+        assert _values(batches) == [0.0, 1.0, 2.0]
+
+    async def test_truncated_pages(self):
+        device = FakeDevice(response_limit=120)
+        device.add_log(1, 30)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=100)
+
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert len(batches) > 1
+        assert _values(batches) == [float(i) for i in range(30)]
+
+    async def test_falls_back_to_position(self):
+        device = FakeDevice(by_sequence=False)
+        device.add_log(1, 15)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=10)
+
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [float(i) for i in range(15)]
+        assert [b.first_sequence_number for b in batches] == [1, 11]
+        assert sum(isinstance(r, RangeBySequenceNumber) for r in device.ranges) == 1
+
+    async def test_position_read_while_log_wraps(self):
+        device = FakeDevice(by_sequence=False)
+        tl = device.add_log(1, 10, buffer_size=10)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=5)
+        await _collect(collector, [(DEV_A, TL1)])
+        for i in range(10, 15):
+            tl.append_record(_record(i))
+
+        logged = iter(range(15, 18))
+
+        def _log_between_counts_and_page():
+            # Overwrite three more records once, after the counts were read
+            device.before_range = None
+            for i in logged:
+                tl.append_record(_record(i))
+
+        device.before_range = _log_between_counts_and_page
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [float(i) for i in range(10, 15)]
+        assert [b.first_sequence_number for b in batches] == [11]
+        assert batches[0].missed == 0
+
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [15.0, 16.0, 17.0]
+        assert batches[0].first_sequence_number == 16
+
+    async def test_falls_back_to_time(self):
+        device = FakeDevice(counts=False)
+        tl = device.add_log(1, 15)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=10)
+
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [float(i) for i in range(15)]
+        cursor = collector.checkpoint.get(DEV_A, TL1)
+        assert cursor.sequence_number is None
+        assert cursor.timestamp == _record(14).timestamp
+
+        tl.append_record(_record(15))
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [15.0]
+
+    async def test_per_device_limit(self):
+        device_a, device_b = FakeDevice(), FakeDevice()
+        for i in range(1, 5):
+            device_a.add_log(i, 30)
+            device_b.add_log(i, 30)
+        client = FakeClient({DEV_A: device_a, DEV_B: device_b})
+        collector = TrendCollector(client, page_size=10, max_per_device=2)
+        logs = [
+            (dev, ObjectIdentifier(ObjectType.TREND_LOG, i))
+            for dev in (DEV_A, DEV_B)
+            for i in range(1, 5)
+        ]
+
+        batches = await _collect(collector, logs)
+        assert len(batches) == 24
+        assert client.peak[DEV_A] == 2
+        assert client.peak[DEV_B] == 2
+
+    async def test_error_yields_batch_and_keeps_cursor(self):
+        device = FakeDevice()
+        device.add_log(1, 5)
+        collector = TrendCollector(FakeClient({DEV_A: device}))
+
+        batches = await _collect(collector, [(DEV_A, TL1), (DEV_A, TL2)])
+        failed = [b for b in batches if not b.ok]
+        assert len(failed) == 1
+        assert failed[0].object_identifier == TL2
+        assert collector.checkpoint.get(DEV_A, TL2) is None
+        assert collector.checkpoint.get(DEV_A, TL1).sequence_number == 5
+
+    async def test_cursor_advances_after_consumer(self):
+        device = FakeDevice()
+        device.add_log(1, 20)
+        collector = TrendCollector(FakeClient({DEV_A: device}), page_size=10)
+
+        stream = collector.collect([(DEV_A, TL1)])
+        await anext(stream)
+        assert collector.checkpoint.get(DEV_A, TL1) is None
+        await anext(stream)
+        assert collector.checkpoint.get(DEV_A, TL1).sequence_number == 10
+        await stream.aclose()
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError, match="page_size"):
+            TrendCollector(FakeClient({}), page_size=0)
+
+
+def _clause21_timestamp(i: int) -> bytes:
+    ts = _record(i).timestamp
+    return (
+        encode_opening_tag(0)
+        + encode_application_date(ts.date)
+        + encode_application_time(ts.time)
+        + encode_closing_tag(0)
+    )
+
+
+def _log_multiple_record(i: int) -> bytes:
+    """Encode a Clause 21 LogMultipleRecord holding a real, an unsigned and a failure."""
+    return (
+        _clause21_timestamp(i)
+        + encode_opening_tag(1)
+        + encode_opening_tag(1)
+        + encode_context_tagged(1, encode_real(float(i)))
+        + encode_context_tagged(3, encode_unsigned(i))
+        + encode_opening_tag(7)
+        + encode_application_enumerated(ErrorClass.PROPERTY)
+        + encode_application_enumerated(ErrorCode.UNKNOWN_PROPERTY)
+        + encode_closing_tag(7)
+        + encode_closing_tag(1)
+        + encode_closing_tag(1)
+    )
+
+
+def _event_log_record(i: int) -> bytes:
+    notification = EventNotificationRequest(
+        process_identifier=1,
+        initiating_device_identifier=ObjectIdentifier(ObjectType.DEVICE, 1),
+        event_object_identifier=ObjectIdentifier(ObjectType.ANALOG_INPUT, i),
+        time_stamp=BACnetTimeStamp(choice=1, value=i),
+        notification_class=1,
+        priority=100,
+        event_type=EventType.OUT_OF_RANGE,
+        notify_type=NotifyType.ACK_NOTIFICATION,
+        to_state=EventState.NORMAL,
+    )
+    return (
+        _clause21_timestamp(i)
+        + encode_opening_tag(1)
+        + encode_opening_tag(1)
+        + notification.encode()
+        + encode_closing_tag(1)
+        + encode_closing_tag(1)
+    )
+
+
+class StaticLogClient:
+    """Client stub serving pre-encoded Clause 21 records by sequence number."""
+
+    def __init__(self, items):
+        self.items = items
+
+    async def read_property(self, address, oid, prop, timeout=None):
+        return ReadPropertyACK(oid, prop, property_value=encode_property_value(len(self.items)))
+
+    async def read_range(self, address, oid, prop, range_qualifier=None, timeout=None):
+        first = range_qualifier.reference_sequence_number
+        chunk = self.items[first - 1 : first - 1 + range_qualifier.count]
+        return ReadRangeACK(
+            oid,
+            prop,
+            ResultFlags(first_item=first == 1, last_item=True),
+            item_count=len(chunk),
+            item_data=b"".join(chunk),
+            first_sequence_number=first,
+        )
+
+
+class TestTrendCollectorRecordTypes:
+    async def test_trend_log_multiple_records(self):
+        tlm = ObjectIdentifier(ObjectType.TREND_LOG_MULTIPLE, 1)
+        client = StaticLogClient([_log_multiple_record(i) for i in range(3)])
+        batches = await _collect(TrendCollector(client), [(DEV_A, tlm)])
+
+        assert all(batch.ok for batch in batches)
+        records = [r for batch in batches for r in batch.records]
+        assert all(isinstance(r, BACnetLogMultipleRecord) for r in records)
+        assert [r.log_data[:2] for r in records] == [[float(i), i] for i in range(3)]
+        assert records[0].log_data[2] == (ErrorClass.PROPERTY, ErrorCode.UNKNOWN_PROPERTY)
+        assert records[2].timestamp == _record(2).timestamp
+
+    async def test_log_multiple_status_and_time_change(self):
+        tlm = ObjectIdentifier(ObjectType.TREND_LOG_MULTIPLE, 1)
+        status = (
+            _clause21_timestamp(0)
+            + encode_opening_tag(1)
+            + encode_context_bit_string(0, BitString(b"\x80", 5))
+            + encode_closing_tag(1)
+        )
+        time_change = (
+            _clause21_timestamp(1)
+            + encode_opening_tag(1)
+            + encode_context_tagged(2, encode_real(-3.5))
+            + encode_closing_tag(1)
+        )
+        batches = await _collect(
+            TrendCollector(StaticLogClient([status, time_change])), [(DEV_A, tlm)]
+        )
+        records = batches[0].records
+        assert isinstance(records[0].log_data, BitString)
+        assert records[1].log_data == -3.5
+
+    async def test_event_log_records(self):
+        el = ObjectIdentifier(ObjectType.EVENT_LOG, 1)
+        client = StaticLogClient([_event_log_record(i) for i in range(2)])
+        batches = await _collect(TrendCollector(client), [(DEV_A, el)])
+
+        assert all(batch.ok for batch in batches)
+        records = batches[0].records
+        assert all(isinstance(r, BACnetEventLogRecord) for r in records)
+        assert [r.log_datum.event_object_identifier.instance_number for r in records] == [0, 1]
+        assert records[1].log_datum.event_type == EventType.OUT_OF_RANGE
+
+
+class TestTrendCheckpoint:
+    def test_round_trip(self, tmp_path):
+        path = tmp_path / "trends.json"
+        checkpoint = TrendCheckpoint(path)
+        checkpoint.update(DEV_A, TL1, TrendCursor(42, _record(3).timestamp))
+        checkpoint.update(DEV_B, TL2, TrendCursor(None, None))
+        checkpoint.save()
+
+        loaded = TrendCheckpoint(path)
+        assert len(loaded) == 2
+        assert loaded.get(DEV_A, TL1) == TrendCursor(42, _record(3).timestamp)
+        assert loaded.get(DEV_B, TL2) == TrendCursor()
+
+    def test_unreadable_file_ignored(self, tmp_path):
+        path = tmp_path / "trends.json"
+        path.write_text(json.dumps({"logs": [{"address": 1}]}))
+        assert len(TrendCheckpoint(path)) == 0
+
+    async def test_resume_from_file(self, tmp_path):
+        path = tmp_path / "trends.json"
+        device = FakeDevice()
+        tl = device.add_log(1, 5)
+        client = FakeClient({DEV_A: device})
+        await _collect(TrendCollector(client, checkpoint=TrendCheckpoint(path)), [(DEV_A, TL1)])
+
+        tl.append_record(_record(5))
+        collector = TrendCollector(client, checkpoint=TrendCheckpoint(path))
+        batches = await _collect(collector, [(DEV_A, TL1)])
+        assert _values(batches) == [5.0]
@@ -1,11 +1,10 @@
 """Tests for TrendLog recording engine (Clause 12.25)."""
 
 import asyncio
-import datetime
 import time
 from unittest.mock import patch
 
-from bac_py.app.trendlog_engine import TrendLogEngine, _datetime_to_float, _now_datetime
+from bac_py.app.trendlog_engine import TrendLogEngine, _datetime_to_float
 from bac_py.objects.analog import AnalogInputObject
 from bac_py.objects.base import ObjectDatabase
 from bac_py.objects.trendlog import TrendLogObject
@@ -80,7 +79,7 @@ class TestAppendRecord:
     def test_append_basic(self):
         tl = TrendLogObject(1)
         tl._properties[PropertyIdentifier.BUFFER_SIZE] = 100
-        record = BACnetLogRecord(timestamp=_now_datetime(), log_datum=42.0)
+        record = BACnetLogRecord(timestamp=BACnetDateTime.now(), log_datum=42.0)
         assert tl.append_record(record) is True
         assert tl.read_property(PropertyIdentifier.RECORD_COUNT) == 1
         assert tl.read_property(PropertyIdentifier.TOTAL_RECORD_COUNT) == 1
@@ -91,7 +90,7 @@ class TestAppendRecord:
         tl._properties[PropertyIdentifier.STOP_WHEN_FULL] = False
 
         for i in range(5):
-            record = BACnetLogRecord(timestamp=_now_datetime(), log_datum=float(i))
+            record = BACnetLogRecord(timestamp=BACnetDateTime.now(), log_datum=float(i))
             tl.append_record(record)
 
         # Buffer should have last 3 records
@@ -108,9 +107,9 @@ class TestAppendRecord:
         tl._properties[PropertyIdentifier.BUFFER_SIZE] = 2
         tl._properties[PropertyIdentifier.STOP_WHEN_FULL] = True
 
-        r1 = BACnetLogRecord(timestamp=_now_datetime(), log_datum=1.0)
-        r2 = BACnetLogRecord(timestamp=_now_datetime(), log_datum=2.0)
-        r3 = BACnetLogRecord(timestamp=_now_datetime(), log_datum=3.0)
+        r1 = BACnetLogRecord(timestamp=BACnetDateTime.now(), log_datum=1.0)
+        r2 = BACnetLogRecord(timestamp=BACnetDateTime.now(), log_datum=2.0)
+        r3 = BACnetLogRecord(timestamp=BACnetDateTime.now(), log_datum=3.0)
 
         assert tl.append_record(r1) is True
         assert tl.append_record(r2) is True
@@ -386,21 +385,6 @@ class TestCOVLogging:
         assert len(engine._cov_subscriptions) == 0
 
 
-# ---------------------------------------------------------------------------
-# now_datetime helper
-# ---------------------------------------------------------------------------
-
-
-class TestNowDatetime:
-    def test_now_datetime_structure(self):
-        dt = _now_datetime()
-        now = datetime.datetime.now()
-        assert dt.date.year == now.year
-        assert dt.date.month == now.month
-        assert dt.date.day == now.day
-        assert dt.time.hour == now.hour
-
-
 # ---------------------------------------------------------------------------
 # _datetime_to_float exception handling (lines 54-55)
 # ---------------------------------------------------------------------------
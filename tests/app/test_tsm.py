@@ -1,4 +1,5 @@
 import asyncio
+import dataclasses
 
 import pytest
 
@@ -17,6 +18,7 @@ from bac_py.encoding.apdu import (
     decode_apdu,
 )
 from bac_py.network.address import BACnetAddress
+from bac_py.segmentation.manager import compute_max_segment_payload
 from bac_py.services.errors import (
     BACnetAbortError,
     BACnetError,
@@ -184,6 +186,24 @@ class TestServerTSM:
         assert txn.service_choice == 12
         assert data == b"\x01\x02"
 
+    async def test_response_limit(self, tsm):
+        assert tsm.response_limit(PEER) is None
+        pdu = dataclasses.replace(
+            _make_non_segmented_pdu(invoke_id=1), segmented_response_accepted=False
+        )
+        tsm.receive_confirmed_request(pdu, PEER)
+        assert tsm.response_limit(PEER) == compute_max_segment_payload(1476, "complex_ack")
+
+    async def test_response_limit_unbounded_segments(self, tsm):
+        tsm.receive_confirmed_request(_make_non_segmented_pdu(invoke_id=1), PEER)
+        assert tsm.response_limit(PEER) is None
+
+    async def test_response_limit_segmented(self, tsm):
+        pdu = _make_non_segmented_pdu(invoke_id=1)
+        pdu = dataclasses.replace(pdu, segmented_response_accepted=True, max_segments=4)
+        tsm.receive_confirmed_request(pdu, PEER)
+        assert tsm.response_limit(PEER) == 4 * compute_max_segment_payload(1476, "complex_ack")
+
     async def test_duplicate_request_returns_none(self, tsm, network):
         pdu = _make_non_segmented_pdu(invoke_id=1)
         result = tsm.receive_confirmed_request(pdu, PEER)
@@ -2536,3 +2556,410 @@ class TestServerTSMCachedResponseCleanup:
         key = (PEER, txn.invoke_id)
         tsm._on_timeout(key)
         assert txn.cached_response is None
+
+
+class TestClientRequestLimits:
+    """Per-peer and per-network outstanding-request windows."""
+
+    @staticmethod
+    def _ack_all(tsm, network):
+        """SimpleACK every request sent so far and clear the send log."""
+        for apdu, dest, _ in list(network.sent):
+            tsm.handle_simple_ack(dest, apdu[2], 12)
+        network.clear()
+
+    async def test_unlimited_by_default(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0)
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x01", PEER)) for _ in range(10)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 10
+        self._ack_all(tsm, network)
+        await asyncio.gather(*tasks)
+        assert tsm.queue_stats.total_queued == 0
+
+    async def test_default_peer_limit_queues_fifo(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=2)
+        tasks = [asyncio.create_task(tsm.send_request(12, bytes([i]), PEER)) for i in range(5)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 2
+        assert tsm.queue_depth(PEER) == 3
+        assert tsm.outstanding(PEER) == 2
+        assert tsm.queue_stats.queue_depth == 3
+
+        order: list[int] = []
+        while len(order) < 5:
+            for apdu, dest, _ in list(network.sent):
+                order.append(apdu[-1])
+                tsm.handle_simple_ack(dest, apdu[2], 12)
+            network.clear()
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*tasks)
+        assert order == [0, 1, 2, 3, 4]
+        stats = tsm.queue_stats
+        assert stats.total_queued == 3
+        assert stats.queue_depth == 0
+        assert stats.max_queue_depth == 3
+        assert stats.total_wait_time > 0
+        assert tsm._windows == {}
+
+    async def test_limit_does_not_block_other_peers(self):
+        other = BACnetAddress(mac_address=b"\xc0\xa8\x01\x02\xba\xc0")
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        t2 = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        t3 = asyncio.create_task(tsm.send_request(12, b"\x03", other))
+        await asyncio.sleep(0.01)
+        assert {dest for _, dest, _ in network.sent} == {PEER, other}
+        assert tsm.queue_depth(PEER) == 1
+        for _ in range(2):
+            self._ack_all(tsm, network)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(t1, t2, t3)
+
+    async def test_device_limit_overrides_default(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        tsm.set_request_limit(3, address=PEER)
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x01", PEER)) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 3
+        for _ in range(2):
+            self._ack_all(tsm, network)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+
+    async def test_network_window_is_shared_round_robin(self):
+        dev_a = BACnetAddress(network=5, mac_address=b"\x01")
+        dev_b = BACnetAddress(network=5, mac_address=b"\x02")
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0)
+        tsm.set_request_limit(1, network=5)
+
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x0a", dev_a)) for _ in range(3)]
+        tasks += [asyncio.create_task(tsm.send_request(12, b"\x0b", dev_b)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+
+        order: list[BACnetAddress] = []
+        while len(order) < 5:
+            for apdu, dest, _ in list(network.sent):
+                order.append(dest)
+                tsm.handle_simple_ack(dest, apdu[2], 12)
+            network.clear()
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*tasks)
+        # After the first dev_a request, slots alternate between devices.
+        assert order == [dev_a, dev_a, dev_b, dev_a, dev_b]
+
+    async def test_local_network_limit(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0)
+        tsm.set_request_limit(1, local_network=True)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        t2 = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+        for _ in range(2):
+            self._ack_all(tsm, network)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(t1, t2)
+
+    async def test_slot_released_on_error(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        t2 = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        await asyncio.sleep(0.01)
+        apdu = network.sent[0][0]
+        network.clear()
+        tsm.handle_error(PEER, apdu[2], ErrorClass.OBJECT, ErrorCode.UNKNOWN_OBJECT)
+        with pytest.raises(BACnetError):
+            await t1
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+        self._ack_all(tsm, network)
+        await t2
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        t2 = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        await asyncio.sleep(0.01)
+        t2.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t2
+        assert tsm.queue_depth(PEER) == 0
+        assert tsm.queue_stats.queue_depth == 0
+        self._ack_all(tsm, network)
+        await t1
+        assert tsm._windows == {}
+
+    async def test_caller_timeout_while_queued(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        await asyncio.sleep(0.01)
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(tsm.send_request(12, b"\x02", PEER), 0.02)
+        self._ack_all(tsm, network)
+        await t1
+        assert len(network.sent) == 0
+
+    async def test_raising_limit_wakes_waiters(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        tasks = [asyncio.create_task(tsm.send_request(12, bytes([i]), PEER)) for i in range(5)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+
+        tsm.set_request_limit(3, address=PEER)
+        await asyncio.sleep(0.01)
+        assert [apdu[-1] for apdu, _, _ in network.sent] == [0, 1, 2]
+        assert tsm.queue_depth(PEER) == 2
+
+        tsm.set_request_limit(4)
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 3
+
+        for _ in range(2):
+            self._ack_all(tsm, network)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        assert tsm._windows == {}
+
+    async def test_raising_default_limit_wakes_waiters(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x01", PEER)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        tsm.set_request_limit(2)
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 2
+        assert tsm.queue_depth(PEER) == 1
+        for _ in range(2):
+            self._ack_all(tsm, network)
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+
+    async def test_removing_network_limit_releases_all_waiters(self):
+        dev_a = BACnetAddress(network=5, mac_address=b"\x01")
+        dev_b = BACnetAddress(network=5, mac_address=b"\x02")
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0)
+        tsm.set_request_limit(1, network=5)
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x0a", dev_a)) for _ in range(2)]
+        tasks += [asyncio.create_task(tsm.send_request(12, b"\x0b", dev_b)) for _ in range(2)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+
+        tsm.set_request_limit(None, network=5)
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 4
+        assert tsm.queue_stats.queue_depth == 0
+        self._ack_all(tsm, network)
+        await asyncio.gather(*tasks)
+        assert tsm._windows == {}
+
+    async def test_stricter_network_limit_keeps_throttling(self):
+        dev = BACnetAddress(network=5, mac_address=b"\x01")
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        tasks = [asyncio.create_task(tsm.send_request(12, bytes([i]), dev)) for i in range(20)]
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+
+        tsm.set_request_limit(2, network=5)
+        await asyncio.sleep(0.01)
+        assert tsm.outstanding(dev) == 2
+        assert tsm.queue_depth(dev) == 18
+
+        order: list[int] = []
+        while len(order) < 20:
+            assert tsm.outstanding(dev) <= 2
+            for apdu, dest, _ in list(network.sent):
+                order.append(apdu[-1])
+                tsm.handle_simple_ack(dest, apdu[2], 12)
+            network.clear()
+            await asyncio.sleep(0.01)
+        await asyncio.gather(*tasks)
+        assert order == list(range(20))
+        assert tsm._windows == {}
+
+    async def test_cancel_waiter_moved_to_new_window(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=1)
+        t1 = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        t2 = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        await asyncio.sleep(0.01)
+        tsm.set_request_limit(1, local_network=True)
+        t2.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t2
+        assert tsm.queue_depth(PEER) == 0
+        self._ack_all(tsm, network)
+        await t1
+        assert tsm._windows == {}
+
+    async def test_lowering_limit_keeps_in_flight_requests(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=5.0, apdu_retries=0, max_outstanding_per_peer=3)
+        tasks = [asyncio.create_task(tsm.send_request(12, b"\x01", PEER)) for _ in range(4)]
+        await asyncio.sleep(0.01)
+        tsm.set_request_limit(1)
+        await asyncio.sleep(0.01)
+        assert tsm.outstanding(PEER) == 3
+        assert tsm.queue_depth(PEER) == 1
+        self._ack_all(tsm, network)
+        await asyncio.sleep(0.01)
+        assert len(network.sent) == 1
+        self._ack_all(tsm, network)
+        await asyncio.gather(*tasks)
+
+    def test_set_request_limit_validation(self):
+        tsm = ClientTSM(FakeNetworkLayer())
+        with pytest.raises(ValueError, match="at least 1"):
+            tsm.set_request_limit(0)
+        with pytest.raises(ValueError, match="at most one"):
+            tsm.set_request_limit(2, address=PEER, network=5)
+
+    def test_remove_limits(self):
+        tsm = ClientTSM(FakeNetworkLayer(), max_outstanding_per_peer=2)
+        tsm.set_request_limit(4, address=PEER)
+        tsm.set_request_limit(3, network=7)
+        tsm.set_request_limit(None, address=PEER)
+        tsm.set_request_limit(None, network=7)
+        tsm.set_request_limit(None)
+        assert tsm._window_for(PEER) is None
+
+
+class TestClientAdaptiveTimeout:
+    """Per-peer APDU timeouts derived from measured round-trip times."""
+
+    @staticmethod
+    def _make_tsm(**kwargs):
+        network = FakeNetworkLayer()
+        kwargs.setdefault("apdu_timeout", 1.0)
+        kwargs.setdefault("apdu_retries", 0)
+        kwargs.setdefault("adaptive_timeout", True)
+        kwargs.setdefault("min_apdu_timeout", 0.05)
+        return ClientTSM(network, **kwargs), network
+
+    async def _round_trip(self, tsm, network, dest=PEER):
+        task = asyncio.create_task(tsm.send_request(12, b"\x01", dest))
+        await asyncio.sleep(0)
+        apdu, sent_dest, _ = network.sent[-1]
+        tsm.handle_simple_ack(sent_dest, apdu[2], 12)
+        await task
+
+    async def test_disabled_by_default(self):
+        network = FakeNetworkLayer()
+        tsm = ClientTSM(network, apdu_timeout=1.0, apdu_retries=0)
+        await self._round_trip(tsm, network)
+        assert tsm.rtt_estimate(PEER) is None
+        assert tsm.rtt_estimates() == {}
+
+    async def test_sample_recorded_and_clamped_to_min(self):
+        tsm, network = self._make_tsm()
+        await self._round_trip(tsm, network)
+        est = tsm.rtt_estimate(PEER)
+        assert est is not None
+        assert est.samples == 1
+        assert est.srtt < 0.05
+        assert est.timeout == pytest.approx(0.05)
+        assert tsm.rtt_estimates() == {PEER: est}
+
+    async def test_measured_peer_times_out_quickly(self):
+        tsm, network = self._make_tsm(apdu_timeout=5.0)
+        await self._round_trip(tsm, network)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        with pytest.raises(BACnetTimeoutError):
+            await asyncio.wait_for(tsm.send_request(12, b"\x02", PEER), 1.0)
+        assert loop.time() - started < 1.0
+
+    async def test_unmeasured_peer_uses_configured_timeout(self):
+        tsm, _ = self._make_tsm(apdu_timeout=2.0, max_apdu_timeout=3.0)
+        txn = ClientTransaction(1, PEER, 12, b"", asyncio.get_running_loop().create_future())
+        assert tsm._timeout_for(txn) == pytest.approx(2.0)
+
+    async def test_retry_backoff_capped_at_max(self):
+        tsm, network = self._make_tsm(max_apdu_timeout=0.3)
+        await self._round_trip(tsm, network)
+        txn = ClientTransaction(1, PEER, 12, b"", asyncio.get_running_loop().create_future())
+        txn.retry_count = 1
+        assert tsm._timeout_for(txn) == pytest.approx(0.1)
+        txn.retry_count = 3
+        assert tsm._timeout_for(txn) == pytest.approx(0.3)
+
+    async def test_response_after_retry_backs_off_without_sampling(self):
+        tsm, network = self._make_tsm(apdu_retries=1)
+        await self._round_trip(tsm, network)
+        network.clear()
+
+        task = asyncio.create_task(tsm.send_request(12, b"\x02", PEER))
+        await asyncio.sleep(0.08)
+        # Original plus one retransmission after the 50 ms timeout.
+        assert len(network.sent) == 2
+        apdu, dest, _ = network.sent[-1]
+        tsm.handle_simple_ack(dest, apdu[2], 12)
+        await task
+
+        est = tsm.rtt_estimate(PEER)
+        assert est.samples == 1
+        assert est.timeout == pytest.approx(0.1)
+
+    async def test_error_response_is_sampled(self):
+        tsm, network = self._make_tsm()
+        task = asyncio.create_task(tsm.send_request(12, b"\x01", PEER))
+        await asyncio.sleep(0)
+        apdu, dest, _ = network.sent[-1]
+        tsm.handle_error(dest, apdu[2], ErrorClass.OBJECT, ErrorCode.UNKNOWN_OBJECT)
+        with pytest.raises(BACnetError):
+            await task
+        assert tsm.rtt_estimate(PEER).samples == 1
+
+    async def test_reset_rtt_estimate(self):
+        tsm, network = self._make_tsm()
+        other = BACnetAddress(mac_address=b"\x0a\x00\x00\x02\xba\xc0")
+        await self._round_trip(tsm, network)
+        await self._round_trip(tsm, network, other)
+        tsm.reset_rtt_estimate(PEER)
+        assert set(tsm.rtt_estimates()) == {other}
+        tsm.reset_rtt_estimate()
+        assert tsm.rtt_estimates() == {}
+
+    async def test_tracked_peers_bounded(self, monkeypatch):
+        monkeypatch.setattr("bac_py.app.tsm._MAX_RTT_PEERS", 2)
+        tsm, network = self._make_tsm()
+        peers = [BACnetAddress(mac_address=bytes([10, 0, 0, i, 0xBA, 0xC0])) for i in range(3)]
+        for peer in peers:
+            await self._round_trip(tsm, network, peer)
+        assert set(tsm.rtt_estimates()) == set(peers[1:])
+
+    def test_estimator_smoothing(self):
+        from bac_py.app.tsm import _RTTEstimator
+
+        est = _RTTEstimator(0.01, 10.0)
+        est.update(0.2)
+        assert est.srtt == pytest.approx(0.2)
+        assert est.rttvar == pytest.approx(0.1)
+        assert est.timeout == pytest.approx(0.6)
+        est.update(0.4)
+        assert est.rttvar == pytest.approx(0.125)
+        assert est.srtt == pytest.approx(0.225)
+        assert est.timeout == pytest.approx(0.725)
+
+    def test_invalid_bounds(self):
+        with pytest.raises(ValueError, match="0 < min <= max"):
+            ClientTSM(
+                FakeNetworkLayer(),
+                adaptive_timeout=True,
+                min_apdu_timeout=2.0,
+                max_apdu_timeout=1.0,
+            )
@@ -2,6 +2,7 @@
 
 import pytest
 
+from bac_py.encoding import primitives
 from bac_py.encoding.primitives import (
     decode_application_value,
     encode_character_string,
@@ -17,6 +18,7 @@ from bac_py.encoding.primitives import (
     encode_double,
     encode_property_value,
     encode_time,
+    register_property_encoder,
 )
 from bac_py.encoding.tags import TagClass, decode_tag
 from bac_py.types.constructed import StatusFlags
@@ -234,6 +236,27 @@ class TestEncodePropertyValueExistingTypes:
         with pytest.raises(TypeError, match="Cannot encode value of type"):
             encode_property_value(object())
 
+    def test_object_with_encode_method_raises(self):
+        class Payload:
+            def encode(self) -> bytes:
+                return b"\x21\x01"
+
+        with pytest.raises(TypeError, match="Cannot encode value of type Payload"):
+            encode_property_value(Payload())
+
+    def test_registered_encoder_is_used(self):
+        class Payload:
+            pass
+
+        register_property_encoder(Payload, lambda v, iar: b"\x44" if iar else b"\x21")
+        try:
+            assert encode_property_value(Payload()) == b"\x21"
+            assert encode_property_value(Payload(), int_as_real=True) == b"\x44"
+        finally:
+            primitives._REGISTERED_ENCODERS.pop(Payload)
+            if primitives._CONSTRUCTED_ENCODERS is not None:
+                primitives._CONSTRUCTED_ENCODERS.pop(Payload)
+
 
 class TestEncodePropertyValuePriorityArray:
     """Verify Priority_Array encoding with None (relinquished) slots works."""
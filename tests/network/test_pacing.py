@@ -0,0 +1,276 @@
+"""Tests for outbound send pacing (pacing.py)."""
+
+import asyncio
+
+import pytest
+
+from bac_py.network.address import BACnetAddress
+from bac_py.network.layer import NetworkLayer
+from bac_py.network.npdu import decode_npdu
+from bac_py.network.pacing import PacingPolicy, PacingRate, SendPacer, TokenBucket
+from bac_py.network.router import NetworkRouter
+from bac_py.types.enums import NetworkPriority
+from tests.network.conftest import _make_port
+from tests.network.test_layer import FakeTransport
+
+ROUTER_A = b"\x0a\x00\x00\x01\xba\xc0"
+ROUTER_B = b"\x0a\x00\x00\x02\xba\xc0"
+
+
+def _recorder(sent, tag):
+    return lambda: sent.append(tag)
+
+
+class TestPacingRate:
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError, match="rate"):
+            PacingRate(0)
+
+    def test_rejects_zero_burst(self):
+        with pytest.raises(ValueError, match="burst"):
+            PacingRate(10, burst=0)
+
+    def test_policy_rejects_zero_queue(self):
+        with pytest.raises(ValueError, match="max_queue"):
+            PacingPolicy(max_queue=0)
+
+    def test_policy_rejects_non_positive_max_delay(self):
+        with pytest.raises(ValueError, match="max_delay"):
+            PacingPolicy(max_delay=0)
+
+
+class TestTokenBucket:
+    def test_starts_full(self):
+        bucket = TokenBucket(PacingRate(10, burst=3), now=0.0)
+        for _ in range(3):
+            assert bucket.wait_time(0.0) == 0.0
+            bucket.consume(0.0)
+        assert bucket.wait_time(0.0) == pytest.approx(0.1)
+
+    def test_refills_up_to_burst(self):
+        bucket = TokenBucket(PacingRate(10, burst=2), now=0.0)
+        bucket.consume(0.0)
+        bucket.consume(0.0)
+        assert bucket.wait_time(0.05) == pytest.approx(0.05)
+        assert bucket.wait_time(10.0) == 0.0
+        assert bucket.tokens == 2.0
+
+    def test_debt_delays_next_token(self):
+        bucket = TokenBucket(PacingRate(10), now=0.0)
+        bucket.consume(0.0)
+        bucket.consume(0.0)
+        assert bucket.wait_time(0.0) == pytest.approx(0.2)
+
+
+class TestSendPacer:
+    def test_unpaced_network_sends_immediately(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(1)}))
+        sent = []
+        for i in range(5):
+            pacer.submit(6, ROUTER_A, NetworkPriority.NORMAL, _recorder(sent, i))
+        assert sent == [0, 1, 2, 3, 4]
+        assert pacer.stats(6) is None
+
+    async def test_burst_then_paced(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(100, burst=2)}))
+        sent = []
+        for i in range(4):
+            pacer.submit(5, ROUTER_A, NetworkPriority.NORMAL, _recorder(sent, i))
+        assert sent == [0, 1]
+        stats = pacer.stats(5)
+        assert stats.queue_depth == 2
+        assert stats.queued == 2
+        assert pacer.queue_depth == 2
+
+        await asyncio.sleep(0.05)
+        assert sent == [0, 1, 2, 3]
+        assert stats.queue_depth == 0
+        assert stats.max_queue_depth == 2
+        assert stats.sent == 4
+        assert stats.max_delay > 0
+
+    async def test_higher_priority_released_first(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(200)}))
+        sent = []
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "first"))
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "normal"))
+        pacer.submit(5, None, NetworkPriority.CRITICAL_EQUIPMENT, _recorder(sent, "critical"))
+        pacer.submit(5, None, NetworkPriority.URGENT, _recorder(sent, "urgent"))
+        await asyncio.sleep(0.05)
+        assert sent == ["first", "critical", "urgent", "normal"]
+
+    async def test_life_safety_bypasses_queue(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(50)}))
+        sent = []
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, 0))
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, 1))
+        pacer.submit(5, None, NetworkPriority.LIFE_SAFETY, _recorder(sent, "alarm"))
+        assert sent == [0, "alarm"]
+        stats = pacer.stats(5)
+        assert stats.bypassed == 1
+        assert stats.queue_depth == 1
+        pacer.close()
+
+    async def test_router_rate_shared_across_networks(self):
+        pacer = SendPacer(PacingPolicy(router_rates={ROUTER_A: PacingRate(100)}))
+        sent = []
+        pacer.submit(5, ROUTER_A, NetworkPriority.NORMAL, _recorder(sent, "n5"))
+        pacer.submit(6, ROUTER_A, NetworkPriority.NORMAL, _recorder(sent, "n6"))
+        pacer.submit(7, ROUTER_B, NetworkPriority.NORMAL, _recorder(sent, "n7"))
+        assert sent == ["n5", "n7"]
+        await asyncio.sleep(0.05)
+        assert sent == ["n5", "n7", "n6"]
+
+    async def test_default_network_rate(self):
+        pacer = SendPacer(PacingPolicy(default_network_rate=PacingRate(1)))
+        sent = []
+        pacer.submit(9, None, NetworkPriority.NORMAL, _recorder(sent, 0))
+        pacer.submit(9, None, NetworkPriority.NORMAL, _recorder(sent, 1))
+        assert sent == [0]
+        pacer.close()
+
+    async def test_full_queue_drops_oldest_lowest_priority(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(1)}, max_queue=2))
+        sent = []
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "sent"))
+        pacer.submit(5, None, NetworkPriority.URGENT, _recorder(sent, "urgent"))
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "old"))
+        pacer.submit(5, None, NetworkPriority.URGENT, _recorder(sent, "urgent2"))
+        # Queue is full of URGENT: a NORMAL NPDU cannot displace them.
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "new"))
+        stats = pacer.stats(5)
+        assert stats.dropped == 2
+        assert stats.queue_depth == 2
+        pacer.set_network_rate(5, None)
+        assert sent == ["sent", "urgent", "urgent2"]
+
+    async def test_close_discards_queue(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(1)}))
+        sent = []
+        for i in range(3):
+            pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, i))
+        pacer.close()
+        await asyncio.sleep(0)
+        assert sent == [0]
+        assert pacer.stats(5).dropped == 2
+        assert pacer.queue_depth == 0
+
+    async def test_raising_rate_releases_waiting_npdus(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(1)}))
+        sent = []
+        for i in range(3):
+            pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, i))
+        pacer.set_network_rate(5, PacingRate(1000, burst=10))
+        assert sent == [0, 1, 2]
+
+    async def test_npdu_that_would_outlast_max_delay_is_dropped(self):
+        # 10 NPDUs/s with a limit of 0.25 s: two can wait, the rest would
+        # only go out after the requester's APDU timeout.
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(10)}, max_delay=0.25))
+        sent = []
+        for i in range(5):
+            pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, i))
+        stats = pacer.stats(5)
+        assert sent == [0]
+        assert stats.queue_depth == 2
+        assert stats.expired == 2
+        await asyncio.sleep(0.3)
+        assert sent == [0, 1, 2]
+        assert stats.max_delay <= 0.25
+
+    async def test_overtaken_npdu_expires_in_queue(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(10)}, max_delay=0.15))
+        sent = []
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "first"))
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, "normal"))
+        pacer.submit(5, None, NetworkPriority.URGENT, _recorder(sent, "urgent"))
+        await asyncio.sleep(0.3)
+        assert sent == ["first", "urgent"]
+        assert pacer.stats(5).expired == 1
+        assert pacer.queue_depth == 0
+
+    async def test_failing_send_does_not_stall_queue(self):
+        pacer = SendPacer(PacingPolicy(network_rates={5: PacingRate(200)}))
+        sent = []
+
+        def boom():
+            raise OSError("send failed")
+
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, 0))
+        pacer.submit(5, None, NetworkPriority.NORMAL, boom)
+        pacer.submit(5, None, NetworkPriority.NORMAL, _recorder(sent, 2))
+        await asyncio.sleep(0.05)
+        assert sent == [0, 2]
+
+
+class TestNetworkLayerPacing:
+    async def test_remote_sends_paced_via_cached_router(self):
+        transport = FakeTransport()
+        layer = NetworkLayer(transport, pacing=PacingPolicy(network_rates={5: PacingRate(100)}))
+        layer.add_route(5, ROUTER_A)
+        dest = BACnetAddress(network=5, mac_address=b"\x07")
+        layer.send(b"\x10\x08", dest)
+        layer.send(b"\x10\x08", dest)
+        assert len(transport.sent_unicast) == 1
+        assert layer.pacer.stats(5).queue_depth == 1
+        await asyncio.sleep(0.05)
+        assert [mac for _, mac in transport.sent_unicast] == [ROUTER_A, ROUTER_A]
+
+    async def test_local_sends_not_paced(self):
+        transport = FakeTransport()
+        layer = NetworkLayer(transport, pacing=PacingPolicy(default_network_rate=PacingRate(1)))
+        for _ in range(3):
+            layer.send(b"\x10\x08", BACnetAddress(mac_address=b"\x01\x02\x03\x04\xba\xc0"))
+        assert len(transport.sent_unicast) == 3
+        assert layer.pacer.all_stats() == {}
+
+    async def test_life_safety_skips_queue(self):
+        transport = FakeTransport()
+        layer = NetworkLayer(
+            transport, pacing=PacingPolicy(router_rates={ROUTER_A: PacingRate(1)})
+        )
+        layer.add_route(5, ROUTER_A)
+        dest = BACnetAddress(network=5, mac_address=b"\x07")
+        layer.send(b"\x10\x08", dest)
+        layer.send(b"\x10\x08", dest)
+        layer.send(b"\x10\x08", dest, priority=NetworkPriority.LIFE_SAFETY)
+        assert len(transport.sent_unicast) == 2
+        npdu = decode_npdu(memoryview(transport.sent_unicast[1][0]))
+        assert npdu.priority == NetworkPriority.LIFE_SAFETY
+        layer.pacer.close()
+
+    def test_pacer_disabled_by_default(self):
+        assert NetworkLayer(FakeTransport()).pacer is None
+
+
+class TestRouterPacing:
+    async def test_application_send_paced_per_dnet(self):
+        port1 = _make_port(1, 10)
+        port2 = _make_port(2, 20)
+        router = NetworkRouter(
+            [port1, port2],
+            application_port_id=1,
+            pacing=PacingPolicy(network_rates={20: PacingRate(100)}),
+        )
+        dest = BACnetAddress(network=20, mac_address=b"\x0a\x00\x00\x05\xba\xc0")
+        router.send(b"\x10\x08", dest)
+        router.send(b"\x10\x08", dest)
+        assert port2.transport.send_unicast.call_count == 1
+        await asyncio.sleep(0.05)
+        assert port2.transport.send_unicast.call_count == 2
+        assert router.pacer.stats(20).sent == 2
+
+    async def test_stop_closes_pacer(self):
+        port1 = _make_port(1, 10)
+        port2 = _make_port(2, 20)
+        router = NetworkRouter(
+            [port1, port2],
+            application_port_id=1,
+            pacing=PacingPolicy(network_rates={20: PacingRate(1)}),
+        )
+        dest = BACnetAddress(network=20, mac_address=b"\x0a\x00\x00\x05\xba\xc0")
+        router.send(b"\x10\x08", dest)
+        router.send(b"\x10\x08", dest)
+        await router.stop()
+        assert router.pacer.queue_depth == 0
+        assert router.pacer.stats(20).dropped == 1
@@ -2669,3 +2669,126 @@ class TestWhoIsRouterWildcardNoNetworks:
         # Only one port, so all reachable networks are on port 1 itself --
         # exclude_port=1 leaves nothing.
         t1.send_broadcast.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Zero-decode forwarding fast path
+# ---------------------------------------------------------------------------
+
+_NEXT_HOP_MAC = b"\x0a\x00\x00\x63\xba\xc0"
+
+
+def _make_parity_router(*, fast: bool) -> tuple[NetworkRouter, list, MagicMock]:
+    """Three-port router with a next-hop route to network 40 via port 2."""
+    transports = [_make_transport(local_mac=bytes([i, 0, 0, 1, 0xBA, 0xC0])) for i in (1, 2, 3)]
+    ports = [
+        _make_port(port_id=i + 1, network_number=(i + 1) * 10, transport=t)
+        for i, t in enumerate(transports)
+    ]
+    app_callback = MagicMock()
+    router = NetworkRouter(
+        ports,
+        application_port_id=1,
+        application_callback=app_callback,
+        fast_forwarding=fast,
+    )
+    router.routing_table.update_route(40, 2, _NEXT_HOP_MAC)
+    return router, transports, app_callback
+
+
+def _sent(transports: list) -> list:
+    return [
+        (i, t.send_unicast.call_args_list, t.send_broadcast.call_args_list)
+        for i, t in enumerate(transports)
+    ]
+
+
+_PARITY_CASES = [
+    pytest.param(_build_routed_npdu(20, _MAC_DEVICE_B), id="direct-unicast"),
+    pytest.param(_build_routed_npdu(20), id="direct-broadcast"),
+    pytest.param(
+        _build_routed_npdu(30, b"\x05", source=BACnetAddress(network=7, mac_address=b"\x09")),
+        id="direct-with-source",
+    ),
+    pytest.param(_build_routed_npdu(40, b"\x21", hop_count=10), id="next-hop"),
+    pytest.param(
+        _build_routed_npdu(
+            40, b"", source=BACnetAddress(network=5, mac_address=b"\x01\x02"), hop_count=255
+        ),
+        id="next-hop-with-source",
+    ),
+    pytest.param(_build_routed_npdu(40, b"\x21", hop_count=1), id="next-hop-hop-exhausted"),
+    pytest.param(_build_global_broadcast_npdu(b"\x10\x08"), id="global-broadcast"),
+    pytest.param(
+        _build_global_broadcast_npdu(
+            source=BACnetAddress(network=5, mac_address=b"\x01"), hop_count=3
+        ),
+        id="global-broadcast-with-source",
+    ),
+    pytest.param(
+        encode_npdu(
+            NPDU(
+                destination=BACnetAddress(network=20, mac_address=_MAC_DEVICE_B),
+                expecting_reply=True,
+                priority=NetworkPriority.LIFE_SAFETY,
+                apdu=b"\x00\x05\x01\x0c" + bytes(range(200)),
+            )
+        ),
+        id="priority-and-reply-bits",
+    ),
+    pytest.param(_build_routed_npdu(20, _MAC_DEVICE_B, apdu=b""), id="empty-apdu"),
+    pytest.param(_build_routed_npdu(99, b"\x01"), id="unknown-dnet"),
+    pytest.param(_build_local_npdu(), id="local"),
+    pytest.param(_build_who_is_router_npdu(20), id="network-message"),
+    pytest.param(b"\x01\x20\x00\x14\x06\xc0\xa8", id="truncated-dadr"),
+    pytest.param(b"\x01\x28\x00\x14\x00\x00\x00\x01\x01\xff", id="snet-zero"),
+]
+
+
+class TestFastForwardParity:
+    """The fast path must produce exactly what decode + re-encode produces."""
+
+    @pytest.mark.parametrize("data", _PARITY_CASES)
+    def test_matches_decoding_path(self, data: bytes) -> None:
+        fast, fast_transports, fast_app = _make_parity_router(fast=True)
+        slow, slow_transports, slow_app = _make_parity_router(fast=False)
+        fast._on_port_receive(1, data, _MAC_DEVICE_A)
+        slow._on_port_receive(1, data, _MAC_DEVICE_A)
+        assert _sent(fast_transports) == _sent(slow_transports)
+        assert fast_app.call_args_list == slow_app.call_args_list
+
+    def test_reserved_control_bits_cleared(self) -> None:
+        data = bytearray(_build_routed_npdu(40, b"\x21"))
+        data[1] |= 0x50
+        fast, transports, _ = _make_parity_router(fast=True)
+        fast._on_port_receive(1, bytes(data), _MAC_DEVICE_A)
+        sent = transports[1].send_unicast.call_args.args[0]
+        assert sent[1] & 0x50 == 0
+        assert decode_npdu(sent).hop_count == 254
+
+    def test_apdu_is_not_decoded(self, monkeypatch) -> None:
+        import bac_py.network.router as router_module
+
+        def fail(_data):
+            raise AssertionError("decode_npdu called")
+
+        router, transports, _ = _make_parity_router(fast=True)
+        monkeypatch.setattr(router_module, "decode_npdu", fail)
+        router._on_port_receive(1, _build_routed_npdu(20, _MAC_DEVICE_B), _MAC_DEVICE_A)
+        router._on_port_receive(1, _build_routed_npdu(40, b"\x21"), _MAC_DEVICE_A)
+        transports[1].send_unicast.assert_called()
+
+    def test_buffer_grows_for_large_npdu(self) -> None:
+        router, transports, _ = _make_parity_router(fast=True)
+        apdu = bytes(range(256)) * 8
+        router._on_port_receive(1, _build_routed_npdu(20, _MAC_DEVICE_B, apdu=apdu), b"\x01")
+        sent = transports[1].send_unicast.call_args.args[0]
+        assert decode_npdu(sent).apdu == apdu
+
+    def test_busy_network_falls_back_to_reject(self) -> None:
+        router, transports, _ = _make_parity_router(fast=True)
+        router.routing_table.get_entry(40).reachability = NetworkReachability.BUSY
+        router._on_port_receive(1, _build_routed_npdu(40, b"\x21"), _MAC_DEVICE_A)
+        transports[1].send_unicast.assert_not_called()
+        reject = decode_npdu(transports[0].send_unicast.call_args.args[0])
+        assert reject.message_type == NetworkMessageType.REJECT_MESSAGE_TO_NETWORK
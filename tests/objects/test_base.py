@@ -1,16 +1,21 @@
 """Tests for BACnet object model base classes (PropertyDefinition, ObjectDatabase, factory)."""
 
+import copy
+import pickle
+
 import pytest
 
+from bac_py.objects.analog import AnalogInputObject, AnalogOutputObject, AnalogValueObject
 from bac_py.objects.base import (
     ObjectDatabase,
     PropertyAccess,
     PropertyDefinition,
     create_object,
 )
+from bac_py.objects.binary import BinaryInputObject
 from bac_py.objects.device import DeviceObject
 from bac_py.services.errors import BACnetError
-from bac_py.types.enums import ErrorCode, ObjectType, PropertyIdentifier
+from bac_py.types.enums import ErrorCode, EventState, ObjectType, Polarity, PropertyIdentifier
 from bac_py.types.primitives import ObjectIdentifier
 
 
@@ -521,3 +526,195 @@ class TestStandardPropertiesCache:
         a = standard_properties()
         b = standard_properties()
         assert a is b
+
+
+class TestEncodedCache:
+    """Cached property encodings and their invalidation rules."""
+
+    @staticmethod
+    def _cache(obj, prop, array_index=None):
+        obj.cache_encoded(prop, array_index, b"cached")
+        return obj.get_encoded(prop, array_index)
+
+    def test_write_property_invalidates(self):
+        obj = AnalogValueObject(1, object_name="av")
+        assert self._cache(obj, PropertyIdentifier.OBJECT_NAME) == b"cached"
+        assert self._cache(obj, PropertyIdentifier.DESCRIPTION) == b"cached"
+        obj.write_property(PropertyIdentifier.OBJECT_NAME, "renamed")
+        assert obj.get_encoded(PropertyIdentifier.OBJECT_NAME) is None
+        assert obj.get_encoded(PropertyIdentifier.DESCRIPTION) == b"cached"
+
+    def test_direct_mutation_invalidates(self):
+        obj = AnalogInputObject(1, object_name="ai")
+        self._cache(obj, PropertyIdentifier.PRESENT_VALUE)
+        obj._properties[PropertyIdentifier.PRESENT_VALUE] = 42.0
+        assert obj.get_encoded(PropertyIdentifier.PRESENT_VALUE) is None
+
+        self._cache(obj, PropertyIdentifier.PRESENT_VALUE)
+        obj._properties.update({PropertyIdentifier.PRESENT_VALUE: 1.0})
+        assert obj.get_encoded(PropertyIdentifier.PRESENT_VALUE) is None
+
+    def test_status_flags_follow_inputs(self):
+        obj = AnalogInputObject(1, object_name="ai")
+        self._cache(obj, PropertyIdentifier.STATUS_FLAGS)
+        obj._properties[PropertyIdentifier.EVENT_STATE] = EventState.HIGH_LIMIT
+        assert obj.get_encoded(PropertyIdentifier.STATUS_FLAGS) is None
+
+        self._cache(obj, PropertyIdentifier.STATUS_FLAGS)
+        obj.write_property(PropertyIdentifier.OUT_OF_SERVICE, True)
+        assert obj.get_encoded(PropertyIdentifier.STATUS_FLAGS) is None
+
+    def test_property_list_follows_key_changes(self):
+        obj = AnalogInputObject(1, object_name="ai")
+        self._cache(obj, PropertyIdentifier.PROPERTY_LIST)
+        obj._properties[PropertyIdentifier.OBJECT_NAME] = "same-key"
+        assert obj.get_encoded(PropertyIdentifier.PROPERTY_LIST) == b"cached"
+        obj._properties[PropertyIdentifier.DESCRIPTION] = "new key"
+        assert obj.get_encoded(PropertyIdentifier.PROPERTY_LIST) is None
+
+        self._cache(obj, PropertyIdentifier.PROPERTY_LIST)
+        obj._properties.pop(PropertyIdentifier.DESCRIPTION)
+        assert obj.get_encoded(PropertyIdentifier.PROPERTY_LIST) is None
+
+    def test_commandable_write_invalidates_priority_state(self):
+        obj = AnalogOutputObject(1, object_name="ao")
+        self._cache(obj, PropertyIdentifier.PRESENT_VALUE)
+        self._cache(obj, PropertyIdentifier.CURRENT_COMMAND_PRIORITY)
+        obj.write_property(PropertyIdentifier.PRESENT_VALUE, 50.0, priority=8)
+        assert obj.get_encoded(PropertyIdentifier.PRESENT_VALUE) is None
+        assert obj.get_encoded(PropertyIdentifier.CURRENT_COMMAND_PRIORITY) is None
+
+    def test_mutable_values_not_cached(self):
+        obj = AnalogOutputObject(1, object_name="ao")
+        assert self._cache(obj, PropertyIdentifier.PRIORITY_ARRAY) is None
+        assert self._cache(obj, PropertyIdentifier.PRIORITY_ARRAY, 8) is None
+
+    def test_polarity_invalidates_binary_present_value(self):
+        obj = BinaryInputObject(1, object_name="bi")
+        self._cache(obj, PropertyIdentifier.PRESENT_VALUE)
+        obj._properties[PropertyIdentifier.POLARITY] = Polarity.REVERSE
+        assert obj.get_encoded(PropertyIdentifier.PRESENT_VALUE) is None
+
+    def test_device_object_list_follows_database(self):
+        device = DeviceObject(1, object_name="dev")
+        assert self._cache(device, PropertyIdentifier.OBJECT_LIST) is None
+
+        db = ObjectDatabase()
+        db.add(device)
+        assert self._cache(device, PropertyIdentifier.OBJECT_LIST) == b"cached"
+        assert self._cache(device, PropertyIdentifier.OBJECT_LIST, 1) is None
+        assert self._cache(device, PropertyIdentifier.ACTIVE_COV_SUBSCRIPTIONS) is None
+
+        ai = AnalogInputObject(1, object_name="ai")
+        db.add(ai)
+        assert device.get_encoded(PropertyIdentifier.OBJECT_LIST) is None
+        self._cache(device, PropertyIdentifier.OBJECT_LIST)
+        db.remove(ai.object_identifier)
+        assert device.get_encoded(PropertyIdentifier.OBJECT_LIST) is None
+
+    def test_invalidate_all(self):
+        device = DeviceObject(1, object_name="dev")
+        self._cache(device, PropertyIdentifier.OBJECT_NAME)
+        device.invalidate_encoded()
+        assert device.get_encoded(PropertyIdentifier.OBJECT_NAME) is None
+
+
+class TestDatabaseListeners:
+    """Database-wide write and membership listeners."""
+
+    def test_write_listener_sees_write_property_and_direct_assignment(self):
+        db = ObjectDatabase()
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        seen = []
+        db.register_write_listener(lambda obj, pid: seen.append((obj.object_identifier, pid)))
+
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 5.0)
+        av._properties[PropertyIdentifier.DESCRIPTION] = "direct"
+
+        assert (av.object_identifier, PropertyIdentifier.PRESENT_VALUE) in seen
+        assert (av.object_identifier, PropertyIdentifier.DESCRIPTION) in seen
+
+    def test_write_listener_covers_objects_added_later(self):
+        db = ObjectDatabase()
+        seen = []
+        db.register_write_listener(lambda obj, pid: seen.append(pid))
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        seen.clear()
+        av._properties[PropertyIdentifier.DESCRIPTION] = "x"
+        assert seen == [PropertyIdentifier.DESCRIPTION]
+
+    def test_unregister_write_listener(self):
+        db = ObjectDatabase()
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        seen = []
+
+        def listener(obj, pid):
+            seen.append(pid)
+
+        db.register_write_listener(listener)
+        db.unregister_write_listener(listener)
+        db.unregister_write_listener(listener)  # Unknown listener is ignored
+        av._properties[PropertyIdentifier.DESCRIPTION] = "x"
+        assert seen == []
+
+    def test_removed_object_no_longer_reports(self):
+        db = ObjectDatabase()
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        seen = []
+        db.register_write_listener(lambda obj, pid: seen.append(pid))
+        db.remove(av.object_identifier)
+        av._properties[PropertyIdentifier.DESCRIPTION] = "x"
+        assert seen == []
+
+    def test_membership_listener(self):
+        db = ObjectDatabase()
+        events = []
+        db.register_membership_listener(lambda oid, obj: events.append((oid, obj)))
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        db.remove(av.object_identifier)
+        assert events == [(av.object_identifier, av), (av.object_identifier, None)]
+
+    def test_listener_errors_are_suppressed(self):
+        db = ObjectDatabase()
+
+        def boom(*args):
+            raise RuntimeError("boom")
+
+        db.register_membership_listener(boom)
+        db.register_write_listener(boom)
+        av = AnalogValueObject(1, object_name="av")
+        db.add(av)
+        av.write_property(PropertyIdentifier.PRESENT_VALUE, 1.0)
+        assert av.read_property(PropertyIdentifier.PRESENT_VALUE) == 1.0
+
+
+class TestPickleAndCopy:
+    """Objects survive pickling and deep copies with change tracking intact."""
+
+    @pytest.mark.parametrize(
+        "clone",
+        [lambda obj: pickle.loads(pickle.dumps(obj)), copy.deepcopy],
+        ids=["pickle", "deepcopy"],
+    )
+    def test_round_trip(self, clone):
+        obj = AnalogInputObject(1, object_name="ai", present_value=21.5)
+        db = ObjectDatabase()
+        db.add(obj)
+        obj.cache_encoded(PropertyIdentifier.PRESENT_VALUE, None, b"cached")
+
+        copied = clone(obj)
+        assert copied is not obj
+        assert copied.object_identifier == obj.object_identifier
+        assert copied.read_property(PropertyIdentifier.PRESENT_VALUE) == 21.5
+        assert copied.read_property(PropertyIdentifier.OBJECT_NAME) == "ai"
+        assert copied.get_encoded(PropertyIdentifier.PRESENT_VALUE) == b"cached"
+
+        copied._properties[PropertyIdentifier.PRESENT_VALUE] = 30.0
+        assert copied.get_encoded(PropertyIdentifier.PRESENT_VALUE) is None
+        assert obj.get_encoded(PropertyIdentifier.PRESENT_VALUE) == b"cached"
+        assert obj.read_property(PropertyIdentifier.PRESENT_VALUE) == 21.5
@@ -2,7 +2,7 @@
 
 import pytest
 
-from bac_py.objects.file import FileObject
+from bac_py.objects.file import FileObject, MappedFileObject
 from bac_py.services.errors import BACnetError
 from bac_py.types.enums import FileAccessMethod, ObjectType, PropertyIdentifier
 
@@ -185,3 +185,142 @@ class TestRecordAccessPadding:
         assert records[3] == b""
         assert records[4] == b""
         assert records[5] == b"rec5"
+
+
+class TestMappedStreamAccess:
+    def test_reads_existing_file_zero_copy(self, tmp_path):
+        path = tmp_path / "firmware.bin"
+        path.write_bytes(b"Hello BACnet")
+        f = MappedFileObject(1, path)
+        assert f.read_property(PropertyIdentifier.FILE_SIZE) == 12
+
+        data, eof = f.read_stream(6, 4)
+        assert isinstance(data, memoryview)
+        assert data == b"BACn"
+        assert eof is False
+        data, eof = f.read_stream(6, 100)
+        assert data == b"BACnet"
+        assert eof is True
+        f.close()
+
+    def test_write_in_place_and_extend(self, tmp_path):
+        path = tmp_path / "config.txt"
+        f = MappedFileObject(1, path)
+        assert f.read_stream(0, 10) == (b"", True)
+
+        assert f.write_stream(0, b"Hello BACnet") == 0
+        assert f.write_stream(6, b"World!") == 6
+        assert f.write_stream(-1, b"?") == 12
+        assert f.write_stream(15, b"!") == 15
+        assert f.read_property(PropertyIdentifier.FILE_SIZE) == 16
+        f.close()
+        assert path.read_bytes() == b"Hello World!?\x00\x00!"
+
+    def test_views_survive_growth(self, tmp_path):
+        f = MappedFileObject(1, tmp_path / "grow.bin")
+        f.write_stream(0, b"abc")
+        view, _ = f.read_stream(0, 3)
+        f.write_stream(-1, b"def" * 1000)
+        assert view == b"abc"
+        assert f.read_stream(0, 6)[0] == b"abcdef"
+        f.close()
+
+    def test_read_only(self, tmp_path):
+        path = tmp_path / "ro.bin"
+        path.write_bytes(b"fixed")
+        f = MappedFileObject(1, path, read_only=True)
+        assert f.read_property(PropertyIdentifier.READ_ONLY) is True
+        assert f.read_stream(0, 5)[0] == b"fixed"
+        with pytest.raises(BACnetError):
+            f.write_stream(0, b"x")
+        f.close()
+
+    def test_read_only_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            MappedFileObject(1, tmp_path / "absent.bin", read_only=True)
+
+    def test_record_on_stream_file_raises(self, tmp_path):
+        f = MappedFileObject(1, tmp_path / "s.bin")
+        with pytest.raises(BACnetError):
+            f.read_records(0, 1)
+        with pytest.raises(BACnetError):
+            f.write_records(0, [b"x"])
+        f.close()
+
+    def test_encodes_atomic_read_file_ack(self, tmp_path):
+        from bac_py.services.file_access import AtomicReadFileACK, StreamReadACK
+
+        path = tmp_path / "data.bin"
+        path.write_bytes(bytes(range(256)) * 4)
+        f = MappedFileObject(1, path)
+        data, eof = f.read_stream(100, 500)
+        ack = AtomicReadFileACK(eof, StreamReadACK(100, data))
+        decoded = AtomicReadFileACK.decode(ack.encode())
+        assert decoded.access_method.file_data == path.read_bytes()[100:600]
+        f.close()
+
+
+class TestMappedRecordAccess:
+    def _file(self, tmp_path, **kwargs):
+        return MappedFileObject(
+            1,
+            tmp_path / "log.dat",
+            file_access_method=FileAccessMethod.RECORD_ACCESS,
+            **kwargs,
+        )
+
+    def test_write_and_read(self, tmp_path):
+        f = self._file(tmp_path)
+        assert f.write_records(0, [b"one", b"two", b"three"]) == 0
+        records, eof = f.read_records(1, 5)
+        assert records == [b"two", b"three"]
+        assert all(isinstance(r, memoryview) for r in records)
+        assert eof is True
+        assert f.read_property(PropertyIdentifier.FILE_SIZE) == 3
+        f.close()
+
+    def test_overwrite_shorter_in_place_longer_appended(self, tmp_path):
+        f = self._file(tmp_path)
+        f.write_records(0, [b"alpha", b"beta"])
+        f.write_records(0, [b"a"])
+        assert (tmp_path / "log.dat").stat().st_size == 9
+        f.write_records(1, [b"much longer"])
+        assert (tmp_path / "log.dat").stat().st_size == 20
+        assert f.read_records(0, 2)[0] == [b"a", b"much longer"]
+        f.close()
+
+    def test_append_and_pad(self, tmp_path):
+        f = self._file(tmp_path)
+        f.write_records(0, [b"a"])
+        assert f.write_records(-1, [b"b"]) == 1
+        f.write_records(4, [b"e"])
+        assert f.read_records(0, 10)[0] == [b"a", b"b", b"", b"", b"e"]
+        f.close()
+
+    def test_reopen_restores_index(self, tmp_path):
+        f = self._file(tmp_path)
+        f.write_records(0, [b"one", b"two", b"three"])
+        f.write_records(1, [b"TWO!"])
+        f.close()
+        assert (tmp_path / "log.dat.idx").stat().st_size == 3 * 16
+
+        f = self._file(tmp_path)
+        assert f.read_property(PropertyIdentifier.FILE_SIZE) == 3
+        assert f.read_records(0, 3)[0] == [b"one", b"TWO!", b"three"]
+        f.close()
+
+    def test_custom_index_path(self, tmp_path):
+        f = self._file(tmp_path, index_path=tmp_path / "custom.idx")
+        f.write_records(0, [b"x"])
+        f.close()
+        assert (tmp_path / "custom.idx").exists()
+
+    def test_read_only(self, tmp_path):
+        f = self._file(tmp_path)
+        f.write_records(0, [b"x"])
+        f.close()
+        f = self._file(tmp_path, read_only=True)
+        assert f.read_records(0, 1)[0] == [b"x"]
+        with pytest.raises(BACnetError):
+            f.write_records(0, [b"y"])
+        f.close()
@@ -0,0 +1,141 @@
+"""Tests for the Log_Buffer ring shared by Trend Log Multiple, Event Log and Audit Log."""
+
+import pytest
+
+from bac_py.encoding.primitives import encode_property_value
+from bac_py.objects.audit_log import AuditLogObject
+from bac_py.objects.event_log import EventLogObject
+from bac_py.objects.log_buffer import LogRecordBuffer, datetime_key
+from bac_py.objects.trendlog_multiple import TrendLogMultipleObject
+from bac_py.services.event_notification import BACnetEventLogRecord
+from bac_py.types.audit_types import BACnetAuditNotification
+from bac_py.types.constructed import BACnetDateTime, BACnetLogMultipleRecord, BACnetLogRecord
+from bac_py.types.enums import PropertyIdentifier
+from bac_py.types.primitives import BACnetDate, BACnetTime
+
+
+def _record(minute, value=None):
+    return BACnetLogMultipleRecord(
+        timestamp=BACnetDateTime(BACnetDate(2024, 6, 1, 6), BACnetTime(0, minute, 0, 0)),
+        log_data=[float(minute) if value is None else value],
+    )
+
+
+class TestLogRecordBuffer:
+    def test_overwrites_oldest_when_full(self):
+        buf = LogRecordBuffer(3)
+        for i in range(7):
+            buf.append(_record(i))
+        assert buf.full
+        assert len(buf) == 3
+        assert [r.timestamp.time.minute for r in buf] == [4, 5, 6]
+        assert buf[-1] == _record(6)
+        assert buf[1:] == [_record(5), _record(6)]
+        with pytest.raises(IndexError):
+            buf[3]
+
+    def test_unbounded(self):
+        buf = LogRecordBuffer()
+        for i in range(50):
+            buf.append(_record(i))
+        assert not buf.full
+        assert len(buf) == 50
+
+    def test_resize_keeps_newest(self):
+        buf = LogRecordBuffer(4, [_record(i) for i in range(6)])
+        buf.resize(2)
+        assert buf == [_record(4), _record(5)]
+        buf.resize(5)
+        buf.append(_record(9))
+        assert buf == [_record(4), _record(5), _record(9)]
+        assert [buf.timestamp_key(i) for i in range(3)] == [datetime_key(r.timestamp) for r in buf]
+
+    def test_timestamp_key_follows_ring(self):
+        buf = LogRecordBuffer(3, [_record(i) for i in range(5)])
+        keys = [buf.timestamp_key(i) for i in range(len(buf))]
+        assert keys == sorted(keys)
+        assert keys == [datetime_key(r.timestamp) for r in buf]
+
+    def test_record_without_timestamp_keys_zero(self):
+        buf = LogRecordBuffer(2, [object()])
+        assert buf.timestamp_key(0) == 0
+
+    def test_clear(self):
+        buf = LogRecordBuffer(2, [_record(0), _record(1), _record(2)])
+        buf.clear()
+        assert buf == []
+        assert buf.capacity == 2
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="capacity"):
+            LogRecordBuffer(-1)
+        with pytest.raises(ValueError, match="capacity"):
+            LogRecordBuffer().resize(-1)
+
+    def test_encode_matches_record_list(self):
+        records = [
+            BACnetLogRecord(
+                timestamp=BACnetDateTime(BACnetDate(2024, 6, 1, 6), BACnetTime(0, i, 0, 0)),
+                log_datum=float(i),
+            )
+            for i in range(3)
+        ]
+        buf = LogRecordBuffer(2, records)
+        assert buf.encode() == encode_property_value(records[1:])
+        assert encode_property_value(buf) == buf.encode()
+
+
+class TestLogBufferObjects:
+    def test_trend_log_multiple_wraps(self):
+        tlm = TrendLogMultipleObject(1, buffer_size=2)
+        for i in range(3):
+            assert tlm.append_record(_record(i))
+        assert isinstance(tlm.log_buffer, LogRecordBuffer)
+        assert tlm.read_property(PropertyIdentifier.LOG_BUFFER) == [_record(1), _record(2)]
+        assert tlm.read_property(PropertyIdentifier.RECORD_COUNT) == 2
+        assert tlm.read_property(PropertyIdentifier.TOTAL_RECORD_COUNT) == 3
+
+    def test_stop_when_full(self):
+        event_log = EventLogObject(1, buffer_size=2, stop_when_full=True)
+        records = [
+            BACnetEventLogRecord(
+                timestamp=BACnetDateTime(BACnetDate(2024, 6, 1, 6), BACnetTime(0, i, 0, 0)),
+                log_datum=float(i),
+            )
+            for i in range(3)
+        ]
+        assert event_log.append_record(records[0])
+        assert event_log.append_record(records[1])
+        assert not event_log.append_record(records[2])
+        assert event_log.read_property(PropertyIdentifier.LOG_BUFFER) == records[:2]
+        assert event_log.read_property(PropertyIdentifier.TOTAL_RECORD_COUNT) == 2
+
+    def test_buffer_size_change_resizes(self):
+        tlm = TrendLogMultipleObject(1, buffer_size=5)
+        for i in range(5):
+            tlm.append_record(_record(i))
+        tlm.write_property(PropertyIdentifier.BUFFER_SIZE, 3)
+        tlm.append_record(_record(5))
+        assert tlm.log_buffer == [_record(3), _record(4), _record(5)]
+        assert tlm.read_property(PropertyIdentifier.RECORD_COUNT) == 3
+
+    def test_initial_records_indexed(self):
+        tlm = TrendLogMultipleObject(1, buffer_size=3, log_buffer=[_record(0), _record(1)])
+        assert isinstance(tlm.log_buffer, LogRecordBuffer)
+        assert tlm.log_buffer.timestamp_key(1) == datetime_key(_record(1).timestamp)
+
+    def test_log_buffer_encoding_not_cached(self):
+        tlm = TrendLogMultipleObject(1)
+        tlm.cache_encoded(PropertyIdentifier.LOG_BUFFER, None, b"stale")
+        assert tlm.get_encoded(PropertyIdentifier.LOG_BUFFER) is None
+
+    def test_audit_log_wrap_keeps_sequence_numbers(self):
+        audit_log = AuditLogObject(1, log_enable=True, buffer_size=3)
+        for _ in range(5):
+            audit_log.append_record(BACnetAuditNotification())
+        assert [r.sequence_number for r in audit_log.log_buffer] == [3, 4, 5]
+        assert audit_log.read_property(PropertyIdentifier.RECORD_COUNT) == 3
+        assert audit_log.read_property(PropertyIdentifier.TOTAL_RECORD_COUNT) == 5
+        records, no_more = audit_log.query_records(start_at=4)
+        assert [r.sequence_number for r in records] == [4, 5]
+        assert no_more
@@ -2,17 +2,28 @@
 
 import pytest
 
+from bac_py.encoding.primitives import encode_property_value
 from bac_py.objects.base import create_object
-from bac_py.objects.trendlog import TrendLogObject
+from bac_py.objects.log_buffer import datetime_key
+from bac_py.objects.trendlog import TrendLogBuffer, TrendLogObject
 from bac_py.services.errors import BACnetError
-from bac_py.types.constructed import StatusFlags
+from bac_py.types.constructed import BACnetDateTime, BACnetLogRecord, StatusFlags
 from bac_py.types.enums import (
+    BinaryPV,
     ErrorCode,
     EventState,
     ObjectType,
     PropertyIdentifier,
 )
-from bac_py.types.primitives import ObjectIdentifier
+from bac_py.types.primitives import BACnetDate, BACnetTime, ObjectIdentifier
+
+
+def _record(datum, second=0, status_flags=None):
+    return BACnetLogRecord(
+        timestamp=BACnetDateTime(BACnetDate(2024, 6, 1, 6), BACnetTime(12, 0, second, 50)),
+        log_datum=datum,
+        status_flags=status_flags,
+    )
 
 
 class TestTrendLogObject:
@@ -121,3 +132,115 @@ class TestTrendLogObject:
         tl = TrendLogObject(1, object_name="TL-1", buffer_size=500)
         assert tl.read_property(PropertyIdentifier.OBJECT_NAME) == "TL-1"
         assert tl.read_property(PropertyIdentifier.BUFFER_SIZE) == 500
+
+
+class TestTrendLogBuffer:
+    """Tests for the columnar ring buffer behind Log_Buffer."""
+
+    def test_round_trips_values(self):
+        records = [
+            _record(21.5, 1),
+            _record(True, 2, StatusFlags(in_alarm=True, out_of_service=True)),
+            _record(42, 3, StatusFlags()),
+            _record(BinaryPV.ACTIVE, 4),
+            _record(2**60, 5, StatusFlags(fault=True, overridden=True)),
+            _record(None, 6),
+        ]
+        buf = TrendLogBuffer(10, records)
+        assert list(buf) == records
+        assert type(buf[1].log_datum) is bool
+        assert type(buf[2].log_datum) is int
+        assert buf[3].log_datum is BinaryPV.ACTIVE
+
+    def test_wildcard_timestamp(self):
+        record = BACnetLogRecord(
+            timestamp=BACnetDateTime(
+                BACnetDate(0xFF, 0xFF, 0xFF, 0xFF), BACnetTime(0xFF, 0xFF, 0xFF, 0xFF)
+            ),
+            log_datum=1.0,
+        )
+        assert TrendLogBuffer(1, [record])[0] == record
+
+    def test_overwrites_oldest_when_full(self):
+        buf = TrendLogBuffer(3)
+        for i in range(7):
+            buf.append(_record(float(i), i))
+        assert buf.full
+        assert len(buf) == 3
+        assert [r.log_datum for r in buf] == [4.0, 5.0, 6.0]
+        assert buf[-1].log_datum == 6.0
+        assert [r.log_datum for r in buf[1:]] == [5.0, 6.0]
+        with pytest.raises(IndexError):
+            buf[3]
+
+    def test_overwrite_releases_object_values(self):
+        buf = TrendLogBuffer(2)
+        buf.append(_record(BinaryPV.ACTIVE))
+        buf.append(_record(1.0))
+        buf.append(_record(2.0))
+        assert buf._objects == {}
+
+    def test_unbounded(self):
+        buf = TrendLogBuffer()
+        for i in range(100):
+            buf.append(_record(float(i)))
+        assert not buf.full
+        assert len(buf) == 100
+
+    def test_resize_keeps_newest(self):
+        buf = TrendLogBuffer(4)
+        for i in range(6):
+            buf.append(_record(BinaryPV(i % 2) if i == 5 else float(i)))
+        buf.resize(2)
+        assert [r.log_datum for r in buf] == [4.0, BinaryPV.ACTIVE]
+        buf.resize(5)
+        buf.append(_record(9.0))
+        assert [r.log_datum for r in buf] == [4.0, BinaryPV.ACTIVE, 9.0]
+
+    def test_clear(self):
+        buf = TrendLogBuffer(2, [_record(None), _record(1.0)])
+        buf.clear()
+        assert len(buf) == 0
+        assert buf == []
+
+    def test_timestamp_key_orders_records(self):
+        buf = TrendLogBuffer(3)
+        for i in range(5):
+            buf.append(_record(float(i), i))
+        keys = [buf.timestamp_key(i) for i in range(len(buf))]
+        assert keys == sorted(keys)
+        assert keys == [datetime_key(r.timestamp) for r in buf]
+
+    def test_invalid_capacity(self):
+        with pytest.raises(ValueError, match="capacity"):
+            TrendLogBuffer(-1)
+
+    def test_encode_matches_record_list(self):
+        records = [_record(1.5), _record(BinaryPV.ACTIVE, 1), _record(None, 2)]
+        buf = TrendLogBuffer(2, records)
+        assert buf.encode() == encode_property_value(records[1:])
+        assert encode_property_value(buf) == buf.encode()
+
+    def test_trend_log_uses_buffer(self):
+        tl = TrendLogObject(1, buffer_size=2, log_buffer=[_record(1.0)])
+        assert isinstance(tl.log_buffer, TrendLogBuffer)
+        assert tl.log_buffer.capacity == 2
+        for i in range(3):
+            tl.append_record(_record(float(i + 2)))
+        assert tl.read_property(PropertyIdentifier.LOG_BUFFER) == [_record(3.0), _record(4.0)]
+        assert tl.read_property(PropertyIdentifier.RECORD_COUNT) == 2
+        assert tl.read_property(PropertyIdentifier.TOTAL_RECORD_COUNT) == 3
+
+    def test_buffer_size_change_resizes(self):
+        tl = TrendLogObject(1, buffer_size=5)
+        for i in range(5):
+            tl.append_record(_record(float(i)))
+        tl.write_property(PropertyIdentifier.BUFFER_SIZE, 3)
+        tl.append_record(_record(5.0))
+        assert [r.log_datum for r in tl.log_buffer] == [3.0, 4.0, 5.0]
+        assert tl.read_property(PropertyIdentifier.RECORD_COUNT) == 3
+
+    def test_log_buffer_encoding_not_cached(self):
+        tl = TrendLogObject(1)
+        tl.cache_encoded(PropertyIdentifier.LOG_BUFFER, None, b"stale")
+        assert tl.get_encoded(PropertyIdentifier.LOG_BUFFER) is None
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 
 from bac_py.network.address import BACnetAddress
-from bac_py.services.base import ServiceRegistry
+from bac_py.services.base import ServiceRegistry, run_eagerly
 from bac_py.services.errors import BACnetRejectError
 from bac_py.types.enums import RejectReason
 
@@ -80,3 +82,70 @@ class TestServiceRegistry:
         source = BACnetAddress(mac_address=b"\x01\x02\x03\x04\xba\xc0")
         result = await registry.dispatch_confirmed(15, b"", source)
         assert result is None
+
+    def test_inline_registration(self):
+        registry = ServiceRegistry()
+
+        async def handler(sc, data, source):
+            return None
+
+        registry.register_confirmed(12, handler, inline=True)
+        registry.register_unconfirmed(8, handler, inline=True)
+        assert registry.is_inline_confirmed(12)
+        assert registry.is_inline_unconfirmed(8)
+        assert not registry.is_inline_confirmed(15)
+
+        # Re-registering without the flag clears it
+        registry.register_confirmed(12, handler)
+        registry.register_unconfirmed(8, handler)
+        assert not registry.is_inline_confirmed(12)
+        assert not registry.is_inline_unconfirmed(8)
+
+
+class TestRunEagerly:
+    def test_completes_without_loop(self):
+        async def handler():
+            return 42
+
+        assert run_eagerly(handler()) == (True, 42)
+
+    def test_exception_propagates(self):
+        async def handler():
+            raise ValueError("bad")
+
+        with pytest.raises(ValueError, match="bad"):
+            run_eagerly(handler())
+
+    async def test_suspended_coroutine_resumes_in_task(self):
+        steps = []
+
+        async def handler():
+            steps.append("start")
+            await asyncio.sleep(0)
+            steps.append("resumed")
+            return "done"
+
+        done, rest = run_eagerly(handler())
+        assert not done
+        assert steps == ["start"]
+        assert await asyncio.create_task(rest) == "done"
+        assert steps == ["start", "resumed"]
+
+    async def test_cancellation_reaches_suspended_coroutine(self):
+        cancelled = []
+
+        async def handler():
+            await asyncio.sleep(0)
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        _done, rest = run_eagerly(handler())
+        task = asyncio.create_task(rest)
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert cancelled == [True]
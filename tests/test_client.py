@@ -5,6 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from bac_py.app.application import DeviceConfig
+from bac_py.app.client import DiscoveredDevice
 from bac_py.client import Client, _parse_enum, _resolve_broadcast_destination
 from bac_py.encoding.primitives import (
     encode_application_character_string,
@@ -17,6 +18,7 @@ from bac_py.types.enums import (
     ObjectType,
     PropertyIdentifier,
     ReinitializedState,
+    Segmentation,
 )
 from bac_py.types.primitives import ObjectIdentifier
 
@@ -133,6 +135,8 @@ class TestClientDelegation:
         mock_app = MagicMock()
         mock_app.start = AsyncMock()
         mock_app.stop = AsyncMock()
+        mock_app.config = DeviceConfig(instance_number=1)
+        mock_app.get_device_info = MagicMock(return_value=None)
         mock_app_cls.return_value = mock_app
 
         ack = ReadPropertyMultipleACK(
@@ -533,6 +537,37 @@ class TestBroadcastDestinationDefault:
         dest_arg = mock.discover_extended.call_args[1]["destination"]
         assert dest_arg is GLOBAL_BROADCAST
 
+    def test_scan_site_resolves_destination(self):
+        client, mock = _make_mock_client()
+        client.scan_site(destination="192.168.1.255", max_per_network=2)
+        kwargs = mock.scan_site.call_args[1]
+        assert kwargs["destination"] == parse_address("192.168.1.255")
+        assert kwargs["max_per_network"] == 2
+
+    async def test_collect_trends_parses_logs(self):
+        client, mock = _make_mock_client()
+        mock.read_property.side_effect = RuntimeError("unreachable")
+        batches = [b async for b in client.collect_trends([("192.168.1.20", "trend-log,3")])]
+        assert len(batches) == 1
+        assert batches[0].address == parse_address("192.168.1.20")
+        assert batches[0].object_identifier == ObjectIdentifier(ObjectType.TREND_LOG, 3)
+        assert not batches[0].ok
+
+    async def test_backup_fleet_reports_failures(self, tmp_path):
+        client, mock = _make_mock_client()
+        mock.reinitialize_device.side_effect = RuntimeError("unreachable")
+        device = DiscoveredDevice(
+            address=parse_address("192.168.1.20"),
+            instance=20,
+            vendor_id=1,
+            max_apdu_length=1476,
+            segmentation_supported=Segmentation.NONE,
+        )
+        results = [r async for r in client.backup_fleet([device], tmp_path)]
+        assert len(results) == 1
+        assert results[0].phase == "start"
+        assert not results[0].ok
+
     async def test_who_has_default_broadcast(self):
         client, mock = _make_mock_client()
         mock.who_has.return_value = []
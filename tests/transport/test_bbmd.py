@@ -14,6 +14,7 @@ from bac_py.transport.bbmd import (
     BBMDManager,
     BDTEntry,
     FDTEntry,
+    ForeignDeviceTable,
     _compute_forward_address,
     _encode_bvlc_result,
 )
@@ -909,3 +910,207 @@ class TestBBMDCoverageGaps:
         )
         # Should not raise -- the error is caught and logged
         assert len(bbmd.bdt) == 1
+
+
+# --- ForeignDeviceTable ---
+
+
+def _fd(n: int) -> BIPAddress:
+    return BIPAddress(host=f"10.1.{n // 250}.{n % 250 + 1}", port=47808)
+
+
+class TestForeignDeviceTable:
+    def test_mapping_and_targets_stay_in_sync(self):
+        table = ForeignDeviceTable()
+        for n in range(5):
+            table[_fd(n)] = FDTEntry(address=_fd(n), ttl=60, expiry=100.0 + n)
+        del table[_fd(1)]
+        del table[_fd(4)]
+
+        assert len(table) == 3
+        assert _fd(1) not in table
+        assert list(table) == [_fd(0), _fd(2), _fd(3)]
+        assert sorted(table.targets, key=str) == sorted(table, key=str)
+        for address in table:
+            slot = table.slot(address)
+            assert table.targets[slot] == address
+            assert table.sockaddrs[slot] == (address.host, address.port)
+        assert table.slot(_fd(1)) == -1
+
+    def test_pop_expired_only_returns_due_entries(self):
+        table = ForeignDeviceTable()
+        for n in range(4):
+            table[_fd(n)] = FDTEntry(address=_fd(n), ttl=60, expiry=float(n))
+        assert table.pop_expired(1.5) == [_fd(0), _fd(1)]
+        assert list(table) == [_fd(2), _fd(3)]
+        assert table.pop_expired(1.5) == []
+
+    def test_re_registration_supersedes_old_expiry(self):
+        table = ForeignDeviceTable()
+        table[_fd(0)] = FDTEntry(address=_fd(0), ttl=60, expiry=10.0)
+        table[_fd(0)] = FDTEntry(address=_fd(0), ttl=60, expiry=50.0)
+        assert table.pop_expired(20.0) == []
+        assert _fd(0) in table
+        assert table.pop_expired(50.0) == [_fd(0)]
+        assert not table.targets
+
+    def test_deleted_entry_is_not_reported_expired(self):
+        table = ForeignDeviceTable()
+        table[_fd(0)] = FDTEntry(address=_fd(0), ttl=60, expiry=10.0)
+        del table[_fd(0)]
+        assert table.pop_expired(20.0) == []
+
+    def test_stale_heap_records_are_compacted(self):
+        table = ForeignDeviceTable()
+        for expiry in range(1000):
+            table[_fd(0)] = FDTEntry(address=_fd(0), ttl=60, expiry=float(expiry))
+        assert len(table._heap) <= 2 * len(table) + 64
+        assert table.pop_expired(998.0) == []
+        assert table.pop_expired(999.0) == [_fd(0)]
+
+
+# --- BBMDManager: batched fan-out ---
+
+
+class ManySentCollector(SentCollector):
+    """Collector that also records batched sends."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches: list[tuple[bytes, list[tuple[str, int]]]] = []
+        self.calls: list[tuple[bytes, object, int]] = []
+
+    def send_many(self, data: bytes, destinations, exclude: int) -> int:
+        self.calls.append((data, destinations, exclude))
+        self.batches.append((data, [d for i, d in enumerate(destinations) if i != exclude]))
+        return 0
+
+    def destinations(self) -> list[tuple[str, int]]:
+        return [dest for _, dests in self.batches for dest in dests]
+
+    def clear(self) -> None:
+        super().clear()
+        self.batches.clear()
+        self.calls.clear()
+
+
+class TestBBMDBatchedFanOut:
+    @pytest.fixture
+    def many(self) -> ManySentCollector:
+        return ManySentCollector()
+
+    @pytest.fixture
+    def batched_bbmd(self, many: ManySentCollector) -> BBMDManager:
+        bbmd = BBMDManager(
+            local_address=BBMD_ADDR,
+            send_callback=many.send,
+            local_broadcast_callback=many.local_broadcast,
+            max_fdt_entries=5000,
+            send_many_callback=many.send_many,
+        )
+        bbmd.set_bdt(
+            [
+                BDTEntry(address=BBMD_ADDR, broadcast_mask=ALL_ONES_MASK),
+                BDTEntry(address=PEER_ADDR, broadcast_mask=ALL_ONES_MASK),
+            ]
+        )
+        for n in range(2000):
+            bbmd.handle_bvlc(BvlcFunction.REGISTER_FOREIGN_DEVICE, b"\x00\x3c", _fd(n))
+        many.clear()
+        return bbmd
+
+    def test_original_broadcast_is_one_batch_per_table(
+        self, batched_bbmd: BBMDManager, many: ManySentCollector
+    ):
+        npdu = b"\x01\x20\xff\xff\x00\xff\x10\x08"
+        batched_bbmd.handle_bvlc(BvlcFunction.ORIGINAL_BROADCAST_NPDU, npdu, CLIENT_ADDR)
+
+        assert many.sent == []
+        assert len(many.batches) == 2
+        data, peers = many.batches[0]
+        msg = decode_bvll(data)
+        assert msg.function == BvlcFunction.FORWARDED_NPDU
+        assert msg.originating_address == CLIENT_ADDR
+        assert msg.data == npdu
+        assert peers == [(PEER_ADDR.host, PEER_ADDR.port)]
+        assert many.batches[1][0] is data
+        dests = many.destinations()
+        assert len(dests) == 2001
+        assert len(set(dests)) == 2001
+
+        stats = batched_bbmd.fanout_stats
+        assert stats.broadcasts == 1
+        assert stats.peer_datagrams == 1
+        assert stats.fd_datagrams == 2000
+        assert stats.max_fanout == 2001
+
+    def test_distribute_broadcast_excludes_sender(
+        self, batched_bbmd: BBMDManager, many: ManySentCollector
+    ):
+        sender = _fd(1234)
+        batched_bbmd.handle_bvlc(
+            BvlcFunction.DISTRIBUTE_BROADCAST_TO_NETWORK, b"\x01\x00\x10\x08", sender
+        )
+        dests = many.destinations()
+        assert len(dests) == 2000
+        assert (sender.host, sender.port) not in dests
+        assert batched_bbmd.fanout_stats.fd_datagrams == 1999
+
+    def test_sender_skipped_without_copying_fdt(
+        self, batched_bbmd: BBMDManager, many: ManySentCollector
+    ):
+        sender = _fd(1234)
+        batched_bbmd.handle_bvlc(
+            BvlcFunction.DISTRIBUTE_BROADCAST_TO_NETWORK, b"\x01\x00\x10\x08", sender
+        )
+        _, fd_dests, exclude = many.calls[-1]
+        assert fd_dests is batched_bbmd._fdt.sockaddrs
+        assert exclude == batched_bbmd._fdt.slot(sender)
+
+    def test_forwarded_npdu_goes_to_foreign_devices_only(
+        self, batched_bbmd: BBMDManager, many: ManySentCollector
+    ):
+        originator = _fd(7)
+        batched_bbmd.handle_bvlc(
+            BvlcFunction.FORWARDED_NPDU, b"\x01\x00\x10\x08", originator, udp_source=PEER_ADDR
+        )
+        dests = many.destinations()
+        assert len(dests) == 1999
+        assert (PEER_ADDR.host, PEER_ADDR.port) not in dests
+        assert (originator.host, originator.port) not in dests
+
+    def test_send_errors_counted(self, batched_bbmd: BBMDManager, many: ManySentCollector):
+        batched_bbmd._send_many = lambda data, dests, exclude: 3
+        batched_bbmd.handle_bvlc(BvlcFunction.ORIGINAL_BROADCAST_NPDU, b"\x01\x00", CLIENT_ADDR)
+        # One batch for the BDT peer, one for the foreign devices.
+        assert batched_bbmd.fanout_stats.send_errors == 6
+
+    def test_deleted_and_expired_devices_leave_fan_out(
+        self, batched_bbmd: BBMDManager, many: ManySentCollector
+    ):
+        batched_bbmd.handle_bvlc(
+            BvlcFunction.DELETE_FOREIGN_DEVICE_TABLE_ENTRY, _fd(0).encode(), CLIENT_ADDR
+        )
+        batched_bbmd._fdt[_fd(1)] = FDTEntry(address=_fd(1), ttl=1, expiry=time.monotonic() - 1)
+        batched_bbmd._purge_expired_fdt_entries()
+        assert batched_bbmd.fanout_stats.expired_entries == 1
+
+        batched_bbmd.handle_bvlc(BvlcFunction.ORIGINAL_BROADCAST_NPDU, b"\x01\x00", CLIENT_ADDR)
+        dests = many.destinations()
+        assert len(dests) == 1 + 1998
+        assert (_fd(0).host, _fd(0).port) not in dests
+        assert (_fd(1).host, _fd(1).port) not in dests
+
+    def test_unbatched_fan_out_updates_stats(
+        self, bbmd_with_bdt: BBMDManager, collector: SentCollector
+    ):
+        for n in range(3):
+            bbmd_with_bdt.handle_bvlc(BvlcFunction.REGISTER_FOREIGN_DEVICE, b"\x00\x3c", _fd(n))
+        collector.clear()
+        bbmd_with_bdt.handle_bvlc(
+            BvlcFunction.DISTRIBUTE_BROADCAST_TO_NETWORK, b"\x01\x00", _fd(1)
+        )
+        assert {dest for _, dest in collector.sent} == {PEER_ADDR, _fd(0), _fd(2)}
+        stats = bbmd_with_bdt.fanout_stats
+        assert stats.peer_datagrams == 1
+        assert stats.fd_datagrams == 2
@@ -7,8 +7,10 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from bac_py.network.address import BIPAddress
+from bac_py.transport.bbmd import FDTEntry
 from bac_py.transport.bip import (
     BIPTransport,
+    _BatchedUDPTransport,
     _is_confirmed_request_npdu,
     _resolve_local_ip,
     _UDPProtocol,
@@ -2122,3 +2124,207 @@ class TestBBMDInterceptPaths:
 
         assert len(received) == 1
         assert received[0][0] == npdu
+
+
+class TestBatchedIO:
+    """Test the batched receive/send engine with real sockets."""
+
+    def test_invalid_batch_size_raises(self):
+        with pytest.raises(ValueError, match="batch_size"):
+            BIPTransport(batched_io=True, batch_size=0)
+
+    async def test_start_uses_batched_transport(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        try:
+            await transport.start()
+            assert transport.batched_io
+            assert isinstance(transport._transport, _BatchedUDPTransport)
+            assert transport.local_address.port > 0
+        finally:
+            await transport.stop()
+        assert transport._transport is None
+
+    async def test_default_is_not_batched(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0)
+        try:
+            await transport.start()
+            assert not transport.batched_io
+        finally:
+            await transport.stop()
+
+    async def test_falls_back_without_add_reader(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "add_reader", side_effect=NotImplementedError):
+            await transport.start()
+        try:
+            assert not transport.batched_io
+            assert transport._protocol is not None
+        finally:
+            await transport.stop()
+
+    async def test_receives_burst_in_order(self):
+        """A burst larger than the batch size is fully delivered, in order."""
+        server = BIPTransport(interface="127.0.0.1", port=0, batched_io=True, batch_size=4)
+        sender = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        received: list[bytes] = []
+        done = asyncio.Event()
+
+        def _on_receive(npdu: bytes, source: bytes) -> None:
+            received.append(npdu)
+            if len(received) == 20:
+                done.set()
+
+        server.on_receive(_on_receive)
+        try:
+            await server.start()
+            await sender.start()
+            for i in range(20):
+                sender.send_unicast(bytes([0x01, 0x00, i]), server.local_mac)
+            await asyncio.wait_for(done.wait(), timeout=2.0)
+            assert received == [bytes([0x01, 0x00, i]) for i in range(20)]
+        finally:
+            await sender.stop()
+            await server.stop()
+
+    async def test_callback_error_does_not_stop_drain(self):
+        server = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        sender = BIPTransport(interface="127.0.0.1", port=0)
+        received: list[bytes] = []
+        done = asyncio.Event()
+
+        def _on_receive(npdu: bytes, source: bytes) -> None:
+            received.append(npdu)
+            if len(received) == 1:
+                raise RuntimeError("boom")
+            done.set()
+
+        server.on_receive(_on_receive)
+        try:
+            await server.start()
+            await sender.start()
+            sender.send_unicast(b"\x01\x00\x01", server.local_mac)
+            sender.send_unicast(b"\x01\x00\x02", server.local_mac)
+            await asyncio.wait_for(done.wait(), timeout=2.0)
+            assert received == [b"\x01\x00\x01", b"\x01\x00\x02"]
+        finally:
+            await sender.stop()
+            await server.stop()
+
+    async def test_send_queues_when_socket_full(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        await transport.start()
+        try:
+            batched = transport._transport
+            assert isinstance(batched, _BatchedUDPTransport)
+            real_sock = batched._sock
+            mock_sock = MagicMock(wraps=real_sock)
+            mock_sock.sendto.side_effect = BlockingIOError
+            batched._sock = mock_sock
+            batched.sendto(b"a", ("127.0.0.1", 9))
+            batched.sendto(b"b", ("127.0.0.1", 9))
+            assert len(batched._send_queue) == 2
+            assert batched._writer_registered
+            # Only the first send hit the socket; the second was queued
+            # behind it.
+            assert mock_sock.sendto.call_count == 1
+
+            mock_sock.sendto.side_effect = None
+            batched._write_ready()
+            assert not batched._send_queue
+            assert not batched._writer_registered
+            assert mock_sock.sendto.call_count == 3
+            batched._sock = real_sock
+        finally:
+            await transport.stop()
+
+    async def test_sendmany_queues_remainder_when_socket_full(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        await transport.start()
+        try:
+            batched = transport._transport
+            assert isinstance(batched, _BatchedUDPTransport)
+            real_sock = batched._sock
+            mock_sock = MagicMock(wraps=real_sock)
+            mock_sock.sendto.side_effect = [None, BlockingIOError]
+            batched._sock = mock_sock
+            addrs = [("127.0.0.1", 9), ("127.0.0.2", 9), ("127.0.0.3", 9)]
+            assert batched.sendmany(b"fwd", addrs) == 0
+            assert [addr for _, addr in batched._send_queue] == addrs[1:]
+            assert batched._writer_registered
+
+            mock_sock.sendto.side_effect = None
+            batched._write_ready()
+            assert not batched._send_queue
+            assert mock_sock.sendto.call_count == 4
+            batched._sock = real_sock
+        finally:
+            await transport.stop()
+
+    async def test_sendmany_skips_excluded_index(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        await transport.start()
+        try:
+            batched = transport._transport
+            assert isinstance(batched, _BatchedUDPTransport)
+            real_sock = batched._sock
+            mock_sock = MagicMock(wraps=real_sock)
+            mock_sock.sendto.side_effect = [None, BlockingIOError]
+            batched._sock = mock_sock
+            addrs = [("127.0.0.1", 9), ("127.0.0.2", 9), ("127.0.0.3", 9), ("127.0.0.4", 9)]
+            assert batched.sendmany(b"fwd", addrs, exclude=1) == 0
+            sent = [call.args[1] for call in mock_sock.sendto.call_args_list]
+            assert sent == [addrs[0], addrs[2]]
+            # The blocked destination and the rest are queued, still skipping 1.
+            assert [addr for _, addr in batched._send_queue] == addrs[2:]
+            batched._send_queue.clear()
+            batched._sock = real_sock
+        finally:
+            await transport.stop()
+
+    async def test_sendmany_counts_failed_destinations(self):
+        transport = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        await transport.start()
+        try:
+            batched = transport._transport
+            assert isinstance(batched, _BatchedUDPTransport)
+            real_sock = batched._sock
+            mock_sock = MagicMock(wraps=real_sock)
+            mock_sock.sendto.side_effect = [None, OSError("unreachable"), None]
+            batched._sock = mock_sock
+            addrs = [("127.0.0.1", 9), ("127.0.0.2", 9), ("127.0.0.3", 9)]
+            assert batched.sendmany(b"fwd", addrs) == 1
+            assert not batched._send_queue
+            batched._sock = real_sock
+        finally:
+            await transport.stop()
+
+    async def test_bbmd_fan_out_reaches_every_foreign_device(self):
+        """BBMD broadcast fan-out goes through the batched send to real sockets."""
+        server = BIPTransport(interface="127.0.0.1", port=0, batched_io=True)
+        sinks = [BIPTransport(interface="127.0.0.1", port=0) for _ in range(3)]
+        received: list[bytes] = []
+        done = asyncio.Event()
+
+        def _on_receive(npdu: bytes, source: bytes) -> None:
+            received.append(npdu)
+            if len(received) == len(sinks):
+                done.set()
+
+        try:
+            await server.start()
+            bbmd = await server.attach_bbmd()
+            for sink in sinks:
+                sink.on_receive(_on_receive)
+                await sink.start()
+                bbmd._fdt[sink.local_address] = FDTEntry(
+                    address=sink.local_address, ttl=60, expiry=1e12
+                )
+            server.send_broadcast(b"\x01\x20\xff\xff\x00\xff\x10\x08")
+            await asyncio.wait_for(done.wait(), timeout=2.0)
+            assert received == [b"\x01\x20\xff\xff\x00\xff\x10\x08"] * len(sinks)
+            assert bbmd.fanout_stats.fd_datagrams == len(sinks)
+        finally:
+            for sink in sinks:
+                await sink.stop()
+            await server.stop()
@@ -1,5 +1,7 @@
 """Tests for BACnet constructed data types."""
 
+import datetime
+
 import pytest
 
 from bac_py.encoding.primitives import (
@@ -133,6 +135,17 @@ class TestBACnetDateTimeEncode:
         assert encoded == via_pv
 
 
+class TestBACnetDateTimeNow:
+    def test_now_structure(self):
+        dt = BACnetDateTime.now()
+        now = datetime.datetime.now()
+        assert dt.date.year == now.year
+        assert dt.date.month == now.month
+        assert dt.date.day == now.day
+        assert dt.date.day_of_week == now.isoweekday()
+        assert dt.time.hour == now.hour
+
+
 class TestBACnetDateRangeEncode:
     def test_encode_produces_bytes(self):
         dr = BACnetDateRange(
@@ -308,6 +321,69 @@ class TestBACnetLogRecordEncode:
         assert isinstance(encoded, bytes)
 
 
+class TestBACnetLogRecordDecode:
+    TS = BACnetDateTime(date=BACnetDate(2024, 6, 15, 6), time=BACnetTime(14, 30, 0, 0))
+
+    @pytest.mark.parametrize(
+        ("datum", "flags"),
+        [(72.5, None), (True, StatusFlags(fault=True)), (None, None), (7, StatusFlags())],
+    )
+    def test_round_trips_encode(self, datum, flags):
+        rec = BACnetLogRecord(timestamp=self.TS, log_datum=datum, status_flags=flags)
+        data = rec.encode() + rec.encode()
+        first, offset = BACnetLogRecord.decode(data)
+        second, end = BACnetLogRecord.decode(data, offset)
+        assert first == second == rec
+        assert end == len(data)
+
+    def _clause21(self, datum: bytes, flags: bytes = b"") -> bytes:
+        from bac_py.encoding.primitives import encode_application_date, encode_application_time
+        from bac_py.encoding.tags import encode_closing_tag, encode_opening_tag
+
+        return b"".join(
+            [
+                encode_opening_tag(0),
+                encode_application_date(self.TS.date),
+                encode_application_time(self.TS.time),
+                encode_closing_tag(0),
+                encode_opening_tag(1),
+                datum,
+                encode_closing_tag(1),
+                flags,
+            ]
+        )
+
+    def test_decodes_clause21_real_with_flags(self):
+        from bac_py.encoding.primitives import encode_context_bit_string, encode_context_real
+
+        data = self._clause21(
+            encode_context_real(2, 21.5),
+            encode_context_bit_string(2, StatusFlags(in_alarm=True).to_bit_string()),
+        )
+        rec, offset = BACnetLogRecord.decode(data)
+        assert rec == BACnetLogRecord(self.TS, 21.5, StatusFlags(in_alarm=True))
+        assert offset == len(data)
+
+    def test_decodes_clause21_failure(self):
+        from bac_py.encoding.primitives import encode_application_enumerated
+        from bac_py.encoding.tags import encode_closing_tag, encode_opening_tag
+        from bac_py.types.enums import ErrorClass, ErrorCode
+
+        failure = (
+            encode_opening_tag(8)
+            + encode_application_enumerated(ErrorClass.DEVICE)
+            + encode_application_enumerated(ErrorCode.COMMUNICATION_DISABLED)
+            + encode_closing_tag(8)
+        )
+        rec, _ = BACnetLogRecord.decode(self._clause21(failure))
+        assert rec.log_datum == (ErrorClass.DEVICE, ErrorCode.COMMUNICATION_DISABLED)
+        assert rec.status_flags is None
+
+    def test_rejects_other_data(self):
+        with pytest.raises(ValueError):
+            BACnetLogRecord.decode(b"\x21\x01")
+
+
 class TestBACnetRecipientProcessEncode:
     def test_encode_produces_bytes(self):
         rp = BACnetRecipientProcess(